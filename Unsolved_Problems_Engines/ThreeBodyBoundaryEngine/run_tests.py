@@ -28,6 +28,26 @@ import tests.test_failure_bias_converter
 import tests.test_integration
 import tests.test_gravity_calculator
 import tests.test_boundary_convergence
+import tests.test_scalar_field
+import tests.test_analysis_cache
+import tests.test_canonical_frame
+import tests.test_potential_field_builder
+import tests.test_adaptive_field
+import tests.test_barnes_hut
+import tests.test_orbit_integrator
+import tests.test_signature_index
+import tests.test_failure_store
+import tests.test_failure_shard
+import tests.test_failure_buckets
+import tests.test_spatial_risk
+import tests.test_adaptive_sampler
+import tests.test_batch_result
+import tests.test_run_metrics
+import tests.test_shared_fields
+import tests.test_lagrange_batch
+import tests.test_async_api
+import tests.test_precision
+import tests.test_benchmark_suite
 
 # 함수 기반 테스트를 unittest로 변환하기 위한 래퍼
 import unittest
@@ -44,6 +64,12 @@ class IntegrationTestWrapper(TestCase):
 class GravityCalculatorTestWrapper(TestCase):
     def test_gravity_calculator(self):
         tests.test_gravity_calculator.test_gravity_calculator()
+    
+    def test_potential_grid_matches_dict_field(self):
+        tests.test_gravity_calculator.test_potential_grid_matches_dict_field()
+    
+    def test_potential_to_density_inplace(self):
+        tests.test_gravity_calculator.test_potential_to_density_inplace()
 
 class BoundaryConvergenceTestWrapper(TestCase):
     def test_boundary_convergence(self):
@@ -82,6 +108,26 @@ def run_all_tests():
         ("L0: 원인 분석 레이어", tests.test_three_body_boundary_engine),
         ("L1: 실패 추적 레이어", tests.test_failure_atlas),
         ("L2: 실패 학습 레이어", tests.test_failure_bias_converter),
+        ("L0: 격자 필드 (ScalarField)", tests.test_scalar_field),
+        ("L0: 분석 캐시 (AnalysisCache)", tests.test_analysis_cache),
+        ("L0: 정규화 (Canonical Frame)", tests.test_canonical_frame),
+        ("L0: 층 재사용 필드 (PotentialFieldBuilder)", tests.test_potential_field_builder),
+        ("L0: 적응형 필드 (AdaptiveField)", tests.test_adaptive_field),
+        ("L0: 다체 퍼텐셜 (Barnes-Hut)", tests.test_barnes_hut),
+        ("L0: 궤도 전파 (OrbitIntegrator)", tests.test_orbit_integrator),
+        ("L1: 서명 색인 (SignatureIndex)", tests.test_signature_index),
+        ("L1: 영구 저장소 (FailureStore)", tests.test_failure_store),
+        ("L1: 샤드 병합 (FailureShard)", tests.test_failure_shard),
+        ("L1: 메모리 상한 (BoundedFailureAtlas)", tests.test_failure_buckets),
+        ("L2: 공간 위험도 (SpatialRiskGrid)", tests.test_spatial_risk),
+        ("L2: 적응형 스캔 (BiasGuidedSampler)", tests.test_adaptive_sampler),
+        ("배치 실행 (run_batch)", tests.test_batch_result),
+        ("단계별 계측 (RunMetrics)", tests.test_run_metrics),
+        ("L0: 공유 메모리 필드 (SharedFieldRegistry)", tests.test_shared_fields),
+        ("L0: 라그랑주 점 배치 풀이", tests.test_lagrange_batch),
+        ("비동기 API (arun / arun_batch)", tests.test_async_api),
+        ("L0: 필드 정밀도 (float32)", tests.test_precision),
+        ("벤치마크 도구", tests.test_benchmark_suite),
     ]
     
     for name, module in modules:
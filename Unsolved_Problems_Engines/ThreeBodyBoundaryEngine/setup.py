@@ -46,6 +46,7 @@ setup(
     python_requires=">=3.8",
     install_requires=[],
     extras_require={
+        "numpy": ["numpy>=1.20"],
         "dev": ["pytest", "pytest-cov"],
     },
 )
@@ -24,21 +24,52 @@ from .config import ThreeBodyConfig
 from .models import (
     Body,
     ThreeBodySystem,
+    NBodySystem,
     StabilityAnalysis,
     BoundaryDynamics,
     LagrangeAnalysis
 )
 from .point import Point
+from .scalar_field import ScalarField
+from .adaptive_field import AdaptiveField
+from .potential_field_builder import PotentialFieldBuilder
+from .orbit_integrator import OrbitIntegrator
+from .lagrange_calculator import LagrangeCalculator
 from .failure_atlas import (
     FailureRecord,
     FailureAtlas,
+    FailureSummary,
     CollapseMode
 )
+from .failure_store import (
+    FailureStore,
+    PersistentFailureAtlas,
+    compact_failure_store
+)
+from .failure_buckets import (
+    FailureBucket,
+    BoundedFailureAtlas
+)
+from .failure_shard import (
+    write_failure_shard,
+    read_failure_shard,
+    read_failure_shard_summary
+)
 from .failure_bias_converter import (
     FailureBiasConverter,
+    IncrementalBiasConverter,
     SearchBias
 )
+from .spatial_risk import SpatialRiskGrid, configuration_coordinates, system_coordinates
+from .adaptive_sampler import BiasGuidedSampler, AdaptiveScanReport
 from .run_result import EngineRunResult
+from .run_metrics import RunMetrics, StageTiming, MetricsHook
+from .shared_fields import SharedFieldRegistry, SharedFieldView
+from .async_pool import AsyncWorkerPool
+from .precision_report import PrecisionReport, compare_precision, reference_systems
+from .batch_result import BatchRunResult, iter_systems_from_arrays
+from .analysis_cache import AnalysisCache
+from .canonical_frame import CanonicalSystem, CanonicalTransform, canonicalize_system
 
 __version__ = "1.2.1"
 __all__ = [
@@ -46,15 +77,51 @@ __all__ = [
     "ThreeBodyConfig",
     "Body",
     "Point",
+    "ScalarField",
+    "AdaptiveField",
+    "PotentialFieldBuilder",
+    "OrbitIntegrator",
+    "LagrangeCalculator",
     "ThreeBodySystem",
+    "NBodySystem",
     "StabilityAnalysis",
     "BoundaryDynamics",
     "LagrangeAnalysis",
     "FailureRecord",
     "FailureAtlas",
+    "FailureSummary",
     "CollapseMode",
+    "FailureStore",
+    "PersistentFailureAtlas",
+    "compact_failure_store",
+    "FailureBucket",
+    "BoundedFailureAtlas",
+    "write_failure_shard",
+    "read_failure_shard",
+    "read_failure_shard_summary",
     "FailureBiasConverter",
+    "IncrementalBiasConverter",
     "SearchBias",
-    "EngineRunResult"
+    "SpatialRiskGrid",
+    "configuration_coordinates",
+    "system_coordinates",
+    "BiasGuidedSampler",
+    "AdaptiveScanReport",
+    "EngineRunResult",
+    "RunMetrics",
+    "StageTiming",
+    "MetricsHook",
+    "SharedFieldRegistry",
+    "SharedFieldView",
+    "AsyncWorkerPool",
+    "PrecisionReport",
+    "compare_precision",
+    "reference_systems",
+    "BatchRunResult",
+    "iter_systems_from_arrays",
+    "AnalysisCache",
+    "CanonicalSystem",
+    "CanonicalTransform",
+    "canonicalize_system"
 ]
 
@@ -0,0 +1,37 @@
+"""
+선택적 의존성 (Optional Dependencies)
+
+엔진 번호: UP-1
+역할: NumPy를 선택적 가속기로 다루기 위한 공용 import 지점
+
+⚠️ 원칙:
+- 엔진 본체는 표준 라이브러리만으로 동작해야 한다.
+- NumPy가 설치되어 있으면 배열 기반 경로(벡터화 커널)를 사용한다.
+- 배열 전용 API는 NumPy가 없으면 명시적인 ImportError를 발생시킨다.
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy 미설치 환경
+    np = None
+
+HAS_NUMPY = np is not None
+
+
+def require_numpy(feature: str) -> None:
+    """NumPy가 필요한 기능에서 호출
+
+    Args:
+        feature: 기능 이름 (에러 메시지용)
+
+    Raises:
+        ImportError: NumPy가 설치되어 있지 않은 경우
+    """
+    if np is None:
+        raise ImportError(
+            f"{feature}에는 numpy가 필요합니다. "
+            f"'pip install three-body-boundary-engine[numpy]'로 설치하세요."
+        )
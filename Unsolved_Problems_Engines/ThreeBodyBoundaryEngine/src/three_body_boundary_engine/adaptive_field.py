@@ -0,0 +1,190 @@
+"""
+AdaptiveField - 적응형 사분트리 스칼라 필드
+
+엔진 번호: UP-1
+역할: 천체 근처(1/r 특이점)는 잘게, 먼 영역(매끄러운 퍼텐셜)은 크게 나눈 필드
+
+구조 (평탄한 배열 기반 사분트리):
+- 노드 i: 셀 좌하단 (x0[i], y0[i]), 크기 (width[i], height[i]), 깊이 level[i]
+- corners[i] = (v00, v10, v01, v11): 네 꼭짓점 값, center[i]: 중심 값
+- first_child[i]: 자식 4개의 첫 인덱스 (잎이면 -1)
+  자식 순서: 0 = (좌, 하), 1 = (우, 하), 2 = (좌, 상), 3 = (우, 상)
+- 루트 단계: base × base 균일 셀 (노드 0 ~ base² - 1, 인덱스 = i * base + j)
+
+샘플링:
+- 루트 셀에서 잎까지 내려간 뒤 잎의 꼭짓점 값으로 쌍선형 보간
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+from .point import Point
+from ._compat import np, require_numpy
+
+
+@dataclass
+class AdaptiveField:
+    """적응형 사분트리 스칼라 필드
+
+    Attributes:
+        origin: 영역 좌하단 (x_min, y_min)
+        extent: 영역 크기 (x_max - x_min, y_max - y_min)
+        base: 루트 단계 한 변의 셀 수
+        x0, y0: 노드 셀 좌하단 좌표, shape (n_nodes,)
+        width, height: 노드 셀 크기, shape (n_nodes,)
+        level: 노드 깊이 (루트 단계 = 0), shape (n_nodes,)
+        first_child: 첫 자식 인덱스 (잎이면 -1), shape (n_nodes,)
+        corners: 꼭짓점 값 (v00, v10, v01, v11), shape (n_nodes, 4)
+        center: 중심 값, shape (n_nodes,)
+        evaluations: 생성에 사용한 퍼텐셜 평가 횟수
+    """
+    origin: Tuple[float, float]
+    extent: Tuple[float, float]
+    base: int
+    x0: "np.ndarray"
+    y0: "np.ndarray"
+    width: "np.ndarray"
+    height: "np.ndarray"
+    level: "np.ndarray"
+    first_child: "np.ndarray"
+    corners: "np.ndarray"
+    center: "np.ndarray"
+    evaluations: int = 0
+
+    def __post_init__(self):
+        """검증"""
+        require_numpy("AdaptiveField")
+        if self.corners.shape != (self.x0.size, 4):
+            raise ValueError("corners는 shape (n_nodes, 4)여야 합니다")
+        if self.first_child.size != self.x0.size or self.center.size != self.x0.size:
+            raise ValueError("노드 배열의 길이가 서로 다릅니다")
+
+    @property
+    def n_nodes(self) -> int:
+        """노드 수 (내부 노드 포함)"""
+        return self.x0.size
+
+    @property
+    def leaf_mask(self) -> "np.ndarray":
+        """잎 노드 마스크"""
+        return self.first_child < 0
+
+    @property
+    def n_leaves(self) -> int:
+        """잎 노드 수"""
+        return int(np.count_nonzero(self.leaf_mask))
+
+    @property
+    def max_level(self) -> int:
+        """가장 깊은 노드의 깊이"""
+        return int(self.level.max()) if self.level.size else 0
+
+    @property
+    def nbytes(self) -> int:
+        """버퍼 크기 합 (바이트)"""
+        return sum(
+            array.nbytes for array in (
+                self.x0, self.y0, self.width, self.height, self.level,
+                self.first_child, self.corners, self.center
+            )
+        )
+
+    def __len__(self) -> int:
+        """잎 노드 수"""
+        return self.n_leaves
+
+    def leaf_centers(self) -> Tuple["np.ndarray", "np.ndarray"]:
+        """잎 셀 중심 좌표 (xs, ys)"""
+        leaves = self.leaf_mask
+        return (
+            self.x0[leaves] + 0.5 * self.width[leaves],
+            self.y0[leaves] + 0.5 * self.height[leaves]
+        )
+
+    def leaf_areas(self) -> "np.ndarray":
+        """잎 셀 면적"""
+        leaves = self.leaf_mask
+        return self.width[leaves] * self.height[leaves]
+
+    def sample(self, x: float, y: float) -> float:
+        """쌍선형 보간 샘플링 (루트 셀 → 잎, O(깊이))
+
+        영역 밖의 좌표는 가장 가까운 경계로 고정(clamp)한다.
+        """
+        return float(self.sample_many(np.array([x]), np.array([y]))[0])
+
+    def sample_many(self, xs: "np.ndarray", ys: "np.ndarray") -> "np.ndarray":
+        """쌍선형 보간 샘플링 (배열 입력, 깊이 단계별 벡터화)
+
+        Args:
+            xs, ys: 같은 shape의 좌표 배열
+
+        Returns:
+            보간 값 배열 (float64)
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        shape = xs.shape
+        x = np.clip(xs.ravel(), self.origin[0], self.origin[0] + self.extent[0])
+        y = np.clip(ys.ravel(), self.origin[1], self.origin[1] + self.extent[1])
+
+        # 루트 단계 셀 찾기
+        base = self.base
+        i = np.clip(((x - self.origin[0]) / self.extent[0] * base).astype(np.intp), 0, base - 1)
+        j = np.clip(((y - self.origin[1]) / self.extent[1] * base).astype(np.intp), 0, base - 1)
+        node = i * base + j
+
+        # 자식이 있는 동안 사분면을 따라 내려감
+        while True:
+            child = self.first_child[node]
+            inner = child >= 0
+            if not inner.any():
+                break
+            parent = node[inner]
+            right = x[inner] >= self.x0[parent] + 0.5 * self.width[parent]
+            upper = y[inner] >= self.y0[parent] + 0.5 * self.height[parent]
+            node[inner] = child[inner] + right + 2 * upper
+
+        tx = np.clip((x - self.x0[node]) / self.width[node], 0.0, 1.0)
+        ty = np.clip((y - self.y0[node]) / self.height[node], 0.0, 1.0)
+        c = self.corners[node]
+        values = (
+            c[:, 0] * (1.0 - tx) * (1.0 - ty)
+            + c[:, 1] * tx * (1.0 - ty)
+            + c[:, 2] * (1.0 - tx) * ty
+            + c[:, 3] * tx * ty
+        )
+        return values.reshape(shape)
+
+    def to_dict(self) -> Dict[Point, float]:
+        """잎 셀 중심의 {Point: value} 딕셔너리 (기존 호출자용 어댑터)"""
+        xs, ys = self.leaf_centers()
+        values = self.center[self.leaf_mask]
+        return {
+            Point(x, y): value
+            for x, y, value in zip(xs.tolist(), ys.tolist(), values.tolist())
+        }
+
+    def to_scalar_field(self, resolution: int):
+        """균일 격자로 재표본화 (ScalarField)
+
+        Args:
+            resolution: 해상도 (격자점 (resolution + 1)²)
+
+        Returns:
+            ScalarField
+        """
+        from .scalar_field import ScalarField
+
+        dx = self.extent[0] / resolution
+        dy = self.extent[1] / resolution
+        steps = np.arange(resolution + 1, dtype=np.float64)
+        xs = self.origin[0] + steps * dx
+        ys = self.origin[1] + steps * dy
+        values = self.sample_many(
+            np.repeat(xs, ys.size).reshape(xs.size, ys.size),
+            np.tile(ys, xs.size).reshape(xs.size, ys.size)
+        )
+        return ScalarField(origin=self.origin, spacing=(dx, dy), values=values)
@@ -0,0 +1,342 @@
+"""
+Adaptive Sampler - 편향 유도 적응형 안정성 스캔 (L0 → L1 → L2 루프)
+
+엔진 번호: UP-1
+역할: 2차원 초기 조건 공간을 균일 격자 대신 안정/불안정 경계 근처만 세분해 스캔
+
+동작 (단계 동기 사분 세분):
+- 거친 격자 (initial_resolution × initial_resolution 셀)의 꼭짓점을 run()으로 평가
+- 꼭짓점 판정이 섞인 셀 (경계 통과) 또는 mismatch가 임계값 ±boundary_band 안인 셀만 4등분
+- 판정이 같은 셀은 더 나누지 않음 (같은 해상도의 균일 격자가 평가할 내부 점을 생략)
+- 꼭짓점은 격자 인덱스로 공유하므로 같은 점을 두 번 평가하지 않음
+
+편향 (L2 SearchBias):
+- 결과는 매번 run(..., failure_atlas, bias_converter)으로 되먹임 (기본 IncrementalBiasConverter)
+- 가지치기 / 우선순위는 스캔 시작 시점의 편향 스냅샷 (이전 스캔 또는 넘겨받은 지도)만 사용
+  → 조건 서명은 위치와 mismatch를 담아 점마다 다르므로, 이번 스캔에서 막 기록한 실패는
+    항상 횟수 1 = 최대 횟수로 위험도가 높게 나온다. 이를 쓰면 "알려진" 위험이 아니라
+    방금 평가한 실패 꼭짓점을 모두 가지치기하게 된다. 새 실패는 다음 스캔부터 반영
+- 실패 꼭짓점이 모두 should_avoid_condition()인 셀은 가지치기 (이미 알려진 위험 영역)
+  → 안정 꼭짓점은 보지 않는다. 판정이 섞인 경계 셀도 실패 쪽이 이미 알려져 있으면
+    다시 세분하지 않음 (기본 boundary_band=0에서도 가지치기)
+- 나머지 셀은 크기 × (1 - risk_weight × 꼭짓점 최대 위험도) 순으로 세분
+  → 예산 (max_evaluations)이 모자라면 위험한 셀을 뒤로 미룸
+
+보고 (AdaptiveScanReport):
+- 모든 경계 셀을 끝까지 세분한 가장 깊은 단계 (resolved_depth)와
+  그 해상도의 균일 격자 평가 수 대비 절약한 평가 수
+- 첫 격자 셀보다 작아서 꼭짓점 판정에 드러나지 않는 경계 (작은 섬)는 찾지 못함
+  → initial_resolution은 예상되는 가장 작은 안정/불안정 영역보다 촘촘하게
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .models import ThreeBodySystem
+from .failure_atlas import FailureAtlas
+from .failure_bias_converter import FailureBiasConverter, IncrementalBiasConverter, SearchBias
+from .run_result import EngineRunResult
+
+
+# 셀 = (단계, 최소 꼭짓점 인덱스 i, j) — 인덱스는 max_depth 격자 기준
+Cell = Tuple[int, int, int]
+
+
+@dataclass
+class AdaptiveScanReport:
+    """적응형 스캔 결과
+
+    - results: 평가 순서대로의 run() 결과
+    - coordinates: results와 같은 순서의 (u, v) 좌표
+    - boundary_cells: 마지막 세분 단계의 경계 셀 ((u0, v0), (u1, v1))
+    - resolved_depth: 모든 경계 셀을 세분 완료한 가장 깊은 단계
+    - uniform_evaluations: resolved_depth 해상도 균일 격자의 평가 수
+    - pruned_cells: 편향으로 가지치기한 셀 수
+      (가지치기한 셀은 boundary_cells에서 빠지고, 세분하지 않은 평가는 절약 수에 포함)
+    """
+    results: List[EngineRunResult] = field(default_factory=list)
+    coordinates: List[Tuple[float, float]] = field(default_factory=list)
+    boundary_cells: List[Tuple[Tuple[float, float], Tuple[float, float]]] = field(default_factory=list)
+    resolved_depth: int = 0
+    uniform_evaluations: int = 0
+    pruned_cells: int = 0
+
+    @property
+    def evaluations(self) -> int:
+        """실제 평가 수 (run() 호출 수)"""
+        return len(self.results)
+
+    @property
+    def evaluations_saved(self) -> int:
+        """같은 경계 해상도의 균일 격자 대비 절약한 평가 수"""
+        return self.uniform_evaluations - self.evaluations
+
+    @property
+    def saved_ratio(self) -> float:
+        """절약 비율 (0.0 ~ 1.0)"""
+        if self.uniform_evaluations == 0:
+            return 0.0
+        return self.evaluations_saved / self.uniform_evaluations
+
+    def get_statistics(self) -> Dict[str, float]:
+        """통계 반환"""
+        return {
+            "evaluations": self.evaluations,
+            "uniform_evaluations": self.uniform_evaluations,
+            "evaluations_saved": self.evaluations_saved,
+            "saved_ratio": self.saved_ratio,
+            "resolved_depth": self.resolved_depth,
+            "boundary_cells": len(self.boundary_cells),
+            "pruned_cells": self.pruned_cells,
+        }
+
+
+@dataclass
+class _Sample:
+    """평가한 꼭짓점"""
+    result: EngineRunResult
+    stable: bool
+    near_threshold: bool
+    # 실패로 기록된 조건 서명 (안정이면 None)
+    signature: Optional[str]
+
+
+class BiasGuidedSampler:
+    """편향 유도 적응형 스캐너
+
+    system_factory(u, v)로 2차원 매개변수 공간의 점을 ThreeBodySystem으로 만들고
+    engine.run()으로 평가한다. 같은 failure_atlas / bias_converter를 계속 넘겨 실패를
+    누적하고, 세분 순서와 가지치기는 스캔을 시작할 때의 SearchBias로 판단한다.
+    """
+
+    def __init__(
+        self,
+        engine,
+        system_factory: Callable[[float, float], ThreeBodySystem],
+        bounds: Tuple[Tuple[float, float], Tuple[float, float]],
+        *,
+        initial_resolution: int = 4,
+        max_depth: int = 4,
+        max_evaluations: Optional[int] = None,
+        failure_threshold: float = 0.1,
+        boundary_band: float = 0.0,
+        avoid_threshold: float = 0.5,
+        risk_weight: float = 1.0,
+        failure_atlas: Optional[FailureAtlas] = None,
+        bias_converter: Optional[FailureBiasConverter] = None,
+        x_range: Optional[tuple] = None,
+        y_range: Optional[tuple] = None
+    ):
+        """
+        Args:
+            engine: ThreeBodyBoundaryEngine (run()을 제공하는 객체)
+            system_factory: (u, v) → ThreeBodySystem
+            bounds: ((u_min, u_max), (v_min, v_max))
+            initial_resolution: 첫 단계 격자의 한 변 셀 수
+            max_depth: 최대 세분 단계 (셀 한 변 = 첫 셀 / 2^max_depth)
+            max_evaluations: 평가 예산 (None이면 제한 없음)
+            failure_threshold: 실패 판정 임계값 (run()과 동일)
+            boundary_band: mismatch가 임계값의 ±boundary_band (상대값) 안이면 판정이 같아도 세분
+            avoid_threshold: should_avoid_condition() 회피 임계값 (가지치기)
+            risk_weight: 세분 우선순위의 위험도 감쇠 (0이면 편향 무시)
+            failure_atlas: 누적할 실패 지도 (None이면 새로 생성)
+            bias_converter: 편향 변환기 (None이면 IncrementalBiasConverter)
+            x_range / y_range: run()에 그대로 전달
+        """
+        (u_min, u_max), (v_min, v_max) = bounds
+        if not (u_max > u_min and v_max > v_min):
+            raise ValueError(f"bounds는 (최소, 최대) 순서의 구간이어야 합니다: {bounds}")
+        if initial_resolution < 1:
+            raise ValueError("initial_resolution은 1 이상이어야 합니다")
+        if max_depth < 0:
+            raise ValueError("max_depth는 0 이상이어야 합니다")
+        if max_evaluations is not None and max_evaluations < (initial_resolution + 1) ** 2:
+            raise ValueError(
+                f"max_evaluations는 첫 격자 점 수 ({(initial_resolution + 1) ** 2}) 이상이어야 합니다"
+            )
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold는 양수여야 합니다")
+        if boundary_band < 0 or risk_weight < 0:
+            raise ValueError("boundary_band와 risk_weight는 0 이상이어야 합니다")
+
+        self.engine = engine
+        self.system_factory = system_factory
+        self.bounds = ((u_min, u_max), (v_min, v_max))
+        self.initial_resolution = initial_resolution
+        self.max_depth = max_depth
+        self.max_evaluations = max_evaluations
+        self.failure_threshold = failure_threshold
+        self.boundary_band = boundary_band
+        self.avoid_threshold = avoid_threshold
+        self.risk_weight = risk_weight
+        self.failure_atlas = failure_atlas if failure_atlas is not None else FailureAtlas()
+        self.bias_converter = bias_converter or IncrementalBiasConverter()
+        self.x_range = x_range
+        self.y_range = y_range
+
+        # 가장 깊은 단계의 격자 한 변 점 수 - 1
+        self._finest = initial_resolution << max_depth
+        self._samples: Dict[Tuple[int, int], _Sample] = {}
+        self._report = AdaptiveScanReport()
+        # 스캔 시작 시점의 편향 (이번 스캔의 새 실패는 반영하지 않음)
+        self._prior_bias: Optional[SearchBias] = None
+
+    def coordinate(self, i: int, j: int) -> Tuple[float, float]:
+        """격자 인덱스 → (u, v)"""
+        (u_min, u_max), (v_min, v_max) = self.bounds
+        return (
+            u_min + (u_max - u_min) * i / self._finest,
+            v_min + (v_max - v_min) * j / self._finest
+        )
+
+    def _budget_left(self) -> bool:
+        return self.max_evaluations is None or len(self._samples) < self.max_evaluations
+
+    def _evaluate(self, index: Tuple[int, int]) -> Optional[_Sample]:
+        """꼭짓점 평가 (이미 평가했으면 재사용, 예산이 없으면 None)"""
+        sample = self._samples.get(index)
+        if sample is not None:
+            return sample
+        if not self._budget_left():
+            return None
+
+        u, v = self.coordinate(*index)
+        result = self.engine.run(
+            self.system_factory(u, v),
+            self.x_range,
+            self.y_range,
+            failure_threshold=self.failure_threshold,
+            failure_atlas=self.failure_atlas,
+            bias_converter=self.bias_converter
+        )
+        analysis = result.analysis
+        record = result.last_failure_record
+        sample = _Sample(
+            result=result,
+            stable=analysis.is_stable(self.failure_threshold),
+            near_threshold=abs(analysis.mismatch / self.failure_threshold - 1.0) <= self.boundary_band,
+            signature=record.condition_signature if record is not None else None
+        )
+        self._samples[index] = sample
+        self._report.results.append(result)
+        self._report.coordinates.append((u, v))
+        return sample
+
+    def _corners(self, cell: Cell) -> List[Tuple[int, int]]:
+        level, i, j = cell
+        step = self._finest // (self.initial_resolution << level)
+        return [(i, j), (i + step, j), (i, j + step), (i + step, j + step)]
+
+    def _is_frontier(self, samples: List[_Sample]) -> bool:
+        """경계 셀 판정 (꼭짓점 판정이 섞이거나 임계값 근처)"""
+        return (
+            len({sample.stable for sample in samples}) > 1
+            or any(sample.near_threshold for sample in samples)
+        )
+
+    def _is_avoided(self, samples: List[_Sample]) -> bool:
+        """실패 꼭짓점이 모두 (스캔 전부터) 회피 대상인지
+
+        안정 꼭짓점은 판단에서 뺀다 (경계 셀은 판정이 섞이므로 안정 꼭짓점이 있어도
+        가지치기 대상). 실패 꼭짓점이 없으면 False.
+        """
+        if self._prior_bias is None:
+            return False
+        failing = [sample.signature for sample in samples if sample.signature is not None]
+        return bool(failing) and all(
+            self.bias_converter.should_avoid_condition(self._prior_bias, signature, self.avoid_threshold)
+            for signature in failing
+        )
+
+    def _priority(self, cell: Cell, samples: List[_Sample]) -> float:
+        """세분 우선순위 (클수록 먼저): 셀 크기 × 위험도 감쇠"""
+        risk = 0.0
+        if self._prior_bias is not None:
+            risk = max(
+                (self._prior_bias.get_risk(sample.signature) for sample in samples if sample.signature),
+                default=0.0
+            )
+        size = 1.0 / (1 << cell[0])
+        return size * max(0.0, 1.0 - self.risk_weight * risk)
+
+    def _children(self, cell: Cell) -> List[Cell]:
+        level, i, j = cell
+        half = self._finest // (self.initial_resolution << (level + 1))
+        return [
+            (level + 1, i + di, j + dj)
+            for di in (0, half)
+            for dj in (0, half)
+        ]
+
+    def run(self) -> AdaptiveScanReport:
+        """스캔 실행
+
+        실패 지도는 호출 사이에 계속 누적되므로, 같은 지도로 다시 스캔하면
+        처음부터 이전 스캔의 편향으로 가지치기한다. 빈 지도로 시작한 첫 스캔은
+        가지치기하지 않는다.
+
+        Returns:
+            AdaptiveScanReport (평가 결과, 경계 셀, 균일 격자 대비 절약 수)
+        """
+        self._samples = {}
+        self._report = AdaptiveScanReport()
+        self._prior_bias = None
+        if self.failure_atlas.total_failures:
+            self._prior_bias = self.bias_converter.convert_failure_to_bias(self.failure_atlas)
+
+        step = self._finest // self.initial_resolution
+        cells: List[Cell] = [
+            (0, i * step, j * step)
+            for i in range(self.initial_resolution)
+            for j in range(self.initial_resolution)
+        ]
+        report = self._report
+        resolved_depth = 0
+        frontier: List[Cell] = []
+
+        for level in range(self.max_depth + 1):
+            # 이 단계 셀의 꼭짓점을 모두 평가해야 단계 완료
+            pending = [self._corners(cell) for cell in cells]
+            complete = True
+            for corners in pending:
+                for index in corners:
+                    if self._evaluate(index) is None:
+                        complete = False
+                        break
+                if not complete:
+                    break
+            if not complete:
+                break
+            resolved_depth = level
+
+            frontier = []
+            queue = []
+            for order, cell in enumerate(cells):
+                samples = [self._samples[index] for index in self._corners(cell)]
+                if not self._is_frontier(samples):
+                    continue
+                if self._is_avoided(samples):
+                    report.pruned_cells += 1
+                    continue
+                frontier.append(cell)
+                heapq.heappush(queue, (-self._priority(cell, samples), order, cell))
+
+            if level == self.max_depth or not queue:
+                break
+            # 우선순위 순서로 세분 (예산이 모자라면 뒤쪽 셀은 다음 단계를 완료하지 못함)
+            cells = []
+            while queue:
+                cells.extend(self._children(heapq.heappop(queue)[2]))
+
+        report.resolved_depth = resolved_depth
+        points = (self.initial_resolution << resolved_depth) + 1
+        report.uniform_evaluations = points * points
+        report.boundary_cells = [
+            (self.coordinate(*corners[0]), self.coordinate(*corners[3]))
+            for corners in (self._corners(cell) for cell in frontier)
+        ]
+        return report
@@ -0,0 +1,220 @@
+"""
+Analysis Cache - 안정성 분석 결과 캐시
+
+엔진 번호: UP-1
+역할: 같은 조건의 analyze_orbit_stability 재계산 방지 (선택적)
+
+캐시 키 (지문):
+- 천체 질량/위치 (quantum 단위로 양자화)
+- x/y 범위 (None이면 "auto")
+- 결과에 영향을 주는 ThreeBodyConfig 필드
+
+계층:
+- 메모리: 개수 제한 LRU (OrderedDict)
+- 디스크 (선택): 키별 JSON 파일, 재시작한 작업이 이전 결과를 재사용
+  (쓰기 실패(디스크 가득 참, 읽기 전용 등)는 분석을 실패시키지 않고 disk_errors로 집계)
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from typing import Dict, Optional
+
+from .config import ThreeBodyConfig
+from .models import StabilityAnalysis
+
+
+# 분석 결과에 영향을 주는 설정 필드
+FINGERPRINT_CONFIG_FIELDS = (
+    "gravitational_constant",
+    "potential_resolution",
+    "adaptive_tolerance",
+    "opening_angle",
+    "direct_sum_threshold",
+    "layer_reuse_tolerance",
+    "density_normalization",
+    "stability_threshold",
+    "boundary_radius",
+    "initial_boundary_points",
+    "max_iterations",
+    "error_threshold",
+    "screening_resolutions",
+    "screening_band",
+    "field_precision",
+)
+
+
+class AnalysisCache:
+    """StabilityAnalysis 결과 캐시 (메모리 LRU + 선택적 디스크 계층)"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        quantum: float = 1e-9,
+        disk_path: Optional[str] = None
+    ):
+        """
+        Args:
+            max_entries: 메모리 계층 최대 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+            quantum: 지문 양자화 단위 (이보다 작은 차이는 같은 조건으로 간주)
+            disk_path: 디스크 계층 디렉토리 (None이면 메모리만 사용)
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries는 1 이상이어야 합니다")
+        if quantum <= 0:
+            raise ValueError("quantum은 양수여야 합니다")
+
+        self.max_entries = max_entries
+        self.quantum = quantum
+        self.disk_path = disk_path
+        if disk_path is not None:
+            os.makedirs(disk_path, exist_ok=True)
+
+        self._entries: "OrderedDict[str, StabilityAnalysis]" = OrderedDict()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        self.disk_writes = 0
+        self.disk_errors = 0
+
+    def _quantize(self, value: float) -> int:
+        """값 양자화"""
+        return round(value / self.quantum)
+
+    def fingerprint(
+        self,
+        system,
+        x_range: Optional[tuple],
+        y_range: Optional[tuple],
+        config: ThreeBodyConfig
+    ) -> str:
+        """캐시 키 생성
+
+        Args:
+            system: 분석할 시스템 (get_all_bodies() 제공)
+            x_range: x 범위 (None이면 자동)
+            y_range: y 범위 (None이면 자동)
+            config: 엔진 설정
+
+        Returns:
+            지문 문자열 (SHA-1 hex)
+        """
+        q = self._quantize
+        bodies = tuple(
+            (q(body.mass), q(body.position.x), q(body.position.y))
+            for body in system.get_all_bodies()
+        )
+        # 엔진은 둘 중 하나라도 None이면 범위를 자동 계산
+        if x_range is None or y_range is None:
+            ranges = "auto"
+        else:
+            ranges = (q(x_range[0]), q(x_range[1]), q(y_range[0]), q(y_range[1]))
+        settings = tuple(getattr(config, name) for name in FINGERPRINT_CONFIG_FIELDS)
+
+        payload = repr((bodies, ranges, settings))
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[StabilityAnalysis]:
+        """캐시 조회 (메모리 → 디스크)
+
+        Returns:
+            캐시된 결과의 복사본 (없으면 None)
+        """
+        analysis = self._entries.get(key)
+        if analysis is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return replace(analysis)
+
+        analysis = self._load_from_disk(key)
+        if analysis is not None:
+            self.hits += 1
+            self.disk_hits += 1
+            self._store_in_memory(key, analysis)
+            return replace(analysis)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, analysis: StabilityAnalysis) -> None:
+        """캐시 저장 (메모리 + 디스크)"""
+        self._store_in_memory(key, replace(analysis))
+        self._write_to_disk(key, analysis)
+
+    def _store_in_memory(self, key: str, analysis: StabilityAnalysis) -> None:
+        """메모리 계층 저장 (LRU 제거)"""
+        self._entries[key] = analysis
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_file(self, key: str) -> str:
+        """키에 해당하는 디스크 파일 경로"""
+        return os.path.join(self.disk_path, f"{key}.json")
+
+    def _load_from_disk(self, key: str) -> Optional[StabilityAnalysis]:
+        """디스크 계층 조회 (손상된 파일은 미스로 처리)"""
+        if self.disk_path is None:
+            return None
+        try:
+            with open(self._disk_file(key), "r", encoding="utf-8") as f:
+                return StabilityAnalysis(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write_to_disk(self, key: str, analysis: StabilityAnalysis) -> None:
+        """디스크 계층 저장 (임시 파일 후 원자적 교체, 실패하면 임시 파일 제거 후 무시)"""
+        if self.disk_path is None:
+            return
+        path = self._disk_file(key)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(asdict(analysis), f)
+            os.replace(temp_path, path)
+        except OSError:
+            self.disk_errors += 1
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+        self.disk_writes += 1
+
+    def __len__(self) -> int:
+        """메모리 계층 항목 수"""
+        return len(self._entries)
+
+    def get_statistics(self) -> Dict:
+        """캐시 통계 반환"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "disk_hits": self.disk_hits,
+            "disk_writes": self.disk_writes,
+            "disk_errors": self.disk_errors,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """메모리 계층과 통계 초기화 (디스크 계층은 유지)"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        self.disk_writes = 0
+        self.disk_errors = 0
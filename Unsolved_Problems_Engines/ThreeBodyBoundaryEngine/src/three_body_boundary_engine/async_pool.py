@@ -0,0 +1,185 @@
+"""
+Async Pool - asyncio용 관리형 프로세스 풀
+
+엔진 번호: UP-1
+역할: 이벤트 루프를 막지 않고 L0 분석 (CPU 작업)을 워커 프로세스에서 실행
+
+구성:
+- AsyncWorkerPool: ProcessPoolExecutor를 처음 사용할 때 생성하고 aclose()에서 종료
+  (워커 초기화는 병렬 배치와 같음: 프로세스당 엔진 한 번, 공유 필드 manifest 전달)
+- 진행 중 요청 상한 (max_in_flight): 슬롯이 없으면 요청이 이벤트 루프에서 대기 (배압)
+- 요청별 제한 시간 (timeout): 슬롯 대기 + 워커 실행을 합한 시간, 넘으면 asyncio.TimeoutError
+- 취소: 대기 중인 요청을 취소하면 아직 시작하지 않은 워커 작업도 취소
+  (이미 워커에서 실행 중인 작업은 끝까지 돌고 결과만 버려짐)
+- 워커 프로세스가 비정상 종료되면 (BrokenProcessPool) 그때 진행 중이던 요청은 실패하고,
+  다음 요청에서 프로세스 풀을 새로 만든다 (restarts 카운터)
+- 슬롯 (asyncio.Semaphore)은 이벤트 루프마다 만든다 → 엔진 소유 풀을 여러 asyncio.run()에서
+  재사용 가능 (프로세스 풀은 공유, 슬롯 상한은 루프별)
+
+L1/L2 갱신 (실패 기록 / 편향 계산)은 엔진이 이벤트 루프 스레드에서 await 없이
+한 번에 수행하므로, 여러 요청이 동시에 끝나도 지도와 편향이 섞이지 않는다.
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Set
+
+from .config import ThreeBodyConfig
+from .models import StabilityAnalysis, ThreeBodySystem
+from .parallel_batch import _analyze_system, _initialize_worker
+
+
+class AsyncWorkerPool:
+    """asyncio용 관리형 프로세스 풀 (L0 분석 전용)
+
+    async with AsyncWorkerPool(config) as pool: 형태로 쓰거나,
+    ThreeBodyBoundaryEngine.async_pool()이 만든 엔진 소유 풀을 사용한다.
+    """
+
+    def __init__(
+        self,
+        config: ThreeBodyConfig,
+        *,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        mp_context=None,
+        shared_manifest: Optional[dict] = None
+    ):
+        """
+        Args:
+            config: 워커 엔진 설정 (워커마다 한 번 피클되어 전달)
+            max_workers: 워커 프로세스 수 (None이면 CPU 수)
+            max_in_flight: 동시에 진행할 최대 요청 수 (None이면 워커 수의 2배)
+            mp_context: multiprocessing 컨텍스트
+            shared_manifest: 공유 필드 manifest (SharedFieldRegistry.manifest)
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers는 1 이상이어야 합니다")
+        if max_in_flight is None:
+            max_in_flight = 2 * (max_workers or os.cpu_count() or 1)
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight는 1 이상이어야 합니다")
+        self.config = config
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.mp_context = mp_context
+        self.shared_manifest = shared_manifest
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        # 슬롯을 만든 이벤트 루프 (다른 루프에서 쓰면 슬롯을 새로 만든다)
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._futures: Set[asyncio.Future] = set()
+        self._closed = False
+        # 워커 비정상 종료로 프로세스 풀을 다시 만든 횟수
+        self.restarts = 0
+
+    @property
+    def in_flight(self) -> int:
+        """워커에 제출된 뒤 아직 끝나지 않은 요청 수"""
+        return len(self._futures)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def _ensure_started(self) -> None:
+        """프로세스 풀 (없거나 깨졌으면) 과 현재 이벤트 루프의 슬롯 준비"""
+        if self._closed:
+            raise RuntimeError("AsyncWorkerPool이 이미 닫혔습니다")
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self.mp_context,
+                initializer=_initialize_worker,
+                initargs=(self.config, self.shared_manifest)
+            )
+        loop = asyncio.get_running_loop()
+        if self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+            self._slots_loop = loop
+
+    def _discard_broken(self, executor: ProcessPoolExecutor) -> None:
+        """깨진 프로세스 풀 버리기 (다음 요청의 _ensure_started()가 새로 생성)"""
+        if self._executor is executor:
+            self._executor = None
+            self.restarts += 1
+            # 깨진 풀은 남은 작업을 이미 BrokenProcessPool로 실패시키므로 cancel_futures가
+            # 필요 없음 (cancel_futures는 Python 3.9+ 전용, python_requires >= 3.8)
+            executor.shutdown(wait=False)
+
+    async def analyze(
+        self,
+        system: ThreeBodySystem,
+        x_range: Optional[tuple] = None,
+        y_range: Optional[tuple] = None,
+        *,
+        timeout: Optional[float] = None
+    ) -> StabilityAnalysis:
+        """워커에서 analyze_orbit_stability() 실행
+
+        Args:
+            system: 삼체 시스템
+            x_range: x 범위 (None이면 자동 계산)
+            y_range: y 범위 (None이면 자동 계산)
+            timeout: 제한 시간 (초, 슬롯 대기 포함). None이면 제한 없음
+
+        Returns:
+            StabilityAnalysis
+
+        Raises:
+            asyncio.TimeoutError: 제한 시간 초과
+            BrokenProcessPool: 실행 중 워커 프로세스가 비정상 종료 (다음 요청은 새 풀 사용)
+        """
+        if timeout is not None and timeout <= 0:
+            raise ValueError("timeout은 양수여야 합니다")
+        self._ensure_started()
+        if timeout is None:
+            return await self._submit(system, x_range, y_range)
+        return await asyncio.wait_for(self._submit(system, x_range, y_range), timeout)
+
+    async def _submit(
+        self,
+        system: ThreeBodySystem,
+        x_range: Optional[tuple],
+        y_range: Optional[tuple]
+    ) -> StabilityAnalysis:
+        """슬롯을 얻어 워커에 제출하고 결과 대기 (취소되면 워커 작업도 취소 시도)"""
+        async with self._slots:
+            # 슬롯을 기다리는 동안 풀이 깨져 교체되었을 수 있음
+            self._ensure_started()
+            executor = self._executor
+            try:
+                future = asyncio.wrap_future(
+                    executor.submit(_analyze_system, system, x_range, y_range)
+                )
+                self._futures.add(future)
+                try:
+                    return await future
+                finally:
+                    self._futures.discard(future)
+            except BrokenProcessPool:
+                self._discard_broken(executor)
+                raise
+
+    async def aclose(self) -> None:
+        """대기 중인 작업을 취소하고 워커 프로세스 종료 (여러 번 호출해도 안전)"""
+        self._closed = True
+        executor, self._executor = self._executor, None
+        if executor is None:
+            return
+        for future in list(self._futures):
+            future.cancel()
+        # shutdown(wait=True)는 블로킹이므로 기본 스레드 실행기에서 기다림
+        await asyncio.get_running_loop().run_in_executor(None, executor.shutdown, True)
+
+    async def __aenter__(self) -> "AsyncWorkerPool":
+        self._ensure_started()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.aclose()
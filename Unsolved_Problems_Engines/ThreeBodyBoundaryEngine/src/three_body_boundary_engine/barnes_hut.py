@@ -0,0 +1,299 @@
+"""
+Barnes-Hut Tree - 다체 퍼텐셜 근사
+
+엔진 번호: UP-1
+역할: 천체 수 N이 클 때 격자 퍼텐셜을 O(격자 × log N)으로 근사
+
+수식:
+V(x,y) = -G * Σ(m_i / r_i)
+먼 셀은 질량 중심 전개의 단극 + 사극 항으로 대체 (d = p - c, |d| = r)
+M / r + (Q_xx d_x² + 2 Q_xy d_x d_y + Q_yy d_y²) / (2 r⁵)
+Q_xx = Σm(2x² - y²), Q_yy = Σm(2y² - x²), Q_xy = 3 Σm x y  (질량 중심 기준)
+
+열림 기준 (opening angle θ):
+- 셀 한 변 s, 평가점과 셀 질량 중심 거리 d
+- s < θ * d 이면 셀 전체를 전개식으로 근사, 아니면 자식 셀로 내려감
+- θ = 0 이면 항상 내려가므로 직접 합과 같은 값 (합산 순서만 다름)
+
+구조 (평탄한 배열 기반 사분트리):
+- 천체를 Morton(Z-order) 키로 정렬한 뒤 깊이 단계별로 벡터화하여 생성
+- 노드는 너비 우선 순서, 형제 노드는 연속된 인덱스
+- 노드 i: 질량 중심 (com_x[i], com_y[i]), 총 질량 mass[i], 셀 한 변 size[i],
+  사극 모멘트 (q_xx[i], q_xy[i], q_yy[i])
+- 자식: first_child[i] ~ first_child[i] + child_count[i] - 1 (잎이면 0개)
+- 같은 위치의 천체들은 한 잎에 모인다 (max_depth 도달 시)
+
+평가:
+- 임의 점: (평가점, 노드) 쌍을 깊이 단계별로 벡터화하여 처리
+- 규칙 격자: 격자점을 tile × tile 묶음으로 나눠 (묶음, 노드) 쌍으로 순회
+  (묶음 경계 원까지의 거리로 보수적으로 판정, 채택된 노드는 묶음 전체에 브로드캐스팅)
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+from typing import List
+from .models import Body
+from ._compat import np, require_numpy
+
+
+class BarnesHutTree:
+    """Barnes-Hut 사분트리 (단극 + 사극 근사)"""
+
+    def __init__(self, bodies: List[Body], max_depth: int = 30):
+        """
+        Args:
+            bodies: 천체 리스트
+            max_depth: 최대 분할 깊이 (30 이하, 같은 위치의 천체가 무한 분할되지 않도록)
+        """
+        require_numpy("BarnesHutTree")
+        if not bodies:
+            raise ValueError("천체가 하나 이상 필요합니다")
+        if not 0 <= max_depth <= 30:
+            raise ValueError("max_depth는 0 ~ 30이어야 합니다")
+
+        self.n_bodies = len(bodies)
+        xs = np.array([b.position.x for b in bodies], dtype=np.float64)
+        ys = np.array([b.position.y for b in bodies], dtype=np.float64)
+        masses = np.array([b.mass for b in bodies], dtype=np.float64)
+
+        x_min, y_min = float(xs.min()), float(ys.min())
+        root_size = max(float(xs.max()) - x_min, float(ys.max()) - y_min)
+        depth = max_depth if root_size > 0 else 0
+
+        # Morton 키: 깊이 depth의 정수 좌표 비트를 교차 (형제 셀이 정렬 후 연속)
+        cells = 1 << depth
+        scale = cells / root_size if root_size > 0 else 0.0
+        ix = np.clip(((xs - x_min) * scale).astype(np.int64), 0, cells - 1)
+        iy = np.clip(((ys - y_min) * scale).astype(np.int64), 0, cells - 1)
+        morton = np.zeros(self.n_bodies, dtype=np.int64)
+        for bit in range(depth):
+            morton |= ((ix >> bit) & 1) << (2 * bit)
+            morton |= ((iy >> bit) & 1) << (2 * bit + 1)
+
+        order = np.argsort(morton, kind="stable")
+        morton = morton[order]
+        xs, ys, masses = xs[order], ys[order], masses[order]
+
+        levels = []
+        active = np.arange(self.n_bodies)
+        parent_keys = None
+        parent_ids = None
+        next_id = 0
+        for level in range(depth + 1):
+            keys = morton[active] >> (2 * (depth - level))
+            starts = np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+            counts = np.diff(np.append(starts, keys.size))
+            node_keys = keys[starts]
+
+            m = masses[active]
+            total = np.add.reduceat(m, starts)
+            cx = np.add.reduceat(m * xs[active], starts) / total
+            cy = np.add.reduceat(m * ys[active], starts) / total
+            dx = xs[active] - np.repeat(cx, counts)
+            dy = ys[active] - np.repeat(cy, counts)
+            sxx = np.add.reduceat(m * dx * dx, starts)
+            syy = np.add.reduceat(m * dy * dy, starts)
+            sxy = np.add.reduceat(m * dx * dy, starts)
+
+            ids = next_id + np.arange(starts.size)
+            next_id += starts.size
+            parent = None
+            if parent_keys is not None:
+                parent = parent_ids[np.searchsorted(parent_keys, node_keys >> 2)]
+            levels.append((ids, parent, total, cx, cy, sxx, syy, sxy, root_size / (1 << level)))
+
+            # 천체가 둘 이상인 셀만 다음 깊이로 분할
+            split = counts > 1
+            if level == depth or not split.any():
+                break
+            parent_keys = node_keys[split]
+            parent_ids = ids[split]
+            active = active[np.repeat(split, counts)]
+
+        n_nodes = next_id
+        self.com_x = np.concatenate([lv[3] for lv in levels])
+        self.com_y = np.concatenate([lv[4] for lv in levels])
+        self.mass = np.concatenate([lv[2] for lv in levels])
+        sxx = np.concatenate([lv[5] for lv in levels])
+        syy = np.concatenate([lv[6] for lv in levels])
+        self.q_xx = 2.0 * sxx - syy
+        self.q_yy = 2.0 * syy - sxx
+        self.q_xy = 3.0 * np.concatenate([lv[7] for lv in levels])
+        self.size = np.concatenate([np.full(lv[0].size, lv[8]) for lv in levels])
+
+        # 형제는 연속 인덱스이므로 부모별 첫 자식과 자식 수만 기록
+        self.first_child = np.zeros(n_nodes, dtype=np.intp)
+        self.child_count = np.zeros(n_nodes, dtype=np.intp)
+        for ids, parent, *_ in levels[1:]:
+            self.child_count += np.bincount(parent, minlength=n_nodes)
+            first = np.full(n_nodes, n_nodes, dtype=np.intp)
+            np.minimum.at(first, parent, ids)
+            has = first < n_nodes
+            self.first_child[has] = first[has]
+
+    @property
+    def n_nodes(self) -> int:
+        """노드 수"""
+        return self.mass.size
+
+    def _expansion(
+        self,
+        node: "np.ndarray",
+        dx: "np.ndarray",
+        dy: "np.ndarray",
+        distance: "np.ndarray"
+    ) -> "np.ndarray":
+        """노드의 단극 + 사극 전개 값 (distance = inf인 쌍은 0)"""
+        r2 = distance * distance
+        quadrupole = (
+            self.q_xx[node] * dx * dx
+            + 2.0 * self.q_xy[node] * dx * dy
+            + self.q_yy[node] * dy * dy
+        ) / (2.0 * r2 * r2 * distance)
+        return self.mass[node] / distance + quadrupole
+
+    def _children_of(self, node: "np.ndarray", count: "np.ndarray") -> "np.ndarray":
+        """열린 노드들의 자식 노드 인덱스 (부모 순서대로 펼침)"""
+        offsets = np.arange(int(count.sum())) - np.repeat(np.cumsum(count) - count, count)
+        return np.repeat(self.first_child[node], count) + offsets
+
+    def mass_over_distance(
+        self,
+        xs: "np.ndarray",
+        ys: "np.ndarray",
+        opening_angle: float = 0.5,
+        chunk_size: int = 16384
+    ) -> "np.ndarray":
+        """Σ m_i / r_i 근사 (부호와 G 제외)
+
+        Args:
+            xs, ys: 같은 shape의 평가점 좌표 배열
+            opening_angle: 열림 각도 θ (작을수록 정확, 0이면 직접 합)
+            chunk_size: 한 번에 처리할 평가점 수 (쌍 배열 메모리 제한)
+
+        Returns:
+            xs와 같은 shape의 배열 (천체 위치와 겹치는 점의 자기 기여는 0)
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        flat_x = xs.ravel()
+        flat_y = ys.ravel()
+        result = np.empty(flat_x.size, dtype=np.float64)
+        for start in range(0, flat_x.size, chunk_size):
+            stop = min(start + chunk_size, flat_x.size)
+            result[start:stop] = self._evaluate(flat_x[start:stop], flat_y[start:stop], opening_angle)
+        return result.reshape(xs.shape)
+
+    def _evaluate(self, xs: "np.ndarray", ys: "np.ndarray", opening_angle: float) -> "np.ndarray":
+        """평가점 묶음 하나 처리 (깊이 단계별 벡터화)"""
+        n_points = xs.size
+        total = np.zeros(n_points, dtype=np.float64)
+        point = np.arange(n_points)
+        node = np.zeros(n_points, dtype=np.intp)
+
+        while point.size:
+            dx = xs[point] - self.com_x[node]
+            dy = ys[point] - self.com_y[node]
+            distance = np.hypot(dx, dy)
+            count = self.child_count[node]
+            accept = (count == 0) | (self.size[node] < opening_angle * distance)
+
+            # 채택된 쌍: 단극 + 사극 항 (r = 0은 기여 없음)
+            use = accept & (distance > 0)
+            if use.any():
+                total += np.bincount(
+                    point[use],
+                    weights=self._expansion(node[use], dx[use], dy[use], distance[use]),
+                    minlength=n_points
+                )
+
+            # 열린 쌍: 자식 노드로 확장
+            opened = ~accept
+            count = count[opened]
+            point = np.repeat(point[opened], count)
+            node = self._children_of(node[opened], count)
+
+        return total
+
+    def mass_over_distance_grid(
+        self,
+        xs: "np.ndarray",
+        ys: "np.ndarray",
+        opening_angle: float = 0.5,
+        tile: int = 8,
+        max_pair_points: int = 1 << 20
+    ) -> "np.ndarray":
+        """규칙 격자 위의 Σ m_i / r_i 근사 (부호와 G 제외)
+
+        격자점을 tile × tile 묶음으로 나눠 묶음 단위로 트리를 순회한다.
+        묶음 안의 모든 점에 대해 열림 기준을 만족하도록
+        (셀 한 변) < θ * (질량 중심 ~ 묶음 중심 거리 - 묶음 반지름)으로 판정한다.
+
+        Args:
+            xs: x 좌표 배열, shape (nx,)
+            ys: y 좌표 배열, shape (ny,)
+            opening_angle: 열림 각도 θ
+            tile: 묶음 한 변의 격자점 수
+            max_pair_points: 한 번에 계산할 (채택 노드 × 묶음 점) 수 상한
+
+        Returns:
+            배열, shape (nx, ny), [i, j]는 점 (xs[i], ys[j])의 값
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        nx, ny = xs.size, ys.size
+        tiles_x = -(-nx // tile)
+        tiles_y = -(-ny // tile)
+
+        # 묶음 크기의 배수로 채움 (채운 점은 마지막 좌표 반복, 결과에서 잘라냄)
+        px = np.concatenate([xs, np.full(tiles_x * tile - nx, xs[-1])]).reshape(tiles_x, 1, tile, 1)
+        py = np.concatenate([ys, np.full(tiles_y * tile - ny, ys[-1])]).reshape(1, tiles_y, 1, tile)
+        # (묶음, 묶음 내 점) 좌표: 묶음 인덱스 = tx * tiles_y + ty
+        shape = (tiles_x, tiles_y, tile, tile)
+        tile_x = np.broadcast_to(px, shape).reshape(tiles_x * tiles_y, tile * tile)
+        tile_y = np.broadcast_to(py, shape).reshape(tiles_x * tiles_y, tile * tile)
+
+        x_lo, x_hi = tile_x.min(axis=1), tile_x.max(axis=1)
+        y_lo, y_hi = tile_y.min(axis=1), tile_y.max(axis=1)
+        center_x = 0.5 * (x_lo + x_hi)
+        center_y = 0.5 * (y_lo + y_hi)
+        radius = 0.5 * np.hypot(x_hi - x_lo, y_hi - y_lo)
+
+        n_tiles, per_tile = tile_x.shape
+        total = np.zeros((n_tiles, per_tile), dtype=np.float64)
+        pair_tile = np.arange(n_tiles)
+        node = np.zeros(n_tiles, dtype=np.intp)
+        batch = max(1, max_pair_points // per_tile)
+
+        while pair_tile.size:
+            distance = np.hypot(center_x[pair_tile] - self.com_x[node], center_y[pair_tile] - self.com_y[node])
+            count = self.child_count[node]
+            accept = (count == 0) | (self.size[node] < opening_angle * (distance - radius[pair_tile]))
+
+            # 채택된 (묶음, 노드) 쌍: 묶음 전체 점에 대해 단극 + 사극 항
+            # (묶음별로 정렬하여 구간 합으로 누적, r = 0은 기여 없음)
+            accepted_tile = pair_tile[accept]
+            accepted_node = node[accept]
+            order = np.argsort(accepted_tile, kind="stable")
+            accepted_tile = accepted_tile[order]
+            accepted_node = accepted_node[order]
+            for start in range(0, accepted_tile.size, batch):
+                t = accepted_tile[start:start + batch]
+                k = accepted_node[start:start + batch, np.newaxis]
+                dx = tile_x[t] - self.com_x[k]
+                dy = tile_y[t] - self.com_y[k]
+                r = np.hypot(dx, dy)
+                r[r == 0] = np.inf
+                contribution = self._expansion(k, dx, dy, r)
+                runs = np.flatnonzero(np.concatenate([[True], t[1:] != t[:-1]]))
+                total[t[runs]] += np.add.reduceat(contribution, runs, axis=0)
+
+            # 열린 쌍: 자식 노드로 확장
+            opened = ~accept
+            count = count[opened]
+            pair_tile = np.repeat(pair_tile[opened], count)
+            node = self._children_of(node[opened], count)
+
+        grid = total.reshape(shape).transpose(0, 2, 1, 3)
+        return grid.reshape(tiles_x * tile, tiles_y * tile)[:nx, :ny].copy()
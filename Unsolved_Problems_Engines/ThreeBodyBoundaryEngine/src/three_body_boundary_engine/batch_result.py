@@ -0,0 +1,157 @@
+"""
+Batch Result - 열 기반 배치 실행 결과 (L0/L1/L2 통합 반환, struct-of-arrays)
+
+엔진 번호: UP-1
+역할: run_batch()의 결과를 시스템별 객체 대신 StabilityAnalysis 필드별 NumPy 열로 보관
+
+구성:
+- 열: converged / mismatch / iteration / boundary_points / stability_score / convergence_rate
+  (행 i = 입력 i번째 시스템)
+- failure_atlas / search_bias: 배치 전체가 공유 (EngineRunResult처럼 행마다 두지 않음)
+
+저장:
+- ".npz" 경로: 배치가 끝난 뒤 열을 한 파일로 저장 (np.savez)
+- 그 밖의 경로: 디렉터리에 열마다 "<열 이름>.npy" 메모리 맵을 만들고 결과가 나오는 대로 기록
+  → 결과 열이 메모리에 올라오지 않음, BatchRunResult.load()는 mmap_mode="r"로 다시 엶
+- 실패 지도 / 편향은 파일에 포함하지 않음 (FailureStore / 샤드 형식 사용)
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterator, Optional, Union
+
+from .models import Body, NBodySystem, StabilityAnalysis, ThreeBodySystem
+from .point import Point
+from .failure_atlas import FailureAtlas
+from .failure_bias_converter import SearchBias
+from ._compat import np, require_numpy
+
+
+# (열 이름, dtype) — StabilityAnalysis 필드 순서
+BATCH_COLUMNS = (
+    ("converged", "bool"),
+    ("mismatch", "float64"),
+    ("iteration", "int64"),
+    ("boundary_points", "int64"),
+    ("stability_score", "float64"),
+    ("convergence_rate", "float64"),
+)
+
+
+def _validate_arrays(masses, positions) -> tuple:
+    """(masses (n, k), positions (n, k, 2)) 검증"""
+    masses = np.asarray(masses, dtype=np.float64)
+    positions = np.asarray(positions, dtype=np.float64)
+    if masses.ndim != 2 or masses.shape[1] < 1:
+        raise ValueError(f"masses는 (시스템 수, 천체 수) 배열이어야 합니다: {masses.shape}")
+    if positions.shape != masses.shape + (2,):
+        raise ValueError(
+            f"positions는 (시스템 수, 천체 수, 2) 배열이어야 합니다: {positions.shape} "
+            f"(masses {masses.shape})"
+        )
+    if masses.size and masses.min() <= 0:
+        raise ValueError("질량은 양수여야 합니다")
+    return masses, positions
+
+
+def iter_systems_from_arrays(
+    masses,
+    positions,
+    gravitational_constant: float = 1.0
+) -> Iterator[Union[ThreeBodySystem, NBodySystem]]:
+    """질량/위치 배열 → 시스템 (지연 생성)
+
+    Args:
+        masses: (n, k) 질량
+        positions: (n, k, 2) 위치
+        gravitational_constant: 시스템 G
+
+    Yields:
+        천체가 3개면 ThreeBodySystem, 아니면 NBodySystem
+    """
+    require_numpy("iter_systems_from_arrays")
+    masses, positions = _validate_arrays(masses, positions)
+    for row_masses, row_positions in zip(masses.tolist(), positions.tolist()):
+        bodies = [
+            Body(position=Point(x, y), mass=mass)
+            for mass, (x, y) in zip(row_masses, row_positions)
+        ]
+        if len(bodies) == 3:
+            yield ThreeBodySystem(*bodies, gravitational_constant=gravitational_constant)
+        else:
+            yield NBodySystem(bodies, gravitational_constant=gravitational_constant)
+
+
+def _allocate_columns(rows: int, output: Optional[str]) -> Dict[str, "np.ndarray"]:
+    """결과 열 할당 (output이 디렉터리면 .npy 메모리 맵)"""
+    if output is None or output.endswith(".npz"):
+        return {name: np.zeros(rows, dtype=dtype) for name, dtype in BATCH_COLUMNS}
+    os.makedirs(output, exist_ok=True)
+    return {
+        name: np.lib.format.open_memmap(
+            os.path.join(output, f"{name}.npy"), mode="w+", dtype=dtype, shape=(rows,)
+        )
+        for name, dtype in BATCH_COLUMNS
+    }
+
+
+@dataclass
+class BatchRunResult:
+    """배치 통합 실행 결과 (열 기반)
+
+    - 열 (길이 = 시스템 수): converged, mismatch, iteration, boundary_points,
+      stability_score, convergence_rate
+    - failure_atlas: L1 누적 결과 (배치 공유)
+    - search_bias: L2 출력 (배치 끝에서 한 번 계산)
+    """
+
+    converged: "np.ndarray"
+    mismatch: "np.ndarray"
+    iteration: "np.ndarray"
+    boundary_points: "np.ndarray"
+    stability_score: "np.ndarray"
+    convergence_rate: "np.ndarray"
+    failure_atlas: Optional[FailureAtlas] = None
+    search_bias: Optional[SearchBias] = None
+
+    def __len__(self) -> int:
+        return len(self.mismatch)
+
+    @property
+    def columns(self) -> Dict[str, "np.ndarray"]:
+        """열 이름 → 배열"""
+        return {name: getattr(self, name) for name, _ in BATCH_COLUMNS}
+
+    def analysis(self, index: int) -> StabilityAnalysis:
+        """행 하나를 StabilityAnalysis로 복원"""
+        return StabilityAnalysis(
+            converged=bool(self.converged[index]),
+            mismatch=float(self.mismatch[index]),
+            iteration=int(self.iteration[index]),
+            boundary_points=int(self.boundary_points[index]),
+            stability_score=float(self.stability_score[index]),
+            convergence_rate=float(self.convergence_rate[index])
+        )
+
+    def stable_mask(self, threshold: float = 0.1) -> "np.ndarray":
+        """StabilityAnalysis.is_stable()의 벡터화 판정"""
+        return (self.mismatch < threshold) & self.converged
+
+    def save(self, path: str) -> None:
+        """열을 .npz 파일로 저장"""
+        np.savez(path, **self.columns)
+
+    @classmethod
+    def load(cls, path: str) -> "BatchRunResult":
+        """.npz 파일 또는 메모리 맵 디렉터리에서 열 읽기 (디렉터리는 읽기 전용 메모리 맵)"""
+        require_numpy("BatchRunResult.load")
+        if os.path.isdir(path):
+            return cls(**{
+                name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r")
+                for name, _ in BATCH_COLUMNS
+            })
+        with np.load(path) as data:
+            return cls(**{name: data[name] for name, _ in BATCH_COLUMNS})
@@ -12,8 +12,10 @@ Version: 1.2.0
 """
 
 import math
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 from .point import Point
+from .scalar_field import ScalarField
+from .adaptive_field import AdaptiveField
 from dataclasses import dataclass
 
 
@@ -113,12 +115,13 @@ class BoundaryConvergenceAdapter:
     
     def converge(
         self,
-        importance_weights: Optional[Dict[Point, float]] = None
+        importance_weights: Optional[Union[ScalarField, AdaptiveField, Dict[Point, float]]] = None
     ) -> ConvergenceResult:
         """경계 수렴 실행
         
         Args:
-            importance_weights: 중요도 가중치 (밀도 분포)
+            importance_weights: 중요도 가중치 (밀도 분포).
+                ScalarField, AdaptiveField 또는 기존 {Point: value} 딕셔너리.
         
         Returns:
             수렴 결과
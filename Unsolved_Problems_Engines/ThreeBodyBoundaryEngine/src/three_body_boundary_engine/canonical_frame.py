@@ -0,0 +1,186 @@
+"""
+Canonical Frame - 삼체 시스템 정규화 (평행이동/회전/스케일)
+
+엔진 번호: UP-1
+역할: 강체 운동·균일 스케일만 다른 시스템을 하나의 정규형으로 사상
+
+정규형:
+1. 질량 중심을 원점으로 이동
+2. 질량 가중 2차 모멘트의 주축을 x축에 정렬
+3. 최대 천체 간 거리를 1로 정규화
+4. 부호 모호성 제거: Σm·x³ ≥ 0, Σm·y³ ≥ 0 (필요 시 축 반전)
+5. 천체 순서 정렬 (질량, x, y)
+
+⚠️ 주의:
+- 축 반전(거울상)도 같은 정규형으로 묶는다 (퍼텐셜은 거울 대칭에 불변).
+- 속도는 같은 회전/반전 후 √scale 배 (G, 질량 고정 시 동역학 상사).
+- StabilityAnalysis는 스칼라 결과이므로 원래 좌표계로 그대로 반환된다.
+  좌표가 필요한 경우 CanonicalTransform.to_original()로 되돌린다.
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from .point import Point
+from .models import Body
+
+
+# 주축/부호 판정 시 수치 잡음으로 간주할 상대 허용 오차
+_DEGENERACY_TOLERANCE = 1e-9
+
+
+@dataclass(frozen=True)
+class CanonicalTransform:
+    """원래 좌표계 → 정규 좌표계 변환
+
+    p_canonical = F · R(-θ) · (p - center) / scale
+    (F: y축 반전 여부, x축 반전은 θ에 π를 더해 표현)
+    """
+    center: Tuple[float, float]
+    angle: float
+    scale: float
+    reflected: bool = False
+
+    def to_canonical(self, point: Point) -> Point:
+        """원래 좌표 → 정규 좌표"""
+        cos_a, sin_a = math.cos(self.angle), math.sin(self.angle)
+        dx = point.x - self.center[0]
+        dy = point.y - self.center[1]
+        x = (cos_a * dx + sin_a * dy) / self.scale
+        y = (-sin_a * dx + cos_a * dy) / self.scale
+        return Point(x, -y if self.reflected else y)
+
+    def to_original(self, point: Point) -> Point:
+        """정규 좌표 → 원래 좌표"""
+        cos_a, sin_a = math.cos(self.angle), math.sin(self.angle)
+        x = point.x * self.scale
+        y = (-point.y if self.reflected else point.y) * self.scale
+        return Point(
+            self.center[0] + cos_a * x - sin_a * y,
+            self.center[1] + sin_a * x + cos_a * y
+        )
+
+    def velocity_to_canonical(self, velocity: Point) -> Point:
+        """속도 벡터 변환 (회전/반전 + √scale 배)"""
+        cos_a, sin_a = math.cos(self.angle), math.sin(self.angle)
+        factor = math.sqrt(self.scale)
+        vx = (cos_a * velocity.x + sin_a * velocity.y) * factor
+        vy = (-sin_a * velocity.x + cos_a * velocity.y) * factor
+        return Point(vx, -vy if self.reflected else vy)
+
+
+@dataclass(frozen=True)
+class CanonicalSystem:
+    """정규화 결과
+
+    - system: 정규 좌표계의 시스템 (원래와 같은 타입)
+    - transform: 원래 → 정규 좌표 변환
+    - permutation: 정규 시스템의 k번째 천체 = 원래 시스템의 permutation[k]번째 천체
+    """
+    system: object
+    transform: CanonicalTransform
+    permutation: Tuple[int, ...]
+
+
+def _principal_angle(bodies: List[Body], cx: float, cy: float) -> Optional[float]:
+    """질량 가중 2차 모멘트의 장축 각도 (등방성이면 None)"""
+    sxx = syy = sxy = 0.0
+    for body in bodies:
+        dx = body.position.x - cx
+        dy = body.position.y - cy
+        sxx += body.mass * dx * dx
+        syy += body.mass * dy * dy
+        sxy += body.mass * dx * dy
+
+    anisotropy = math.hypot(sxx - syy, 2.0 * sxy)
+    if anisotropy <= _DEGENERACY_TOLERANCE * max(sxx + syy, 1e-300):
+        return None
+    return 0.5 * math.atan2(2.0 * sxy, sxx - syy)
+
+
+def _anchor_angle(bodies: List[Body], cx: float, cy: float) -> float:
+    """등방성 배치의 기준 각도: 관성 기여(m·r²)가 가장 큰 천체 방향"""
+    anchor = max(
+        bodies,
+        key=lambda b: (
+            round(b.mass * ((b.position.x - cx) ** 2 + (b.position.y - cy) ** 2), 9),
+            round(b.mass, 9)
+        )
+    )
+    return math.atan2(anchor.position.y - cy, anchor.position.x - cx)
+
+
+def _third_moment(values: List[Tuple[float, float]]) -> float:
+    """Σ m·v³ (수치 잡음 제거)"""
+    moment = sum(mass * v ** 3 for mass, v in values)
+    scale = sum(mass * abs(v) ** 3 for mass, v in values)
+    return 0.0 if abs(moment) <= _DEGENERACY_TOLERANCE * max(scale, 1e-300) else moment
+
+
+def canonicalize_system(system) -> CanonicalSystem:
+    """시스템 정규화
+
+    Args:
+        system: get_all_bodies() / with_bodies()를 제공하는 시스템 (ThreeBodySystem 등)
+
+    Returns:
+        CanonicalSystem (정규 시스템 + 변환 + 천체 순서)
+    """
+    bodies = system.get_all_bodies()
+    total_mass = sum(body.mass for body in bodies)
+    cx = sum(body.mass * body.position.x for body in bodies) / total_mass
+    cy = sum(body.mass * body.position.y for body in bodies) / total_mass
+
+    # 정규화 스케일: 최대 천체 간 거리
+    scale = 0.0
+    for i in range(len(bodies)):
+        for j in range(i + 1, len(bodies)):
+            scale = max(scale, bodies[i].position.distance_to(bodies[j].position))
+    if scale == 0.0:
+        scale = 1.0
+
+    angle = _principal_angle(bodies, cx, cy)
+    if angle is None:
+        angle = _anchor_angle(bodies, cx, cy)
+
+    transform = CanonicalTransform(center=(cx, cy), angle=angle, scale=scale)
+    rotated = [transform.to_canonical(body.position) for body in bodies]
+
+    # 부호 모호성 제거: x축 방향은 θ+π, y축 방향은 반전으로 고정
+    flip_x = _third_moment([(b.mass, p.x) for b, p in zip(bodies, rotated)]) < 0
+    flip_y = _third_moment([(b.mass, p.y) for b, p in zip(bodies, rotated)]) < 0
+    if flip_x:
+        # x 반전 = 180도 회전 + y 반전
+        angle += math.pi
+        flip_y = not flip_y
+    transform = CanonicalTransform(center=(cx, cy), angle=angle, scale=scale, reflected=flip_y)
+
+    canonical_bodies = []
+    for body in bodies:
+        velocity = None
+        if body.velocity is not None:
+            velocity = transform.velocity_to_canonical(body.velocity)
+        canonical_bodies.append(
+            Body(position=transform.to_canonical(body.position), mass=body.mass, velocity=velocity)
+        )
+
+    # 천체 순서 정렬 (양자화하여 수치 잡음에 안정)
+    permutation = tuple(sorted(
+        range(len(canonical_bodies)),
+        key=lambda k: (
+            round(canonical_bodies[k].mass, 9),
+            round(canonical_bodies[k].position.x, 9),
+            round(canonical_bodies[k].position.y, 9)
+        )
+    ))
+    ordered = [canonical_bodies[k] for k in permutation]
+
+    return CanonicalSystem(
+        system=system.with_bodies(ordered),
+        transform=transform,
+        permutation=permutation
+    )
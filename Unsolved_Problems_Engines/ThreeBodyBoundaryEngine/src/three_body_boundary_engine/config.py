@@ -5,10 +5,11 @@ ThreeBodyBoundaryEngine Configuration
 역할: 삼체 문제 경계 정합 분석 설정
 
 Author: GNJz (Qquarts)
-Version: 1.2.0
+Version: 1.2.1
 """
 
 from dataclasses import dataclass
+from typing import Optional, Tuple
 
 
 @dataclass
@@ -19,9 +20,39 @@ class ThreeBodyConfig:
     gravitational_constant: float = 1.0  # G (정규화)
     potential_resolution: int = 100  # 퍼텐셜 계산 해상도
     
+    # 다체 퍼텐셜 파라미터
+    # 천체 수가 direct_sum_threshold를 넘으면 Barnes-Hut 트리(열림 각도 θ)로 근사
+    opening_angle: float = 0.7
+    direct_sum_threshold: int = 512
+    
+    # 층 재사용 허용 거리 (PotentialFieldBuilder)
+    # 0이면 위치가 정확히 같은 천체만, 양수면 이 거리 이내로 움직인 천체의 층도 재사용
+    layer_reuse_tolerance: float = 0.0
+    
+    # 선별 모드 (coarse-to-fine) 파라미터
+    # 설정하면 이 해상도들(potential_resolution 미만)부터 분석하고,
+    # mismatch가 stability_threshold의 ±screening_band 이내일 때만 해상도를 올린다.
+    screening_resolutions: Optional[Tuple[int, ...]] = None
+    screening_band: float = 0.25
+    
+    # 적응형 필드 파라미터
+    # 설정하면 균일 격자 대신 사분트리 AdaptiveField 사용 (곡률 상대 허용치).
+    # 가장 작은 셀은 potential_resolution 격자 간격과 같거나 더 작다.
+    adaptive_tolerance: Optional[float] = None
+    
     # 밀도 변환 파라미터
     density_normalization: str = "max"  # "max" or "sum"
     
+    # 필드 정밀도 ("float64" or "float32")
+    # float32면 균일 격자 필드의 층 / 합산 / 밀도 정규화를 float32로 수행 (메모리·대역폭 절반).
+    # 적응형 필드와 NumPy 없는 딕셔너리 경로는 float64 유지
+    field_precision: str = "float64"
+    
+    # 정규화 파라미터
+    # True이면 범위 자동 계산 시 평행이동/회전/스케일 정규형에서 분석
+    # (강체 운동·균일 스케일만 다른 시스템이 같은 계산/캐시 항목을 공유)
+    canonicalize: bool = False
+    
     # 경계 정합 분석 파라미터
     stability_threshold: float = 0.1  # 안정성 판정 임계값
     collapse_threshold: float = 1.0  # 붕괴 판정 임계값
@@ -44,4 +75,18 @@ class ThreeBodyConfig:
             raise ValueError("안정성 임계값은 양수여야 합니다")
         if self.boundary_radius <= 0:
             raise ValueError("경계 반지름은 양수여야 합니다")
+        if self.screening_resolutions is not None:
+            self.screening_resolutions = tuple(self.screening_resolutions)
+            if any(r <= 0 for r in self.screening_resolutions):
+                raise ValueError("선별 해상도는 양수여야 합니다")
+        if self.layer_reuse_tolerance < 0:
+            raise ValueError("층 재사용 허용 거리는 0 이상이어야 합니다")
+        if self.opening_angle < 0:
+            raise ValueError("열림 각도는 0 이상이어야 합니다")
+        if self.adaptive_tolerance is not None and self.adaptive_tolerance <= 0:
+            raise ValueError("적응형 필드 허용치는 양수여야 합니다")
+        if self.screening_band < 0:
+            raise ValueError("선별 불확실 대역은 0 이상이어야 합니다")
+        if self.field_precision not in ("float64", "float32"):
+            raise ValueError(f"알 수 없는 필드 정밀도: {self.field_precision} (float64 또는 float32)")
 
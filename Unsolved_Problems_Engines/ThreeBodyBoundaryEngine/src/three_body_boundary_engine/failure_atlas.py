@@ -15,16 +15,51 @@ ThreeBodyBoundaryEngine - 실패 구조 축적 레이어 (L1)
 - L0의 정체성 유지 (L0는 건드리지 않음)
 - 실패를 "기억"으로 변환
 
+저장 구조 (열 기반):
+- FailureColumns: 필드별 array.array 열 + 조건 서명 문자열 인턴 테이블
+- FailureRecord는 호출자가 요청할 때만 행에서 생성 (failure_records / failure_manifold는 뷰)
+- 통계·분류표·편향 변환은 열 단위 축약 (NumPy가 있으면 벡터화)
+- 파일 기반 영구 저장은 같은 접근 메서드를 구현한 failure_store.FailureStore
+- 병렬 스윕: 워커별 지도를 merge_from()으로 열 단위 병합, FailureSummary는 요약끼리 병합
+
 Author: GNJz (Qquarts)
 Version: 1.2.0
 """
 
+import re
+from array import array
+from collections.abc import Sequence as SequenceABC
+from itertools import combinations
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Tuple
+from typing import Iterator, List, Dict, Optional, Sequence, Tuple, Union
 from datetime import datetime
 from enum import Enum
 from .models import StabilityAnalysis, ThreeBodySystem
 from .point import Point
+from .signature_index import SignatureIndex
+from ._compat import HAS_NUMPY, np
+
+
+# 조건 서명 문자열 형식: mass_(질량...)_dist_(거리...)_mismatch_0.000
+_SIGNATURE_PATTERN = re.compile(r"^mass_\((.*)\)_dist_\((.*)\)_mismatch_(.*)$")
+_SIGNATURE_LABELS = ("mass", "dist", "mismatch")
+
+
+def _parse_signature_features(signature: str) -> Optional[Tuple[float, ...]]:
+    """조건 서명 문자열 → 특징 벡터 (형식이 다르면 None)
+
+    문자열의 거리는 소수 둘째 자리, mismatch는 셋째 자리로 반올림되어 있다.
+    """
+    match = _SIGNATURE_PATTERN.match(signature)
+    if match is None:
+        return None
+    try:
+        masses = [float(v) for v in match.group(1).split(",") if v.strip()]
+        distances = [float(v) for v in match.group(2).split(",") if v.strip()]
+        mismatch = float(match.group(3))
+    except ValueError:
+        return None
+    return tuple(masses + distances + [mismatch])
 
 
 class CollapseMode(Enum):
@@ -64,11 +99,19 @@ class FailureRecord:
     iteration: int = 0  # 반복 횟수
     boundary_points: int = 0  # 경계 점 개수
     
+    # 수치 서명 (질량 내림차순, 쌍별 거리 오름차순, mismatch)
+    # condition_signature 문자열은 표시용, 유사도 질의는 이 벡터를 사용
+    signature_features: Optional[Tuple[float, ...]] = None
+    
     def __post_init__(self):
         """검증 및 자동 계산"""
         # 붕괴 심각도 자동 계산
         if self.collapse_severity == 0.0:
             self.collapse_severity = self._calculate_severity()
+        
+        # 수치 서명이 없으면 서명 문자열에서 복원
+        if self.signature_features is None:
+            self.signature_features = _parse_signature_features(self.condition_signature)
     
     def _calculate_severity(self) -> float:
         """붕괴 심각도 계산"""
@@ -94,6 +137,459 @@ class FailureRecord:
             return "unknown"
 
 
+# 붕괴 모드 코드 (열 저장용, 정의 순서)
+_COLLAPSE_MODES = tuple(CollapseMode)
+_MODE_CODES = {mode: code for code, mode in enumerate(_COLLAPSE_MODES)}
+
+# array typecode → NumPy dtype
+_NUMPY_DTYPES = {"d": "float64", "b": "int8", "i": "int32", "q": "int64"}
+
+
+class FailureColumns:
+    """열 기반 실패 기록 저장소
+    
+    행 i = 기록 i. 각 열은 array.array (표준 라이브러리, 연속 버퍼).
+    - signature_id: 서명 인턴 테이블 인덱스 (같은 서명 문자열은 한 번만 저장)
+    - feature_start / feature_dim: features 평탄 배열에서 수치 서명 구간 (dim 0 = 없음)
+    - spatial_pattern은 드물어서 행 → 딕셔너리로 따로 보관
+    
+    FailureAtlas와 편향 변환기는 접근 메서드(value / column / iter_column /
+    feature_values / feature_block / signature_text / intern)만 사용한다.
+    파일 기반 저장소(failure_store.FailureStore)는 이 메서드들을 재정의한다.
+    """
+    
+    # (열 이름, array typecode)
+    COLUMNS = (
+        ("timestamp", "d"),
+        ("delta_threshold_crossed", "d"),
+        ("mismatch", "d"),
+        ("convergence_rate", "d"),
+        ("converged", "b"),
+        ("stability_score", "d"),
+        ("collapse_mode", "b"),
+        ("collapse_severity", "d"),
+        ("iteration", "q"),
+        ("boundary_points", "q"),
+        ("signature_id", "q"),
+        ("feature_start", "q"),
+        ("feature_dim", "i"),
+    )
+    
+    def __init__(self):
+        self.signatures: List[str] = []
+        self._signature_ids: Dict[str, int] = {}
+        self._reset_columns()
+    
+    def _reset_columns(self) -> None:
+        """열 비우기 (서명 테이블 유지)"""
+        for name, typecode in self.COLUMNS:
+            setattr(self, name, array(typecode))
+        self.features = array("d")
+        self.spatial_patterns: Dict[int, Dict[str, float]] = {}
+        # 행 삭제/재배열 시 증가 (행 번호 기반 색인 무효화 판정용)
+        self.generation = getattr(self, "generation", -1) + 1
+    
+    def __len__(self) -> int:
+        return len(self.timestamp)
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(rows={len(self)}, signatures={self.signature_count})"
+    
+    def __eq__(self, other) -> bool:
+        """값 비교: 행마다 기록 (열 값, 서명 문자열, 수치 서명, 공간 패턴)이 같으면 같음
+        
+        인턴 테이블 순서 / 미사용 서명 / 저장 방식 (메모리·파일)은 비교하지 않는다.
+        """
+        if not isinstance(other, FailureColumns):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        return all(self.record(row) == other.record(row) for row in range(len(self)))
+    
+    __hash__ = None
+    
+    @property
+    def nbytes(self) -> int:
+        """메모리 열 버퍼 크기 합 (바이트, 서명 테이블 제외)"""
+        buffers = [getattr(self, name) for name, _ in self.COLUMNS] + [self.features]
+        return sum(len(buffer) * buffer.itemsize for buffer in buffers)
+    
+    @property
+    def signature_count(self) -> int:
+        """인턴된 서명 수"""
+        return len(self.signatures)
+    
+    def signature_text(self, signature_id: int) -> str:
+        """인턴 테이블 인덱스 → 서명 문자열"""
+        return self.signatures[signature_id]
+    
+    def intern(self, signature: str) -> int:
+        """서명 문자열 → 인턴 테이블 인덱스"""
+        signature_id = self._signature_ids.get(signature)
+        if signature_id is None:
+            signature_id = len(self.signatures)
+            self.signatures.append(signature)
+            self._signature_ids[signature] = signature_id
+        return signature_id
+    
+    def _next_feature_start(self) -> int:
+        """다음 수치 서명이 들어갈 features 위치"""
+        return len(self.features)
+    
+    def append(self, record: FailureRecord) -> int:
+        """기록 추가
+        
+        Returns:
+            추가된 행 번호
+        """
+        row = len(self)
+        features = record.signature_features or ()
+        self.timestamp.append(record.timestamp)
+        self.delta_threshold_crossed.append(record.delta_threshold_crossed)
+        self.mismatch.append(record.mismatch)
+        self.convergence_rate.append(record.convergence_rate)
+        self.converged.append(bool(record.converged))
+        self.stability_score.append(record.stability_score)
+        self.collapse_mode.append(_MODE_CODES[record.collapse_mode])
+        self.collapse_severity.append(record.collapse_severity)
+        self.iteration.append(record.iteration)
+        self.boundary_points.append(record.boundary_points)
+        self.signature_id.append(self.intern(record.condition_signature))
+        self.feature_start.append(self._next_feature_start())
+        self.feature_dim.append(len(features))
+        self.features.extend(features)
+        if record.spatial_pattern is not None:
+            self.spatial_patterns[row] = record.spatial_pattern
+        return row
+    
+    def value(self, name: str, row: int):
+        """열 name의 row번째 값"""
+        return getattr(self, name)[row]
+    
+    def iter_column(self, name: str) -> Iterator:
+        """열 값 순회 (NumPy 없이 쓰는 경로)"""
+        return iter(getattr(self, name))
+    
+    def column(self, name: str, start: int = 0) -> "np.ndarray":
+        """열의 NumPy 복사본, start행부터 (array 버퍼를 붙잡지 않도록 복사)"""
+        buffer = getattr(self, name)
+        return np.frombuffer(buffer, dtype=_NUMPY_DTYPES[buffer.typecode])[start:].copy()
+    
+    def feature_values(self, start: int, dim: int) -> Tuple[float, ...]:
+        """features[start:start + dim]"""
+        return tuple(self.features[start:start + dim])
+    
+    def feature_block(self, starts: "np.ndarray", dim: int) -> "np.ndarray":
+        """같은 차원 수치 서명 묶음, shape (len(starts), dim)"""
+        flat = np.frombuffer(self.features, dtype=np.float64)
+        return flat[starts[:, np.newaxis] + np.arange(dim)]
+    
+    def signature(self, row: int) -> str:
+        """행의 조건 서명 문자열"""
+        return self.signature_text(self.value("signature_id", row))
+    
+    def features_of(self, row: int) -> Optional[Tuple[float, ...]]:
+        """행의 수치 서명 (없으면 None)"""
+        dim = self.value("feature_dim", row)
+        if dim == 0:
+            return None
+        return self.feature_values(self.value("feature_start", row), dim)
+    
+    def record(self, row: int) -> FailureRecord:
+        """행 → FailureRecord 생성"""
+        value = self.value
+        return FailureRecord(
+            condition_signature=self.signature(row),
+            timestamp=value("timestamp", row),
+            delta_threshold_crossed=value("delta_threshold_crossed", row),
+            mismatch=value("mismatch", row),
+            convergence_rate=value("convergence_rate", row),
+            converged=bool(value("converged", row)),
+            stability_score=value("stability_score", row),
+            collapse_mode=_COLLAPSE_MODES[value("collapse_mode", row)],
+            collapse_severity=value("collapse_severity", row),
+            spatial_pattern=self.spatial_patterns.get(row),
+            iteration=value("iteration", row),
+            boundary_points=value("boundary_points", row),
+            signature_features=self.features_of(row)
+        )
+    
+    def retain(self, rows: Sequence[int]) -> None:
+        """주어진 행만 (주어진 순서로) 남김"""
+        rows = list(rows)
+        if HAS_NUMPY and rows:
+            index = np.asarray(rows, dtype=np.int64)
+            flat, local = self._gather_features(
+                self, self.column("feature_start")[index], self.column("feature_dim")[index]
+            )
+            values = {name: self.column(name)[index] for name, _ in self.COLUMNS}
+            values["feature_start"] = local
+            old_patterns = self.spatial_patterns
+            self._reset_columns()
+            for name, typecode in self.COLUMNS:
+                getattr(self, name).frombytes(values[name].astype(_NUMPY_DTYPES[typecode]).tobytes())
+            self.features.frombytes(flat.tobytes())
+            if old_patterns:
+                for new_row, row in enumerate(rows):
+                    if row in old_patterns:
+                        self.spatial_patterns[new_row] = old_patterns[row]
+            return
+        old = {name: getattr(self, name) for name, _ in self.COLUMNS}
+        old_features = self.features
+        old_patterns = self.spatial_patterns
+        self._reset_columns()
+        for name, typecode in self.COLUMNS:
+            source = old[name]
+            setattr(self, name, array(typecode, [source[row] for row in rows]))
+        for new_row, row in enumerate(rows):
+            start, dim = old["feature_start"][row], old["feature_dim"][row]
+            self.feature_start[new_row] = len(self.features)
+            self.features.extend(old_features[start:start + dim])
+            if row in old_patterns:
+                self.spatial_patterns[new_row] = old_patterns[row]
+    
+    def drop_unused_signatures(self) -> int:
+        """행이 참조하지 않는 서명을 인턴 테이블에서 제거 (처음 나타난 순서로 재번호)
+        
+        Returns:
+            제거한 서명 수
+        """
+        ids = list(self.iter_column("signature_id"))
+        order = list(dict.fromkeys(ids))
+        removed = self.signature_count - len(order)
+        if removed == 0:
+            return 0
+        remap = {old_id: new_id for new_id, old_id in enumerate(order)}
+        self.signatures = [self.signatures[old_id] for old_id in order]
+        self._signature_ids = {signature: new_id for new_id, signature in enumerate(self.signatures)}
+        self.signature_id = array("q", [remap[old_id] for old_id in ids])
+        self.generation += 1
+        return removed
+    
+    @staticmethod
+    def _gather_features(
+        source: "FailureColumns",
+        starts: "np.ndarray",
+        dims: "np.ndarray"
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """행들의 수치 서명을 이어 붙인 평탄 배열과 행별 시작 위치"""
+        dims = dims.astype(np.int64)
+        local = np.cumsum(dims) - dims
+        flat = np.empty(int(dims.sum()))
+        for dim in np.unique(dims[dims > 0]).tolist():
+            selected = np.flatnonzero(dims == dim)
+            flat[local[selected, np.newaxis] + np.arange(dim)] = source.feature_block(starts[selected], dim)
+        return flat, local
+    
+    def extend_from(self, other: "FailureColumns") -> None:
+        """다른 저장소의 행을 뒤에 이어 붙임
+        
+        NumPy가 있으면 열 단위 일괄 복사 (서명은 처음 나타난 순서로 다시 인턴,
+        수치 서명은 행 순서대로 다시 채움). 결과는 other의 기록을 차례로
+        append()한 것과 같다.
+        """
+        count = len(other)
+        if count == 0:
+            return
+        if not HAS_NUMPY:
+            for row in range(count):
+                self.append(other.record(row))
+            return
+        
+        row_offset = len(self)
+        ids = other.column("signature_id")
+        unique, first = np.unique(ids, return_index=True)
+        remap = np.zeros(int(unique[-1]) + 1, dtype=np.int64)
+        for signature_id in unique[np.argsort(first, kind="stable")].tolist():
+            remap[signature_id] = self.intern(other.signature_text(signature_id))
+        
+        flat, local = self._gather_features(
+            other, other.column("feature_start"), other.column("feature_dim")
+        )
+        
+        replaced = {
+            "signature_id": remap[ids],
+            "feature_start": self._next_feature_start() + local,
+        }
+        for name, typecode in self.COLUMNS:
+            values = replaced[name] if name in replaced else other.column(name)
+            getattr(self, name).frombytes(values.astype(_NUMPY_DTYPES[typecode]).tobytes())
+        self.features.frombytes(flat.tobytes())
+        for row, pattern in other.spatial_patterns.items():
+            self.spatial_patterns[row_offset + row] = pattern
+    
+    def clear(self) -> None:
+        """모든 행과 서명 테이블 제거"""
+        self.signatures = []
+        self._signature_ids = {}
+        self._reset_columns()
+    
+    def first_occurrence_counts(self, name: str) -> List[Tuple[int, int]]:
+        """정수 열 값별 (값, 개수), 처음 나타난 순서"""
+        if HAS_NUMPY:
+            values, counts = self._first_occurrence(self.column(name))
+            return list(zip(values.tolist(), counts.tolist()))
+        counts: Dict[int, int] = {}
+        for value in self.iter_column(name):
+            counts[value] = counts.get(value, 0) + 1
+        return list(counts.items())
+    
+    @staticmethod
+    def _first_occurrence(values: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """고유값과 개수, 처음 나타난 순서"""
+        unique, first, counts = np.unique(values, return_index=True, return_counts=True)
+        order = np.argsort(first, kind="stable")
+        return unique[order], counts[order]
+    
+    def signature_statistics(self) -> Tuple[List[str], Sequence[int], Sequence[float]]:
+        """서명별 (서명 리스트, 개수, 심각도 합), 처음 나타난 순서
+        
+        개수/심각도 합은 NumPy가 있으면 배열, 없으면 리스트.
+        심각도 합은 행 순서대로 누적 (기록 리스트를 순회한 합과 같은 값).
+        """
+        if HAS_NUMPY:
+            ids = self.column("signature_id")
+            if ids.size == 0:
+                return [], np.zeros(0, dtype=np.int64), np.zeros(0)
+            sums = np.bincount(ids, weights=self.column("collapse_severity"))
+            unique, counts = self._first_occurrence(ids)
+            names = [self.signature_text(i) for i in unique.tolist()]
+            return names, counts, sums[unique]
+        totals: Dict[int, List[float]] = {}
+        for signature_id, severity in zip(
+            self.iter_column("signature_id"), self.iter_column("collapse_severity")
+        ):
+            entry = totals.setdefault(signature_id, [0, 0.0])
+            entry[0] += 1
+            entry[1] += severity
+        return (
+            [self.signature_text(signature_id) for signature_id in totals],
+            [count for count, _ in totals.values()],
+            [severity_sum for _, severity_sum in totals.values()]
+        )
+
+
+class FailureRecordView(SequenceABC):
+    """열 저장소의 읽기 전용 기록 뷰 (인덱싱할 때 FailureRecord 생성)"""
+    
+    def __init__(self, columns: FailureColumns, rows: Optional[Sequence[int]] = None):
+        """
+        Args:
+            columns: 열 저장소
+            rows: 보여줄 행 번호 (None이면 전체 행)
+        """
+        self._columns = columns
+        self._rows = rows
+    
+    def _row(self, index: int) -> int:
+        return index if self._rows is None else self._rows[index]
+    
+    def __len__(self) -> int:
+        return len(self._columns) if self._rows is None else len(self._rows)
+    
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("기록 인덱스 범위 초과")
+        return self._columns.record(self._row(index))
+    
+    def __iter__(self) -> Iterator[FailureRecord]:
+        for index in range(len(self)):
+            yield self._columns.record(self._row(index))
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (FailureRecordView, list)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self)} records)"
+
+
+class FailureRecordList(FailureRecordView):
+    """FailureAtlas.failure_records 뷰 (추가/삭제는 열 저장소에 반영)"""
+    
+    def append(self, record: FailureRecord) -> None:
+        self._columns.append(record)
+    
+    def extend(self, records) -> None:
+        for record in records:
+            self._columns.append(record)
+    
+    def clear(self) -> None:
+        self._columns.retain([])
+    
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        removed = set(range(len(self))[index]) if isinstance(index, slice) else {
+            range(len(self))[index]
+        }
+        self._columns.retain([row for row in range(len(self)) if row not in removed])
+
+
+@dataclass
+class FailureSummary:
+    """병합 가능한 실패 요약 (분류표 / 실패율 / 서명별 통계)
+    
+    merge()는 결합·교환 법칙을 만족한다 (개수는 정확히, 심각도 합은
+    부동소수점 반올림 범위 안에서). 샤드가 몇 개든 요약 크기
+    (모드 수 + 서명 수)에만 비례해 합칠 수 있다.
+    FailureBiasConverter.convert_failure_to_bias()에 FailureAtlas 대신 넘길 수 있다.
+    """
+    total_failures: int = 0
+    collapse_taxonomy: Dict[str, int] = field(default_factory=dict)
+    signature_counts: Dict[str, int] = field(default_factory=dict)
+    signature_severity: Dict[str, float] = field(default_factory=dict)
+    
+    @property
+    def failure_rate_by_mode(self) -> Dict[str, float]:
+        """붕괴 모드별 실패율"""
+        total = self.total_failures
+        return {mode: count / total for mode, count in self.collapse_taxonomy.items()}
+    
+    def merge(self, *others: "FailureSummary") -> "FailureSummary":
+        """요약 합치기 (새 요약 반환, 키 순서는 처음 나타난 순서)"""
+        merged = FailureSummary(
+            self.total_failures,
+            dict(self.collapse_taxonomy),
+            dict(self.signature_counts),
+            dict(self.signature_severity)
+        )
+        for other in others:
+            merged.total_failures += other.total_failures
+            for mode, count in other.collapse_taxonomy.items():
+                merged.collapse_taxonomy[mode] = merged.collapse_taxonomy.get(mode, 0) + count
+            for signature, count in other.signature_counts.items():
+                merged.signature_counts[signature] = merged.signature_counts.get(signature, 0) + count
+            for signature, severity in other.signature_severity.items():
+                merged.signature_severity[signature] = (
+                    merged.signature_severity.get(signature, 0.0) + severity
+                )
+        return merged
+    
+    __add__ = merge
+    
+    def signature_statistics(self) -> Tuple[List[str], Sequence[int], Sequence[float]]:
+        """FailureAtlas.signature_statistics()와 같은 형식"""
+        names = list(self.signature_counts)
+        counts = [self.signature_counts[name] for name in names]
+        sums = [self.signature_severity[name] for name in names]
+        if HAS_NUMPY:
+            return names, np.array(counts, dtype=np.int64), np.array(sums, dtype=np.float64)
+        return names, counts, sums
+    
+    def get_failure_statistics(self) -> Dict:
+        """FailureAtlas.get_failure_statistics()와 같은 형식"""
+        return {
+            "total_failures": self.total_failures,
+            "failure_by_mode": dict(self.collapse_taxonomy),
+            "failure_rate_by_mode": self.failure_rate_by_mode,
+            "failure_by_type": dict(self.collapse_taxonomy)
+        }
+
+
 @dataclass
 class FailureAtlas:
     """실패 지도 (Failure Atlas)
@@ -101,24 +597,87 @@ class FailureAtlas:
     L1 레이어의 핵심 클래스.
     실패 패턴을 구조화하여 저장하고 분류.
     
+    유사도 질의:
+    - find_nearest_failures() / find_failures_within(): 수치 서명의 KD-트리 색인
+      (차원별 SignatureIndex, NumPy가 없으면 전수 비교)
+    - get_similar_failures(): 서명 문자열 유사도 (결과는 기존 전수 비교와 동일,
+      값 토큰 조합별 역색인으로 후보만 확인)
+    - 색인은 추가된 행을 질의 시점에 반영한다.
+      행이 삭제되면 (columns.generation 변경) 다음 질의에서 전체를 다시 색인한다.
+    
+    저장:
+    - columns (FailureColumns)에 열 단위로 저장
+    - failure_records / failure_manifold는 요청 시 FailureRecord를 만드는 뷰
+    - collapse_taxonomy / failure_rate_by_mode / total_failures는 열 축약으로 계산
+    
     핵심 질문:
     - 실패는 어떤 유형으로 반복되는가?
     - 붕괴는 항상 같은 방식인가?
     - 실패에는 "형태"가 있는가?
     """
     
-    # 실패 기록 저장소
-    failure_records: List[FailureRecord] = field(default_factory=list)
+    # 열 기반 기록 저장소
+    columns: FailureColumns = field(default_factory=FailureColumns)
     
-    # 실패 유형별 분류 (Failure Manifold)
-    failure_manifold: Dict[str, List[FailureRecord]] = field(default_factory=dict)
+    # 유사도 색인 (columns의 앞쪽 _indexed_records개 행을 반영)
+    _indexed_records: int = field(default=0, init=False, repr=False, compare=False)
+    _indexed_generation: int = field(default=0, init=False, repr=False, compare=False)
+    _feature_indexes: Dict[int, SignatureIndex] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _token_postings: Dict[Tuple[Tuple[int, str], ...], List[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _irregular_records: List[int] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
     
-    # 붕괴 모드 분류 (Collapse Taxonomy)
-    collapse_taxonomy: Dict[str, int] = field(default_factory=dict)
+    @classmethod
+    def from_records(cls, records: Sequence[FailureRecord]) -> "FailureAtlas":
+        """기존 FailureRecord 목록으로 지도 생성 (이전 FailureAtlas(failure_records=...) 대체)"""
+        atlas = cls()
+        atlas.failure_records.extend(records)
+        return atlas
     
-    # 통계 정보
-    total_failures: int = 0
-    failure_rate_by_mode: Dict[str, float] = field(default_factory=dict)
+    @property
+    def failure_records(self) -> FailureRecordList:
+        """실패 기록 뷰 (인덱싱/순회 시 FailureRecord 생성, append/clear 지원)"""
+        return FailureRecordList(self.columns)
+    
+    @property
+    def total_failures(self) -> int:
+        """실패 기록 수"""
+        return len(self.columns)
+    
+    @property
+    def collapse_taxonomy(self) -> Dict[str, int]:
+        """붕괴 모드별 실패 횟수 (처음 나타난 순서)"""
+        return {
+            _COLLAPSE_MODES[code].value: count
+            for code, count in self.columns.first_occurrence_counts("collapse_mode")
+        }
+    
+    @property
+    def failure_rate_by_mode(self) -> Dict[str, float]:
+        """붕괴 모드별 실패율"""
+        total = self.total_failures
+        return {mode: count / total for mode, count in self.collapse_taxonomy.items()}
+    
+    @property
+    def failure_manifold(self) -> Dict[str, FailureRecordView]:
+        """실패 유형별 기록 뷰 (Failure Manifold, 처음 나타난 순서)"""
+        rows: Dict[int, List[int]] = {}
+        if HAS_NUMPY:
+            codes = self.columns.column("collapse_mode")
+            for code, _ in self.columns.first_occurrence_counts("collapse_mode"):
+                rows[code] = np.flatnonzero(codes == code).tolist()
+        else:
+            for row, code in enumerate(self.columns.iter_column("collapse_mode")):
+                rows.setdefault(code, []).append(row)
+        return {
+            _COLLAPSE_MODES[code].value: FailureRecordView(self.columns, members)
+            for code, members in rows.items()
+        }
     
     def record_failure(
         self,
@@ -150,6 +709,7 @@ class FailureAtlas:
         
         # 조건 서명 생성 (구조적 특징)
         condition_signature = self._generate_condition_signature(system, analysis)
+        signature_features = self.signature_features(system, analysis)
         
         # 실패 기록 생성
         failure_record = FailureRecord(
@@ -163,18 +723,12 @@ class FailureAtlas:
             collapse_mode=collapse_mode,
             collapse_severity=0.0,  # 자동 계산됨
             iteration=analysis.iteration,
-            boundary_points=analysis.boundary_points
+            boundary_points=analysis.boundary_points,
+            signature_features=signature_features
         )
         
-        # 기록 추가
-        self.failure_records.append(failure_record)
-        self.total_failures += 1
-        
-        # 실패 유형별 분류
-        self._classify_failure(failure_record)
-        
-        # 붕괴 모드 분류 업데이트
-        self._update_collapse_taxonomy(failure_record)
+        # 기록 추가 (분류표/실패율은 열에서 계산)
+        self.columns.append(failure_record)
         
         return failure_record
     
@@ -228,35 +782,25 @@ class FailureAtlas:
         signature = f"mass_{mass_ratio}_dist_{tuple(sorted(distances))}_mismatch_{analysis.mismatch:.3f}"
         return signature
     
-    def _classify_failure(self, failure_record: FailureRecord):
-        """실패 유형별 분류"""
-        failure_type = failure_record.get_failure_type()
-        
-        if failure_type not in self.failure_manifold:
-            self.failure_manifold[failure_type] = []
-        
-        self.failure_manifold[failure_type].append(failure_record)
-    
-    def _update_collapse_taxonomy(self, failure_record: FailureRecord):
-        """붕괴 모드 분류 업데이트"""
-        mode_key = failure_record.collapse_mode.value
-        
-        if mode_key not in self.collapse_taxonomy:
-            self.collapse_taxonomy[mode_key] = 0
-        
-        self.collapse_taxonomy[mode_key] += 1
-        
-        # 실패율 업데이트
-        self._update_failure_rate()
-    
-    def _update_failure_rate(self):
-        """실패율 업데이트"""
-        if self.total_failures == 0:
-            return
+    def signature_features(
+        self,
+        system: ThreeBodySystem,
+        analysis: StabilityAnalysis
+    ) -> Tuple[float, ...]:
+        """수치 서명 (고정 길이 특징 벡터) 생성
         
-        self.failure_rate_by_mode = {}
-        for mode, count in self.collapse_taxonomy.items():
-            self.failure_rate_by_mode[mode] = count / self.total_failures
+        천체 N개: 질량 내림차순 N개 + 쌍별 거리 오름차순 N(N-1)/2개 + mismatch.
+        문자열 서명과 같은 특징이지만 반올림하지 않는다.
+        """
+        bodies = system.get_all_bodies()
+        masses = sorted((b.mass for b in bodies), reverse=True)
+        distances = []
+        for i in range(len(bodies)):
+            for j in range(i + 1, len(bodies)):
+                dx = bodies[i].position.x - bodies[j].position.x
+                dy = bodies[i].position.y - bodies[j].position.y
+                distances.append((dx * dx + dy * dy) ** 0.5)
+        return tuple(masses + sorted(distances) + [analysis.mismatch])
     
     def get_similar_failures(
         self,
@@ -266,6 +810,9 @@ class FailureAtlas:
         """유사한 실패 패턴 찾기
         
         조건 서명이 유사한 실패 기록들을 반환.
+        결과(순서 포함)는 모든 기록과 _calculate_signature_similarity()를
+        비교한 결과와 같다. 표준 서명끼리는 값 토큰 조합의 역색인으로
+        임계값을 넘는 기록만 모은다.
         
         Args:
             condition_signature: 비교할 조건 서명
@@ -274,18 +821,186 @@ class FailureAtlas:
         Returns:
             유사한 실패 기록 리스트
         """
-        similar_failures = []
+        self._sync_similarity_index()
+        parts = condition_signature.split('_')
         
-        for record in self.failure_records:
-            similarity = self._calculate_signature_similarity(
-                condition_signature,
-                record.condition_signature
-            )
+        if not self._is_regular_signature(parts):
+            # 비표준 질의 서명: 전수 비교 (인턴된 서명별로 한 번만 계산)
+            similar_ids = {
+                signature_id
+                for signature_id in range(self.columns.signature_count)
+                if self._calculate_signature_similarity(
+                    condition_signature, self.columns.signature_text(signature_id)
+                ) >= similarity_threshold
+            }
+            return [
+                self.columns.record(row)
+                for row, signature_id in enumerate(self.columns.iter_column("signature_id"))
+                if signature_id in similar_ids
+            ]
+        
+        # 표준 서명끼리는 라벨 3개가 항상 같으므로 유사도 = (3 + 값 토큰 일치 수) / 6
+        required = next(
+            (k for k in range(4) if (3 + k) / 6 >= similarity_threshold), None
+        )
+        if required == 0:
+            irregular = set(self._irregular_records)
+            selected = [
+                index for index in range(len(self.columns))
+                if index not in irregular
+            ]
+        elif required is None:
+            selected = []
+        else:
+            # 값 토큰 required개가 일치하는 조합별 역색인의 합집합
+            found = set()
+            for key in self._token_keys(parts, required):
+                found.update(self._token_postings.get(key, ()))
+            selected = list(found)
+        
+        # 비표준 기록: 전수 비교
+        selected += [
+            index for index in self._irregular_records
+            if self._calculate_signature_similarity(
+                condition_signature, self.columns.signature(index)
+            ) >= similarity_threshold
+        ]
+        return [self.columns.record(index) for index in sorted(selected)]
+    
+    def find_nearest_failures(
+        self,
+        features: Sequence[float],
+        k: int = 1
+    ) -> List[Tuple[float, FailureRecord]]:
+        """수치 서명 k-최근접 실패 기록
+        
+        Args:
+            features: 질의 특징 벡터 (signature_features()와 같은 구성)
+            k: 반환할 기록 수
+        
+        Returns:
+            (유클리드 거리, 실패 기록) 리스트, 거리 오름차순.
+            차원(천체 수)이 같은 기록만 비교한다.
+        """
+        if k < 1:
+            raise ValueError("k는 1 이상이어야 합니다")
+        self._sync_similarity_index()
+        index = self._feature_indexes.get(len(features))
+        if index is not None:
+            hits = index.nearest(features, k)
+        else:
+            hits = self._scan_features(features)[:k]
+        return [(distance, self.columns.record(row)) for distance, row in hits]
+    
+    def find_failures_within(
+        self,
+        features: Sequence[float],
+        radius: float
+    ) -> List[Tuple[float, FailureRecord]]:
+        """수치 서명 반경 질의
+        
+        Args:
+            features: 질의 특징 벡터 (signature_features()와 같은 구성)
+            radius: 유클리드 거리 반경
+        
+        Returns:
+            (유클리드 거리, 실패 기록) 리스트, 거리 오름차순
+        """
+        if radius < 0:
+            raise ValueError("radius는 0 이상이어야 합니다")
+        self._sync_similarity_index()
+        index = self._feature_indexes.get(len(features))
+        if index is not None:
+            hits = index.within(features, radius)
+        else:
+            hits = [hit for hit in self._scan_features(features) if hit[0] <= radius]
+        return [(distance, self.columns.record(row)) for distance, row in hits]
+    
+    def _scan_features(self, features: Sequence[float]) -> List[Tuple[float, int]]:
+        """수치 서명 전수 비교 (NumPy 미설치 시)"""
+        hits = []
+        for row in range(len(self.columns)):
+            if self.columns.value("feature_dim", row) != len(features):
+                continue
+            stored = self.columns.features_of(row)
+            distance = sum((a - b) ** 2 for a, b in zip(stored, features)) ** 0.5
+            hits.append((distance, row))
+        hits.sort()
+        return hits
+    
+    @staticmethod
+    def _is_regular_signature(parts: List[str]) -> bool:
+        """_generate_condition_signature() 형식의 토큰 배열인지"""
+        return len(parts) == 6 and tuple(parts[0::2]) == _SIGNATURE_LABELS
+    
+    @staticmethod
+    def _token_keys(parts: List[str], size: int) -> List[Tuple[Tuple[int, str], ...]]:
+        """값 토큰 (위치 1, 3, 5) 중 size개 조합의 역색인 키"""
+        return [
+            tuple((position, parts[position]) for position in positions)
+            for positions in combinations((1, 3, 5), size)
+        ]
+    
+    def _sync_similarity_index(self) -> None:
+        """열 저장소에 새로 추가된 행을 색인에 반영"""
+        columns = self.columns
+        if columns.generation != self._indexed_generation or len(columns) < self._indexed_records:
+            self._reset_similarity_index()
+            self._indexed_generation = columns.generation
+        start = self._indexed_records
+        if start == len(columns):
+            return
+        
+        if HAS_NUMPY:
+            # 서명별 행 묶음 (행 오름차순 유지)
+            ids = columns.column("signature_id", start)
+            order = np.argsort(ids, kind="stable")
+            unique, first = np.unique(ids[order], return_index=True)
+            groups = zip(unique.tolist(), np.split(order + start, first[1:]))
+            self._index_signature_rows((sid, rows.tolist()) for sid, rows in groups)
             
-            if similarity >= similarity_threshold:
-                similar_failures.append(record)
+            dims = columns.column("feature_dim", start)
+            starts = columns.column("feature_start", start)
+            for dim in np.unique(dims[dims > 0]).tolist():
+                selected = np.flatnonzero(dims == dim)
+                feature_index = self._feature_indexes.get(dim)
+                if feature_index is None:
+                    feature_index = SignatureIndex(dim)
+                    self._feature_indexes[dim] = feature_index
+                feature_index.add_many(
+                    columns.feature_block(starts[selected], dim), selected + start
+                )
+        else:
+            groups: Dict[int, List[int]] = {}
+            for row in range(start, len(columns)):
+                groups.setdefault(columns.value("signature_id", row), []).append(row)
+            self._index_signature_rows(groups.items())
         
-        return similar_failures
+        self._irregular_records.sort()
+        self._indexed_records = len(columns)
+    
+    def _index_signature_rows(self, groups) -> None:
+        """(서명 id, 행 리스트) 묶음을 토큰 역색인에 추가 (서명은 한 번만 분해)"""
+        for signature_id, rows in groups:
+            parts = self.columns.signature_text(signature_id).split('_')
+            if not self._is_regular_signature(parts):
+                self._irregular_records.extend(rows)
+                continue
+            # _token_keys(parts, 1~3)과 같은 7개 키
+            mass, dist, mismatch = (1, parts[1]), (3, parts[3]), (5, parts[5])
+            for key in (
+                (mass,), (dist,), (mismatch,),
+                (mass, dist), (mass, mismatch), (dist, mismatch),
+                (mass, dist, mismatch)
+            ):
+                self._token_postings.setdefault(key, []).extend(rows)
+    
+    def _reset_similarity_index(self) -> None:
+        """유사도 색인 초기화"""
+        self._indexed_records = 0
+        self._feature_indexes.clear()
+        self._token_postings.clear()
+        self._irregular_records.clear()
     
     def _calculate_signature_similarity(
         self,
@@ -316,22 +1031,52 @@ class FailureAtlas:
         return common_parts / total_parts
     
     def get_failure_statistics(self) -> Dict:
-        """실패 통계 반환"""
+        """실패 통계 반환 (열 축약, 기록을 만들지 않음)"""
+        taxonomy = self.collapse_taxonomy
+        total = self.total_failures
         return {
-            "total_failures": self.total_failures,
-            "failure_by_mode": self.collapse_taxonomy.copy(),
-            "failure_rate_by_mode": self.failure_rate_by_mode.copy(),
-            "failure_by_type": {
-                failure_type: len(records)
-                for failure_type, records in self.failure_manifold.items()
-            }
+            "total_failures": total,
+            "failure_by_mode": taxonomy,
+            "failure_rate_by_mode": {mode: count / total for mode, count in taxonomy.items()},
+            # 실패 유형 = 붕괴 모드 값
+            "failure_by_type": dict(taxonomy)
         }
     
+    def summary(self) -> FailureSummary:
+        """병합 가능한 요약 (열 축약)"""
+        names, counts, sums = self.signature_statistics()
+        if HAS_NUMPY:
+            counts, sums = counts.tolist(), sums.tolist()
+        return FailureSummary(
+            total_failures=self.total_failures,
+            collapse_taxonomy=self.collapse_taxonomy,
+            signature_counts=dict(zip(names, counts)),
+            signature_severity=dict(zip(names, sums))
+        )
+    
+    def merge_from(self, *others: "FailureAtlas") -> "FailureAtlas":
+        """다른 지도들의 기록을 뒤에 이어 붙임 (제자리, self 반환)
+        
+        열 단위 일괄 복사라 기록마다 record_failure()를 다시 부르지 않는다.
+        분류표·실패율·서명 통계는 각 지도의 summary()를 merge()한 것과 같다.
+        """
+        for other in others:
+            self.columns.extend_from(other.columns)
+        return self
+    
+    def merge(self, *others: "FailureAtlas") -> "FailureAtlas":
+        """self와 others를 차례로 합친 새 지도 (입력은 변경하지 않음)"""
+        return FailureAtlas().merge_from(self, *others)
+    
+    def signature_statistics(self) -> Tuple[List[str], Sequence[int], Sequence[float]]:
+        """조건 서명별 (서명 리스트, 실패 횟수, 심각도 합), 처음 나타난 순서
+        
+        횟수/심각도 합은 NumPy가 있으면 배열, 없으면 리스트.
+        """
+        return self.columns.signature_statistics()
+    
     def clear(self):
         """모든 기록 초기화"""
-        self.failure_records.clear()
-        self.failure_manifold.clear()
-        self.collapse_taxonomy.clear()
-        self.total_failures = 0
-        self.failure_rate_by_mode.clear()
+        self.columns.clear()
+        self._reset_similarity_index()
 
@@ -15,6 +15,17 @@ ThreeBodyBoundaryEngine - 실패 학습 레이어 (L2)
 - 실패 패턴을 탐색 편향으로 변환
 - 탐색 공간에서 위험 영역 식별
 
+온라인 갱신 (IncrementalBiasConverter):
+- 서명별 횟수 / 심각도 합 / 최대 횟수 / 붕괴 모드 횟수를 기록마다 O(1)로 누적
+- 같은 지도를 다시 변환하면 마지막 변환 이후 추가된 행만 반영 (결과는 일괄 변환과 동일)
+- 반환하는 SearchBias는 그 시점 상태의 지연 뷰: risk_map / 총합 / 공간 격자는 처음 읽을 때
+  계산 (변환 호출 비용은 새 행 수에만 비례, 이후 기록이 쌓여도 뷰의 값은 바뀌지 않음)
+- 감쇠 편향은 항목별 갱신 시점을 저장해 두고 읽을 때 감쇠 (갱신마다 전체를 곱하지 않음)
+
+공간 위험도 (spatial_cell_size 지정 시):
+- 서명을 (mass_ratio, separation) 격자 셀로 모은 SpatialRiskGrid를 함께 생성
+- 처음 보는 조건도 셀 / 보간으로 위험도 조회, 후보 배열은 get_safe_conditions로 일괄 필터
+
 ⚠️ 중요:
 - 이건 성공 학습이 아니다
 - 실패 확률을 줄이는 학습
@@ -25,10 +36,21 @@ Author: GNJz (Qquarts)
 Version: 1.2.0
 """
 
+from array import array
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
-from .failure_atlas import FailureAtlas, FailureRecord
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from .failure_atlas import (
+    FailureAtlas,
+    FailureColumns,
+    FailureRecord,
+    FailureSummary,
+    _COLLAPSE_MODES
+)
+from .failure_buckets import BoundedFailureAtlas
 from .point import Point
+from .spatial_risk import SpatialRiskGrid
+from ._compat import HAS_NUMPY, np
 
 
 @dataclass
@@ -44,13 +66,30 @@ class SearchBias:
     # 붕괴 모드별 위험도
     collapse_mode_risk: Dict[str, float] = field(default_factory=dict)
     
-    # 공간 패턴별 위험도 (선택적)
+    # 공간 패턴별 위험도 (선택적, 셀 중심 (mass_ratio, separation) → 위험도)
     spatial_risk_pattern: Optional[Dict[Tuple[float, float], float]] = None
     
+    # 공간 위험도 격자 (선택적, 좌표 조회용)
+    spatial_grid: Optional[SpatialRiskGrid] = field(default=None, compare=False, repr=False)
+    
     # 전체 위험도 통계
     total_risk_score: float = 0.0
     max_risk_score: float = 0.0
     
+    def __eq__(self, other) -> bool:
+        # 지연 편향 (_SnapshotSearchBias)과도 값으로 비교 (spatial_grid 제외)
+        if not isinstance(other, SearchBias):
+            return NotImplemented
+        return (
+            self.risk_map == other.risk_map
+            and self.collapse_mode_risk == other.collapse_mode_risk
+            and self.spatial_risk_pattern == other.spatial_risk_pattern
+            and self.total_risk_score == other.total_risk_score
+            and self.max_risk_score == other.max_risk_score
+        )
+    
+    __hash__ = None
+    
     def get_risk(self, condition_signature: str) -> float:
         """조건 서명에 대한 위험도 반환"""
         return self.risk_map.get(condition_signature, 0.0)
@@ -58,6 +97,17 @@ class SearchBias:
     def is_risky(self, condition_signature: str, threshold: float = 0.5) -> bool:
         """위험한 조건인지 판정"""
         return self.get_risk(condition_signature) >= threshold
+    
+    def get_spatial_risk(
+        self,
+        mass_ratio: float,
+        separation: float,
+        interpolate: bool = False
+    ) -> float:
+        """구성 공간 좌표의 위험도 반환 (격자가 없으면 0)"""
+        if self.spatial_grid is None:
+            return 0.0
+        return self.spatial_grid.risk(mass_ratio, separation, interpolate)
 
 
 class FailureBiasConverter:
@@ -74,7 +124,8 @@ class FailureBiasConverter:
     def __init__(
         self,
         risk_decay_factor: float = 0.9,
-        min_risk_threshold: float = 0.1
+        min_risk_threshold: float = 0.1,
+        spatial_cell_size: Optional[Tuple[float, float]] = None
     ):
         """
         Args:
@@ -82,20 +133,26 @@ class FailureBiasConverter:
                 - 높을수록 실패 기록이 오래 유지됨
             min_risk_threshold: 최소 위험도 임계값
                 - 이 값 이하는 위험도로 간주하지 않음
+            spatial_cell_size: 공간 위험도 격자 셀 크기 (mass_ratio, separation)
+                - None이면 공간 위험도를 만들지 않음
         """
         self.risk_decay_factor = risk_decay_factor
         self.min_risk_threshold = min_risk_threshold
+        if spatial_cell_size is not None:
+            # 잘못된 셀 크기는 생성 시점에 ValueError
+            SpatialRiskGrid(spatial_cell_size)
+        self.spatial_cell_size = spatial_cell_size
     
     def convert_failure_to_bias(
         self,
-        failure_atlas: FailureAtlas
+        failure_atlas: Union[FailureAtlas, FailureSummary]
     ) -> SearchBias:
         """실패 패턴을 탐색 편향으로 변환
         
         L1의 FailureAtlas를 받아서 탐색 편향을 생성.
         
         Args:
-            failure_atlas: L1의 실패 지도
+            failure_atlas: L1의 실패 지도 (또는 병합한 FailureSummary)
         
         Returns:
             탐색 편향
@@ -114,48 +171,53 @@ class FailureBiasConverter:
         total_risk = sum(risk_map.values())
         max_risk = max(risk_map.values()) if risk_map else 0.0
         
+        # 공간 위험도 격자 (선택적)
+        spatial_grid = None
+        spatial_risk_pattern = None
+        if self.spatial_cell_size is not None:
+            spatial_grid = SpatialRiskGrid.from_statistics(failure_atlas, self.spatial_cell_size)
+            spatial_risk_pattern = spatial_grid.pattern(self.min_risk_threshold)
+        
         return SearchBias(
             risk_map=risk_map,
             collapse_mode_risk=collapse_mode_risk,
+            spatial_risk_pattern=spatial_risk_pattern,
+            spatial_grid=spatial_grid,
             total_risk_score=total_risk,
             max_risk_score=max_risk
         )
     
     def _build_risk_map(
         self,
-        failure_atlas: FailureAtlas
+        failure_atlas: Union[FailureAtlas, FailureSummary]
     ) -> Dict[str, float]:
         """위험 지도 생성
         
         조건 서명별 위험도를 계산.
         실패 빈도가 높을수록 위험도가 높음.
+        서명별 횟수/심각도 합은 FailureAtlas의 열 축약으로 얻고,
+        NumPy가 있으면 위험도도 서명 배열 단위로 계산.
         """
-        risk_map = {}
+        # 조건 서명별 (실패 횟수, 심각도 합)
+        signatures, counts, severity_sums = failure_atlas.signature_statistics()
+        if not signatures:
+            return {}
         
-        # 조건 서명별 실패 빈도 계산
-        condition_counts: Dict[str, int] = {}
-        condition_severities: Dict[str, List[float]] = {}
+        if HAS_NUMPY:
+            # 빈도 기반 위험도 (0.0 ~ 1.0) 60% + 평균 심각도 40%
+            risk = counts / counts.max() * 0.6 + severity_sums / counts * 0.4
+            keep = np.flatnonzero(risk >= self.min_risk_threshold)
+            return dict(zip([signatures[i] for i in keep.tolist()], risk[keep].tolist()))
         
-        for record in failure_atlas.failure_records:
-            sig = record.condition_signature
-            
-            # 실패 횟수 카운트
-            if sig not in condition_counts:
-                condition_counts[sig] = 0
-                condition_severities[sig] = []
-            
-            condition_counts[sig] += 1
-            condition_severities[sig].append(record.collapse_severity)
-        
-        # 위험도 계산
-        max_count = max(condition_counts.values()) if condition_counts else 1
+        risk_map = {}
+        max_count = max(counts)
         
-        for sig, count in condition_counts.items():
+        for sig, count, severity_sum in zip(signatures, counts, severity_sums):
             # 빈도 기반 위험도 (0.0 ~ 1.0)
             frequency_risk = count / max_count
             
             # 심각도 기반 위험도 (평균)
-            avg_severity = sum(condition_severities[sig]) / len(condition_severities[sig])
+            avg_severity = severity_sum / count
             
             # 최종 위험도 (빈도 60% + 심각도 40%)
             risk = frequency_risk * 0.6 + avg_severity * 0.4
@@ -168,7 +230,7 @@ class FailureBiasConverter:
     
     def _calculate_collapse_mode_risk(
         self,
-        failure_atlas: FailureAtlas
+        failure_atlas: Union[FailureAtlas, FailureSummary]
     ) -> Dict[str, float]:
         """붕괴 모드별 위험도 계산"""
         if failure_atlas.total_failures == 0:
@@ -233,6 +295,8 @@ class FailureBiasConverter:
         return SearchBias(
             risk_map=updated_risk_map,
             collapse_mode_risk=bias.collapse_mode_risk.copy(),
+            spatial_risk_pattern=bias.spatial_risk_pattern,
+            spatial_grid=bias.spatial_grid,
             total_risk_score=total_risk,
             max_risk_score=max_risk
         )
@@ -258,21 +322,33 @@ class FailureBiasConverter:
     def get_safe_conditions(
         self,
         bias: SearchBias,
-        candidate_conditions: List[str],
-        threshold: float = 0.5
-    ) -> List[str]:
+        candidate_conditions: Union[List[str], "np.ndarray"],
+        threshold: float = 0.5,
+        interpolate: bool = False
+    ) -> Union[List[str], "np.ndarray"]:
         """안전한 조건 필터링
         
         후보 조건 중에서 안전한 조건만 반환.
+        (n, 2) 좌표 배열 [mass_ratio, separation]을 주면 공간 위험도 격자로
+        한 번에 걸러서 안전한 행만 반환 (bias.spatial_grid 필요).
         
         Args:
             bias: 탐색 편향
-            candidate_conditions: 후보 조건 서명 리스트
+            candidate_conditions: 후보 조건 서명 리스트 또는 (n, 2) 좌표 배열
             threshold: 안전 임계값 (이 값 미만이면 안전)
+            interpolate: 좌표 배열일 때 셀 중심 사이 보간 여부
         
         Returns:
-            안전한 조건 리스트
+            안전한 조건 리스트 (좌표 배열이면 안전한 행 배열)
         """
+        if HAS_NUMPY and isinstance(candidate_conditions, np.ndarray):
+            if bias.spatial_grid is None:
+                raise ValueError(
+                    "좌표 후보를 거르려면 공간 위험도 격자가 필요합니다 (spatial_cell_size 지정)"
+                )
+            risk = bias.spatial_grid.risk_many(candidate_conditions, interpolate)
+            return candidate_conditions[risk < threshold]
+        
         safe_conditions = []
         
         for condition in candidate_conditions:
@@ -282,3 +358,330 @@ class FailureBiasConverter:
         
         return safe_conditions
 
+
+class _SignatureSnapshot:
+    """IncrementalBiasConverter 누적 상태의 한 시점 (기록 로그 앞쪽 rows개)
+    
+    로그 / 서명 리스트는 추가만 되므로 참조와 길이만 보관하고 (O(1)),
+    signature_statistics()는 읽을 때 로그 앞부분을 다시 집계한다 (행 순서 합, 일괄 변환과 같은 값).
+    """
+    
+    def __init__(
+        self,
+        signatures: List[str],
+        slot_log: array,
+        severity_log: array,
+        rows: int,
+        slot_count: int,
+        collapse_taxonomy: Dict[str, int]
+    ):
+        self._signatures = signatures
+        self._slot_log = slot_log
+        self._severity_log = severity_log
+        self._slot_count = slot_count
+        self.total_failures = rows
+        self.collapse_taxonomy = collapse_taxonomy
+    
+    def signature_statistics(self) -> Tuple[List[str], Sequence[int], Sequence[float]]:
+        """FailureAtlas.signature_statistics()와 같은 형식 (이 시점 상태)"""
+        rows, slot_count = self.total_failures, self._slot_count
+        signatures = self._signatures[:slot_count]
+        if HAS_NUMPY:
+            # memoryview는 바로 해제 (내보낸 버퍼가 남으면 로그 array를 늘릴 수 없음)
+            with memoryview(self._slot_log) as view:
+                slots = np.array(view[:rows], dtype=np.int64)
+            with memoryview(self._severity_log) as view:
+                severities = np.array(view[:rows], dtype=np.float64)
+            counts = np.bincount(slots, minlength=slot_count)
+            sums = np.bincount(slots, weights=severities, minlength=slot_count)
+            return signatures, counts, sums
+        counts = [0] * slot_count
+        sums = [0.0] * slot_count
+        for row in range(rows):
+            slot = self._slot_log[row]
+            counts[slot] += 1
+            sums[slot] += self._severity_log[row]
+        return signatures, counts, sums
+
+
+class _LazyRiskMap(Mapping):
+    """처음 읽을 때 만드는 읽기 전용 위험 지도 (dict와 값으로 비교)"""
+    
+    def __init__(self, build: Callable[[], Dict[str, float]]):
+        self._build = build
+        self._data: Optional[Dict[str, float]] = None
+    
+    def _materialized(self) -> Dict[str, float]:
+        if self._data is None:
+            self._data = self._build()
+            self._build = None
+        return self._data
+    
+    def __getitem__(self, signature: str) -> float:
+        return self._materialized()[signature]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialized())
+    
+    def __len__(self) -> int:
+        return len(self._materialized())
+    
+    def __repr__(self) -> str:
+        return repr(self._materialized())
+
+
+class _SnapshotSearchBias(SearchBias):
+    """IncrementalBiasConverter가 반환하는 지연 SearchBias
+    
+    생성은 O(붕괴 모드 수). risk_map / total_risk_score / max_risk_score /
+    spatial_grid / spatial_risk_pattern은 처음 읽을 때 스냅샷에서 계산해 보관한다.
+    """
+    
+    def __init__(self, converter: FailureBiasConverter, snapshot: _SignatureSnapshot):
+        self._converter = converter
+        self._snapshot = snapshot
+        self._spatial: Optional[Tuple] = None
+        self.risk_map = _LazyRiskMap(self._build_risk_map)
+        self.collapse_mode_risk = converter._calculate_collapse_mode_risk(snapshot)
+    
+    def _build_risk_map(self) -> Dict[str, float]:
+        return self._converter._build_risk_map(self._snapshot)
+    
+    @property
+    def total_risk_score(self) -> float:
+        return sum(self.risk_map.values())
+    
+    @property
+    def max_risk_score(self) -> float:
+        return max(self.risk_map.values()) if len(self.risk_map) else 0.0
+    
+    def _spatial_state(self) -> Tuple:
+        if self._spatial is None:
+            grid = pattern = None
+            cell_size = self._converter.spatial_cell_size
+            if cell_size is not None:
+                grid = SpatialRiskGrid.from_statistics(self._snapshot, cell_size)
+                pattern = grid.pattern(self._converter.min_risk_threshold)
+            self._spatial = (grid, pattern)
+        return self._spatial
+    
+    @property
+    def spatial_grid(self) -> Optional[SpatialRiskGrid]:
+        return self._spatial_state()[0]
+    
+    @property
+    def spatial_risk_pattern(self) -> Optional[Dict[Tuple[float, float], float]]:
+        return self._spatial_state()[1]
+
+
+class IncrementalBiasConverter(FailureBiasConverter):
+    """온라인 실패 → 편향 변환기
+    
+    서명별 (실패 횟수, 심각도 합)과 최대 횟수, 붕괴 모드별 횟수를 상태로 유지한다.
+    - observe(): 기록 하나를 O(1)로 반영
+    - convert_failure_to_bias(atlas): 마지막으로 본 행 이후만 반영 후 search_bias()
+      (다른 지도이거나 행이 삭제/재배열되면 처음부터 다시 누적)
+    - search_bias(): 현재 상태의 지연 편향 O(1) — 반영한 기록을 (서명 슬롯, 심각도) 로그로
+      보관하고, risk_map 등은 읽을 때 로그 앞부분으로 계산. 값은
+      FailureBiasConverter.convert_failure_to_bias()와 동일 (심각도 합은 기록 순서대로),
+      이후 기록이 추가되어도 이미 반환한 편향은 바뀌지 않음
+    - get_risk(): 서명 하나의 위험도 O(1)
+    
+    감쇠 편향 (update_bias_with_new_failure를 매 기록 연쇄 적용한 것과 같은 값):
+    - 항목마다 (위험도, 갱신 시점)만 저장하고 읽을 때 risk_decay_factor ** 경과 단계 적용
+    - 기록당 O(1), decayed_bias()는 읽을 때 한 번 생성
+    - 반복 곱 대신 거듭제곱이므로 값은 부동소수점 반올림 범위에서 같다
+    """
+    
+    def __init__(
+        self,
+        risk_decay_factor: float = 0.9,
+        min_risk_threshold: float = 0.1,
+        spatial_cell_size: Optional[Tuple[float, float]] = None
+    ):
+        super().__init__(risk_decay_factor, min_risk_threshold, spatial_cell_size)
+        self.reset()
+    
+    def reset(self) -> None:
+        """누적 상태 초기화"""
+        self._signatures: List[str] = []
+        self._slots: Dict[str, int] = {}
+        self._counts: List[int] = []
+        self._severity_sums: List[float] = []
+        # 반영한 기록 순서의 (서명 슬롯, 심각도) 로그 — 반환한 편향 스냅샷이 참조하므로
+        # 초기화할 때 비우지 않고 새로 만든다 (_signatures도 마찬가지)
+        self._slot_log = array("q")
+        self._severity_log = array("d")
+        self.max_count = 0
+        self.total_failures = 0
+        self.collapse_taxonomy: Dict[str, int] = {}
+        # 감쇠 상태: 서명 → (갱신 시 위험도, 갱신 단계)
+        self._decay_step = 0
+        self._decayed: Dict[str, Tuple[float, int]] = {}
+        # 마지막으로 반영한 열 저장소와 행 수
+        self._source: Optional[FailureColumns] = None
+        self._source_rows = 0
+        self._source_generation = -1
+    
+    def _observe(self, signature: str, severity: float, mode: str) -> None:
+        """기록 하나의 (서명, 심각도, 붕괴 모드) 반영"""
+        slot = self._slots.get(signature)
+        if slot is None:
+            slot = len(self._signatures)
+            self._slots[signature] = slot
+            self._signatures.append(signature)
+            self._counts.append(0)
+            self._severity_sums.append(0.0)
+        count = self._counts[slot] + 1
+        self._counts[slot] = count
+        self._severity_sums[slot] += severity
+        self._slot_log.append(slot)
+        self._severity_log.append(severity)
+        if count > self.max_count:
+            self.max_count = count
+        self.total_failures += 1
+        self.collapse_taxonomy[mode] = self.collapse_taxonomy.get(mode, 0) + 1
+        self._observe_decayed(signature, severity)
+    
+    def _observe_decayed(self, signature: str, new_risk: float) -> None:
+        """감쇠 지도 갱신 (update_bias_with_new_failure의 한 단계)"""
+        entry = self._decayed.get(signature)
+        risk = new_risk
+        if entry is not None:
+            if self._decayed_value(signature) is not None:
+                # 지난 단계까지 남아 있던 항목: 이번 단계 감쇠 후 큰 값 (위치 유지)
+                value, step = entry
+                risk = max(value * self.risk_decay_factor ** (self._decay_step + 1 - step), new_risk)
+            else:
+                # 이미 제거된 항목 → 맨 뒤에 다시 추가
+                del self._decayed[signature]
+        self._decay_step += 1
+        if risk >= self.min_risk_threshold:
+            self._decayed[signature] = (risk, self._decay_step)
+        else:
+            self._decayed.pop(signature, None)
+    
+    def _decayed_value(self, signature: str) -> Optional[float]:
+        """현재 단계의 감쇠 위험도 (임계값 미만이거나 없으면 None)"""
+        entry = self._decayed.get(signature)
+        if entry is None:
+            return None
+        risk, step = entry
+        risk *= self.risk_decay_factor ** (self._decay_step - step)
+        return risk if risk >= self.min_risk_threshold else None
+    
+    def observe(self, record: FailureRecord) -> None:
+        """실패 기록 하나 반영 (O(1))
+        
+        지도와 별개로 기록을 직접 넣으면 이후 convert_failure_to_bias(atlas)는
+        그 지도를 처음부터 다시 누적한다.
+        """
+        self._source = None
+        self._observe(record.condition_signature, record.collapse_severity, record.collapse_mode.value)
+    
+    def observe_all(self, records: Sequence[FailureRecord]) -> None:
+        """실패 기록 여러 개를 순서대로 반영"""
+        for record in records:
+            self.observe(record)
+    
+    def sync(self, failure_atlas: FailureAtlas) -> int:
+        """지도에서 마지막으로 본 행 이후를 반영
+        
+        Returns:
+            새로 반영한 행 수
+        """
+        columns = failure_atlas.columns
+        rows = len(columns)
+        if (
+            columns is not self._source
+            or columns.generation != self._source_generation
+            or rows < self._source_rows
+        ):
+            self.reset()
+            self._source = columns
+            self._source_generation = columns.generation
+        start = self._source_rows
+        if rows == start:
+            return 0
+        
+        def tail(name: str):
+            if HAS_NUMPY:
+                return columns.column(name, start).tolist()
+            return (columns.value(name, row) for row in range(start, rows))
+        
+        signature_text = columns.signature_text
+        for signature_id, severity, mode in zip(
+            tail("signature_id"), tail("collapse_severity"), tail("collapse_mode")
+        ):
+            self._observe(signature_text(signature_id), severity, _COLLAPSE_MODES[mode].value)
+        self._source_rows = rows
+        return rows - start
+    
+    def signature_statistics(self) -> Tuple[List[str], Sequence[int], Sequence[float]]:
+        """FailureAtlas.signature_statistics()와 같은 형식 (누적 상태)"""
+        if HAS_NUMPY:
+            return (
+                list(self._signatures),
+                np.array(self._counts, dtype=np.int64),
+                np.array(self._severity_sums, dtype=np.float64)
+            )
+        return list(self._signatures), list(self._counts), list(self._severity_sums)
+    
+    def search_bias(self) -> SearchBias:
+        """누적 상태의 탐색 편향 (일괄 변환과 동일한 결과, 지연 계산 스냅샷)"""
+        if self.total_failures == 0:
+            return SearchBias()
+        snapshot = _SignatureSnapshot(
+            self._signatures,
+            self._slot_log,
+            self._severity_log,
+            self.total_failures,
+            len(self._signatures),
+            dict(self.collapse_taxonomy)
+        )
+        return _SnapshotSearchBias(self, snapshot)
+    
+    def convert_failure_to_bias(
+        self,
+        failure_atlas: Union[FailureAtlas, FailureSummary]
+    ) -> SearchBias:
+        """새 행만 반영한 뒤 탐색 편향 생성
+        
+        FailureSummary / BoundedFailureAtlas는 이미 요약이므로 일괄 변환.
+        """
+        if isinstance(failure_atlas, (FailureSummary, BoundedFailureAtlas)):
+            return super().convert_failure_to_bias(failure_atlas)
+        self.sync(failure_atlas)
+        return self.search_bias()
+    
+    def get_risk(self, condition_signature: str) -> float:
+        """조건 서명의 위험도 (search_bias().get_risk()와 동일, O(1))"""
+        slot = self._slots.get(condition_signature)
+        if slot is None:
+            return 0.0
+        count = self._counts[slot]
+        risk = count / self.max_count * 0.6 + self._severity_sums[slot] / count * 0.4
+        return risk if risk >= self.min_risk_threshold else 0.0
+    
+    def decayed_risk(self, condition_signature: str) -> float:
+        """조건 서명의 감쇠 위험도 (O(1))"""
+        risk = self._decayed_value(condition_signature)
+        return 0.0 if risk is None else risk
+    
+    def decayed_bias(self) -> SearchBias:
+        """감쇠 탐색 편향
+        
+        빈 편향에서 시작해 반영한 기록마다 update_bias_with_new_failure()를
+        적용한 것과 같은 risk_map. collapse_mode_risk는 누적 상태의 값.
+        """
+        risk_map = {}
+        for signature in self._decayed:
+            risk = self._decayed_value(signature)
+            if risk is not None:
+                risk_map[signature] = risk
+        return SearchBias(
+            risk_map=risk_map,
+            collapse_mode_risk=self._calculate_collapse_mode_risk(self),
+            total_risk_score=sum(risk_map.values()),
+            max_risk_score=max(risk_map.values()) if risk_map else 0.0
+        )
@@ -0,0 +1,405 @@
+"""
+Failure Buckets - 메모리 상한이 있는 실패 지도 (L1)
+
+엔진 번호: UP-1
+레이어: L1 (실패 구조 축적)
+역할: 장기 실행 탐색에서 실패를 서명 버킷 요약으로 모으고, 원본 기록은 상한까지만 유지
+
+버킷:
+- 서명의 수치 (질량, 거리, mismatch)를 bucket_resolution 단위로 양자화한 대표 서명
+  (조건 서명과 같은 형식, 서명 문자열만으로 정해지므로 조회 시에도 같은 버킷)
+  → mismatch 셋째 자리만 다른 근접 중복 조건이 한 버킷으로 모인다
+- 수치 서명이 없는 서명은 서명 그대로 버킷
+- 버킷마다 횟수, 심각도 합/제곱합 (평균·분산), 처음/마지막 발생 시각, 붕괴 모드별 횟수
+
+상한:
+- max_records (원본 기록 수), max_bytes (열 버퍼 + 서명 테이블 + 버킷 추정 크기), max_buckets
+- 넘으면 상한의 7/8까지 한 번에 제거 (제거 비용을 기록당 상수로 분할 상환)
+- eviction: "oldest" (먼저 기록된 것), "lru" (버킷에 가장 오래전에 기록이 들어온 것),
+  "lowest_severity" (심각도가 가장 낮은 것). 방금 추가한 기록과 그 버킷은 제외
+- 원본 기록 제거는 버킷 요약을 바꾸지 않는다 (요약은 모든 기록을 이미 반영)
+- 버킷 제거 시 그 횟수는 분류표·전체 실패 수에서도 빠진다 (항상 버킷 합과 일치)
+- 기록을 직접 삭제하면 (del failure_records[...]) 그 기록은 버킷에서도 빠진다
+
+통계/편향:
+- total_failures / collapse_taxonomy / signature_statistics()는 버킷 요약에서 계산
+  → FailureBiasConverter의 risk_map 키는 버킷 대표 서명 (bucket_signature()로 변환해 조회)
+- failure_records / failure_manifold / 유사도 질의는 남아 있는 원본 기록 대상
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .failure_atlas import (
+    FailureAtlas,
+    FailureColumns,
+    FailureRecord,
+    _COLLAPSE_MODES,
+    _parse_signature_features
+)
+from ._compat import HAS_NUMPY, np
+
+
+EVICTION_POLICIES = ("oldest", "lru", "lowest_severity")
+
+# 메모리 추정 (max_bytes): 버킷 하나 (객체 + 딕셔너리 항목), 행별 버킷 참조
+_BUCKET_BYTES = 512
+_ROW_BYTES = 8
+
+
+def _low_water(limit: int) -> int:
+    """상한 초과 시 줄일 목표 (상한의 7/8)"""
+    return limit - max(1, limit // 8)
+
+
+@dataclass
+class FailureBucket:
+    """서명 버킷 요약"""
+    signature: str  # 버킷 대표 서명
+    count: int = 0
+    severity_sum: float = 0.0
+    severity_square_sum: float = 0.0
+    first_seen: float = math.inf  # 처음 발생 시각 (기록 timestamp)
+    last_seen: float = -math.inf  # 마지막 발생 시각
+    mode_counts: Dict[str, int] = field(default_factory=dict)
+    last_used: int = 0  # 마지막으로 기록이 들어온 순번 (LRU)
+
+    @property
+    def mean_severity(self) -> float:
+        """평균 심각도"""
+        return self.severity_sum / self.count if self.count else 0.0
+
+    @property
+    def severity_variance(self) -> float:
+        """심각도 분산 (모분산)"""
+        if not self.count:
+            return 0.0
+        mean = self.mean_severity
+        return max(self.severity_square_sum / self.count - mean * mean, 0.0)
+
+    def add(self, severity: float, mode: str, timestamp: float, tick: int) -> None:
+        """기록 하나 반영"""
+        self.count += 1
+        self.severity_sum += severity
+        self.severity_square_sum += severity * severity
+        self.first_seen = min(self.first_seen, timestamp)
+        self.last_seen = max(self.last_seen, timestamp)
+        self.mode_counts[mode] = self.mode_counts.get(mode, 0) + 1
+        self.last_used = tick
+
+    def remove(self, severity: float, mode: str) -> None:
+        """기록 하나 제외 (발생 시각 범위는 유지)"""
+        self.count -= 1
+        self.severity_sum -= severity
+        self.severity_square_sum -= severity * severity
+        self.mode_counts[mode] -= 1
+        if not self.mode_counts[mode]:
+            del self.mode_counts[mode]
+
+
+class BoundedFailureColumns(FailureColumns):
+    """상한이 있는 열 저장소 + 서명 버킷 요약
+
+    원본 행은 FailureColumns와 같고, 추가할 때마다 버킷 요약을 갱신한 뒤 상한을 적용한다.
+    """
+
+    def __init__(
+        self,
+        max_records: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_buckets: Optional[int] = None,
+        eviction: str = "oldest",
+        bucket_resolution: Optional[float] = 0.05
+    ):
+        """
+        Args:
+            max_records: 원본 기록 최대 수 (None이면 제한 없음)
+            max_bytes: 추정 메모리 상한 (바이트, None이면 제한 없음)
+            max_buckets: 버킷 최대 수 (None이면 제한 없음)
+            eviction: 제거 정책 ("oldest" / "lru" / "lowest_severity")
+            bucket_resolution: 버킷 양자화 단위 (None이면 서명 그대로 버킷)
+        """
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"eviction은 {EVICTION_POLICIES} 중 하나여야 합니다: {eviction!r}")
+        for name, limit in (("max_records", max_records), ("max_bytes", max_bytes), ("max_buckets", max_buckets)):
+            if limit is not None and limit < 1:
+                raise ValueError(f"{name}는 1 이상이어야 합니다")
+        if bucket_resolution is not None and bucket_resolution <= 0:
+            raise ValueError("bucket_resolution은 양수여야 합니다")
+
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+        self.max_buckets = max_buckets
+        self.eviction = eviction
+        self.bucket_resolution = bucket_resolution
+        self._signature_bytes = 0
+        # 인턴 테이블 인덱스 → 버킷 대표 서명 (서명마다 한 번만 계산)
+        self._signature_buckets: List[str] = []
+        super().__init__()
+        self._reset_buckets()
+
+    def _reset_buckets(self) -> None:
+        """버킷 요약과 통계 초기화"""
+        self.buckets: Dict[str, FailureBucket] = {}
+        self._row_buckets: List[FailureBucket] = []
+        self._bucket_bytes = 0
+        self._tick = 0
+        # 붕괴 모드별 횟수 / 전체 실패 수 (항상 버킷 합과 같음)
+        self.mode_totals: Dict[str, int] = {}
+        self.total_failures = 0
+        # 제거 통계
+        self.evicted_records = 0
+        self.evicted_buckets = 0
+
+    @property
+    def memory_bytes(self) -> int:
+        """추정 메모리 (열 버퍼 + 서명 테이블 + 행별 버킷 참조 + 버킷)"""
+        return self.nbytes + self._signature_bytes + len(self) * _ROW_BYTES + self._bucket_bytes
+
+    def intern(self, signature: str) -> int:
+        count = self.signature_count
+        signature_id = super().intern(signature)
+        if self.signature_count > count:
+            self._signature_bytes += len(signature)
+            self._signature_buckets.append(self.bucket_signature(signature))
+        return signature_id
+
+    def drop_unused_signatures(self) -> int:
+        labels = dict(zip(self.signatures, self._signature_buckets))
+        removed = super().drop_unused_signatures()
+        if removed:
+            self._signature_bytes = sum(len(signature) for signature in self.signatures)
+            self._signature_buckets = [labels[signature] for signature in self.signatures]
+        return removed
+
+    def bucket_signature(self, signature: str) -> str:
+        """조건 서명 → 버킷 대표 서명"""
+        features = _parse_signature_features(signature)
+        if self.bucket_resolution is None or not features:
+            return signature
+        # 천체 N개: 질량 N + 거리 N(N-1)/2 + mismatch 1
+        bodies = 1
+        while bodies + bodies * (bodies - 1) // 2 + 1 < len(features):
+            bodies += 1
+        if bodies + bodies * (bodies - 1) // 2 + 1 != len(features):
+            return signature
+
+        resolution = self.bucket_resolution
+        quantized = [round(round(value / resolution) * resolution, 9) for value in features]
+        masses = tuple(quantized[:bodies])
+        distances = tuple(quantized[bodies:-1])
+        return f"mass_{masses}_dist_{distances}_mismatch_{quantized[-1]:.3f}"
+
+    def append(self, record: FailureRecord) -> int:
+        """기록 추가 후 상한 적용
+
+        Returns:
+            추가된 기록의 (제거 후) 행 번호
+        """
+        super().append(record)
+        label = self._signature_buckets[self.signature_id[-1]]
+        bucket = self.buckets.get(label)
+        if bucket is None:
+            bucket = self.buckets[label] = FailureBucket(label)
+            self._bucket_bytes += _BUCKET_BYTES + len(label)
+        self._tick += 1
+        mode = record.collapse_mode.value
+        bucket.add(record.collapse_severity, mode, record.timestamp, self._tick)
+        self._row_buckets.append(bucket)
+        self.mode_totals[mode] = self.mode_totals.get(mode, 0) + 1
+        self.total_failures += 1
+        self._enforce_limits()
+        return len(self) - 1
+
+    def extend_from(self, other: FailureColumns) -> None:
+        """다른 저장소의 행 추가 (기록마다 append, 버킷/상한 규칙 유지)"""
+        for row in range(len(other)):
+            self.append(other.record(row))
+
+    def _enforce_limits(self) -> None:
+        """상한 초과 시 상한의 7/8까지 제거"""
+        if self.max_buckets is not None and len(self.buckets) > self.max_buckets:
+            self._evict_buckets(len(self.buckets) - _low_water(self.max_buckets))
+        if self.max_records is not None and len(self) > self.max_records:
+            self._evict_rows(len(self) - _low_water(self.max_records))
+        if self.max_bytes is not None and self.memory_bytes > self.max_bytes:
+            target = _low_water(self.max_bytes)
+            # 원본 기록부터, 남은 기록이 새 기록뿐이면 버킷 제거
+            while self.memory_bytes > target:
+                excess = self.memory_bytes - target
+                if len(self) > 1:
+                    per_row = self.nbytes / len(self) + _ROW_BYTES
+                    self._evict_rows(max(1, math.ceil(excess / per_row)))
+                elif len(self.buckets) > 1:
+                    self._evict_buckets(max(1, math.ceil(excess / _BUCKET_BYTES)))
+                else:
+                    break
+
+    def _keep_rows(self, rows: Sequence[int]) -> None:
+        """주어진 행만 남김 (버킷 요약은 그대로, 참조 없는 서명 제거)"""
+        rows = list(rows)
+        row_buckets = self._row_buckets
+        FailureColumns.retain(self, rows)
+        self._row_buckets = [row_buckets[row] for row in rows]
+        self.drop_unused_signatures()
+
+    def _evict_rows(self, count: int) -> None:
+        """원본 기록 count개 제거 (정책 순서, 마지막 행 제외)"""
+        rows = len(self)
+        count = min(count, rows - 1)
+        if count <= 0:
+            return
+        if self.eviction == "oldest":
+            keep = range(count, rows)
+        else:
+            if self.eviction == "lru":
+                keys = [bucket.last_used for bucket in self._row_buckets[:-1]]
+            elif HAS_NUMPY:
+                keys = self.column("collapse_severity")[:-1]
+            else:
+                keys = [self.value("collapse_severity", row) for row in range(rows - 1)]
+            if HAS_NUMPY:
+                victims = np.argsort(np.asarray(keys), kind="stable")[:count]
+                mask = np.ones(rows, dtype=bool)
+                mask[victims] = False
+                keep = np.flatnonzero(mask).tolist()
+            else:
+                victims = set(sorted(range(rows - 1), key=keys.__getitem__)[:count])
+                keep = [row for row in range(rows) if row not in victims]
+        self._keep_rows(keep)
+        self.evicted_records += count
+
+    def _drop_bucket(self, bucket: FailureBucket) -> None:
+        """버킷 요약 제거 (분류표/전체 실패 수에서도 뺌)"""
+        del self.buckets[bucket.signature]
+        self._bucket_bytes -= _BUCKET_BYTES + len(bucket.signature)
+        self.total_failures -= bucket.count
+        for mode, count in bucket.mode_counts.items():
+            self.mode_totals[mode] -= count
+            if not self.mode_totals[mode]:
+                del self.mode_totals[mode]
+
+    def _evict_buckets(self, count: int) -> None:
+        """버킷 count개 제거 (정책 순서, 마지막 기록의 버킷 제외) + 그 버킷의 원본 기록 제거"""
+        protected = self._row_buckets[-1] if self._row_buckets else None
+        candidates = [bucket for bucket in self.buckets.values() if bucket is not protected]
+        if self.eviction == "lru":
+            candidates.sort(key=lambda bucket: bucket.last_used)
+        elif self.eviction == "lowest_severity":
+            candidates.sort(key=lambda bucket: bucket.mean_severity)
+        victims = candidates[:count]
+        if not victims:
+            return
+        for bucket in victims:
+            self._drop_bucket(bucket)
+        evicted = {id(bucket) for bucket in victims}
+        self._keep_rows([
+            row for row, bucket in enumerate(self._row_buckets) if id(bucket) not in evicted
+        ])
+        self.evicted_buckets += len(victims)
+
+    def retain(self, rows: Sequence[int]) -> None:
+        """주어진 행만 남김 (삭제된 기록은 버킷 요약에서도 뺌)"""
+        rows = list(rows)
+        kept = set(rows)
+        for row in range(len(self)):
+            if row in kept:
+                continue
+            bucket = self._row_buckets[row]
+            mode = _COLLAPSE_MODES[self.value("collapse_mode", row)].value
+            bucket.remove(self.value("collapse_severity", row), mode)
+            self.total_failures -= 1
+            self.mode_totals[mode] -= 1
+            if not self.mode_totals[mode]:
+                del self.mode_totals[mode]
+            if not bucket.count:
+                del self.buckets[bucket.signature]
+                self._bucket_bytes -= _BUCKET_BYTES + len(bucket.signature)
+        self._keep_rows(rows)
+
+    def clear(self) -> None:
+        """모든 행, 서명 테이블, 버킷 요약 제거"""
+        super().clear()
+        self._signature_bytes = 0
+        self._signature_buckets = []
+        self._reset_buckets()
+
+    def bucket_statistics(self) -> Tuple[List[str], Sequence[int], Sequence[float]]:
+        """버킷별 (대표 서명, 횟수, 심각도 합), 버킷이 처음 생긴 순서"""
+        buckets = list(self.buckets.values())
+        names = [bucket.signature for bucket in buckets]
+        counts = [bucket.count for bucket in buckets]
+        sums = [bucket.severity_sum for bucket in buckets]
+        if HAS_NUMPY:
+            return names, np.array(counts, dtype=np.int64), np.array(sums, dtype=np.float64)
+        return names, counts, sums
+
+
+class BoundedFailureAtlas(FailureAtlas):
+    """메모리 상한이 있는 FailureAtlas (BoundedFailureColumns 위의 FailureAtlas)
+
+    분류표·실패율·서명 통계 (따라서 FailureBiasConverter 편향)는 버킷 요약 기준.
+
+    사용:
+        atlas = BoundedFailureAtlas(max_records=100_000, eviction="lru")
+        atlas.record_failure(analysis, system)
+        bias = FailureBiasConverter().convert_failure_to_bias(atlas)
+        bias.get_risk(atlas.bucket_signature(signature))
+    """
+
+    def __init__(
+        self,
+        max_records: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_buckets: Optional[int] = None,
+        eviction: str = "oldest",
+        bucket_resolution: Optional[float] = 0.05
+    ):
+        """인자는 BoundedFailureColumns와 같다"""
+        super().__init__(columns=BoundedFailureColumns(
+            max_records=max_records,
+            max_bytes=max_bytes,
+            max_buckets=max_buckets,
+            eviction=eviction,
+            bucket_resolution=bucket_resolution
+        ))
+
+    @property
+    def buckets(self) -> Dict[str, FailureBucket]:
+        """버킷 대표 서명 → 버킷 요약 (처음 생긴 순서)"""
+        return self.columns.buckets
+
+    @property
+    def total_failures(self) -> int:
+        """실패 수 (버킷 합, 제거된 원본 기록 포함)"""
+        return self.columns.total_failures
+
+    @property
+    def collapse_taxonomy(self) -> Dict[str, int]:
+        """붕괴 모드별 실패 횟수 (버킷 합)"""
+        return dict(self.columns.mode_totals)
+
+    def bucket_signature(self, condition_signature: str) -> str:
+        """조건 서명 → 버킷 대표 서명 (편향 조회용)"""
+        return self.columns.bucket_signature(condition_signature)
+
+    def signature_statistics(self) -> Tuple[List[str], Sequence[int], Sequence[float]]:
+        """버킷별 (대표 서명, 횟수, 심각도 합)"""
+        return self.columns.bucket_statistics()
+
+    def get_failure_statistics(self) -> Dict:
+        """실패 통계 (버킷 기준) + 원본 기록/버킷/제거 수"""
+        statistics = super().get_failure_statistics()
+        columns = self.columns
+        statistics.update({
+            "raw_records": len(columns),
+            "buckets": len(columns.buckets),
+            "evicted_records": columns.evicted_records,
+            "evicted_buckets": columns.evicted_buckets,
+            "memory_bytes": columns.memory_bytes,
+        })
+        return statistics
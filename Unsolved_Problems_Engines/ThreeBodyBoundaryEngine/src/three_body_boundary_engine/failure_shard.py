@@ -0,0 +1,160 @@
+"""
+Failure Shard - 프로세스 간 FailureAtlas 전달용 샤드 형식 (L1)
+
+엔진 번호: UP-1
+레이어: L1 (실패 구조 축적)
+역할: 워커가 만든 부분 실패 지도를 바이트/파일로 옮기고, 받는 쪽에서 병합
+
+샤드 구성:
+- 매직 b"TBFASHD1" + 헤더 길이 (u8 리틀 엔디언)
+- JSON 헤더: 바이트 순서, 열 (이름, typecode, 길이), 서명 테이블, spatial_pattern,
+  요약 (FailureSummary — 분류표 / 서명별 통계)
+- 열 버퍼 (헤더의 열 순서) + 수치 서명 features 버퍼
+
+병합 (map-reduce):
+- 기록까지: FailureAtlas.merge_from(*shards) — 샤드당 열 단위 일괄 복사
+- 요약만: read_failure_shard_summary()는 헤더만 읽으므로
+  FailureSummary().merge(*summaries)가 샤드 수에 비례 (기록 수와 무관)
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import json
+import struct
+import sys
+from array import array
+
+from .failure_atlas import FailureAtlas, FailureColumns, FailureSummary
+
+
+SHARD_MAGIC = b"TBFASHD1"
+SHARD_VERSION = 1
+_HEADER_LENGTH = struct.Struct("<Q")
+
+
+def _plain_columns(columns: FailureColumns) -> FailureColumns:
+    """메모리 열 저장소 (파일 저장소 등은 복사)"""
+    if type(columns) is FailureColumns:
+        return columns
+    plain = FailureColumns()
+    plain.extend_from(columns)
+    return plain
+
+
+def encode_failure_shard(atlas: FailureAtlas) -> bytes:
+    """실패 지도 → 샤드 바이트"""
+    columns = _plain_columns(atlas.columns)
+    summary = atlas.summary()
+    buffers = [getattr(columns, name) for name, _ in columns.COLUMNS] + [columns.features]
+    header = {
+        "version": SHARD_VERSION,
+        "byteorder": sys.byteorder,
+        "rows": len(columns),
+        "columns": [
+            [name, typecode, len(getattr(columns, name))] for name, typecode in columns.COLUMNS
+        ],
+        "features": len(columns.features),
+        "signatures": columns.signatures,
+        "patterns": [[row, pattern] for row, pattern in columns.spatial_patterns.items()],
+        "summary": {
+            "total_failures": summary.total_failures,
+            "collapse_taxonomy": summary.collapse_taxonomy,
+            "signature_counts": summary.signature_counts,
+            "signature_severity": summary.signature_severity,
+        },
+    }
+    encoded = json.dumps(header).encode("utf-8")
+    parts = [SHARD_MAGIC, _HEADER_LENGTH.pack(len(encoded)), encoded]
+    parts.extend(buffer.tobytes() for buffer in buffers)
+    return b"".join(parts)
+
+
+def _decode_header(data: bytes) -> tuple:
+    """(헤더, 버퍼 시작 위치)"""
+    prefix = len(SHARD_MAGIC) + _HEADER_LENGTH.size
+    if len(data) < prefix or data[:len(SHARD_MAGIC)] != SHARD_MAGIC:
+        raise ValueError("실패 샤드 형식이 아닙니다")
+    (length,) = _HEADER_LENGTH.unpack_from(data, len(SHARD_MAGIC))
+    if len(data) < prefix + length:
+        raise ValueError("실패 샤드 헤더가 잘렸습니다")
+    try:
+        header = json.loads(data[prefix:prefix + length].decode("utf-8"))
+    except ValueError as exc:
+        raise ValueError(f"실패 샤드 헤더를 읽을 수 없습니다: {exc}") from None
+    if header.get("version") != SHARD_VERSION:
+        raise ValueError(f"지원하지 않는 샤드 버전: {header.get('version')}")
+    return header, prefix + length
+
+
+def _summary_from_header(header: dict) -> FailureSummary:
+    summary = header["summary"]
+    return FailureSummary(
+        total_failures=summary["total_failures"],
+        collapse_taxonomy=summary["collapse_taxonomy"],
+        signature_counts=summary["signature_counts"],
+        signature_severity=summary["signature_severity"]
+    )
+
+
+def decode_failure_shard(data: bytes) -> FailureAtlas:
+    """샤드 바이트 → 실패 지도"""
+    header, offset = _decode_header(data)
+    view = memoryview(data)
+    rows = header["rows"]
+    swap = header["byteorder"] != sys.byteorder
+    columns = FailureColumns()
+    expected = [list(column) for column in FailureColumns.COLUMNS]
+    if [column[:2] for column in header["columns"]] != expected:
+        raise ValueError("실패 샤드의 열 구성이 다릅니다")
+
+    layout = [(name, typecode, count) for name, typecode, count in header["columns"]]
+    layout.append(("features", "d", header["features"]))
+    for name, typecode, count in layout:
+        if name != "features" and count != rows:
+            raise ValueError(f"실패 샤드의 열 길이가 맞지 않습니다: {name}")
+        buffer = array(typecode)
+        size = count * buffer.itemsize
+        if offset + size > len(data):
+            raise ValueError("실패 샤드 데이터가 잘렸습니다")
+        buffer.frombytes(view[offset:offset + size])
+        if swap:
+            buffer.byteswap()
+        setattr(columns, name, buffer)
+        offset += size
+
+    for signature in header["signatures"]:
+        columns.intern(signature)
+    if max(columns.signature_id, default=-1) >= columns.signature_count:
+        raise ValueError("실패 샤드의 서명 참조가 서명 테이블을 벗어납니다")
+    columns.spatial_patterns = {row: pattern for row, pattern in header["patterns"]}
+    return FailureAtlas(columns=columns)
+
+
+def write_failure_shard(atlas: FailureAtlas, path: str) -> int:
+    """샤드 파일 저장
+
+    Returns:
+        기록한 바이트 수
+    """
+    data = encode_failure_shard(atlas)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def read_failure_shard(path: str) -> FailureAtlas:
+    """샤드 파일 → 실패 지도"""
+    with open(path, "rb") as f:
+        return decode_failure_shard(f.read())
+
+
+def read_failure_shard_summary(path: str) -> FailureSummary:
+    """샤드 파일의 요약만 읽기 (열 버퍼는 읽지 않음)"""
+    with open(path, "rb") as f:
+        prefix = f.read(len(SHARD_MAGIC) + _HEADER_LENGTH.size)
+        if len(prefix) == len(SHARD_MAGIC) + _HEADER_LENGTH.size and prefix.startswith(SHARD_MAGIC):
+            (length,) = _HEADER_LENGTH.unpack_from(prefix, len(SHARD_MAGIC))
+            prefix += f.read(length)
+    header, _ = _decode_header(prefix)
+    return _summary_from_header(header)
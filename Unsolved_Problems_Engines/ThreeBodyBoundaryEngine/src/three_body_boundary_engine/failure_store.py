@@ -0,0 +1,864 @@
+"""
+Failure Store - 추가 전용 영구 실패 기록 저장소 (L1)
+
+엔진 번호: UP-1
+레이어: L1 (실패 구조 축적)
+역할: FailureAtlas 기록을 디렉토리에 추가 전용으로 쌓고, 재시작 시 메모리 매핑으로 다시 연다
+
+디렉토리 구성 (g = 파일 세대, 압축할 때마다 증가):
+- manifest.json: 현재 세대 + 마지막 스냅샷 (임시 파일 후 원자적 교체, 유일한 커밋 지점)
+- g{g}-segment-{k}.bin: 헤더 16바이트 (매직, 기록 크기, 형식 버전) + 고정 크기 기록
+  기록은 RECORD_DTYPE (리틀 엔디언 96바이트, 앞 88바이트의 CRC32 포함)
+  세그먼트당 segment_records개, 마지막 세그먼트만 덜 찰 수 있다
+- g{g}-features.bin: 수치 서명 float64 평탄 배열
+- g{g}-signatures.bin: 서명 문자열 항목 (u4 길이 + UTF-8 바이트) 연속
+- g{g}-patterns.jsonl: spatial_pattern이 있는 행 ({"row": i, "pattern": {...}})
+- g{g}-snapshot-{s}-offsets.npy: 서명 항목 시작 오프셋 (+ 끝)
+- g{g}-snapshot-{s}-hashes.npy / -ids.npy: 서명 해시 정렬 색인 (인턴 조회용)
+
+쓰기 순서: 새 서명 → 수치 서명 → 기록. 기록이 마지막이므로 온전한 기록의 참조 대상은 항상 온전하다.
+
+열기 (O(스냅샷 이후 꼬리)):
+- 스냅샷까지의 기록·서명은 검사 없이 메모리 매핑 (5천만 기록도 밀리초 단위)
+- 스냅샷 이후 꼬리만 검사 (CRC32, 서명 id, 수치 서명 범위) — 첫 손상 기록부터 잘라냄
+- 반쯤 쓰인 서명 항목 / float / 기록도 잘라냄, 다른 세대의 파일(중단된 압축)은 삭제
+
+스냅샷 (snapshot_interval 기록마다, close() 시):
+- 파일 fsync → 서명 오프셋/해시 색인 저장 → manifest 교체
+- 메모리에 모아 둔 이번 세션 행을 버리고 파일을 다시 매핑 (상주 메모리 ≤ snapshot_interval 행)
+
+압축 (FailureStore.compact(), compact_failure_store(DIR)):
+- 다음 세대 파일에 다시 쓴 뒤 manifest 교체로 전환 (중단되면 이전 세대 유지)
+- 참조되지 않는 서명/수치 서명(충돌 잔여물) 제거, 서명은 처음 나타난 순서로 재번호
+- rows를 주면 그 행만 (그 순서로) 남김 — FailureColumns.retain()의 파일 구현
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import hashlib
+import json
+import os
+import re
+import struct
+import zlib
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from .failure_atlas import FailureAtlas, FailureColumns, FailureRecord, _COLLAPSE_MODES
+from ._compat import np, require_numpy
+
+
+SEGMENT_MAGIC = b"TBFASEG1"
+FORMAT_VERSION = 1
+HEADER_SIZE = 16
+MANIFEST = "manifest.json"
+
+_HEADER = struct.Struct("<8sII")
+# RECORD_DTYPE과 같은 레이아웃 (한 건씩 쓸 때 사용)
+_RECORD_FIELDS = (
+    "timestamp", "delta_threshold_crossed", "mismatch", "convergence_rate",
+    "stability_score", "collapse_severity",
+    "iteration", "boundary_points", "signature_id", "feature_start",
+    "feature_dim", "converged", "collapse_mode",
+)
+_RECORD = struct.Struct("<6d4qibb2x")
+_CRC = struct.Struct("<I4x")
+# CRC32 대상 바이트 수 (crc 필드 앞까지)
+CRC_BYTES = _RECORD.size
+_LENGTH = struct.Struct("<I")
+_FILE_PATTERN = re.compile(r"^g(\d+)-(segment-\d+\.bin|features\.bin|signatures\.bin|"
+                           r"patterns\.jsonl|snapshot-(\d+)-(offsets|hashes|ids)\.npy)$")
+
+if np is not None:
+    # 기록 레이아웃 (오프셋 고정, 86~88 / 92~96은 0으로 채움)
+    RECORD_DTYPE = np.dtype({
+        "names": list(_RECORD_FIELDS) + ["crc"],
+        "formats": [
+            "<f8", "<f8", "<f8", "<f8", "<f8", "<f8",
+            "<i8", "<i8", "<i8", "<i8",
+            "<i4", "i1", "i1", "<u4",
+        ],
+        "offsets": [0, 8, 16, 24, 32, 40, 48, 56, 64, 72, 80, 84, 85, 88],
+        "itemsize": 96,
+    })
+
+
+def _signature_hash(signature: str) -> int:
+    """서명 문자열 → 64비트 해시 (인턴 색인 키)"""
+    digest = hashlib.blake2b(signature.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _fsync(handle) -> None:
+    handle.flush()
+    os.fsync(handle.fileno())
+
+
+class FailureStore(FailureColumns):
+    """파일 기반 열 저장소 (추가 전용, 메모리 매핑)
+
+    행 번호는 파일 전체 기준. 마지막 스냅샷까지의 행은 세그먼트 메모리 맵에서,
+    이후 이번 세션에 추가된 행은 상속한 array 열(메모리 꼬리)에서 읽는다.
+    서명 id, feature_start도 파일 전체 기준 값을 그대로 저장한다.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        segment_records: int = 1 << 20,
+        snapshot_interval: int = 1 << 16,
+        durable: bool = False
+    ):
+        """
+        Args:
+            path: 저장소 디렉토리 (없으면 생성)
+            segment_records: 세그먼트 파일당 기록 수 (기존 저장소는 manifest 값 사용)
+            snapshot_interval: 자동 스냅샷 간격 (기록 수)
+            durable: True면 기록마다 flush + fsync (느림, 전원 차단에도 안전)
+        """
+        require_numpy("FailureStore")
+        if segment_records < 1 or snapshot_interval < 1:
+            raise ValueError("segment_records, snapshot_interval은 1 이상이어야 합니다")
+
+        self.path = path
+        self.segment_records = segment_records
+        self.snapshot_interval = snapshot_interval
+        self.durable = durable
+        self._handles: Dict[str, object] = {}
+        super().__init__()
+
+        # 통계
+        self.recovered_records = 0  # 열 때 검사한 꼬리 기록 수
+        self.truncated_records = 0  # 열 때 잘라낸 손상 기록 수
+        self.snapshots = 0
+
+        os.makedirs(path, exist_ok=True)
+        if not os.path.exists(os.path.join(path, MANIFEST)):
+            self._create(0, self.segment_records)
+        self._open()
+
+    # ------------------------------------------------------------------
+    # 파일 배치
+    # ------------------------------------------------------------------
+
+    def _file(self, name: str, generation: Optional[int] = None) -> str:
+        if generation is None:
+            generation = self._file_generation
+        return os.path.join(self.path, f"g{generation}-{name}")
+
+    def _segment_file(self, index: int, generation: Optional[int] = None) -> str:
+        return self._file(f"segment-{index:06d}.bin", generation)
+
+    def _snapshot_file(self, kind: str, snapshot: int, generation: Optional[int] = None) -> str:
+        return self._file(f"snapshot-{snapshot}-{kind}.npy", generation)
+
+    def _write_manifest(self, manifest: Dict) -> None:
+        """manifest 원자적 교체 (커밋 지점)"""
+        path = os.path.join(self.path, MANIFEST)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+            _fsync(f)
+        os.replace(temp_path, path)
+
+    def _write_snapshot_arrays(
+        self,
+        generation: int,
+        snapshot: int,
+        offsets: "np.ndarray",
+        hashes: "np.ndarray",
+        ids: "np.ndarray"
+    ) -> None:
+        """서명 오프셋 + 해시 정렬 색인 저장"""
+        order = np.argsort(hashes, kind="stable")
+        for kind, values in (("offsets", offsets), ("hashes", hashes[order]), ("ids", ids[order])):
+            with open(self._snapshot_file(kind, snapshot, generation), "wb") as f:
+                np.save(f, values)
+                _fsync(f)
+
+    def _create(self, generation: int, segment_records: int) -> None:
+        """빈 저장소 파일 생성"""
+        with open(self._segment_file(0, generation), "wb") as f:
+            f.write(_HEADER.pack(SEGMENT_MAGIC, RECORD_DTYPE.itemsize, FORMAT_VERSION))
+            _fsync(f)
+        for name in ("features.bin", "signatures.bin", "patterns.jsonl"):
+            with open(self._file(name, generation), "wb") as f:
+                _fsync(f)
+        self._write_snapshot_arrays(
+            generation, 0, np.zeros(1, dtype=np.int64),
+            np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64)
+        )
+        self._write_manifest(self._manifest(generation, 0, segment_records, 0, 0, 0, 0))
+
+    @staticmethod
+    def _manifest(generation, snapshot, segment_records, records, features, signatures, signature_bytes) -> Dict:
+        return {
+            "format": "three-body-failure-store",
+            "version": FORMAT_VERSION,
+            "generation": generation,
+            "snapshot": snapshot,
+            "segment_records": segment_records,
+            "records": records,
+            "features": features,
+            "signatures": signatures,
+            "signature_bytes": signature_bytes,
+        }
+
+    # ------------------------------------------------------------------
+    # 열기 / 복구
+    # ------------------------------------------------------------------
+
+    def _open(self) -> None:
+        """manifest 기준으로 파일을 검사·복구하고 매핑"""
+        with open(os.path.join(self.path, MANIFEST), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != FORMAT_VERSION:
+            raise ValueError(f"지원하지 않는 저장소 형식 버전: {manifest.get('version')}")
+        self._file_generation = manifest["generation"]
+        self._snapshot_id = manifest["snapshot"]
+        self.segment_records = manifest["segment_records"]
+        self._remove_stale_files()
+
+        snapshot_rows = manifest["records"]
+        snapshot_signatures = manifest["signatures"]
+        signature_bytes = self._recover_signatures(manifest["signature_bytes"])
+        feature_count = self._recover_features()
+        truncated = self.truncated_records
+        rows = self._recover_records(snapshot_rows, feature_count)
+        self._recover_patterns(rows, self.truncated_records > truncated)
+
+        self._disk_rows = rows
+        self._disk_features = feature_count
+        self._disk_signature_bytes = signature_bytes
+        self._rows_since_snapshot = rows - snapshot_rows
+        self._map(snapshot_signatures)
+        self._open_handles()
+
+    def _remove_stale_files(self) -> None:
+        """현재 세대/스냅샷이 아닌 저장소 파일과 임시 파일 삭제"""
+        for name in os.listdir(self.path):
+            match = _FILE_PATTERN.match(name)
+            stale = name.endswith(".tmp")
+            if match is not None:
+                stale = int(match.group(1)) != self._file_generation or (
+                    match.group(3) is not None and int(match.group(3)) != self._snapshot_id
+                )
+            if stale:
+                os.remove(os.path.join(self.path, name))
+
+    def _recover_signatures(self, snapshot_bytes: int) -> int:
+        """스냅샷 이후 서명 항목 읽기 (반쯤 쓰인 항목은 잘라냄)
+
+        Returns:
+            유효한 서명 파일 크기 (바이트)
+        """
+        path = self._file("signatures.bin")
+        with open(path, "rb") as f:
+            f.seek(snapshot_bytes)
+            tail = f.read()
+        position = 0
+        self._recent_ends: List[int] = []
+        recent = []
+        while position + _LENGTH.size <= len(tail):
+            (length,) = _LENGTH.unpack_from(tail, position)
+            end = position + _LENGTH.size + length
+            if end > len(tail):
+                break
+            try:
+                recent.append(tail[position + _LENGTH.size:end].decode("utf-8"))
+            except UnicodeDecodeError:
+                break
+            position = end
+            self._recent_ends.append(snapshot_bytes + end)
+        valid = snapshot_bytes + position
+        if valid < snapshot_bytes + len(tail):
+            os.truncate(path, valid)
+        self.signatures = recent
+        return valid
+
+    def _recover_features(self) -> int:
+        """반쯤 쓰인 float 잘라냄
+
+        Returns:
+            float 개수
+        """
+        path = self._file("features.bin")
+        size = os.path.getsize(path)
+        if size % 8:
+            os.truncate(path, size - size % 8)
+        return size // 8
+
+    def _segment_paths(self) -> List[str]:
+        """현재 세대 세그먼트 파일 (번호 순, 빠진 번호 이후는 무시)"""
+        paths = []
+        while os.path.exists(self._segment_file(len(paths))):
+            paths.append(self._segment_file(len(paths)))
+        return paths
+
+    def _recover_records(self, snapshot_rows: int, feature_count: int) -> int:
+        """스냅샷 이후 꼬리 기록 검사, 첫 손상 기록부터 잘라냄
+
+        Returns:
+            유효한 기록 수
+        """
+        paths = self._segment_paths()
+        if not paths:
+            raise ValueError(f"세그먼트 파일이 없습니다: {self.path}")
+        signature_total = None  # 스냅샷 + 꼬리 서명 수 (_map 전이라 직접 계산)
+        size = RECORD_DTYPE.itemsize
+        rows = 0
+        for index, path in enumerate(paths):
+            with open(path, "rb") as f:
+                header = f.read(HEADER_SIZE)
+                if len(header) < HEADER_SIZE:
+                    # 회전 중 헤더를 쓰다 중단
+                    f.close()
+                    with open(path, "wb") as rewritten:
+                        rewritten.write(_HEADER.pack(SEGMENT_MAGIC, size, FORMAT_VERSION))
+                    count = valid = 0
+                else:
+                    magic, record_size, _ = _HEADER.unpack(header)
+                    if magic != SEGMENT_MAGIC or record_size != size:
+                        raise ValueError(f"세그먼트 헤더가 올바르지 않습니다: {path}")
+                    count = min((os.path.getsize(path) - HEADER_SIZE) // size, self.segment_records)
+                    # 스냅샷이 덮는 기록은 검사하지 않음
+                    valid = min(max(snapshot_rows - rows, 0), count)
+                    if valid < count:
+                        f.seek(HEADER_SIZE + valid * size)
+                        raw = f.read((count - valid) * size)
+                        if signature_total is None:
+                            signature_total = self._snapshot_signature_count() + len(self.signatures)
+                        self.recovered_records += count - valid
+                        valid += self._valid_prefix(
+                            raw, np.frombuffer(raw, dtype=RECORD_DTYPE), signature_total, feature_count
+                        )
+            if os.path.getsize(path) != HEADER_SIZE + valid * size:
+                self.truncated_records += count - valid
+                os.truncate(path, HEADER_SIZE + valid * size)
+            rows += valid
+
+            # 덜 찬 세그먼트 뒤의 세그먼트는 버림
+            if valid < self.segment_records:
+                for later in paths[index + 1:]:
+                    self.truncated_records += max((os.path.getsize(later) - HEADER_SIZE) // size, 0)
+                    os.remove(later)
+                break
+        if rows < snapshot_rows:
+            raise ValueError(f"스냅샷보다 기록이 적습니다 (손상된 저장소): {self.path}")
+        return rows
+
+    def _snapshot_signature_count(self) -> int:
+        offsets = np.load(self._snapshot_file("offsets", self._snapshot_id), mmap_mode="r")
+        return offsets.size - 1
+
+    @staticmethod
+    def _valid_prefix(
+        raw: bytes,
+        records: "np.ndarray",
+        signature_total: int,
+        feature_count: int
+    ) -> int:
+        """검사를 통과하는 앞쪽 기록 수"""
+        size = RECORD_DTYPE.itemsize
+        for i in range(records.size):
+            record = records[i]
+            dim = int(record["feature_dim"])
+            start = int(record["feature_start"])
+            if (
+                zlib.crc32(raw[i * size:i * size + CRC_BYTES]) != int(record["crc"])
+                or not 0 <= int(record["signature_id"]) < signature_total
+                or dim < 0 or start < 0 or start + dim > feature_count
+                or not 0 <= int(record["collapse_mode"]) < len(_COLLAPSE_MODES)
+            ):
+                return i
+        return records.size
+
+    def _recover_patterns(self, rows: int, truncated: bool) -> None:
+        """spatial_pattern 파일 복구 (반쯤 쓰인 줄 제거, 잘린 기록의 줄 제거)
+
+        평소에는 열지 않고 처음 접근할 때 읽는다 (spatial_patterns).
+        """
+        path = self._file("patterns.jsonl")
+        self._patterns = None
+        if truncated:
+            # 잘린 행 번호가 다시 쓰일 수 있으므로 유효 행만 남겨 다시 씀
+            patterns = {row: pattern for row, pattern in self._read_patterns().items() if row < rows}
+            self._write_patterns(path, patterns)
+            self._patterns = patterns
+            return
+        size = os.path.getsize(path)
+        if size:
+            with open(path, "rb") as f:
+                f.seek(max(size - 65536, 0))
+                tail = f.read()
+            if not tail.endswith(b"\n"):
+                os.truncate(path, size - len(tail) + tail.rfind(b"\n") + 1)
+
+    def _read_patterns(self) -> Dict[int, Dict[str, float]]:
+        """spatial_pattern 파일 읽기 (깨진 줄은 무시)"""
+        patterns = {}
+        with open(self._file("patterns.jsonl"), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                patterns[entry["row"]] = entry["pattern"]
+        return patterns
+
+    @staticmethod
+    def _write_patterns(path: str, patterns: Dict[int, Dict[str, float]]) -> None:
+        """spatial_pattern 파일 다시 쓰기 (임시 파일 후 교체)"""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for row, pattern in patterns.items():
+                f.write(json.dumps({"row": row, "pattern": pattern}) + "\n")
+            _fsync(f)
+        os.replace(temp_path, path)
+
+    @property
+    def spatial_patterns(self) -> Dict[int, Dict[str, float]]:
+        """행 → spatial_pattern (처음 접근할 때 파일에서 읽음)"""
+        if self._patterns is None:
+            if "patterns" in self._handles:
+                self._handles["patterns"].flush()
+            self._patterns = self._read_patterns()
+        return self._patterns
+
+    @spatial_patterns.setter
+    def spatial_patterns(self, patterns: Dict[int, Dict[str, float]]) -> None:
+        self._patterns = patterns
+
+    def _map(self, snapshot_signatures: int) -> None:
+        """파일 매핑 (기록 _disk_rows개, 서명 스냅샷분), 메모리 꼬리 비움"""
+        self._segments = []
+        remaining = self._disk_rows
+        for path in self._segment_paths():
+            count = min(remaining, self.segment_records)
+            if count == 0:
+                break
+            self._segments.append(
+                np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+            )
+            remaining -= count
+        self._base_rows = self._disk_rows
+        self._base_features = self._disk_features
+        self._feature_map = (
+            np.memmap(self._file("features.bin"), dtype="<f8", mode="r", shape=(self._disk_features,))
+            if self._disk_features else np.zeros(0)
+        )
+
+        self._signature_offsets = np.load(
+            self._snapshot_file("offsets", self._snapshot_id), mmap_mode="r"
+        )
+        self._hash_keys = np.load(self._snapshot_file("hashes", self._snapshot_id), mmap_mode="r")
+        self._hash_ids = np.load(self._snapshot_file("ids", self._snapshot_id), mmap_mode="r")
+        self._signature_base = snapshot_signatures
+        blob_size = int(self._signature_offsets[-1])
+        self._signature_blob = (
+            np.memmap(self._file("signatures.bin"), dtype=np.uint8, mode="r", shape=(blob_size,))
+            if blob_size else np.zeros(0, dtype=np.uint8)
+        )
+        self._signature_ids = {
+            signature: self._signature_base + i for i, signature in enumerate(self.signatures)
+        }
+
+        for name, typecode in self.COLUMNS:
+            setattr(self, name, array(typecode))
+        self.features = array("d")
+
+    def _open_handles(self) -> None:
+        """추가 쓰기 핸들"""
+        segment = len(self._segment_paths()) - 1
+        self._current_segment = segment
+        self._segment_rows = self._disk_rows - segment * self.segment_records
+        self._handles = {
+            "segment": open(self._segment_file(segment), "ab"),
+            "features": open(self._file("features.bin"), "ab"),
+            "signatures": open(self._file("signatures.bin"), "ab"),
+            "patterns": open(self._file("patterns.jsonl"), "a", encoding="utf-8"),
+        }
+        # 세그먼트를 채운 직후 중단된 경우
+        if self._segment_rows == self.segment_records:
+            self._rotate_segment()
+
+    def _close_handles(self) -> None:
+        for handle in self._handles.values():
+            handle.close()
+        self._handles = {}
+
+    # ------------------------------------------------------------------
+    # FailureColumns 접근 메서드 (파일 전체 기준 행/서명/수치 서명 번호)
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self._base_rows + len(self.timestamp)
+
+    @property
+    def signature_count(self) -> int:
+        return self._signature_base + len(self.signatures)
+
+    def signature_text(self, signature_id: int) -> str:
+        if signature_id >= self._signature_base:
+            return self.signatures[signature_id - self._signature_base]
+        start = int(self._signature_offsets[signature_id]) + _LENGTH.size
+        end = int(self._signature_offsets[signature_id + 1])
+        return self._signature_blob[start:end].tobytes().decode("utf-8")
+
+    def intern(self, signature: str) -> int:
+        signature_id = self._signature_ids.get(signature)
+        if signature_id is not None:
+            return signature_id
+        key = _signature_hash(signature)
+        position = int(np.searchsorted(self._hash_keys, np.uint64(key)))
+        while position < self._hash_keys.size and int(self._hash_keys[position]) == key:
+            candidate = int(self._hash_ids[position])
+            if self.signature_text(candidate) == signature:
+                return candidate
+            position += 1
+
+        # 새 서명: 기록보다 먼저 파일에 씀
+        encoded = signature.encode("utf-8")
+        self._handles["signatures"].write(_LENGTH.pack(len(encoded)) + encoded)
+        self._disk_signature_bytes += _LENGTH.size + len(encoded)
+        self._recent_ends.append(self._disk_signature_bytes)
+        signature_id = self.signature_count
+        self.signatures.append(signature)
+        self._signature_ids[signature] = signature_id
+        return signature_id
+
+    def _next_feature_start(self) -> int:
+        return self._base_features + len(self.features)
+
+    def append(self, record: FailureRecord) -> int:
+        row = super().append(record)
+        local = row - self._base_rows
+
+        features = self.features[self.feature_start[local] - self._base_features:]
+        if features:
+            self._handles["features"].write(features.tobytes())
+            self._disk_features += len(features)
+
+        payload = _RECORD.pack(*(getattr(self, name)[local] for name in _RECORD_FIELDS))
+        self._handles["segment"].write(payload + _CRC.pack(zlib.crc32(payload)))
+        if record.spatial_pattern is not None:
+            self._handles["patterns"].write(
+                json.dumps({"row": row, "pattern": record.spatial_pattern}) + "\n"
+            )
+        self._disk_rows += 1
+        self._segment_rows += 1
+        self._rows_since_snapshot += 1
+        if self.durable:
+            self._flush(sync=True)
+
+        if self._segment_rows == self.segment_records:
+            self._rotate_segment()
+        if self._rows_since_snapshot >= self.snapshot_interval:
+            self.snapshot()
+        return row
+
+    def extend_from(self, other: FailureColumns) -> None:
+        """다른 저장소의 행 추가 (기록마다 append, 세그먼트/스냅샷 규칙 유지)"""
+        for row in range(len(other)):
+            self.append(other.record(row))
+
+    def _rotate_segment(self) -> None:
+        """가득 찬 세그먼트를 닫고 다음 세그먼트 시작"""
+        _fsync(self._handles["segment"])
+        self._handles["segment"].close()
+        self._current_segment += 1
+        self._segment_rows = 0
+        handle = open(self._segment_file(self._current_segment), "ab")
+        handle.write(_HEADER.pack(SEGMENT_MAGIC, RECORD_DTYPE.itemsize, FORMAT_VERSION))
+        self._handles["segment"] = handle
+
+    def _segment_slices(self, start: int, stop: int) -> Iterator["np.ndarray"]:
+        """매핑된 행 [start, stop) 구간의 세그먼트 조각"""
+        size = self.segment_records
+        for index in range(start // size, (stop - 1) // size + 1 if stop > start else 0):
+            base = index * size
+            yield self._segments[index][max(start - base, 0):stop - base]
+
+    def value(self, name: str, row: int):
+        if row < self._base_rows:
+            size = self.segment_records
+            return self._segments[row // size][row % size][name].item()
+        return getattr(self, name)[row - self._base_rows]
+
+    def iter_column(self, name: str) -> Iterator:
+        for part in self._segment_slices(0, self._base_rows):
+            yield from part[name].tolist()
+        yield from getattr(self, name)
+
+    def column(self, name: str, start: int = 0) -> "np.ndarray":
+        parts = [
+            part[name] for part in self._segment_slices(min(start, self._base_rows), self._base_rows)
+        ]
+        parts.append(super().column(name, max(start - self._base_rows, 0)))
+        return np.concatenate(parts).astype(parts[-1].dtype, copy=False)
+
+    def take(self, name: str, rows: "np.ndarray") -> "np.ndarray":
+        """열 name의 임의 행 값"""
+        rows = np.asarray(rows, dtype=np.int64)
+        result = np.empty(rows.size, dtype=super().column(name).dtype)
+        mapped = rows < self._base_rows
+        selected = np.flatnonzero(mapped)
+        size = self.segment_records
+        segment = rows[selected] // size
+        for index in np.unique(segment).tolist():
+            members = selected[segment == index]
+            result[members] = self._segments[index][name][rows[members] - index * size]
+        tail = np.flatnonzero(~mapped)
+        result[tail] = super().column(name)[rows[tail] - self._base_rows]
+        return result
+
+    def feature_values(self, start: int, dim: int):
+        if start < self._base_features:
+            return tuple(self._feature_map[start:start + dim].tolist())
+        return super().feature_values(start - self._base_features, dim)
+
+    def feature_block(self, starts: "np.ndarray", dim: int) -> "np.ndarray":
+        starts = np.asarray(starts, dtype=np.int64)
+        block = np.empty((starts.size, dim))
+        mapped = starts < self._base_features
+        if mapped.any():
+            block[mapped] = self._feature_map[starts[mapped, np.newaxis] + np.arange(dim)]
+        if not mapped.all():
+            block[~mapped] = super().feature_block(starts[~mapped] - self._base_features, dim)
+        return block
+
+    # ------------------------------------------------------------------
+    # 영속화
+    # ------------------------------------------------------------------
+
+    def _flush(self, sync: bool = False) -> None:
+        for handle in self._handles.values():
+            if sync:
+                _fsync(handle)
+            else:
+                handle.flush()
+
+    def flush(self) -> None:
+        """버퍼를 파일에 씀 (스냅샷 없이, fsync 없음)"""
+        self._flush()
+
+    def snapshot(self) -> None:
+        """스냅샷 기록 후 다시 매핑 (다음 열기는 여기까지 검사 없이 매핑)"""
+        if self._rows_since_snapshot == 0 and not self.signatures:
+            self._flush(sync=True)
+            return
+        self._flush(sync=True)
+        recent = np.array(self._recent_ends, dtype=np.int64)
+        offsets = np.concatenate([np.asarray(self._signature_offsets), recent])
+        hashes = np.concatenate([
+            np.asarray(self._hash_keys),
+            np.array([_signature_hash(s) for s in self.signatures], dtype=np.uint64)
+        ])
+        ids = np.concatenate([
+            np.asarray(self._hash_ids),
+            np.arange(self._signature_base, self.signature_count, dtype=np.int64)
+        ])
+
+        previous = self._snapshot_id
+        snapshot = previous + 1
+        self._write_snapshot_arrays(self._file_generation, snapshot, offsets, hashes, ids)
+        self._write_manifest(self._manifest(
+            self._file_generation, snapshot, self.segment_records, self._disk_rows,
+            self._disk_features, self.signature_count, self._disk_signature_bytes
+        ))
+        self._snapshot_id = snapshot
+        for kind in ("offsets", "hashes", "ids"):
+            os.remove(self._snapshot_file(kind, previous))
+
+        self.signatures = []
+        self._recent_ends = []
+        self._rows_since_snapshot = 0
+        self._map(offsets.size - 1)
+        self.snapshots += 1
+
+    def close(self) -> None:
+        """스냅샷 기록 후 파일 닫기"""
+        if self._handles:
+            self.snapshot()
+            self._close_handles()
+
+    def compact(self, rows: Optional[Sequence[int]] = None) -> Dict[str, int]:
+        """다음 세대 파일로 다시 쓰기
+
+        Args:
+            rows: 남길 행 번호 (그 순서로), None이면 전체
+
+        Returns:
+            전후 파일 크기 {"bytes_before", "bytes_after", "records", "signatures"}
+        """
+        bytes_before = self.disk_bytes()
+        self._flush(sync=True)
+        rows = np.arange(len(self)) if rows is None else np.asarray(list(rows), dtype=np.int64)
+        generation = self._file_generation + 1
+        size = self.segment_records
+
+        remap = np.full(self.signature_count, -1, dtype=np.int64)
+        ends: List[int] = []
+        hashes: List[int] = []
+        feature_total = 0
+        signature_bytes = 0
+        old_patterns = self.spatial_patterns
+        kept = np.flatnonzero(np.isin(rows, np.fromiter(old_patterns, dtype=np.int64)))
+        patterns = {index: old_patterns[row] for index, row in zip(kept.tolist(), rows[kept].tolist())}
+        with open(self._file("features.bin", generation), "wb") as features_file, \
+                open(self._file("signatures.bin", generation), "wb") as signatures_file:
+            for index, chunk_start in enumerate(range(0, max(rows.size, 1), size)):
+                chunk = rows[chunk_start:chunk_start + size]
+                encoded = np.zeros(chunk.size, dtype=RECORD_DTYPE)
+                for name, _ in self.COLUMNS:
+                    encoded[name] = self.take(name, chunk)
+
+                # 서명: 처음 나타난 순서로 재번호
+                ids = encoded["signature_id"]
+                unique, first = np.unique(ids, return_index=True)
+                new = unique[np.argsort(first, kind="stable")]
+                new = new[remap[new] < 0]
+                remap[new] = len(ends) + np.arange(new.size)
+                for signature_id in new.tolist():
+                    text = self.signature_text(signature_id)
+                    data = text.encode("utf-8")
+                    signatures_file.write(_LENGTH.pack(len(data)) + data)
+                    signature_bytes += _LENGTH.size + len(data)
+                    ends.append(signature_bytes)
+                    hashes.append(_signature_hash(text))
+                encoded["signature_id"] = remap[ids]
+
+                # 수치 서명: 참조되는 구간만 행 순서로
+                dims = encoded["feature_dim"].astype(np.int64)
+                starts = encoded["feature_start"].copy()
+                encoded["feature_start"] = feature_total + np.cumsum(dims) - dims
+                flat = np.empty(int(dims.sum()))
+                for dim in np.unique(dims[dims > 0]).tolist():
+                    selected = np.flatnonzero(dims == dim)
+                    target = encoded["feature_start"][selected] - feature_total
+                    flat[target[:, np.newaxis] + np.arange(dim)] = self.feature_block(starts[selected], dim)
+                features_file.write(flat.astype("<f8").tobytes())
+                feature_total += flat.size
+
+                raw = bytearray(encoded.tobytes())
+                for i in range(chunk.size):
+                    offset = i * RECORD_DTYPE.itemsize
+                    struct.pack_into("<I", raw, offset + CRC_BYTES,
+                                     zlib.crc32(raw[offset:offset + CRC_BYTES]))
+                with open(self._segment_file(index, generation), "wb") as f:
+                    f.write(_HEADER.pack(SEGMENT_MAGIC, RECORD_DTYPE.itemsize, FORMAT_VERSION))
+                    f.write(raw)
+                    _fsync(f)
+
+            _fsync(features_file)
+            _fsync(signatures_file)
+
+        self._write_patterns(self._file("patterns.jsonl", generation), patterns)
+        self._write_snapshot_arrays(
+            generation, 0,
+            np.array([0] + ends, dtype=np.int64),
+            np.array(hashes, dtype=np.uint64),
+            np.arange(len(ends), dtype=np.int64)
+        )
+        # 전환 (이 시점 이전에 중단되면 다음 열기에서 새 세대 파일이 삭제됨)
+        self._write_manifest(self._manifest(
+            generation, 0, size, int(rows.size), feature_total, len(ends), signature_bytes
+        ))
+
+        reordered = rows.size != len(self) or bool((rows != np.arange(len(self))).any())
+        self._close_handles()
+        self.signatures = []
+        self._signature_ids = {}
+        self._open()
+        if reordered:
+            self.generation += 1
+        return {
+            "bytes_before": bytes_before,
+            "bytes_after": self.disk_bytes(),
+            "records": len(self),
+            "signatures": self.signature_count,
+        }
+
+    def retain(self, rows: Sequence[int]) -> None:
+        """주어진 행만 남김 (압축으로 다시 씀)"""
+        self.compact(rows)
+
+    def clear(self) -> None:
+        """모든 기록 삭제 (빈 다음 세대로 전환)"""
+        self.compact([])
+
+    def drop_unused_signatures(self) -> int:
+        """참조 없는 서명 제거 (압축으로 다시 씀)"""
+        before = self.signature_count
+        self.compact()
+        return before - self.signature_count
+
+    def disk_bytes(self) -> int:
+        """저장소 파일 크기 합 (바이트)"""
+        return sum(
+            os.path.getsize(os.path.join(self.path, name))
+            for name in os.listdir(self.path)
+            if _FILE_PATTERN.match(name) or name == MANIFEST
+        )
+
+
+class PersistentFailureAtlas(FailureAtlas):
+    """디렉토리에 영속화되는 FailureAtlas (FailureStore 위의 FailureAtlas)
+
+    사용:
+        with PersistentFailureAtlas("atlas_dir") as atlas:
+            atlas.record_failure(analysis, system)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        segment_records: int = 1 << 20,
+        snapshot_interval: int = 1 << 16,
+        durable: bool = False
+    ):
+        """
+        Args:
+            path: 저장소 디렉토리 (없으면 생성)
+            segment_records: 세그먼트 파일당 기록 수
+            snapshot_interval: 자동 스냅샷 간격 (기록 수)
+            durable: True면 기록마다 fsync
+        """
+        super().__init__(columns=FailureStore(path, segment_records, snapshot_interval, durable))
+
+    @property
+    def path(self) -> str:
+        return self.columns.path
+
+    def flush(self) -> None:
+        """버퍼를 파일에 씀"""
+        self.columns.flush()
+
+    def snapshot(self) -> None:
+        """스냅샷 기록 (다음 열기 시 검사할 꼬리를 비움)"""
+        self.columns.snapshot()
+
+    def compact(self) -> Dict[str, int]:
+        """저장소 압축 (행 번호 유지)"""
+        return self.columns.compact()
+
+    def close(self) -> None:
+        """스냅샷 기록 후 파일 닫기"""
+        self.columns.close()
+
+    def __enter__(self) -> "PersistentFailureAtlas":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def compact_failure_store(path: str) -> Dict[str, int]:
+    """저장소 디렉토리 압축 (열기 → 압축 → 닫기)"""
+    store = FailureStore(path)
+    try:
+        return store.compact()
+    finally:
+        store.close()
+
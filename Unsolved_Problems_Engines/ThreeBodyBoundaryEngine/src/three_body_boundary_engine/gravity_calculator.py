@@ -8,25 +8,63 @@ Gravity Calculator - 중력 퍼텐셜 계산
 V(x,y) = -G * Σ(m_i / r_i)
 ρ(x,y) = V(x,y) / V_max  (정규화)
 
+배열 경로 (NumPy 설치 시):
+- create_potential_grid: 격자 전체를 브로드캐스팅으로 한 번에 계산
+- create_scalar_field: 같은 격자를 ScalarField로 반환
+- potential_to_density: 배열/ScalarField 입력은 제자리(in-place) 정규화
+- create_potential_field: 배열 결과를 {Point: value} 호환 뷰로 변환
+- create_adaptive_field: 기울기/곡률이 큰 셀만 재귀 분할한 AdaptiveField
+
+다체 경로:
+- 천체 수가 direct_sum_threshold를 넘으면 create_potential_grid /
+  potential_at_points는 Barnes-Hut 트리(열림 각도 opening_angle)로 근사
+- 그 이하(또는 opening_angle = 0)는 정확한 벡터화 직접 합
+
 Author: GNJz (Qquarts)
 Version: 1.2.0
 """
 
 import math
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from .point import Point
 from .models import Body
+from .scalar_field import ScalarField
+from .adaptive_field import AdaptiveField
+from .barnes_hut import BarnesHutTree
+from ._compat import np, require_numpy
 
 
 class GravityCalculator:
     """중력 퍼텐셜 계산기"""
     
-    def __init__(self, gravitational_constant: float = 1.0):
+    def __init__(
+        self,
+        gravitational_constant: float = 1.0,
+        opening_angle: float = 0.7,
+        direct_sum_threshold: int = 512,
+        shared_fields=None
+    ):
         """
         Args:
             gravitational_constant: 중력 상수 G
+            opening_angle: Barnes-Hut 열림 각도 θ (0이면 항상 직접 합)
+            direct_sum_threshold: 이 천체 수 이하는 직접 합 사용
+            shared_fields: 공유 격자 좌표 / 천체 층 (SharedFieldView 또는 SharedFieldRegistry)
         """
+        if opening_angle < 0:
+            raise ValueError("opening_angle은 0 이상이어야 합니다")
         self.G = gravitational_constant
+        self.opening_angle = opening_angle
+        self.direct_sum_threshold = direct_sum_threshold
+        self.shared_fields = shared_fields
+    
+    def uses_tree(self, bodies: List[Body]) -> bool:
+        """이 천체 목록에 Barnes-Hut 근사를 사용하는지 여부"""
+        return (
+            np is not None
+            and self.opening_angle > 0
+            and len(bodies) > self.direct_sum_threshold
+        )
     
     def calculate_potential(self, point: Point, bodies: List[Body]) -> float:
         """특정 점에서의 중력 퍼텐셜 계산
@@ -47,6 +85,354 @@ class GravityCalculator:
                 potential += body.mass / distance
         return -self.G * potential
     
+    def create_potential_grid(
+        self,
+        bodies: List[Body],
+        x_range: tuple,
+        y_range: tuple,
+        resolution: int = 100
+    ) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """중력 퍼텐셜 격자 생성 (벡터화)
+        
+        수식: V(x,y) = -G * Σ(m_i / r_i)
+        
+        천체마다 격자 전체를 브로드캐스팅으로 한 번에 계산한다.
+        천체 수가 direct_sum_threshold를 넘으면 Barnes-Hut 트리로 근사한다.
+        격자 좌표는 create_potential_field와 동일하다
+        (x_i = x_min + i * Δx, y_j = y_min + j * Δy).
+        shared_fields에 이 격자가 있으면 공유 좌표를 쓰고, (위치, 질량)이 같은
+        천체는 층을 다시 계산하지 않고 공유 층을 더한다 (결과 동일).
+        
+        Args:
+            bodies: 천체 리스트
+            x_range: x 범위 (min, max)
+            y_range: y 범위 (min, max)
+            resolution: 해상도
+        
+        Returns:
+            (xs, ys, potential) 튜플
+            - xs: x 좌표 배열, shape (resolution + 1,)
+            - ys: y 좌표 배열, shape (resolution + 1,)
+            - potential: 퍼텐셜 배열, shape (len(xs), len(ys)),
+              potential[i, j]는 점 (xs[i], ys[j])의 값
+        """
+        require_numpy("create_potential_grid")
+        
+        shared = self.shared_fields
+        coordinates = shared.coordinates(x_range, y_range, resolution) if shared is not None else None
+        if coordinates is not None:
+            xs, ys = coordinates
+        else:
+            x_min, x_max = x_range
+            y_min, y_max = y_range
+            
+            x_step = (x_max - x_min) / resolution
+            y_step = (y_max - y_min) / resolution
+            
+            steps = np.arange(resolution + 1, dtype=np.float64)
+            xs = x_min + steps * x_step
+            ys = y_min + steps * y_step
+        
+        if self.uses_tree(bodies):
+            tree = BarnesHutTree(bodies)
+            potential = tree.mass_over_distance_grid(xs, ys, opening_angle=self.opening_angle)
+            potential *= -self.G
+            return xs, ys, potential
+        
+        potential = np.zeros((xs.size, ys.size), dtype=np.float64)
+        contribution = np.empty_like(potential)
+        for body in bodies:
+            layer = shared.layer(body, x_range, y_range, resolution) if coordinates is not None else None
+            if layer is None:
+                layer = self.potential_layer(body, xs, ys, out=contribution)
+            potential += layer
+        
+        potential *= -self.G
+        return xs, ys, potential
+    
+    def potential_layer(
+        self,
+        body: Body,
+        xs: "np.ndarray",
+        ys: "np.ndarray",
+        out: Optional["np.ndarray"] = None
+    ) -> "np.ndarray":
+        """천체 하나의 기여 층 m / r (부호와 G 제외)
+        
+        V = -G * Σ layer_i 이므로 층을 합산한 뒤 -G를 곱하면
+        create_potential_grid와 같은 값이 된다.
+        
+        Args:
+            body: 천체
+            xs: x 좌표 배열
+            ys: y 좌표 배열
+            out: 결과를 쓸 배열 (None이면 새로 float64 할당), shape (len(xs), len(ys)).
+                float32 배열이면 거리 계산도 float32로 수행
+        
+        Returns:
+            m / r 배열 (r = 0인 격자점은 0)
+        """
+        require_numpy("potential_layer")
+        if out is None:
+            out = np.empty((xs.size, ys.size), dtype=np.float64)
+        dtype = out.dtype
+        
+        # r² = dx² (nx, 1) + dy² (1, ny) 브로드캐스팅을 out에 바로 기록 (격자 크기 임시 배열 없음)
+        dx = xs.astype(dtype, copy=False) - dtype.type(body.position.x)
+        dy = ys.astype(dtype, copy=False) - dtype.type(body.position.y)
+        np.add((dx ** 2)[:, np.newaxis], (dy ** 2)[np.newaxis, :], out=out)
+        np.sqrt(out, out=out)
+        # 천체 위치와 겹치는 격자점(r = 0)은 0으로 남음 (기여하지 않음)
+        np.divide(dtype.type(body.mass), out, out=out, where=out > 0)
+        return out
+    
+    def create_scalar_field(
+        self,
+        bodies: List[Body],
+        x_range: tuple,
+        y_range: tuple,
+        resolution: int = 100,
+        dtype: str = "float64"
+    ) -> ScalarField:
+        """중력 퍼텐셜 필드 생성 (ScalarField)
+        
+        Args:
+            bodies: 천체 리스트
+            x_range: x 범위 (min, max)
+            y_range: y 범위 (min, max)
+            resolution: 해상도
+            dtype: 버퍼 자료형 ("float64" or "float32")
+        
+        Returns:
+            퍼텐셜 ScalarField
+        """
+        xs, ys, grid = self.create_potential_grid(
+            bodies=bodies,
+            x_range=x_range,
+            y_range=y_range,
+            resolution=resolution
+        )
+        if dtype != grid.dtype.name:
+            grid = grid.astype(dtype)
+        # 간격은 create_potential_grid와 같은 식으로 계산 (좌표 비트 단위 일치)
+        return ScalarField(
+            origin=(x_range[0], y_range[0]),
+            spacing=(
+                (x_range[1] - x_range[0]) / resolution,
+                (y_range[1] - y_range[0]) / resolution
+            ),
+            values=grid
+        )
+    
+    def potential_at_points(
+        self,
+        bodies: List[Body],
+        xs: "np.ndarray",
+        ys: "np.ndarray"
+    ) -> "np.ndarray":
+        """임의 점들의 중력 퍼텐셜 (벡터화)
+        
+        수식: V(x,y) = -G * Σ(m_i / r_i)  (r = 0인 천체는 기여하지 않음)
+        천체 수가 direct_sum_threshold를 넘으면 Barnes-Hut 트리로 근사한다.
+        
+        Args:
+            bodies: 천체 리스트
+            xs, ys: 같은 shape의 좌표 배열
+        
+        Returns:
+            퍼텐셜 배열 (xs와 같은 shape)
+        """
+        require_numpy("potential_at_points")
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if self.uses_tree(bodies):
+            potential = BarnesHutTree(bodies).mass_over_distance(
+                xs, ys, opening_angle=self.opening_angle
+            )
+            potential *= -self.G
+            return potential
+        
+        potential = np.zeros(xs.shape, dtype=np.float64)
+        contribution = np.empty_like(potential)
+        for body in bodies:
+            distance = np.hypot(xs - body.position.x, ys - body.position.y)
+            contribution.fill(0.0)
+            np.divide(body.mass, distance, out=contribution, where=distance > 0)
+            potential += contribution
+        potential *= -self.G
+        return potential
+    
+    def create_adaptive_field(
+        self,
+        bodies: List[Body],
+        x_range: tuple,
+        y_range: tuple,
+        tolerance: float = 1e-3,
+        max_depth: int = 6,
+        base: int = 4,
+        gradient_tolerance: Optional[float] = None
+    ) -> AdaptiveField:
+        """적응형 사분트리 퍼텐셜 필드 생성
+        
+        base × base 균일 셀에서 시작하여, 다음 조건의 셀만 4등분한다
+        (max_depth까지, 깊이 단계별로 벡터화):
+        - 곡률: |V(중심) - 꼭짓점 평균| > tolerance * |V(중심)|
+          (쌍선형 보간의 중심 오차)
+        - 기울기 (gradient_tolerance 지정 시):
+          max |V(꼭짓점) - V(중심)| > gradient_tolerance * |V(중심)|
+        - 셀 안에 천체가 있음 (1/r 특이점)
+        
+        가장 깊은 셀의 크기는 resolution = base * 2**max_depth인
+        균일 격자의 간격과 같다.
+        
+        Args:
+            bodies: 천체 리스트
+            x_range: x 범위 (min, max)
+            y_range: y 범위 (min, max)
+            tolerance: 곡률(보간 오차) 상대 허용치
+            max_depth: 최대 분할 깊이
+            base: 루트 단계 한 변의 셀 수
+            gradient_tolerance: 기울기 상대 허용치 (None이면 사용 안 함)
+        
+        Returns:
+            AdaptiveField (evaluations에 퍼텐셜 평가 횟수 기록)
+        """
+        require_numpy("create_adaptive_field")
+        if tolerance <= 0:
+            raise ValueError("tolerance는 양수여야 합니다")
+        if base < 1 or max_depth < 0:
+            raise ValueError("base는 1 이상, max_depth는 0 이상이어야 합니다")
+        
+        x_min, x_max = x_range
+        y_min, y_max = y_range
+        cell_w = (x_max - x_min) / base
+        cell_h = (y_max - y_min) / base
+        
+        # 루트 단계: 꼭짓점 격자 (base + 1)² + 셀 중심 base²
+        _, _, lattice = self.create_potential_grid(bodies, x_range, y_range, base)
+        ii, jj = np.meshgrid(np.arange(base), np.arange(base), indexing="ij")
+        ii = ii.ravel()
+        jj = jj.ravel()
+        x0 = x_min + ii * cell_w
+        y0 = y_min + jj * cell_h
+        width = np.full(ii.size, cell_w)
+        height = np.full(ii.size, cell_h)
+        corners = np.stack(
+            [lattice[ii, jj], lattice[ii + 1, jj], lattice[ii, jj + 1], lattice[ii + 1, jj + 1]],
+            axis=1
+        )
+        center = self.potential_at_points(bodies, x0 + 0.5 * width, y0 + 0.5 * height)
+        evaluations = lattice.size + center.size
+        
+        levels = [(x0, y0, width, height, corners, center)]
+        first_children = [np.full(ii.size, -1, dtype=np.intp)]
+        offset = ii.size
+        body_xy = np.array([[b.position.x, b.position.y] for b in bodies], dtype=np.float64).reshape(-1, 2)
+        
+        for depth in range(max_depth):
+            refine = self._needs_refinement(
+                x0, y0, width, height, corners, center, body_xy, tolerance, gradient_tolerance
+            )
+            parents = np.flatnonzero(refine)
+            if parents.size == 0:
+                break
+            n = parents.size
+            first_children[-1][parents] = offset + 4 * np.arange(n)
+            
+            px, py = x0[parents], y0[parents]
+            hw, hh = 0.5 * width[parents], 0.5 * height[parents]
+            c, vc = corners[parents], center[parents]
+            
+            # 변 중점: 하, 상, 좌, 우
+            mid = self.potential_at_points(
+                bodies,
+                np.concatenate([px + hw, px + hw, px, px + 2 * hw]),
+                np.concatenate([py, py + 2 * hh, py + hh, py + hh])
+            ).reshape(4, n)
+            bottom, top, left, right = mid
+            
+            # 자식 순서: (좌, 하), (우, 하), (좌, 상), (우, 상) → 인덱스 offset + 4k + q
+            child_x0 = np.stack([px, px + hw, px, px + hw], axis=1).ravel()
+            child_y0 = np.stack([py, py, py + hh, py + hh], axis=1).ravel()
+            child_corners = np.stack([
+                np.stack([c[:, 0], bottom, left, vc], axis=1),
+                np.stack([bottom, c[:, 1], vc, right], axis=1),
+                np.stack([left, vc, c[:, 2], top], axis=1),
+                np.stack([vc, right, top, c[:, 3]], axis=1),
+            ], axis=1).reshape(4 * n, 4)
+            width = np.repeat(hw, 4)
+            height = np.repeat(hh, 4)
+            x0, y0 = child_x0, child_y0
+            corners = child_corners
+            center = self.potential_at_points(bodies, x0 + 0.5 * width, y0 + 0.5 * height)
+            evaluations += mid.size + center.size
+            
+            levels.append((x0, y0, width, height, corners, center))
+            first_children.append(np.full(4 * n, -1, dtype=np.intp))
+            offset += 4 * n
+        
+        return AdaptiveField(
+            origin=(x_min, y_min),
+            extent=(x_max - x_min, y_max - y_min),
+            base=base,
+            x0=np.concatenate([level[0] for level in levels]),
+            y0=np.concatenate([level[1] for level in levels]),
+            width=np.concatenate([level[2] for level in levels]),
+            height=np.concatenate([level[3] for level in levels]),
+            level=np.concatenate([
+                np.full(level[0].size, depth, dtype=np.int8) for depth, level in enumerate(levels)
+            ]),
+            first_child=np.concatenate(first_children),
+            corners=np.concatenate([level[4] for level in levels]),
+            center=np.concatenate([level[5] for level in levels]),
+            evaluations=evaluations
+        )
+    
+    @staticmethod
+    def _needs_refinement(
+        x0: "np.ndarray",
+        y0: "np.ndarray",
+        width: "np.ndarray",
+        height: "np.ndarray",
+        corners: "np.ndarray",
+        center: "np.ndarray",
+        body_xy: "np.ndarray",
+        tolerance: float,
+        gradient_tolerance: Optional[float]
+    ) -> "np.ndarray":
+        """분할 대상 셀 마스크 (create_adaptive_field의 분할 기준)"""
+        scale = np.abs(center)
+        refine = np.abs(center - corners.mean(axis=1)) > tolerance * scale
+        if gradient_tolerance is not None:
+            spread = np.abs(corners - center[:, np.newaxis]).max(axis=1)
+            refine |= spread > gradient_tolerance * scale
+        for bx, by in body_xy:
+            refine |= (x0 <= bx) & (bx <= x0 + width) & (y0 <= by) & (by <= y0 + height)
+        return refine
+    
+    def potential_grid_to_field(
+        self,
+        xs: "np.ndarray",
+        ys: "np.ndarray",
+        grid: "np.ndarray"
+    ) -> Dict[Point, float]:
+        """배열 격자를 {Point: value} 딕셔너리로 변환 (호환 뷰)
+        
+        Args:
+            xs: x 좌표 배열
+            ys: y 좌표 배열
+            grid: 값 배열, shape (len(xs), len(ys))
+        
+        Returns:
+            {Point: value} 딕셔너리 (x 우선 순서)
+        """
+        field = {}
+        y_values = ys.tolist()
+        for x, row in zip(xs.tolist(), grid.tolist()):
+            for y, value in zip(y_values, row):
+                field[Point(x, y)] = value
+        return field
+    
     def create_potential_field(
         self,
         bodies: List[Body],
@@ -56,6 +442,9 @@ class GravityCalculator:
     ) -> Dict[Point, float]:
         """중력 퍼텐셜 필드 생성
         
+        NumPy가 설치되어 있으면 create_potential_grid로 계산한 뒤
+        딕셔너리 뷰로 변환한다.
+        
         Args:
             bodies: 천체 리스트
             x_range: x 범위 (min, max)
@@ -65,6 +454,15 @@ class GravityCalculator:
         Returns:
             {Point: potential_value} 딕셔너리
         """
+        if np is not None:
+            xs, ys, grid = self.create_potential_grid(
+                bodies=bodies,
+                x_range=x_range,
+                y_range=y_range,
+                resolution=resolution
+            )
+            return self.potential_grid_to_field(xs, ys, grid)
+        
         potential_field = {}
         x_min, x_max = x_range
         y_min, y_max = y_range
@@ -91,13 +489,35 @@ class GravityCalculator:
         
         수식: ρ(x,y) = V(x,y) / V_max  (정규화)
         
+        배열(np.ndarray), ScalarField, AdaptiveField가 주어지면 새 딕셔너리를
+        만들지 않고 해당 버퍼를 제자리에서 정규화하여 그대로 반환한다.
+        읽기 전용 버퍼 (공유 메모리 뷰)는 복사본을 정규화해 새 객체로 반환한다.
+        
         Args:
-            potential_field: 중력 퍼텐셜 필드
+            potential_field: 중력 퍼텐셜 필드 (딕셔너리, 배열, ScalarField 또는 AdaptiveField)
             normalization: 정규화 방법 ("max" or "sum")
         
         Returns:
-            {Point: density_value} 딕셔너리
+            {Point: density_value} 딕셔너리 (배열/필드 입력이면 정규화된 같은 객체)
         """
+        if isinstance(potential_field, ScalarField):
+            if not potential_field.values.flags.writeable:
+                potential_field = ScalarField(
+                    origin=potential_field.origin,
+                    spacing=potential_field.spacing,
+                    values=potential_field.values.copy()
+                )
+            self._normalize_grid_inplace(potential_field.values, normalization)
+            return potential_field
+        
+        if isinstance(potential_field, AdaptiveField):
+            return self._normalize_adaptive_inplace(potential_field, normalization)
+        
+        if np is not None and isinstance(potential_field, np.ndarray):
+            if not potential_field.flags.writeable:
+                potential_field = potential_field.copy()
+            return self._normalize_grid_inplace(potential_field, normalization)
+        
         if not potential_field:
             return {}
         
@@ -131,4 +551,80 @@ class GravityCalculator:
             raise ValueError(f"알 수 없는 정규화 방법: {normalization}")
         
         return density_field
-
+    
+    def _normalize_grid_inplace(
+        self,
+        grid: "np.ndarray",
+        normalization: str
+    ) -> "np.ndarray":
+        """배열 제자리 정규화 (potential_to_density의 배열 경로)"""
+        if grid.size == 0:
+            return grid
+        
+        if normalization == "max":
+            max_potential = grid.max()
+            min_potential = grid.min()
+            if max_potential == min_potential:
+                grid.fill(0.5)
+                return grid
+            grid -= min_potential
+            grid /= (max_potential - min_potential)
+        
+        elif normalization == "sum":
+            np.abs(grid, out=grid)
+            sum_potential = grid.sum()
+            if sum_potential == 0:
+                grid.fill(0.0)
+                return grid
+            grid /= sum_potential
+        
+        else:
+            raise ValueError(f"알 수 없는 정규화 방법: {normalization}")
+        
+        return grid
+    
+    def _normalize_adaptive_inplace(
+        self,
+        field: AdaptiveField,
+        normalization: str
+    ) -> AdaptiveField:
+        """AdaptiveField 제자리 정규화 (꼭짓점/중심 값 모두)
+        
+        - "max": 잎 노드 값의 최소/최대로 0~1 정규화
+        - "sum": 셀 면적 가중 합으로 정규화
+          (가장 작은 셀 면적 단위, 같은 깊이의 균일 격자 "sum"과 같은 척도)
+        """
+        leaves = field.leaf_mask
+        if not leaves.any():
+            return field
+        
+        if normalization == "max":
+            leaf_values = np.concatenate([field.corners[leaves].ravel(), field.center[leaves]])
+            max_potential = leaf_values.max()
+            min_potential = leaf_values.min()
+            if max_potential == min_potential:
+                field.corners.fill(0.5)
+                field.center.fill(0.5)
+                return field
+            span = max_potential - min_potential
+            field.corners -= min_potential
+            field.corners /= span
+            field.center -= min_potential
+            field.center /= span
+        
+        elif normalization == "sum":
+            np.abs(field.corners, out=field.corners)
+            np.abs(field.center, out=field.center)
+            areas = field.leaf_areas()
+            sum_potential = float(np.sum(field.center[leaves] * (areas / areas.min())))
+            if sum_potential == 0:
+                field.corners.fill(0.0)
+                field.center.fill(0.0)
+                return field
+            field.corners /= sum_potential
+            field.center /= sum_potential
+        
+        else:
+            raise ValueError(f"알 수 없는 정규화 방법: {normalization}")
+        
+        return field
@@ -8,14 +8,24 @@ Lagrange Calculator - 라그랑주 점 계산
 - L1, L2, L3: 불안정 (collinear)
 - L4, L5: 안정 (equilateral triangle)
 
+배치 풀이 (NumPy):
+- solve_collinear_points(): (m1, m2, 거리) 배열 → L1/L2/L3 위치.
+  회전 좌표계 유효 퍼텐셜의 기울기가 0인 점을 모든 쌍에 대해 동시에
+  뉴턴 반복으로 찾는다 (구간 보호)
+- lagrange_positions(): 두 천체 위치 배열 → 다섯 점 좌표 (n, 5, 2)
+
 Author: GNJz (Qquarts)
-Version: 1.2.0
+Version: 1.2.1
 """
 
 import math
 from typing import List, Tuple
 from .point import Point
 from .models import Body, LagrangePoint
+from ._compat import np, require_numpy
+
+
+LAGRANGE_TYPES = ("L1", "L2", "L3", "L4", "L5")
 
 
 class LagrangeCalculator:
@@ -111,3 +121,124 @@ class LagrangeCalculator:
         
         return lagrange_points
 
+    def solve_collinear_points(
+        self,
+        m1,
+        m2,
+        separation,
+        tolerance: float = 1e-12,
+        max_iterations: int = 50
+    ) -> "np.ndarray":
+        """공선 라그랑주 점 배치 풀이 (벡터화 뉴턴 반복)
+
+        질량비 μ = m2 / (m1 + m2), 거리 1의 회전 좌표계 (무게중심 원점,
+        body1은 x = -μ, body2는 x = 1 - μ)에서 유효 퍼텐셜
+        Ω(x) = x² / 2 + (1 - μ) / |x + μ| + μ / |x - 1 + μ|
+        의 기울기 f(x) = Ω'(x)가 0인 점을 찾는다.
+        f'(x) > 0 이므로 각 구간 (L3: body1 바깥, L1: 두 천체 사이,
+        L2: body2 바깥)에 근이 하나뿐이고, 뉴턴 단계가 구간을 벗어나면
+        구간 경계와의 중점으로 줄인다.
+
+        초기값: 힐 반지름 r_H = (μ / 3)^(1/3) → L1 = 1 - μ - r_H,
+        L2 = 1 - μ + r_H, L3 = -1 - 5μ / 12
+
+        Args:
+            m1, m2: 두 천체 질량 (스칼라 또는 같은 길이 배열, 양수)
+            separation: 두 천체 거리 (양수)
+            tolerance: 수렴 기준 (회전 좌표계 단계 크기)
+            max_iterations: 최대 반복 수
+
+        Returns:
+            body1에서 body2 방향으로 잰 L1, L2, L3까지의 부호 있는 거리,
+            shape (n, 3) (L3은 음수)
+        """
+        require_numpy("solve_collinear_points")
+        m1, m2, separation = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(m1, dtype=np.float64)),
+            np.atleast_1d(np.asarray(m2, dtype=np.float64)),
+            np.atleast_1d(np.asarray(separation, dtype=np.float64))
+        )
+        if m1.ndim != 1:
+            raise ValueError(f"m1, m2, separation은 1차원 배열이어야 합니다: {m1.shape}")
+        if m1.size and (m1.min() <= 0 or m2.min() <= 0):
+            raise ValueError("질량은 양수여야 합니다")
+        if separation.size and separation.min() <= 0:
+            raise ValueError("separation은 양수여야 합니다")
+
+        mu = (m2 / (m1 + m2))[:, np.newaxis]
+        primary1 = -mu
+        primary2 = 1.0 - mu
+        hill = np.cbrt(mu / 3.0)
+        x = np.hstack([primary2 - hill, primary2 + hill, -1.0 - 5.0 * mu / 12.0])
+
+        # 근이 있는 구간 (L1, L2, L3 열)
+        lower = np.hstack([primary1, primary2, np.full_like(mu, -np.inf)])
+        upper = np.hstack([primary2, np.full_like(mu, np.inf), primary1])
+
+        for _ in range(max_iterations):
+            d1 = x - primary1
+            d2 = x - primary2
+            r1 = np.abs(d1) ** 3
+            r2 = np.abs(d2) ** 3
+            gradient = x - (1.0 - mu) * d1 / r1 - mu * d2 / r2
+            slope = 1.0 + 2.0 * (1.0 - mu) / r1 + 2.0 * mu / r2
+            step = gradient / slope
+            candidate = x - step
+            candidate = np.where(candidate <= lower, (x + lower) / 2.0, candidate)
+            candidate = np.where(candidate >= upper, (x + upper) / 2.0, candidate)
+            done = np.all(np.abs(candidate - x) <= tolerance * np.maximum(1.0, np.abs(x)))
+            x = candidate
+            if done:
+                break
+
+        return (x + mu) * separation[:, np.newaxis]
+
+    def lagrange_positions(
+        self,
+        positions1,
+        positions2,
+        m1=None,
+        m2=None,
+        solve_collinear: bool = True
+    ) -> "np.ndarray":
+        """다섯 라그랑주 점 좌표 (배치)
+
+        Args:
+            positions1, positions2: 두 천체 위치, shape (n, 2)
+            m1, m2: 두 천체 질량 (solve_collinear=True일 때 필요)
+            solve_collinear: True면 L1-L3을 solve_collinear_points()로 풀고,
+                False면 calculate_lagrange_points()와 같은 고정 비율 근사 사용
+
+        Returns:
+            shape (n, 5, 2), 순서 LAGRANGE_TYPES (L4, L5는 정삼각형 꼭짓점)
+        """
+        require_numpy("lagrange_positions")
+        p1 = np.asarray(positions1, dtype=np.float64).reshape(-1, 2)
+        p2 = np.asarray(positions2, dtype=np.float64).reshape(-1, 2)
+        if p1.shape != p2.shape:
+            raise ValueError(f"positions1과 positions2의 형태가 다릅니다: {p1.shape} != {p2.shape}")
+        delta = p2 - p1
+        separation = np.hypot(delta[:, 0], delta[:, 1])
+        if separation.size and separation.min() <= 0:
+            raise ValueError("두 천체 위치가 같아 라그랑주 점을 정할 수 없습니다")
+
+        if solve_collinear:
+            if m1 is None or m2 is None:
+                raise ValueError("solve_collinear=True에는 m1, m2가 필요합니다")
+            fractions = self.solve_collinear_points(m1, m2, separation) / separation[:, np.newaxis]
+        else:
+            # calculate_lagrange_points의 근사: L1 중점, L2 body2 너머 0.1, L3 body1 반대편 0.1
+            fractions = np.broadcast_to(np.array([0.5, 1.1, -0.1]), (p1.shape[0], 3))
+
+        points = np.empty((p1.shape[0], 5, 2), dtype=np.float64)
+        points[:, :3, :] = p1[:, np.newaxis, :] + fractions[:, :, np.newaxis] * delta[:, np.newaxis, :]
+
+        cos60 = 0.5
+        sin60 = math.sqrt(3) / 2
+        dx = delta[:, 0]
+        dy = delta[:, 1]
+        points[:, 3, 0] = p1[:, 0] + dx * cos60 - dy * sin60
+        points[:, 3, 1] = p1[:, 1] + dx * sin60 + dy * cos60
+        points[:, 4, 0] = p1[:, 0] + dx * cos60 + dy * sin60
+        points[:, 4, 1] = p1[:, 1] - dx * sin60 + dy * cos60
+        return points
@@ -8,7 +8,7 @@ Author: GNJz (Qquarts)
 Version: 1.2.0
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import List, Optional, Dict
 from .point import Point
 
@@ -37,6 +37,34 @@ class ThreeBodySystem:
     def get_all_bodies(self) -> List[Body]:
         """모든 천체 반환"""
         return [self.body1, self.body2, self.body3]
+    
+    def with_bodies(self, bodies: List[Body]) -> "ThreeBodySystem":
+        """천체만 바꾼 같은 설정의 시스템"""
+        return replace(self, body1=bodies[0], body2=bodies[1], body3=bodies[2])
+
+
+@dataclass
+class NBodySystem:
+    """다체 시스템 (성단, 제한 다체 배치 등)
+    
+    ThreeBodySystem과 같은 get_all_bodies() 인터페이스를 제공하므로
+    엔진의 L0 분석(analyze_orbit_stability 등)에 그대로 사용할 수 있다.
+    """
+    bodies: List[Body]
+    gravitational_constant: float = 1.0  # G (정규화)
+    
+    def __post_init__(self):
+        """검증"""
+        if not self.bodies:
+            raise ValueError("천체가 하나 이상 필요합니다")
+    
+    def get_all_bodies(self) -> List[Body]:
+        """모든 천체 반환"""
+        return list(self.bodies)
+    
+    def with_bodies(self, bodies: List[Body]) -> "NBodySystem":
+        """천체만 바꾼 같은 설정의 시스템"""
+        return replace(self, bodies=list(bodies))
 
 
 @dataclass
@@ -49,6 +77,10 @@ class StabilityAnalysis:
     stability_score: float  # 0.0 (불안정) ~ 1.0 (안정)
     convergence_rate: float
     
+    # 선별 모드에서 판정을 확정한 단계 (선별 모드가 아니면 None)
+    screening_level: Optional[int] = None  # 0 = 가장 거친 해상도
+    screening_resolution: Optional[int] = None  # 판정에 사용한 potential_resolution
+    
     def is_stable(self, threshold: float = 0.1) -> bool:
         """안정 여부 판정"""
         return self.mismatch < threshold and self.converged
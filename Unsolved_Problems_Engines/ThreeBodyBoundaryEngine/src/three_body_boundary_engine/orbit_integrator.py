@@ -0,0 +1,235 @@
+"""
+Orbit Integrator - 궤도 전파 (심플렉틱 적분)
+
+엔진 번호: UP-1
+역할: Body.velocity를 사용해 천체 위치를 관찰 시각까지 전진
+
+수식:
+a_i = G * Σ_j m_j (x_j - x_i) / (|x_j - x_i|² + ε²)^(3/2)
+
+적분 방법:
+- "leapfrog": kick-drift-kick (2차)
+- "yoshida4": leapfrog 3단 합성 (4차, Yoshida 1990)
+  w1 = 1 / (2 - 2^(1/3)),  w0 = -2^(1/3) / (2 - 2^(1/3)),  단계 가중치 (w1, w0, w1)
+
+적응 시간 간격:
+- dt = eta * min_{i<j} sqrt(r_ij³ / (G (m_i + m_j)))  (쌍별 자유낙하 시간)
+- [min_dt, max_dt]로 제한, 관찰 시각을 넘지 않도록 잘라서 정확히 도달
+- 간격이 매 단계 바뀌므로 엄밀한 심플렉틱성은 근사적이다
+
+배치:
+- 상태는 배열 (시스템 B, 천체 N, 2)
+- 같은 천체 수의 시스템들을 한 번에 전파, 시스템별 dt를 독립적으로 사용
+
+⚠️ 주의:
+- velocity가 None인 천체는 정지 상태(0, 0)에서 출발한다.
+- 엔진의 정적 분석 철학과 별개로, observe_boundary_formation(evolve=True)에서만 사용한다.
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+from typing import Dict, List, Sequence, Tuple
+from .point import Point
+from .models import Body
+from ._compat import np, require_numpy
+
+
+_CBRT2 = 2.0 ** (1.0 / 3.0)
+_YOSHIDA_W1 = 1.0 / (2.0 - _CBRT2)
+_YOSHIDA_W0 = -_CBRT2 / (2.0 - _CBRT2)
+
+# 방법별 leapfrog 단계 가중치
+_STAGE_WEIGHTS = {
+    "leapfrog": (1.0,),
+    "yoshida4": (_YOSHIDA_W1, _YOSHIDA_W0, _YOSHIDA_W1),
+}
+
+
+class OrbitIntegrator:
+    """심플렉틱 궤도 적분기 (배치 배열 기반)"""
+
+    def __init__(
+        self,
+        gravitational_constant: float = 1.0,
+        method: str = "yoshida4",
+        eta: float = 0.02,
+        min_dt: float = 1e-6,
+        max_dt: float = 0.05,
+        softening: float = 0.0
+    ):
+        """
+        Args:
+            gravitational_constant: 중력 상수 G
+            method: 적분 방법 ("yoshida4" or "leapfrog")
+            eta: 적응 시간 간격 계수 (자유낙하 시간 대비)
+            min_dt: 최소 시간 간격
+            max_dt: 최대 시간 간격
+            softening: 연화 길이 ε (근접 조우 발산 방지)
+        """
+        require_numpy("OrbitIntegrator")
+        if method not in _STAGE_WEIGHTS:
+            raise ValueError(f"알 수 없는 적분 방법: {method}")
+        if eta <= 0 or min_dt <= 0 or max_dt < min_dt:
+            raise ValueError("eta, min_dt는 양수, max_dt는 min_dt 이상이어야 합니다")
+
+        self.G = gravitational_constant
+        self.method = method
+        self.eta = eta
+        self.min_dt = min_dt
+        self.max_dt = max_dt
+        self.softening = softening
+
+        # 통계
+        self.steps = 0
+        self.force_evaluations = 0
+
+    def accelerations(self, positions: "np.ndarray", masses: "np.ndarray") -> "np.ndarray":
+        """가속도 (배치 직접 합)
+
+        Args:
+            positions: shape (B, N, 2)
+            masses: shape (B, N)
+
+        Returns:
+            shape (B, N, 2)
+        """
+        self.force_evaluations += 1
+        # separation[b, i, j] = x_j - x_i
+        separation = positions[:, np.newaxis, :, :] - positions[:, :, np.newaxis, :]
+        r2 = np.einsum("bijk,bijk->bij", separation, separation) + self.softening ** 2
+        inverse_r3 = np.zeros_like(r2)
+        np.power(r2, -1.5, out=inverse_r3, where=r2 > 0)
+        weights = self.G * masses[:, np.newaxis, :] * inverse_r3
+        return np.einsum("bij,bijk->bik", weights, separation)
+
+    def time_step(self, positions: "np.ndarray", masses: "np.ndarray") -> "np.ndarray":
+        """시스템별 적응 시간 간격, shape (B,)"""
+        n_bodies = positions.shape[1]
+        if n_bodies < 2:
+            return np.full(positions.shape[0], self.max_dt)
+        separation = positions[:, np.newaxis, :, :] - positions[:, :, np.newaxis, :]
+        r2 = np.einsum("bijk,bijk->bij", separation, separation) + self.softening ** 2
+        pair_mass = masses[:, np.newaxis, :] + masses[:, :, np.newaxis]
+        i, j = np.triu_indices(n_bodies, k=1)
+        free_fall = np.sqrt(r2[:, i, j] ** 1.5 / (self.G * pair_mass[:, i, j]))
+        return np.clip(self.eta * free_fall.min(axis=1), self.min_dt, self.max_dt)
+
+    def integrate(
+        self,
+        positions: "np.ndarray",
+        velocities: "np.ndarray",
+        masses: "np.ndarray",
+        times: Sequence[float]
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """관찰 시각들까지 전파 (시각 0의 상태에서 시작)
+
+        Args:
+            positions: 초기 위치, shape (B, N, 2)
+            velocities: 초기 속도, shape (B, N, 2)
+            masses: 질량, shape (B, N)
+            times: 관찰 시각 (0 이상, 오름차순)
+
+        Returns:
+            (positions_at, velocities_at), 각 shape (T, B, N, 2)
+        """
+        times = [float(t) for t in times]
+        if any(t < 0 for t in times) or times != sorted(times):
+            raise ValueError("관찰 시각은 0 이상의 오름차순이어야 합니다")
+
+        x = np.array(positions, dtype=np.float64)
+        v = np.array(velocities, dtype=np.float64)
+        m = np.asarray(masses, dtype=np.float64)
+        clock = np.zeros(x.shape[0])
+        stages = _STAGE_WEIGHTS[self.method]
+        # 마지막 kick의 가속도는 다음 단계 첫 kick에 재사용 (단계당 힘 계산 1회)
+        acceleration = self.accelerations(x, m)
+
+        positions_at = np.empty((len(times),) + x.shape)
+        velocities_at = np.empty((len(times),) + v.shape)
+        for index, target in enumerate(times):
+            while True:
+                # 아직 관찰 시각에 도달하지 않은 시스템만 전진
+                active = np.flatnonzero(clock < target)
+                if active.size == 0:
+                    break
+                xa, va, ma, acc = x[active], v[active], m[active], acceleration[active]
+                # 관찰 시각에 정확히 도달하도록 간격을 자름
+                dt = np.minimum(self.time_step(xa, ma), target - clock[active])
+                step = dt[:, np.newaxis, np.newaxis]
+                for weight in stages:
+                    va += 0.5 * weight * step * acc
+                    xa += weight * step * va
+                    acc = self.accelerations(xa, ma)
+                    va += 0.5 * weight * step * acc
+                x[active], v[active], acceleration[active] = xa, va, acc
+                clock[active] += dt
+                # 반올림 잔차로 무한 반복하지 않도록 목표에 고정
+                clock[np.abs(target - clock) <= 1e-12 * max(1.0, target)] = target
+                self.steps += 1
+            positions_at[index] = x
+            velocities_at[index] = v
+        return positions_at, velocities_at
+
+    def propagate(self, systems: List, times: Sequence[float]) -> List[List]:
+        """시스템들을 관찰 시각까지 전파 (천체 수가 같은 시스템끼리 배치)
+
+        Args:
+            systems: get_all_bodies() / with_bodies()를 제공하는 시스템 리스트
+            times: 관찰 시각 (0 이상, 오름차순)
+
+        Returns:
+            systems[b]의 시각별 스냅샷 리스트 (result[b][t])
+        """
+        groups: Dict[int, List[int]] = {}
+        for index, system in enumerate(systems):
+            groups.setdefault(len(system.get_all_bodies()), []).append(index)
+
+        snapshots: List[List] = [[] for _ in systems]
+        for members in groups.values():
+            positions, velocities, masses = _to_arrays([systems[k] for k in members])
+            positions_at, velocities_at = self.integrate(positions, velocities, masses, times)
+            for slot, k in enumerate(members):
+                template = systems[k].get_all_bodies()
+                for t in range(len(times)):
+                    bodies = [
+                        Body(
+                            position=Point(float(px), float(py)),
+                            mass=body.mass,
+                            velocity=Point(float(vx), float(vy))
+                        )
+                        for body, (px, py), (vx, vy) in zip(
+                            template, positions_at[t, slot].tolist(), velocities_at[t, slot].tolist()
+                        )
+                    ]
+                    snapshots[k].append(systems[k].with_bodies(bodies))
+        return snapshots
+
+    def total_energy(self, positions: "np.ndarray", velocities: "np.ndarray", masses: "np.ndarray") -> "np.ndarray":
+        """시스템별 총 에너지 (운동 + 위치), shape (B,)"""
+        kinetic = 0.5 * np.einsum("bn,bnk,bnk->b", masses, velocities, velocities)
+        separation = positions[:, np.newaxis, :, :] - positions[:, :, np.newaxis, :]
+        r = np.sqrt(np.einsum("bijk,bijk->bij", separation, separation) + self.softening ** 2)
+        i, j = np.triu_indices(positions.shape[1], k=1)
+        potential = -self.G * np.sum(masses[:, i] * masses[:, j] / r[:, i, j], axis=1)
+        return kinetic + potential
+
+
+def _to_arrays(systems: List) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """시스템 리스트 → (positions, velocities, masses) 배열"""
+    positions = []
+    velocities = []
+    masses = []
+    for system in systems:
+        bodies = system.get_all_bodies()
+        positions.append([(b.position.x, b.position.y) for b in bodies])
+        velocities.append([
+            (b.velocity.x, b.velocity.y) if b.velocity is not None else (0.0, 0.0)
+            for b in bodies
+        ])
+        masses.append([b.mass for b in bodies])
+    return (
+        np.array(positions, dtype=np.float64),
+        np.array(velocities, dtype=np.float64),
+        np.array(masses, dtype=np.float64)
+    )
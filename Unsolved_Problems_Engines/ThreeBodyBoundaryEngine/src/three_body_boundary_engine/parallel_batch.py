@@ -0,0 +1,202 @@
+"""
+Parallel Batch - 프로세스 풀 배치 분석
+
+엔진 번호: UP-1
+역할: 다수의 ThreeBodySystem을 여러 프로세스에서 안정성 분석
+
+처리 방식:
+- 입력 iterable을 chunksize 단위로 묶어 ProcessPoolExecutor에 제출
+- 워커는 초기화 시 피클된 ThreeBodyConfig로 엔진을 한 번만 생성
+  (공유 필드 manifest가 있으면 공유 메모리 격자/층에 읽기 전용으로 붙음)
+- 진행 중인 청크 수를 제한 (입력 전체를 한 번에 읽지 않음)
+- 결과는 입력 순서대로, 앞쪽 청크가 끝나는 즉시 스트리밍
+- 통합 실행 스윕: 워커가 청크의 실패를 부분 FailureAtlas에 기록해 샤드 바이트로 반환
+  (부모는 청크 순서대로 merge_from — 샤드당 열 단위 일괄 복사)
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+from .config import ThreeBodyConfig
+from .models import ThreeBodySystem, StabilityAnalysis
+from .failure_atlas import FailureAtlas
+from .failure_shard import encode_failure_shard
+
+
+# 워커 프로세스 전역 엔진 (initializer에서 한 번 생성)
+_WORKER_ENGINE = None
+
+
+def _initialize_worker(config: ThreeBodyConfig, shared_manifest: Optional[dict] = None) -> None:
+    """워커 초기화: 프로세스당 엔진 한 번 생성"""
+    global _WORKER_ENGINE
+    from .three_body_boundary_engine import ThreeBodyBoundaryEngine
+    shared_fields = None
+    if shared_manifest:
+        from .shared_fields import SharedFieldView
+        shared_fields = SharedFieldView(shared_manifest)
+    _WORKER_ENGINE = ThreeBodyBoundaryEngine(config, shared_fields=shared_fields)
+
+
+def _analyze_chunk(
+    systems: List[ThreeBodySystem],
+    x_range: Optional[tuple],
+    y_range: Optional[tuple]
+) -> List[StabilityAnalysis]:
+    """워커 작업: 청크 하나 분석"""
+    return [
+        _WORKER_ENGINE.analyze_orbit_stability(system=system, x_range=x_range, y_range=y_range)
+        for system in systems
+    ]
+
+
+def _analyze_system(
+    system: ThreeBodySystem,
+    x_range: Optional[tuple],
+    y_range: Optional[tuple]
+) -> StabilityAnalysis:
+    """워커 작업: 시스템 하나 분석 (비동기 API용)"""
+    return _WORKER_ENGINE.analyze_orbit_stability(system=system, x_range=x_range, y_range=y_range)
+
+
+def _run_chunk(
+    systems: List[ThreeBodySystem],
+    x_range: Optional[tuple],
+    y_range: Optional[tuple],
+    failure_threshold: float
+) -> Tuple[List[StabilityAnalysis], List[int], bytes]:
+    """워커 작업: 청크 하나 분석 + 실패 기록 (부분 지도는 샤드 바이트로 반환)
+
+    Returns:
+        (분석 결과, 시스템별 샤드 행 번호 (실패가 아니면 -1), 샤드 바이트)
+    """
+    atlas = FailureAtlas()
+    analyses = []
+    rows = []
+    for system in systems:
+        analysis = _WORKER_ENGINE.analyze_orbit_stability(system=system, x_range=x_range, y_range=y_range)
+        record = atlas.record_failure(analysis=analysis, system=system, threshold=failure_threshold)
+        analyses.append(analysis)
+        rows.append(atlas.total_failures - 1 if record is not None else -1)
+    return analyses, rows, encode_failure_shard(atlas)
+
+
+def _iter_chunks(systems: Iterable[ThreeBodySystem], chunksize: int) -> Iterator[List[ThreeBodySystem]]:
+    """iterable을 chunksize 크기 리스트로 분할"""
+    iterator = iter(systems)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_chunk_results(
+    config: ThreeBodyConfig,
+    systems: Iterable[ThreeBodySystem],
+    task: Callable,
+    args: tuple,
+    max_workers: Optional[int],
+    chunksize: int,
+    max_pending_chunks: Optional[int],
+    mp_context,
+    shared_manifest: Optional[dict] = None
+) -> Iterator:
+    """청크마다 task(chunk, *args)를 워커에서 실행하고 결과를 청크 순서대로 내보냄"""
+    if chunksize < 1:
+        raise ValueError("chunksize는 1 이상이어야 합니다")
+
+    if max_pending_chunks is None:
+        max_pending_chunks = 2 * (max_workers or os.cpu_count() or 1)
+    max_pending_chunks = max(1, max_pending_chunks)
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_initialize_worker,
+        initargs=(config, shared_manifest)
+    ) as executor:
+        chunks = _iter_chunks(systems, chunksize)
+        pending = deque()
+
+        try:
+            for chunk in islice(chunks, max_pending_chunks):
+                pending.append(executor.submit(task, chunk, *args))
+
+            while pending:
+                # 가장 앞선 청크가 끝나는 즉시 결과를 내보내고 다음 청크를 제출
+                result = pending.popleft().result()
+                for chunk in islice(chunks, 1):
+                    pending.append(executor.submit(task, chunk, *args))
+                yield result
+        finally:
+            # 소비자가 중간에 멈추면 아직 시작하지 않은 청크는 취소
+            for future in pending:
+                future.cancel()
+
+
+def iter_stability_analyses(
+    config: ThreeBodyConfig,
+    systems: Iterable[ThreeBodySystem],
+    x_range: Optional[tuple] = None,
+    y_range: Optional[tuple] = None,
+    *,
+    max_workers: Optional[int] = None,
+    chunksize: int = 64,
+    max_pending_chunks: Optional[int] = None,
+    mp_context=None,
+    shared_manifest: Optional[dict] = None
+) -> Iterator[StabilityAnalysis]:
+    """프로세스 풀 배치 안정성 분석 (입력 순서 유지 스트리밍)
+
+    Args:
+        config: 워커 엔진 설정 (워커마다 한 번 피클되어 전달)
+        systems: 삼체 시스템 iterable (지연 소비)
+        x_range: x 범위 (min, max), None이면 시스템마다 자동 계산
+        y_range: y 범위 (min, max), None이면 시스템마다 자동 계산
+        max_workers: 워커 프로세스 수 (None이면 CPU 수)
+        chunksize: 작업 하나에 묶을 시스템 수
+        max_pending_chunks: 동시에 제출해 둘 최대 청크 수 (None이면 워커 수의 2배)
+        mp_context: multiprocessing 컨텍스트 (None이면 기본값)
+        shared_manifest: SharedFieldRegistry.manifest (워커가 공유 격자/층에 붙음)
+
+    Yields:
+        입력 순서대로 StabilityAnalysis
+    """
+    for results in _iter_chunk_results(
+        config, systems, _analyze_chunk, (x_range, y_range),
+        max_workers, chunksize, max_pending_chunks, mp_context, shared_manifest
+    ):
+        yield from results
+
+
+def iter_run_shards(
+    config: ThreeBodyConfig,
+    systems: Iterable[ThreeBodySystem],
+    x_range: Optional[tuple] = None,
+    y_range: Optional[tuple] = None,
+    *,
+    failure_threshold: float = 0.1,
+    max_workers: Optional[int] = None,
+    chunksize: int = 64,
+    max_pending_chunks: Optional[int] = None,
+    mp_context=None,
+    shared_manifest: Optional[dict] = None
+) -> Iterator[Tuple[List[StabilityAnalysis], List[int], bytes]]:
+    """프로세스 풀 분석 + 청크별 부분 실패 지도 (입력 순서 유지 스트리밍)
+
+    인자는 iter_stability_analyses()와 같고, failure_threshold는 실패 판정 임계값.
+
+    Yields:
+        청크마다 (분석 결과, 시스템별 샤드 행 번호 (실패가 아니면 -1), 샤드 바이트)
+    """
+    return _iter_chunk_results(
+        config, systems, _run_chunk, (x_range, y_range, failure_threshold),
+        max_workers, chunksize, max_pending_chunks, mp_context, shared_manifest
+    )
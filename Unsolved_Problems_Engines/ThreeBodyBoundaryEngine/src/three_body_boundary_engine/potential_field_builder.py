@@ -0,0 +1,203 @@
+"""
+Potential Field Builder - 천체별 층 재사용 퍼텐셜 필드 생성
+
+엔진 번호: UP-1
+역할: 한 천체만 움직이는 파라미터 스캔에서 퍼텐셜 필드 증분 갱신
+
+수식 (중첩 원리):
+V(x,y) = -G * Σ L_i(x,y),   L_i = m_i / r_i
+
+처리 방식:
+- 격자(범위, 해상도)가 같으면 천체별 층 L_i를 보관
+- 위치나 질량이 바뀐 천체의 층만 다시 계산한 뒤 재합산
+- 격자가 바뀌면 모든 층을 다시 계산
+- reuse_tolerance > 0이면 그 거리 이내로 움직인 천체의 층도 재사용 (근사,
+  궤도 전파 스냅샷처럼 가까운 상태를 연속 분석할 때)
+- 결과는 GravityCalculator.create_potential_grid와 비트 단위로 같다
+- 계산기에 shared_fields가 있으면 격자 좌표와 (위치, 질량)이 같은 천체의 층을
+  공유 메모리 뷰로 참조 (읽기 전용, 그 슬롯을 다시 계산할 때는 새 버퍼 할당)
+- 천체 수가 트리 근사 기준을 넘으면 층 없이 계산기에 위임한다
+- dtype="float32"면 층과 합산을 float32로 수행 (층 메모리 / 대역폭 절반),
+  out으로 결과 버퍼를 넘기면 호출마다 새로 할당하지 않고 그 버퍼에 기록
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+from .models import Body
+from .gravity_calculator import GravityCalculator
+from .scalar_field import ScalarField
+from ._compat import np, require_numpy
+
+
+class PotentialFieldBuilder:
+    """천체별 기여 층을 재사용하는 퍼텐셜 필드 생성기"""
+
+    def __init__(
+        self,
+        gravity_calculator: Optional[GravityCalculator] = None,
+        reuse_tolerance: float = 0.0
+    ):
+        """
+        Args:
+            gravity_calculator: 층 계산에 사용할 계산기 (None이면 G = 1.0)
+            reuse_tolerance: 층을 계산한 위치에서 이 거리 이내면 재사용 (0이면 정확히 같을 때만)
+        """
+        require_numpy("PotentialFieldBuilder")
+        if reuse_tolerance < 0:
+            raise ValueError("reuse_tolerance는 0 이상이어야 합니다")
+        self.gravity_calculator = gravity_calculator or GravityCalculator()
+        self.reuse_tolerance = reuse_tolerance
+
+        self._grid_key: Optional[Tuple] = None
+        self._xs = None
+        self._ys = None
+        self._layers: List["np.ndarray"] = []
+        self._layer_keys: List[Tuple[float, float, float]] = []
+
+        # 통계
+        self.layer_computations = 0
+        self.layer_reuses = 0
+        self.layer_shares = 0
+
+    def build(
+        self,
+        bodies: List[Body],
+        x_range: tuple,
+        y_range: tuple,
+        resolution: int = 100,
+        dtype: str = "float64",
+        out: Optional["np.ndarray"] = None
+    ) -> ScalarField:
+        """퍼텐셜 필드 생성 (바뀐 천체 층만 재계산)
+
+        Args:
+            bodies: 천체 리스트 (같은 인덱스 = 같은 층)
+            x_range: x 범위 (min, max)
+            y_range: y 범위 (min, max)
+            resolution: 해상도
+            dtype: 층 / 결과 버퍼 자료형 ("float64" or "float32")
+            out: 결과를 쓸 버퍼 (형태와 자료형이 맞아야 함, None이면 새로 할당)
+
+        Returns:
+            퍼텐셜 ScalarField (out을 넘기면 그 버퍼를 감싼 필드, 층은 공유하지 않음)
+        """
+        # 다체(트리 근사) 경로는 천체별 층을 보관하지 않음 (층 메모리 O(N × 격자))
+        if self.gravity_calculator.uses_tree(bodies):
+            self.clear()
+            return self.gravity_calculator.create_scalar_field(
+                bodies=bodies,
+                x_range=x_range,
+                y_range=y_range,
+                resolution=resolution,
+                dtype=dtype
+            )
+        
+        grid_key = (tuple(x_range), tuple(y_range), resolution, np.dtype(dtype).name)
+        if grid_key != self._grid_key:
+            self._reset_grid(grid_key)
+
+        # 천체 수가 줄었으면 남는 층 제거
+        del self._layers[len(bodies):]
+        del self._layer_keys[len(bodies):]
+
+        shared_fields = self.gravity_calculator.shared_fields
+        for index, body in enumerate(bodies):
+            layer_key = (body.position.x, body.position.y, body.mass)
+            if index < len(self._layers) and self._can_reuse(self._layer_keys[index], layer_key):
+                self.layer_reuses += 1
+                continue
+            
+            layer = None
+            if shared_fields is not None:
+                layer = shared_fields.layer(body, x_range, y_range, resolution)
+            if layer is not None:
+                self.layer_shares += 1
+            elif index < len(self._layers) and self._layers[index].flags.writeable:
+                layer = self.gravity_calculator.potential_layer(
+                    body, self._xs, self._ys, out=self._layers[index]
+                )
+                self.layer_computations += 1
+            else:
+                layer = self.gravity_calculator.potential_layer(
+                    body, self._xs, self._ys, out=np.empty((self._xs.size, self._ys.size), dtype=dtype)
+                )
+                self.layer_computations += 1
+            
+            if index < len(self._layers):
+                self._layers[index] = layer
+                self._layer_keys[index] = layer_key
+            else:
+                self._layers.append(layer)
+                self._layer_keys.append(layer_key)
+
+        shape = (self._xs.size, self._ys.size)
+        if out is None:
+            potential = np.zeros(shape, dtype=dtype)
+        elif out.shape != shape or out.dtype != np.dtype(dtype):
+            raise ValueError(f"out 버퍼가 맞지 않습니다: {out.shape} {out.dtype} (필요: {shape} {dtype})")
+        else:
+            potential = out
+            potential.fill(0.0)
+        for layer in self._layers:
+            potential += layer
+        potential *= -self.gravity_calculator.G
+
+        resolution = grid_key[2]
+        return ScalarField(
+            origin=(x_range[0], y_range[0]),
+            spacing=(
+                (x_range[1] - x_range[0]) / resolution,
+                (y_range[1] - y_range[0]) / resolution
+            ),
+            values=potential
+        )
+
+    def _can_reuse(self, cached: Tuple[float, float, float], current: Tuple[float, float, float]) -> bool:
+        """보관된 층 재사용 가능 여부 (질량 동일 + 위치 허용 거리 이내)"""
+        if cached == current:
+            return True
+        if self.reuse_tolerance == 0.0 or cached[2] != current[2]:
+            return False
+        return math.hypot(cached[0] - current[0], cached[1] - current[1]) <= self.reuse_tolerance
+
+    def _reset_grid(self, grid_key: Tuple) -> None:
+        """새 격자 좌표 준비 및 층 초기화"""
+        (x_min, x_max), (y_min, y_max), resolution, _ = grid_key
+        shared_fields = self.gravity_calculator.shared_fields
+        coordinates = None
+        if shared_fields is not None:
+            coordinates = shared_fields.coordinates((x_min, x_max), (y_min, y_max), resolution)
+        if coordinates is not None:
+            self._xs, self._ys = coordinates
+        else:
+            steps = np.arange(resolution + 1, dtype=np.float64)
+            self._xs = x_min + steps * ((x_max - x_min) / resolution)
+            self._ys = y_min + steps * ((y_max - y_min) / resolution)
+        self._grid_key = grid_key
+        self._layers = []
+        self._layer_keys = []
+
+    def clear(self) -> None:
+        """보관 중인 격자와 층 제거"""
+        self._grid_key = None
+        self._xs = None
+        self._ys = None
+        self._layers = []
+        self._layer_keys = []
+
+    def get_statistics(self) -> Dict:
+        """층 재사용 통계 반환"""
+        total = self.layer_computations + self.layer_reuses + self.layer_shares
+        return {
+            "layers": len(self._layers),
+            "layer_computations": self.layer_computations,
+            "layer_reuses": self.layer_reuses,
+            "layer_shares": self.layer_shares,
+            "reuse_rate": self.layer_reuses / total if total else 0.0,
+            # 공유 층은 프로세스 메모리가 아니므로 제외
+            "layer_bytes": sum(layer.nbytes for layer in self._layers if layer.flags.writeable),
+        }
@@ -0,0 +1,179 @@
+"""
+Precision Report - 필드 정밀도 (float32) 검증 보고서
+
+엔진 번호: UP-1
+역할: ThreeBodyConfig.field_precision="float32"가 float64와 같은 판정을 내는지
+      기준 시스템 묶음에서 비교
+
+비교 항목 (시스템마다 float64 기준):
+- stability_score / mismatch 차이, is_stable 판정이 갈린 수
+- 퍼텐셜 상대 오차 max|V32 - V64| / max|V64|, 밀도 절대 오차 max|ρ32 - ρ64|
+- 필드 버퍼 크기 (바이트), 필드 + 밀도 단계 시간
+
+참고: 현재 경계 수렴 단계는 밀도 가중치를 읽지 않으므로 stability_score / mismatch는
+정밀도와 무관하게 같다. 정밀도 영향은 필드 / 밀도 오차 항목에서 확인한다.
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import time
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional
+
+from .config import ThreeBodyConfig
+from .models import Body, ThreeBodySystem
+from .point import Point
+from ._compat import np, require_numpy
+
+
+def reference_systems() -> List[ThreeBodySystem]:
+    """정밀도 검증용 기준 시스템 묶음 (결정적)
+
+    - 정삼각형 등질량, 일직선, 계층형 (태양-목성-소행성 질량비)
+    - 근접 쌍 (거리 1e-3), 질량비 1e6, 넓은 배치 (거리 100)
+    """
+    def system(*bodies):
+        return ThreeBodySystem(*[Body(position=Point(x, y), mass=m) for x, y, m in bodies])
+
+    return [
+        system((0.0, 0.0, 1.0), (1.0, 0.0, 1.0), (0.5, 0.8660254037844386, 1.0)),
+        system((-1.0, 0.0, 1.0), (0.0, 0.0, 1.0), (1.0, 0.0, 1.0)),
+        system((0.0, 0.0, 1.0), (5.2, 0.0, 9.5e-4), (2.8, 0.3, 1e-9)),
+        system((0.0, 0.0, 1.0), (1e-3, 0.0, 1.0), (0.5, 0.5, 0.1)),
+        system((0.0, 0.0, 1e6), (1.0, 0.0, 1.0), (0.0, 1.0, 1.0)),
+        system((0.0, 0.0, 1.0), (100.0, 0.0, 2.0), (50.0, 80.0, 0.5)),
+        system((0.3, -0.2, 2.0), (1.7, 0.4, 0.7), (0.9, 1.3, 1.1)),
+    ]
+
+
+@dataclass
+class PrecisionReport:
+    """정밀도 비교 결과 (기준: float64)"""
+    precision: str
+    systems: int
+    resolution: int
+    max_score_error: float
+    max_mismatch_error: float
+    verdict_changes: int
+    max_potential_error: float
+    max_density_error: float
+    field_bytes: Dict[str, int]
+    field_seconds: Dict[str, float]
+    per_system: List[Dict[str, float]] = field(default_factory=list, repr=False)
+
+    @property
+    def memory_ratio(self) -> float:
+        """필드 버퍼 크기 비율 (precision / float64)"""
+        return self.field_bytes[self.precision] / self.field_bytes["float64"]
+
+    def is_safe(self, score_tolerance: float = 1e-6, density_tolerance: float = 1e-4) -> bool:
+        """판정이 모두 같고 점수 / 밀도 오차가 허용치 이내인지"""
+        return (
+            self.verdict_changes == 0
+            and self.max_score_error <= score_tolerance
+            and self.max_density_error <= density_tolerance
+        )
+
+    def as_dict(self) -> Dict:
+        """요약 딕셔너리 (per_system 제외)"""
+        return {
+            "precision": self.precision,
+            "systems": self.systems,
+            "resolution": self.resolution,
+            "max_score_error": self.max_score_error,
+            "max_mismatch_error": self.max_mismatch_error,
+            "verdict_changes": self.verdict_changes,
+            "max_potential_error": self.max_potential_error,
+            "max_density_error": self.max_density_error,
+            "field_bytes": dict(self.field_bytes),
+            "field_seconds": dict(self.field_seconds),
+            "memory_ratio": self.memory_ratio,
+        }
+
+
+def compare_precision(
+    systems: Optional[List[ThreeBodySystem]] = None,
+    config: Optional[ThreeBodyConfig] = None,
+    precision: str = "float32",
+    failure_threshold: float = 0.1
+) -> PrecisionReport:
+    """기준 시스템 묶음에서 precision 필드와 float64 필드 비교
+
+    Args:
+        systems: 비교할 시스템 (None이면 reference_systems())
+        config: 기준 설정 (None이면 기본값, field_precision만 바꿔 두 엔진 생성)
+        precision: 비교할 정밀도
+        failure_threshold: is_stable 판정 임계값
+
+    Returns:
+        PrecisionReport
+    """
+    require_numpy("compare_precision")
+    from .three_body_boundary_engine import ThreeBodyBoundaryEngine
+
+    systems = list(systems) if systems is not None else reference_systems()
+    if not systems:
+        raise ValueError("비교할 시스템이 없습니다")
+    config = config or ThreeBodyConfig()
+    precisions = ("float64", precision)
+    engines = {
+        name: ThreeBodyBoundaryEngine(replace(config, field_precision=name))
+        for name in precisions
+    }
+    resolution = config.potential_resolution
+    field_seconds = {name: 0.0 for name in precisions}
+    field_bytes: Dict[str, int] = {}
+
+    per_system = []
+    for system in systems:
+        bodies = system.get_all_bodies()
+        x_range, y_range = ThreeBodyBoundaryEngine._default_ranges(bodies)
+        analyses = {}
+        potentials = {}
+        densities = {}
+        for name, engine in engines.items():
+            analyses[name] = engine.analyze_orbit_stability(system)
+            started = time.perf_counter()
+            potential = engine.gravity_calculator.create_scalar_field(
+                bodies, x_range, y_range, resolution=resolution, dtype=name
+            ) if engine.field_builder is None else engine.field_builder.build(
+                bodies, x_range, y_range, resolution=resolution, dtype=name
+            )
+            potentials[name] = potential.values.copy()
+            density = engine.gravity_calculator.potential_to_density(
+                potential, normalization=config.density_normalization
+            )
+            field_seconds[name] += time.perf_counter() - started
+            densities[name] = density.values
+            field_bytes[name] = potential.nbytes
+
+        reference, reduced = analyses["float64"], analyses[precision]
+        scale = float(np.abs(potentials["float64"]).max()) or 1.0
+        per_system.append({
+            "score_error": abs(reduced.stability_score - reference.stability_score),
+            "mismatch_error": abs(reduced.mismatch - reference.mismatch),
+            "verdict_changed": float(
+                reduced.is_stable(failure_threshold) != reference.is_stable(failure_threshold)
+            ),
+            "potential_error": float(
+                np.abs(potentials[precision].astype(np.float64) - potentials["float64"]).max()
+            ) / scale,
+            "density_error": float(
+                np.abs(densities[precision].astype(np.float64) - densities["float64"]).max()
+            ),
+        })
+
+    return PrecisionReport(
+        precision=precision,
+        systems=len(systems),
+        resolution=resolution,
+        max_score_error=max(row["score_error"] for row in per_system),
+        max_mismatch_error=max(row["mismatch_error"] for row in per_system),
+        verdict_changes=int(sum(row["verdict_changed"] for row in per_system)),
+        max_potential_error=max(row["potential_error"] for row in per_system),
+        max_density_error=max(row["density_error"] for row in per_system),
+        field_bytes=field_bytes,
+        field_seconds=field_seconds,
+        per_system=per_system
+    )
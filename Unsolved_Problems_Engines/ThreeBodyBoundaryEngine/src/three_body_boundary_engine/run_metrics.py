@@ -0,0 +1,110 @@
+"""
+Run Metrics - 통합 실행 단계별 계측 (선택적)
+
+엔진 번호: UP-1
+역할: run() 한 번의 단계별 벽시계/CPU 시간과 카운터를 모아 EngineRunResult.metrics로 반환
+
+단계 (STAGES):
+- "field": 중력 퍼텐셜 필드 생성 (균일 / 층 재사용 / 적응형)
+- "density": 밀도 정규화
+- "converge": BoundaryConvergenceAdapter.converge() 루프
+- "l1_record": FailureAtlas.record_failure()
+- "l2_bias": FailureBiasConverter.convert_failure_to_bias()
+(선별 모드에서는 단계마다 해상도별 시간이 합산되고 calls가 늘어남)
+
+카운터:
+- grid_cells: 필드 격자점 / 잎 셀 수 (선별 단계 합)
+- convergence_iterations / boundary_points: 경계 수렴 반복 수 (합) / 마지막 경계 점 수
+- screening_levels: 분석한 해상도 단계 수, cache_hits: 분석 캐시 적중 (0/1)
+- atlas_failures / atlas_signatures / bias_signatures: 실행 후 지도·편향 크기
+
+훅 (MetricsHook):
+- on_stage(stage, wall, cpu): 단계가 끝날 때마다
+- on_run(metrics, result): run()이 끝날 때 (외부 지표 수집기로 전달하는 지점)
+
+끄면 (기본값) 엔진은 단계마다 None 확인만 하고 시계를 읽지 않는다.
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+STAGES = ("field", "density", "converge", "l1_record", "l2_bias")
+
+
+@dataclass
+class StageTiming:
+    """단계 시간 (초, 누적)"""
+    wall: float = 0.0
+    cpu: float = 0.0
+    calls: int = 0
+
+
+class MetricsHook:
+    """계측 훅 (필요한 메서드만 재정의)"""
+
+    def on_stage(self, stage: str, wall: float, cpu: float) -> None:
+        """단계 하나가 끝났을 때"""
+
+    def on_run(self, metrics: "RunMetrics", result) -> None:
+        """run() 하나가 끝났을 때 (result: EngineRunResult)"""
+
+
+@dataclass
+class RunMetrics:
+    """run() 한 번의 계측 결과"""
+    stages: Dict[str, StageTiming] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+    hooks: List[MetricsHook] = field(default_factory=list, repr=False, compare=False)
+
+    @staticmethod
+    def start() -> Tuple[float, float]:
+        """(벽시계, CPU 시간) 시작점"""
+        return time.perf_counter(), time.process_time()
+
+    def stop(self, stage: str, started: Tuple[float, float]) -> Tuple[float, float]:
+        """started 이후 시간을 stage에 누적하고 다음 단계 시작점 반환"""
+        now = self.start()
+        wall = now[0] - started[0]
+        cpu = now[1] - started[1]
+        timing = self.stages.get(stage)
+        if timing is None:
+            timing = self.stages[stage] = StageTiming()
+        timing.wall += wall
+        timing.cpu += cpu
+        timing.calls += 1
+        for hook in self.hooks:
+            hook.on_stage(stage, wall, cpu)
+        return now
+
+    def count(self, name: str, value: int = 1) -> None:
+        """카운터 누적"""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set(self, name: str, value: int) -> None:
+        """카운터 설정 (마지막 값)"""
+        self.counters[name] = value
+
+    @property
+    def total_wall(self) -> float:
+        """계측한 단계의 벽시계 시간 합"""
+        return sum(timing.wall for timing in self.stages.values())
+
+    @property
+    def total_cpu(self) -> float:
+        """계측한 단계의 CPU 시간 합"""
+        return sum(timing.cpu for timing in self.stages.values())
+
+    def as_dict(self) -> Dict[str, float]:
+        """평탄한 지표 딕셔너리 ("<단계>.wall" / "<단계>.cpu" / "<단계>.calls" + 카운터)"""
+        flat: Dict[str, float] = {}
+        for stage, timing in self.stages.items():
+            flat[f"{stage}.wall"] = timing.wall
+            flat[f"{stage}.cpu"] = timing.cpu
+            flat[f"{stage}.calls"] = timing.calls
+        flat.update(self.counters)
+        return flat
@@ -10,12 +10,13 @@ Version: 1.2.0
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from .models import StabilityAnalysis, ThreeBodySystem
 from .failure_atlas import FailureAtlas, FailureRecord
 from .failure_bias_converter import SearchBias
+from .run_metrics import RunMetrics
 
 
 @dataclass(frozen=True)
@@ -27,6 +28,7 @@ class EngineRunResult:
     - search_bias: L2 출력 (enable_l2 시)
     - last_failure_record: 이번 실행에서 추가로 기록된 실패 (실패가 아닐 경우 None)
     - system: 분석한 시스템 (추적용; 상태 변형 없음)
+    - metrics: 단계별 계측 (run(collect_metrics=True) 또는 metrics_hooks 지정 시, 비교에서 제외)
     """
 
     system: ThreeBodySystem
@@ -34,5 +36,6 @@ class EngineRunResult:
     failure_atlas: Optional[FailureAtlas] = None
     search_bias: Optional[SearchBias] = None
     last_failure_record: Optional[FailureRecord] = None
+    metrics: Optional[RunMetrics] = field(default=None, compare=False, repr=False)
 
 
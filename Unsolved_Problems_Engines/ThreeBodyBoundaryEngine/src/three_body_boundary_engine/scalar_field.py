@@ -0,0 +1,214 @@
+"""
+ScalarField - 조밀 격자 스칼라 필드
+
+엔진 번호: UP-1
+역할: 퍼텐셜/밀도/중요도 가중치를 위한 조밀 격자 표현
+
+Dict[Point, float] 대비:
+- 격자점마다 Point 객체와 해시를 만들지 않음
+- 원점(origin), 간격(spacing), 형태(shape) + 연속 float64/float32 버퍼
+- 쌍선형(bilinear) 샘플링 O(1)
+
+좌표 규약:
+- values[i, j]는 점 (origin_x + i * dx, origin_y + j * dy)의 값
+- GravityCalculator.create_potential_grid와 같은 격자
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Tuple
+from .point import Point
+from ._compat import np, require_numpy
+
+
+_SUPPORTED_DTYPES = ("float64", "float32")
+
+
+@dataclass
+class ScalarField:
+    """조밀 격자 스칼라 필드
+
+    Attributes:
+        origin: 첫 격자점 좌표 (x_min, y_min)
+        spacing: 격자 간격 (dx, dy)
+        values: 값 버퍼, shape (nx, ny), C-연속 float64 또는 float32
+    """
+    origin: Tuple[float, float]
+    spacing: Tuple[float, float]
+    values: "np.ndarray"
+
+    def __post_init__(self):
+        """검증 및 버퍼 정리"""
+        require_numpy("ScalarField")
+        if self.values.ndim != 2:
+            raise ValueError("ScalarField 값은 2차원 배열이어야 합니다")
+        if self.values.dtype.name not in _SUPPORTED_DTYPES:
+            self.values = self.values.astype(np.float64)
+        self.values = np.ascontiguousarray(self.values)
+        self.origin = (float(self.origin[0]), float(self.origin[1]))
+        self.spacing = (float(self.spacing[0]), float(self.spacing[1]))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """격자 형태 (nx, ny)"""
+        return self.values.shape
+
+    @property
+    def dtype(self) -> str:
+        """버퍼 자료형 이름"""
+        return self.values.dtype.name
+
+    @property
+    def nbytes(self) -> int:
+        """버퍼 크기 (바이트)"""
+        return self.values.nbytes
+
+    def __len__(self) -> int:
+        """격자점 개수"""
+        return self.values.size
+
+    def x_coords(self) -> "np.ndarray":
+        """x 좌표 배열"""
+        return self.origin[0] + np.arange(self.shape[0], dtype=np.float64) * self.spacing[0]
+
+    def y_coords(self) -> "np.ndarray":
+        """y 좌표 배열"""
+        return self.origin[1] + np.arange(self.shape[1], dtype=np.float64) * self.spacing[1]
+
+    def copy(self) -> "ScalarField":
+        """버퍼를 복사한 새 필드"""
+        return ScalarField(origin=self.origin, spacing=self.spacing, values=self.values.copy())
+
+    def sample(self, x: float, y: float) -> float:
+        """쌍선형 보간 샘플링 (O(1))
+
+        격자 밖의 좌표는 가장 가까운 경계로 고정(clamp)한다.
+
+        Args:
+            x, y: 샘플링 좌표
+
+        Returns:
+            보간 값
+        """
+        nx, ny = self.shape
+        i, tx = self._locate(x, self.origin[0], self.spacing[0], nx)
+        j, ty = self._locate(y, self.origin[1], self.spacing[1], ny)
+
+        values = self.values
+        v00 = float(values[i, j])
+        if tx == 0.0 and ty == 0.0:
+            return v00
+        v10 = float(values[i + 1, j]) if tx else v00
+        v01 = float(values[i, j + 1]) if ty else v00
+        v11 = float(values[i + 1, j + 1]) if (tx and ty) else 0.0
+
+        return (
+            v00 * (1.0 - tx) * (1.0 - ty)
+            + v10 * tx * (1.0 - ty)
+            + v01 * (1.0 - tx) * ty
+            + v11 * tx * ty
+        )
+
+    def sample_many(self, xs: "np.ndarray", ys: "np.ndarray") -> "np.ndarray":
+        """쌍선형 보간 샘플링 (배열 입력, 벡터화)
+
+        Args:
+            xs, ys: 같은 shape의 좌표 배열
+
+        Returns:
+            보간 값 배열 (float64)
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        nx, ny = self.shape
+        i, tx = self._locate_many(xs, self.origin[0], self.spacing[0], nx)
+        j, ty = self._locate_many(ys, self.origin[1], self.spacing[1], ny)
+        i1 = np.minimum(i + 1, nx - 1)
+        j1 = np.minimum(j + 1, ny - 1)
+
+        values = self.values
+        return (
+            values[i, j] * (1.0 - tx) * (1.0 - ty)
+            + values[i1, j] * tx * (1.0 - ty)
+            + values[i, j1] * (1.0 - tx) * ty
+            + values[i1, j1] * tx * ty
+        )
+
+    @staticmethod
+    def _locate(coord: float, origin: float, spacing: float, n: int) -> Tuple[int, float]:
+        """좌표 → (셀 인덱스, 셀 내부 비율)"""
+        if n == 1 or spacing == 0:
+            return 0, 0.0
+        position = (coord - origin) / spacing
+        if position <= 0.0:
+            return 0, 0.0
+        if position >= n - 1:
+            return n - 1, 0.0
+        index = int(position)
+        return index, position - index
+
+    @staticmethod
+    def _locate_many(coords: "np.ndarray", origin: float, spacing: float, n: int):
+        """좌표 배열 → (셀 인덱스 배열, 셀 내부 비율 배열)"""
+        if n == 1 or spacing == 0:
+            return np.zeros(coords.shape, dtype=np.intp), np.zeros(coords.shape)
+        position = np.clip((coords - origin) / spacing, 0.0, n - 1)
+        index = np.minimum(position.astype(np.intp), n - 1)
+        return index, position - index
+
+    @classmethod
+    def from_grid(
+        cls,
+        xs: "np.ndarray",
+        ys: "np.ndarray",
+        values: "np.ndarray"
+    ) -> "ScalarField":
+        """좌표 배열 + 값 배열로부터 생성 (create_potential_grid 출력용)"""
+        require_numpy("ScalarField.from_grid")
+        dx = float(xs[1] - xs[0]) if len(xs) > 1 else 0.0
+        dy = float(ys[1] - ys[0]) if len(ys) > 1 else 0.0
+        return cls(origin=(float(xs[0]), float(ys[0])), spacing=(dx, dy), values=values)
+
+    @classmethod
+    def from_dict(cls, field: Dict[Point, float], dtype: str = "float64") -> "ScalarField":
+        """{Point: value} 딕셔너리로부터 생성 (기존 호출자용 어댑터)
+
+        Args:
+            field: 규칙 격자 위의 {Point: value} 딕셔너리
+            dtype: 버퍼 자료형 ("float64" or "float32")
+
+        Returns:
+            ScalarField
+
+        Raises:
+            ValueError: 비어 있거나 완전한 규칙 격자가 아닌 경우
+        """
+        require_numpy("ScalarField.from_dict")
+        if not field:
+            raise ValueError("빈 필드는 ScalarField로 변환할 수 없습니다")
+        if dtype not in _SUPPORTED_DTYPES:
+            raise ValueError(f"지원하지 않는 자료형: {dtype}")
+
+        xs = sorted({point.x for point in field})
+        ys = sorted({point.y for point in field})
+        if len(xs) * len(ys) != len(field):
+            raise ValueError("규칙 격자가 아닌 필드는 ScalarField로 변환할 수 없습니다")
+
+        x_index = {x: i for i, x in enumerate(xs)}
+        y_index = {y: j for j, y in enumerate(ys)}
+        values = np.empty((len(xs), len(ys)), dtype=dtype)
+        for point, value in field.items():
+            values[x_index[point.x], y_index[point.y]] = value
+
+        return cls.from_grid(np.asarray(xs), np.asarray(ys), values)
+
+    def to_dict(self) -> Dict[Point, float]:
+        """{Point: value} 딕셔너리로 변환 (기존 호출자용 어댑터)"""
+        field = {}
+        y_values = self.y_coords().tolist()
+        for x, row in zip(self.x_coords().tolist(), self.values.tolist()):
+            for y, value in zip(y_values, row):
+                field[Point(x, y)] = value
+        return field
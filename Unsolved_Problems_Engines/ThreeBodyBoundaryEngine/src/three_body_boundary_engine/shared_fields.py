@@ -0,0 +1,186 @@
+"""
+Shared Fields - 프로세스 간 공유 메모리 격자 / 천체 층 레지스트리
+
+엔진 번호: UP-1
+역할: 병렬 스윕에서 격자 좌표와 고정 천체의 퍼텐셜 층 (m / r)을 한 번만 계산해
+      multiprocessing.shared_memory에 올리고, 워커는 복사 없이 읽기 전용 뷰로 사용
+
+구성:
+- SharedFieldRegistry (부모): publish_grid() / publish_layer()로 공유 메모리 블록 생성,
+  manifest (블록 이름 · 형태 · 자료형, 작은 딕셔너리)를 워커에 전달, close()에서 해제
+- SharedFieldView (워커): manifest로 블록에 붙어 읽기 전용 NumPy 뷰 생성 (복사 없음)
+
+사용처:
+- GravityCalculator(shared_fields=...): 격자 좌표를 공유 배열로 쓰고,
+  (격자, 위치, 질량)이 정확히 같은 천체는 층 계산 대신 공유 층을 더함 (결과 비트 단위 동일)
+- PotentialFieldBuilder: 같은 조건의 층 슬롯에 공유 층을 그대로 참조
+- potential_to_density(): 읽기 전용 버퍼는 복사본을 정규화 (공유 블록은 바뀌지 않음)
+- ThreeBodyBoundaryEngine(shared_fields=registry): 병렬 경로가 manifest를 워커 초기화에 전달
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+from .models import Body
+from .gravity_calculator import GravityCalculator
+from ._compat import np, require_numpy
+
+
+# (x 범위, y 범위, 해상도)
+GridKey = Tuple[Tuple[float, float], Tuple[float, float], int]
+
+
+def grid_key(x_range: tuple, y_range: tuple, resolution: int) -> GridKey:
+    """격자 식별 키"""
+    return (
+        (float(x_range[0]), float(x_range[1])),
+        (float(y_range[0]), float(y_range[1])),
+        int(resolution)
+    )
+
+
+def grid_coordinates(key: GridKey) -> Tuple["np.ndarray", "np.ndarray"]:
+    """격자 좌표 (GravityCalculator.create_potential_grid와 같은 식)"""
+    (x_min, x_max), (y_min, y_max), resolution = key
+    steps = np.arange(resolution + 1, dtype=np.float64)
+    xs = x_min + steps * ((x_max - x_min) / resolution)
+    ys = y_min + steps * ((y_max - y_min) / resolution)
+    return xs, ys
+
+
+def _close_block(block: shared_memory.SharedMemory) -> None:
+    """블록 연결 해제 (밖에서 아직 배열을 참조 중이면 그 배열이 사라질 때 해제)"""
+    try:
+        block.close()
+    except BufferError:
+        pass
+
+
+def _layer_key(key: GridKey, body: Body) -> tuple:
+    return (key, float(body.position.x), float(body.position.y), float(body.mass))
+
+
+class SharedFieldView:
+    """공유 격자 / 층의 읽기 전용 뷰 (워커 쪽)"""
+
+    def __init__(self, manifest: Optional[Dict] = None):
+        """
+        Args:
+            manifest: SharedFieldRegistry.manifest (None이면 빈 뷰)
+        """
+        require_numpy("SharedFieldView")
+        self.manifest: Dict = {"grids": {}, "layers": {}}
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._grids: Dict[GridKey, Tuple["np.ndarray", "np.ndarray"]] = {}
+        self._layers: Dict[tuple, "np.ndarray"] = {}
+        for key, (xs, ys) in (manifest or {}).get("grids", {}).items():
+            self._grids[key] = (self._attach(xs), self._attach(ys))
+            self.manifest["grids"][key] = (xs, ys)
+        for key, spec in (manifest or {}).get("layers", {}).items():
+            self._layers[key] = self._attach(spec)
+            self.manifest["layers"][key] = spec
+
+    def _attach(self, spec: tuple) -> "np.ndarray":
+        """(블록 이름, 형태, 자료형) → 읽기 전용 배열"""
+        name, shape, dtype = spec
+        block = shared_memory.SharedMemory(name=name)
+        self._blocks.append(block)
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        array.flags.writeable = False
+        return array
+
+    def coordinates(self, x_range: tuple, y_range: tuple, resolution: int):
+        """공유 격자 좌표 (xs, ys) (없으면 None)"""
+        return self._grids.get(grid_key(x_range, y_range, resolution))
+
+    def layer(self, body: Body, x_range: tuple, y_range: tuple, resolution: int):
+        """(격자, 위치, 질량)이 같은 공유 층 m / r (없으면 None)"""
+        if not self._layers:
+            return None
+        return self._layers.get(_layer_key(grid_key(x_range, y_range, resolution), body))
+
+    def __len__(self) -> int:
+        """공유 배열 수 (좌표 쌍은 하나로 셈)"""
+        return len(self._grids) + len(self._layers)
+
+    @property
+    def nbytes(self) -> int:
+        """공유 배열 크기 합 (바이트)"""
+        total = sum(layer.nbytes for layer in self._layers.values())
+        return total + sum(xs.nbytes + ys.nbytes for xs, ys in self._grids.values())
+
+    def close(self) -> None:
+        """블록 연결 해제 (뷰를 더 쓰지 않을 때)"""
+        self._grids = {}
+        self._layers = {}
+        blocks, self._blocks = self._blocks, []
+        for block in blocks:
+            _close_block(block)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class SharedFieldRegistry(SharedFieldView):
+    """공유 격자 / 층 레지스트리 (부모 쪽, 블록 소유)
+
+    워커 풀을 만들기 전에 publish_*()로 올리고, 풀이 끝난 뒤 close()로 해제한다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._owned: List[shared_memory.SharedMemory] = []
+
+    def _publish(self, values: "np.ndarray") -> Tuple[tuple, "np.ndarray"]:
+        """배열을 새 공유 블록으로 복사 → (spec, 읽기 전용 뷰)"""
+        block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        self._owned.append(block)
+        array = np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)
+        array[...] = values
+        array.flags.writeable = False
+        return (block.name, values.shape, values.dtype.str), array
+
+    def publish_grid(self, x_range: tuple, y_range: tuple, resolution: int) -> GridKey:
+        """격자 좌표 공유 (이미 있으면 그대로)"""
+        key = grid_key(x_range, y_range, resolution)
+        if resolution < 1:
+            raise ValueError("resolution은 1 이상이어야 합니다")
+        if key not in self._grids:
+            xs, ys = grid_coordinates(key)
+            xs_spec, xs_view = self._publish(xs)
+            ys_spec, ys_view = self._publish(ys)
+            self._grids[key] = (xs_view, ys_view)
+            self.manifest["grids"][key] = (xs_spec, ys_spec)
+        return key
+
+    def publish_layer(self, body: Body, x_range: tuple, y_range: tuple, resolution: int) -> "np.ndarray":
+        """천체 하나의 층 m / r 계산 후 공유 (격자도 함께 공유)
+
+        Returns:
+            공유 층의 읽기 전용 뷰
+        """
+        key = self.publish_grid(x_range, y_range, resolution)
+        layer_key = _layer_key(key, body)
+        if layer_key not in self._layers:
+            xs, ys = self._grids[key]
+            # 층은 G와 무관 (V = -G * Σ 층)
+            layer = GravityCalculator().potential_layer(body, xs, ys)
+            spec, view = self._publish(layer)
+            self._layers[layer_key] = view
+            self.manifest["layers"][layer_key] = spec
+        return self._layers[layer_key]
+
+    def close(self) -> None:
+        """뷰 해제 후 소유한 블록 삭제 (unlink)"""
+        super().close()
+        self.manifest = {"grids": {}, "layers": {}}
+        owned, self._owned = self._owned, []
+        for block in owned:
+            _close_block(block)
+            block.unlink()
@@ -0,0 +1,314 @@
+"""
+Signature Index - 조건 서명 특징 벡터 색인 (KD-트리 분할)
+
+엔진 번호: UP-1
+역할: FailureAtlas의 수치 서명(특징 벡터)에 대한 최근접 / 반경 질의
+
+특징 벡터 (고정 길이, 천체 N개):
+- 질량 내림차순 N개 + 쌍별 거리 오름차순 N(N-1)/2개 + mismatch 1개
+- 삼체: 3 + 3 + 1 = 7차원 (KD-트리가 효과적인 저차원)
+
+구조 (KD-트리 잎 분할 + 벡터화 가지치기):
+- 생성: 퍼짐이 가장 큰 축의 중앙값으로 반복 2분할, 잎은 최대 leaf_size개
+- 점 배열은 잎 순서로 재배열되어 잎 l은 구간 [start[l], end[l])
+- lo[l], hi[l]: 잎 경계 상자
+- 묶음: 연속한 잎 group_size개 (KD 순서라 공간적으로 인접)의 경계 상자
+- 질의: 상자까지의 하한 거리를 묶음 → 잎 순서로 벡터화 계산 (노드별 파이썬 순회 없음)
+  - 반경: 하한 ≤ r²인 묶음의 잎 중 하한 ≤ r²인 잎의 점만 정확한 거리 계산
+  - k-최근접: 질의를 포함하거나 하한이 가장 작은 묶음/잎으로 k번째 거리 상한을 잡고,
+    하한이 그 이하인 나머지 잎만 추가로 확인
+
+증분 추가:
+- 새 점은 대기 구간에 쌓이고 질의 시 전수 비교
+- 대기 점이 색인된 점의 1/16 (최소 256개)을 넘으면 질의 시점에 재구성
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+from typing import List, Sequence, Tuple
+from ._compat import np, require_numpy
+
+
+class SignatureIndex:
+    """특징 벡터 KD-트리 색인 (증분 추가 + 지연 재구성)"""
+
+    def __init__(
+        self,
+        dimension: int,
+        leaf_size: int = 64,
+        min_pending: int = 256,
+        rebuild_ratio: float = 1.0 / 16.0,
+        nearest_head: int = 4,
+        group_size: int = 32
+    ):
+        """
+        Args:
+            dimension: 특징 벡터 차원
+            leaf_size: 잎 최대 점 수
+            min_pending: 재구성을 고려하는 최소 대기 점 수
+            rebuild_ratio: 색인된 점 대비 대기 점 비율이 이를 넘으면 재구성
+            nearest_head: k-최근접 질의에서 먼저 확인할 (하한이 가장 작은) 묶음/잎 수
+            group_size: 묶음 하나의 잎 수
+        """
+        require_numpy("SignatureIndex")
+        if dimension < 1 or leaf_size < 1 or nearest_head < 1 or group_size < 1:
+            raise ValueError("dimension, leaf_size, nearest_head, group_size는 1 이상이어야 합니다")
+
+        self.dimension = dimension
+        self.leaf_size = leaf_size
+        self.min_pending = min_pending
+        self.rebuild_ratio = rebuild_ratio
+        self.nearest_head = nearest_head
+        self.group_size = group_size
+
+        # 추가 순서 버퍼 (용량 2배 증가)
+        self._points = np.empty((64, dimension))
+        self._ids = np.empty(64, dtype=np.int64)
+        self._size = 0
+        self._reset_tree()
+
+        # 통계
+        self.rebuilds = 0
+
+    def __len__(self) -> int:
+        """색인된 점 수 (대기 포함)"""
+        return self._size
+
+    def _reset_tree(self) -> None:
+        """트리 비우기 (모든 점을 대기 상태로)"""
+        self._indexed = 0
+        self._tree_points = np.empty((0, self.dimension))
+        self._tree_ids = np.empty(0, dtype=np.int64)
+        self._start = np.empty(0, dtype=np.int64)
+        self._end = np.empty(0, dtype=np.int64)
+        self._lo = np.empty((0, self.dimension))
+        self._hi = np.empty((0, self.dimension))
+        self._group_lo = np.empty((0, self.dimension))
+        self._group_hi = np.empty((0, self.dimension))
+
+    def add(self, features: Sequence[float], record_id: int) -> None:
+        """특징 벡터 추가
+
+        Args:
+            features: 길이 dimension의 특징 벡터
+            record_id: 호출자 측 식별자 (FailureAtlas에서는 기록 인덱스)
+        """
+        if len(features) != self.dimension:
+            raise ValueError(f"특징 벡터 길이는 {self.dimension}이어야 합니다")
+        if self._size == self._ids.size:
+            self._points = np.concatenate([self._points, np.empty_like(self._points)])
+            self._ids = np.concatenate([self._ids, np.empty_like(self._ids)])
+        self._points[self._size] = features
+        self._ids[self._size] = record_id
+        self._size += 1
+
+    def add_many(self, features: "np.ndarray", record_ids: Sequence[int]) -> None:
+        """특징 벡터 묶음 추가
+
+        Args:
+            features: shape (n, dimension)
+            record_ids: 길이 n의 식별자
+        """
+        features = np.asarray(features, dtype=np.float64)
+        if features.ndim != 2 or features.shape[1] != self.dimension:
+            raise ValueError(f"특징 배열은 shape (n, {self.dimension})이어야 합니다")
+        count = features.shape[0]
+        if self._size + count > self._ids.size:
+            capacity = max(2 * self._ids.size, self._size + count)
+            points = np.empty((capacity, self.dimension))
+            ids = np.empty(capacity, dtype=self._ids.dtype)
+            points[:self._size] = self._points[:self._size]
+            ids[:self._size] = self._ids[:self._size]
+            self._points, self._ids = points, ids
+        self._points[self._size:self._size + count] = features
+        self._ids[self._size:self._size + count] = record_ids
+        self._size += count
+
+    def clear(self) -> None:
+        """모든 점 제거"""
+        self._size = 0
+        self._reset_tree()
+
+    def _maybe_rebuild(self) -> None:
+        """대기 점이 많으면 트리 재구성"""
+        pending = self._size - self._indexed
+        if pending > self.min_pending and pending > self.rebuild_ratio * self._indexed:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """전체 점으로 잎 분할 재구성 (중앙값 분할)"""
+        n = self._size
+        points = self._points[:n]
+        order = np.arange(n)
+        leaves = []
+        segments = [(0, n)]
+        while segments:
+            s, e = segments.pop()
+            if e - s <= self.leaf_size:
+                leaves.append(s)
+                continue
+            block = points[order[s:e]]
+            spread = block.max(axis=0) - block.min(axis=0)
+            axis = int(np.argmax(spread))
+            if spread[axis] == 0:
+                # 모든 점이 같음: 더 나눌 수 없음
+                leaves.append(s)
+                continue
+            mid = (e - s) // 2
+            order[s:e] = order[s:e][np.argpartition(block[:, axis], mid)]
+            segments += [(s, s + mid), (s + mid, e)]
+
+        self._tree_points = points[order].copy()
+        self._tree_ids = self._ids[:n][order].copy()
+        self._start = np.sort(np.array(leaves, dtype=np.int64))
+        self._end = np.append(self._start[1:], n)
+        self._lo = np.minimum.reduceat(self._tree_points, self._start, axis=0)
+        self._hi = np.maximum.reduceat(self._tree_points, self._start, axis=0)
+        groups = np.arange(0, self._start.size, self.group_size)
+        self._group_lo = np.minimum.reduceat(self._lo, groups, axis=0)
+        self._group_hi = np.maximum.reduceat(self._hi, groups, axis=0)
+        self._indexed = n
+        self.rebuilds += 1
+
+    def _prepare(self, query: Sequence[float]) -> "np.ndarray":
+        """질의 벡터 검증 + 필요 시 재구성"""
+        query = np.asarray(query, dtype=np.float64)
+        if query.shape != (self.dimension,):
+            raise ValueError(f"질의 벡터 길이는 {self.dimension}이어야 합니다")
+        self._maybe_rebuild()
+        return query
+
+    @staticmethod
+    def _box_bounds(lo: "np.ndarray", hi: "np.ndarray", query: "np.ndarray") -> "np.ndarray":
+        """경계 상자들까지의 최소 제곱 거리"""
+        gap = np.maximum(lo - query, 0.0) + np.maximum(query - hi, 0.0)
+        return np.einsum("ij,ij->i", gap, gap)
+
+    @staticmethod
+    def _ranges(starts: "np.ndarray", ends: "np.ndarray") -> "np.ndarray":
+        """구간 [starts[i], ends[i])들의 정수를 이어 붙인 배열"""
+        lengths = ends - starts
+        offsets = np.cumsum(lengths) - lengths
+        return np.arange(int(lengths.sum())) + np.repeat(starts - offsets, lengths)
+
+    def _group_leaves(self, query: "np.ndarray", groups: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """묶음들에 속한 잎과 잎별 하한"""
+        first = groups * self.group_size
+        leaves = self._ranges(first, np.minimum(first + self.group_size, self._start.size))
+        return leaves, self._box_bounds(self._lo[leaves], self._hi[leaves], query)
+
+    def _leaf_rows(self, leaves: "np.ndarray") -> "np.ndarray":
+        """잎들의 점 행 인덱스 (연결)"""
+        return self._ranges(self._start[leaves], self._end[leaves])
+
+    def _candidates(self, query: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+        """대기 점의 (제곱 거리, id)"""
+        diff = self._points[self._indexed:self._size] - query
+        return np.einsum("ij,ij->i", diff, diff), self._ids[self._indexed:self._size]
+
+    def _merge_leaves(
+        self,
+        query: "np.ndarray",
+        leaves: "np.ndarray",
+        distance2: "np.ndarray",
+        ids: "np.ndarray"
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """잎들의 점을 후보에 추가"""
+        rows = self._leaf_rows(leaves)
+        diff = self._tree_points[rows] - query
+        return (
+            np.concatenate([distance2, np.einsum("ij,ij->i", diff, diff)]),
+            np.concatenate([ids, self._tree_ids[rows]])
+        )
+
+    @staticmethod
+    def _top_k(
+        distance2: "np.ndarray",
+        ids: "np.ndarray",
+        k: int
+    ) -> Tuple["np.ndarray", "np.ndarray", float]:
+        """k번째 거리 이하 후보만 남김 (동률은 모두 유지) → (거리², id, k번째 거리²)"""
+        if distance2.size < k:
+            return distance2, ids, np.inf
+        kth = np.partition(distance2, k - 1)[k - 1]
+        keep = distance2 <= kth
+        return distance2[keep], ids[keep], kth
+
+    def _closest(self, bounds: "np.ndarray") -> "np.ndarray":
+        """하한이 0인 (질의를 포함한) 항목 + 하한이 가장 작은 nearest_head개의 위치"""
+        head = min(bounds.size, self.nearest_head)
+        chosen = bounds == 0.0
+        chosen[np.argpartition(bounds, head - 1)[:head]] = True
+        return np.flatnonzero(chosen)
+
+    def nearest(self, query: Sequence[float], k: int = 1) -> List[Tuple[float, int]]:
+        """k-최근접 질의 (유클리드 거리)
+
+        Args:
+            query: 길이 dimension의 특징 벡터
+            k: 반환할 이웃 수
+
+        Returns:
+            (거리, record_id) 리스트, 거리 오름차순
+        """
+        if k < 1:
+            raise ValueError("k는 1 이상이어야 합니다")
+        query = self._prepare(query)
+        best_d2, best_ids = self._candidates(query)
+
+        if self._indexed:
+            group_bounds = self._box_bounds(self._group_lo, self._group_hi, query)
+            # 1단계: 질의를 포함하거나 하한이 가장 작은 묶음 → 그 안의 같은 조건의 잎
+            #        으로 k번째 거리 상한을 잡음
+            leaves, bounds = self._group_leaves(query, self._closest(group_bounds))
+            seed = leaves[self._closest(bounds)]
+            best_d2, best_ids, kth = self._top_k(
+                *self._merge_leaves(query, seed, best_d2, best_ids), k
+            )
+            # 2단계: 하한이 상한 이하인 나머지 잎을 하한 순서로 (묶음 크기 2배씩),
+            #        상한을 계속 좁히며 하한이 상한을 넘으면 종료 (정확한 결과)
+            leaves, bounds = self._group_leaves(query, np.flatnonzero(group_bounds <= kth))
+            keep = (bounds <= kth) & ~np.isin(leaves, seed)
+            order = np.argsort(bounds[keep], kind="stable")
+            leaves, bounds = leaves[keep][order], bounds[keep][order]
+            position, batch = 0, self.nearest_head
+            while position < leaves.size and bounds[position] <= kth:
+                chunk = leaves[position:position + batch]
+                best_d2, best_ids, kth = self._top_k(
+                    *self._merge_leaves(query, chunk, best_d2, best_ids), k
+                )
+                position += batch
+                batch *= 2
+        else:
+            best_d2, best_ids, _ = self._top_k(best_d2, best_ids, k)
+
+        order = np.lexsort((best_ids, best_d2))[:k]
+        return list(zip(np.sqrt(best_d2[order]).tolist(), best_ids[order].tolist()))
+
+    def within(self, query: Sequence[float], radius: float) -> List[Tuple[float, int]]:
+        """반경 질의 (유클리드 거리 ≤ radius)
+
+        Args:
+            query: 길이 dimension의 특징 벡터
+            radius: 반경 (0 이상)
+
+        Returns:
+            (거리, record_id) 리스트, 거리 오름차순
+        """
+        if radius < 0:
+            raise ValueError("radius는 0 이상이어야 합니다")
+        query = self._prepare(query)
+        radius2 = radius * radius
+
+        distance2, ids = self._candidates(query)
+        if self._indexed:
+            group_bounds = self._box_bounds(self._group_lo, self._group_hi, query)
+            leaves, bounds = self._group_leaves(query, np.flatnonzero(group_bounds <= radius2))
+            leaves = leaves[bounds <= radius2]
+            distance2, ids = self._merge_leaves(query, leaves, distance2, ids)
+
+        inside = distance2 <= radius2
+        distance2, ids = distance2[inside], ids[inside]
+        order = np.lexsort((ids, distance2))
+        return list(zip(np.sqrt(distance2[order]).tolist(), ids[order].tolist()))
@@ -0,0 +1,231 @@
+"""
+Spatial Risk Grid - 구성 공간 위험도 격자 (L2)
+
+엔진 번호: UP-1
+레이어: L2 (실패 학습)
+역할: 실패 서명을 구성 공간 좌표로 옮겨 격자 셀별 위험도를 만들고, 처음 보는 조건의 위험도를 조회
+
+좌표 (configuration_coordinates):
+- mass_ratio: 가장 가벼운 질량 / 가장 무거운 질량 (0 ~ 1]
+- separation: 쌍별 거리의 평균
+
+셀 위험도 (risk_map과 같은 규칙):
+- 셀 실패 횟수 / 최대 셀 실패 횟수 × 0.6 + 셀 평균 심각도 × 0.4
+- 입력은 signature_statistics() (서명, 횟수, 심각도 합) — FailureAtlas / FailureSummary /
+  BoundedFailureAtlas / IncrementalBiasConverter 모두 사용 가능, 서명 수에 비례
+
+조회:
+- risk(x, y): 셀 하나 O(1) (interpolate=True면 셀 중심 사이 쌍선형 보간, 빈 셀은 0)
+- risk_many(points): (n, 2) 배열 일괄 조회 (NumPy, 점유 영역 밀집 배열 인덱싱)
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import math
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .failure_atlas import _parse_signature_features
+from ._compat import HAS_NUMPY, np, require_numpy
+
+
+def configuration_coordinates(
+    masses: Sequence[float],
+    distances: Sequence[float]
+) -> Tuple[float, float]:
+    """질량/쌍별 거리 → (mass_ratio, separation)"""
+    heaviest = max(masses)
+    mass_ratio = min(masses) / heaviest if heaviest > 0 else 0.0
+    separation = sum(distances) / len(distances) if distances else 0.0
+    return mass_ratio, separation
+
+
+def system_coordinates(system) -> Tuple[float, float]:
+    """삼체 시스템 → (mass_ratio, separation)"""
+    bodies = system.get_all_bodies()
+    distances = [
+        bodies[i].position.distance_to(bodies[j].position)
+        for i in range(len(bodies))
+        for j in range(i + 1, len(bodies))
+    ]
+    return configuration_coordinates([body.mass for body in bodies], distances)
+
+
+def signature_coordinates(signature: str) -> Optional[Tuple[float, float]]:
+    """조건 서명 → (mass_ratio, separation) (형식이 다르면 None)"""
+    features = _parse_signature_features(signature)
+    if not features:
+        return None
+    # 천체 N개: 질량 N + 거리 N(N-1)/2 + mismatch 1
+    bodies = 1
+    while bodies + bodies * (bodies - 1) // 2 + 1 < len(features):
+        bodies += 1
+    if bodies + bodies * (bodies - 1) // 2 + 1 != len(features):
+        return None
+    return configuration_coordinates(features[:bodies], features[bodies:-1])
+
+
+class SpatialRiskGrid:
+    """구성 공간 위험도 격자 (셀 = (mass_ratio, separation) 사각형)"""
+
+    def __init__(
+        self,
+        cell_size: Tuple[float, float] = (0.05, 0.1),
+        max_cells: int = 1 << 22
+    ):
+        """
+        Args:
+            cell_size: 셀 크기 (mass_ratio 방향, separation 방향)
+            max_cells: 일괄 조회용 밀집 배열의 최대 셀 수 (점유 영역 기준)
+        """
+        if len(cell_size) != 2 or min(cell_size) <= 0:
+            raise ValueError("cell_size는 양수 두 개여야 합니다")
+        if max_cells < 1:
+            raise ValueError("max_cells는 1 이상이어야 합니다")
+        self.cell_size = (float(cell_size[0]), float(cell_size[1]))
+        self.max_cells = max_cells
+        # 셀 → [실패 횟수, 심각도 합]
+        self._cells: Dict[Tuple[int, int], List[float]] = {}
+        self._risk: Optional[Dict[Tuple[int, int], float]] = None
+        self._dense = None
+
+    @classmethod
+    def from_statistics(
+        cls,
+        source,
+        cell_size: Tuple[float, float] = (0.05, 0.1),
+        max_cells: int = 1 << 22
+    ) -> "SpatialRiskGrid":
+        """signature_statistics()를 제공하는 객체로 격자 생성 (좌표가 없는 서명은 건너뜀)"""
+        grid = cls(cell_size, max_cells)
+        names, counts, sums = source.signature_statistics()
+        if HAS_NUMPY:
+            counts, sums = np.asarray(counts).tolist(), np.asarray(sums).tolist()
+        for name, count, severity_sum in zip(names, counts, sums):
+            point = signature_coordinates(name)
+            if point is not None:
+                grid.add(point[0], point[1], count, severity_sum)
+        return grid
+
+    def __len__(self) -> int:
+        """점유 셀 수"""
+        return len(self._cells)
+
+    def cell_of(self, mass_ratio: float, separation: float) -> Tuple[int, int]:
+        """좌표 → 셀 인덱스"""
+        return (
+            math.floor(mass_ratio / self.cell_size[0]),
+            math.floor(separation / self.cell_size[1])
+        )
+
+    def cell_center(self, cell: Tuple[int, int]) -> Tuple[float, float]:
+        """셀 인덱스 → 셀 중심 좌표"""
+        return ((cell[0] + 0.5) * self.cell_size[0], (cell[1] + 0.5) * self.cell_size[1])
+
+    def add(
+        self,
+        mass_ratio: float,
+        separation: float,
+        count: int = 1,
+        severity_sum: float = 0.0
+    ) -> None:
+        """좌표에 실패 count개 (심각도 합 severity_sum) 누적"""
+        entry = self._cells.setdefault(self.cell_of(mass_ratio, separation), [0, 0.0])
+        entry[0] += count
+        entry[1] += severity_sum
+        self._risk = None
+        self._dense = None
+
+    def cell_risks(self) -> Dict[Tuple[int, int], float]:
+        """셀 → 위험도 (점유 셀만)"""
+        if self._risk is None:
+            max_count = max((count for count, _ in self._cells.values()), default=0)
+            self._risk = {
+                cell: count / max_count * 0.6 + severity_sum / count * 0.4
+                for cell, (count, severity_sum) in self._cells.items()
+            }
+        return self._risk
+
+    def pattern(self, min_risk: float = 0.0) -> Dict[Tuple[float, float], float]:
+        """셀 중심 좌표 → 위험도 (SearchBias.spatial_risk_pattern 형식)"""
+        return {
+            self.cell_center(cell): risk
+            for cell, risk in self.cell_risks().items()
+            if risk >= min_risk
+        }
+
+    def risk(self, mass_ratio: float, separation: float, interpolate: bool = False) -> float:
+        """좌표의 위험도 (셀 조회 O(1), 빈 셀은 0)"""
+        risks = self.cell_risks()
+        if not interpolate:
+            return risks.get(self.cell_of(mass_ratio, separation), 0.0)
+        u = mass_ratio / self.cell_size[0] - 0.5
+        v = separation / self.cell_size[1] - 0.5
+        i, j = math.floor(u), math.floor(v)
+        s, t = u - i, v - j
+        return (
+            risks.get((i, j), 0.0) * (1 - s) * (1 - t)
+            + risks.get((i + 1, j), 0.0) * s * (1 - t)
+            + risks.get((i, j + 1), 0.0) * (1 - s) * t
+            + risks.get((i + 1, j + 1), 0.0) * s * t
+        )
+
+    def _dense_risks(self):
+        """(원점 셀, 점유 영역 밀집 위험도 배열)"""
+        if self._dense is None:
+            risks = self.cell_risks()
+            if not risks:
+                self._dense = ((0, 0), np.zeros((0, 0)))
+                return self._dense
+            cells = np.array(list(risks), dtype=np.int64)
+            origin = cells.min(axis=0)
+            shape = cells.max(axis=0) - origin + 1
+            if int(shape[0]) * int(shape[1]) > self.max_cells:
+                raise ValueError(
+                    f"점유 영역이 max_cells({self.max_cells})보다 큽니다: "
+                    f"{int(shape[0])}×{int(shape[1])} (cell_size를 키우세요)"
+                )
+            dense = np.zeros((int(shape[0]), int(shape[1])))
+            dense[cells[:, 0] - origin[0], cells[:, 1] - origin[1]] = list(risks.values())
+            self._dense = ((int(origin[0]), int(origin[1])), dense)
+        return self._dense
+
+    def risk_many(self, points, interpolate: bool = False) -> "np.ndarray":
+        """(n, 2) 좌표 배열의 위험도 (벡터화)
+
+        Args:
+            points: [:, 0] = mass_ratio, [:, 1] = separation
+            interpolate: 셀 중심 사이 쌍선형 보간 여부
+        """
+        require_numpy("SpatialRiskGrid.risk_many")
+        points = np.asarray(points, dtype=np.float64)
+        if points.ndim != 2 or points.shape[1] != 2:
+            raise ValueError(f"points는 (n, 2) 배열이어야 합니다: {points.shape}")
+        origin, dense = self._dense_risks()
+        u = points[:, 0] / self.cell_size[0]
+        v = points[:, 1] / self.cell_size[1]
+        if not interpolate:
+            return self._gather(dense, np.floor(u).astype(np.int64) - origin[0],
+                                np.floor(v).astype(np.int64) - origin[1])
+        u -= 0.5
+        v -= 0.5
+        i = np.floor(u).astype(np.int64)
+        j = np.floor(v).astype(np.int64)
+        s = u - i
+        t = v - j
+        i -= origin[0]
+        j -= origin[1]
+        return (
+            self._gather(dense, i, j) * (1 - s) * (1 - t)
+            + self._gather(dense, i + 1, j) * s * (1 - t)
+            + self._gather(dense, i, j + 1) * (1 - s) * t
+            + self._gather(dense, i + 1, j + 1) * s * t
+        )
+
+    @staticmethod
+    def _gather(dense: "np.ndarray", i: "np.ndarray", j: "np.ndarray") -> "np.ndarray":
+        """밀집 배열 조회 (범위 밖은 0)"""
+        inside = (i >= 0) & (i < dense.shape[0]) & (j >= 0) & (j < dense.shape[1])
+        values = np.zeros(i.shape)
+        values[inside] = dense[i[inside], j[inside]]
+        return values
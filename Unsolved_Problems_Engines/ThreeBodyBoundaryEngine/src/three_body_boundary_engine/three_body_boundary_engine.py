@@ -22,6 +22,7 @@ ThreeBodyBoundaryEngine - 삼체 문제 경계 정합 분석 엔진
 
 처리 방식:
 - 정적 분석: 시간 적분 없음, velocity 사용 안 함
+  (예외: observe_boundary_formation(evolve=True)는 OrbitIntegrator로 궤도 전파)
 - 공간 변환: 중력 퍼텐셜 → 밀도 → 경계 정합
 - 궤도 시뮬레이션 ❌ → 공간 구조 분석 ✅
 
@@ -29,7 +30,9 @@ Author: GNJz (Qquarts)
 Version: 1.2.0 (원인 분석 전용)
 """
 
-from typing import List, Optional, Dict
+import asyncio
+import math
+from typing import Iterable, Iterator, List, Optional, Dict
 from .config import ThreeBodyConfig
 from .models import (
     ThreeBodySystem,
@@ -41,11 +44,33 @@ from .models import (
 )
 from .gravity_calculator import GravityCalculator
 from .boundary_convergence_adapter import BoundaryConvergenceAdapter
-from .lagrange_calculator import LagrangeCalculator
+from .lagrange_calculator import LAGRANGE_TYPES, LagrangeCalculator
 from .point import Point
 from .failure_atlas import FailureAtlas, FailureRecord
-from .failure_bias_converter import FailureBiasConverter, SearchBias
+from .failure_bias_converter import FailureBiasConverter, IncrementalBiasConverter, SearchBias
 from .run_result import EngineRunResult
+from .run_metrics import MetricsHook, RunMetrics
+from .batch_result import (
+    BATCH_COLUMNS,
+    BatchRunResult,
+    _allocate_columns,
+    _validate_arrays,
+    iter_systems_from_arrays
+)
+from .parallel_batch import iter_stability_analyses, iter_run_shards
+from .failure_shard import decode_failure_shard
+from .analysis_cache import AnalysisCache
+from .canonical_frame import canonicalize_system
+from .potential_field_builder import PotentialFieldBuilder
+from .orbit_integrator import OrbitIntegrator
+from .shared_fields import SharedFieldView
+from .async_pool import AsyncWorkerPool
+from .scalar_field import ScalarField
+from ._compat import HAS_NUMPY, np, require_numpy
+
+
+# 적응형 필드 루트 단계 한 변의 셀 수
+_ADAPTIVE_BASE = 4
 
 
 class ThreeBodyBoundaryEngine:
@@ -60,15 +85,38 @@ class ThreeBodyBoundaryEngine:
     - 라그랑주 점 경계 관찰
     """
     
-    def __init__(self, config: Optional[ThreeBodyConfig] = None):
+    def __init__(
+        self,
+        config: Optional[ThreeBodyConfig] = None,
+        analysis_cache: Optional[AnalysisCache] = None,
+        metrics_hooks: Optional[List[MetricsHook]] = None,
+        shared_fields: Optional[SharedFieldView] = None
+    ):
         """
         Args:
             config: 설정 (None이면 기본값 사용)
+            analysis_cache: 분석 결과 캐시 (None이면 캐시 없이 매번 계산)
+            metrics_hooks: 계측 훅 (지정하면 run()마다 단계별 계측을 수집해 전달)
+            shared_fields: 공유 메모리 격자 좌표 / 천체 층 (SharedFieldRegistry)
+                - 필드 생성에 사용하고, 병렬 경로는 워커가 복사 없이 같은 블록에 붙음
         """
         self.config = config or ThreeBodyConfig()
+        self.analysis_cache = analysis_cache
+        self.shared_fields = shared_fields
+        self.metrics_hooks: List[MetricsHook] = list(metrics_hooks or [])
+        # run() 실행 중인 계측 (끄면 None)
+        self._metrics: Optional[RunMetrics] = None
         self.gravity_calculator = GravityCalculator(
-            gravitational_constant=self.config.gravitational_constant
+            gravitational_constant=self.config.gravitational_constant,
+            opening_angle=self.config.opening_angle,
+            direct_sum_threshold=self.config.direct_sum_threshold,
+            shared_fields=self.shared_fields
         )
+        # 천체별 퍼텐셜 층 재사용 (NumPy 경로)
+        self.field_builder = PotentialFieldBuilder(
+            self.gravity_calculator,
+            reuse_tolerance=self.config.layer_reuse_tolerance
+        ) if HAS_NUMPY else None
         self.boundary_adapter = BoundaryConvergenceAdapter(
             boundary_radius=self.config.boundary_radius,
             initial_boundary_points=self.config.initial_boundary_points,
@@ -76,6 +124,12 @@ class ThreeBodyBoundaryEngine:
             error_threshold=self.config.error_threshold
         )
         self.lagrange_calculator = LagrangeCalculator()
+        # 전체 해상도 퍼텐셜 버퍼 (NumPy 경로, 분석마다 재사용)
+        self._potential_buffer = None
+        # arun() / arun_batch() 기본 프로세스 풀 (처음 사용할 때 생성)
+        self._async_pool: Optional[AsyncWorkerPool] = None
+        # bias_converter를 넘기지 않은 실행의 기본 변환기 (같은 지도 반복 실행 시 새 행만 반영)
+        self._bias_converter: Optional[IncrementalBiasConverter] = None
     
     def analyze_orbit_stability(
         self,
@@ -87,43 +141,178 @@ class ThreeBodyBoundaryEngine:
         
         원인 분석: "왜 특정 조건에서 궤도가 안정/불안정한가?"
         
+        선별 모드 (config.screening_resolutions 설정 시):
+        거친 해상도부터 분석하고, 결과가 불확실 대역 안에 있을 때만
+        다음 해상도로 올린다. 판정한 단계는 결과의
+        screening_level / screening_resolution에 기록된다.
+        (현재 경계 수렴은 필드 가중치를 읽지 않아 mismatch가 해상도와 무관하다)
+        
         Args:
-            system: 삼체 시스템
+            system: 삼체 시스템 (NBodySystem 등 get_all_bodies()를 제공하는 다체 시스템도 가능)
             x_range: x 범위 (min, max), None이면 자동 계산
             y_range: y 범위 (min, max), None이면 자동 계산
         
         Returns:
             안정성 분석 결과
         """
+        # 정규화 (설정된 경우): 범위는 정규 좌표계에서 자동 계산.
+        # 결과는 스칼라이므로 원래 좌표계로 그대로 반환된다.
+        if self.config.canonicalize and (x_range is None or y_range is None):
+            system = canonicalize_system(system).system
+        
+        # 캐시 조회 (설정된 경우)
+        cache_key = None
+        if self.analysis_cache is not None:
+            cache_key = self.analysis_cache.fingerprint(system, x_range, y_range, self.config)
+            cached = self.analysis_cache.get(cache_key)
+            if cached is not None:
+                if self._metrics is not None:
+                    self._metrics.count("cache_hits")
+                return cached
+        
         bodies = system.get_all_bodies()
         
         # 범위 자동 계산
         if x_range is None or y_range is None:
-            all_x = [b.position.x for b in bodies]
-            all_y = [b.position.y for b in bodies]
-            x_min, x_max = min(all_x), max(all_x)
-            y_min, y_max = min(all_y), max(all_y)
-            
-            # 여유 공간 추가
-            x_range = (x_min - 1.0, x_max + 1.0)
-            y_range = (y_min - 1.0, y_max + 1.0)
+            x_range, y_range = self._default_ranges(bodies)
         
-        # 중력 퍼텐셜 필드 생성
-        potential_field = self.gravity_calculator.create_potential_field(
-            bodies=bodies,
-            x_range=x_range,
-            y_range=y_range,
-            resolution=self.config.potential_resolution
+        levels = self._screening_levels()
+        for level, resolution in enumerate(levels):
+            analysis = self._analyze_at_resolution(bodies, x_range, y_range, resolution)
+            # 불확실 대역 밖이면 이 해상도에서 판정 확정
+            if level == len(levels) - 1 or not self._is_uncertain(analysis):
+                break
+        
+        if self.config.screening_resolutions:
+            analysis.screening_level = level
+            analysis.screening_resolution = resolution
+        if self._metrics is not None:
+            self._metrics.count("screening_levels", level + 1)
+        
+        if cache_key is not None:
+            self.analysis_cache.put(cache_key, analysis)
+        
+        return analysis
+
+    def _default_bias_converter(self) -> IncrementalBiasConverter:
+        """엔진 소유 기본 편향 변환기
+        
+        같은 지도로 반복 실행하면 마지막 변환 이후 추가된 행만 반영하고,
+        다른 지도이거나 행이 삭제되면 처음부터 다시 누적한다 (결과는 일괄 변환과 동일).
+        """
+        if self._bias_converter is None:
+            self._bias_converter = IncrementalBiasConverter()
+        return self._bias_converter
+    
+    @staticmethod
+    def _default_ranges(bodies: List[Body]) -> tuple:
+        """자동 분석 범위: 천체 경계 상자 + 여유 1.0"""
+        all_x = [b.position.x for b in bodies]
+        all_y = [b.position.y for b in bodies]
+        return (
+            (min(all_x) - 1.0, max(all_x) + 1.0),
+            (min(all_y) - 1.0, max(all_y) + 1.0)
         )
+
+    def _screening_levels(self) -> List[int]:
+        """선별 해상도 단계 (거친 → 전체 해상도)"""
+        full = self.config.potential_resolution
+        coarse = sorted({r for r in (self.config.screening_resolutions or ()) if r < full})
+        return coarse + [full]
+    
+    def _is_uncertain(self, analysis: StabilityAnalysis) -> bool:
+        """선별 불확실 대역 판정
         
-        # 밀도 변환
+        mismatch가 stability_threshold의 ±screening_band (상대값) 이내,
+        즉 stability_score가 0 근처인 경우 더 높은 해상도로 올린다.
+        """
+        ratio = analysis.mismatch / self.config.stability_threshold
+        return abs(ratio - 1.0) <= self.config.screening_band
+    
+    def _analyze_at_resolution(
+        self,
+        bodies: List[Body],
+        x_range: tuple,
+        y_range: tuple,
+        resolution: int
+    ) -> StabilityAnalysis:
+        """지정 해상도에서 L0 분석 (필드 → 밀도 → 경계 수렴)"""
+        metrics = self._metrics
+        if metrics is not None:
+            started = metrics.start()
+        # 중력 퍼텐셜 필드 생성
+        # (NumPy가 있으면 ScalarField 격자, 없으면 {Point: value} 딕셔너리)
+        # 전체 해상도 격자는 빌더가 바뀐 천체의 층만 다시 계산한다.
+        # (선별용 거친 격자는 빌더의 층을 덮어쓰지 않도록 직접 생성)
+        # 적응형 모드는 가장 작은 셀이 격자 간격 이하가 되는 깊이까지 분할한다.
+        if self.config.adaptive_tolerance is not None:
+            potential_field = self.gravity_calculator.create_adaptive_field(
+                bodies=bodies,
+                x_range=x_range,
+                y_range=y_range,
+                tolerance=self.config.adaptive_tolerance,
+                max_depth=max(0, math.ceil(math.log2(resolution / _ADAPTIVE_BASE))),
+                base=_ADAPTIVE_BASE
+            )
+        elif self.field_builder is not None and resolution == self.config.potential_resolution:
+            # 전체 해상도 필드는 미리 할당한 버퍼를 호출마다 재사용 (분석 결과는 스칼라뿐)
+            potential_field = self.field_builder.build(
+                bodies=bodies,
+                x_range=x_range,
+                y_range=y_range,
+                resolution=resolution,
+                dtype=self.config.field_precision,
+                out=self._field_buffer(resolution)
+            )
+        elif self.field_builder is not None:
+            potential_field = self.gravity_calculator.create_scalar_field(
+                bodies=bodies,
+                x_range=x_range,
+                y_range=y_range,
+                resolution=resolution,
+                dtype=self.config.field_precision
+            )
+        else:
+            potential_field = self.gravity_calculator.create_potential_field(
+                bodies=bodies,
+                x_range=x_range,
+                y_range=y_range,
+                resolution=resolution
+            )
+        
+        if metrics is not None:
+            metrics.stop("field", started)
+            metrics.count("grid_cells", len(potential_field))
+        return self._analyze_field(potential_field)
+    
+    def _field_buffer(self, resolution: int) -> "np.ndarray":
+        """전체 해상도 필드 버퍼 (형태나 정밀도가 바뀌면 다시 할당)"""
+        shape = (resolution + 1, resolution + 1)
+        buffer = self._potential_buffer
+        if buffer is None or buffer.shape != shape or buffer.dtype != np.dtype(self.config.field_precision):
+            buffer = self._potential_buffer = np.empty(shape, dtype=self.config.field_precision)
+        return buffer
+    
+    def _analyze_field(self, potential_field) -> StabilityAnalysis:
+        """퍼텐셜 필드 → 밀도 → 경계 수렴 → StabilityAnalysis"""
+        metrics = self._metrics
+        if metrics is not None:
+            started = metrics.start()
+        
+        # 밀도 변환 (ScalarField/AdaptiveField는 제자리 정규화)
         density_field = self.gravity_calculator.potential_to_density(
             potential_field=potential_field,
             normalization=self.config.density_normalization
         )
+        if metrics is not None:
+            started = metrics.stop("density", started)
         
         # 경계 형성 시뮬레이션
         result = self.boundary_adapter.converge(importance_weights=density_field)
+        if metrics is not None:
+            metrics.stop("converge", started)
+            metrics.count("convergence_iterations", result.iteration)
+            metrics.set("boundary_points", result.boundary_points)
         
         # 안정성 점수 계산 (0.0 ~ 1.0)
         if result.converged:
@@ -150,7 +339,8 @@ class ThreeBodyBoundaryEngine:
         enable_l1: bool = True,
         enable_l2: bool = True,
         failure_atlas: Optional[FailureAtlas] = None,
-        bias_converter: Optional[FailureBiasConverter] = None
+        bias_converter: Optional[FailureBiasConverter] = None,
+        collect_metrics: bool = False
     ) -> EngineRunResult:
         """통합 실행 (L0 → L1 → L2)
 
@@ -165,12 +355,48 @@ class ThreeBodyBoundaryEngine:
             enable_l1: L1(FailureAtlas) 기록 수행 여부
             enable_l2: L2(SearchBias) 생성 수행 여부
             failure_atlas: 기존 FailureAtlas (누적 목적). None이면 필요 시 새로 생성.
-            bias_converter: 기존 FailureBiasConverter. None이면 기본값으로 생성.
+            bias_converter: 기존 FailureBiasConverter. None이면 엔진 소유 IncrementalBiasConverter 사용
+                (같은 지도로 반복 실행하면 새 기록만 반영한다, 결과 동일).
+            collect_metrics: 단계별 시간/카운터 수집 여부 (metrics_hooks가 있으면 항상 수집)
 
         Returns:
-            EngineRunResult: analysis(L0), failure_atlas(L1), search_bias(L2), last_failure_record
+            EngineRunResult: analysis(L0), failure_atlas(L1), search_bias(L2), last_failure_record,
+                metrics (계측을 켠 경우 RunMetrics)
         """
-        analysis = self.analyze_orbit_stability(system=system, x_range=x_range, y_range=y_range)
+        metrics = None
+        if collect_metrics or self.metrics_hooks:
+            metrics = RunMetrics(hooks=self.metrics_hooks)
+        self._metrics = metrics
+        try:
+            analysis = self.analyze_orbit_stability(system=system, x_range=x_range, y_range=y_range)
+        finally:
+            self._metrics = None
+        return self._finish_run(
+            system,
+            analysis,
+            failure_threshold=failure_threshold,
+            enable_l1=enable_l1,
+            enable_l2=enable_l2,
+            failure_atlas=failure_atlas,
+            bias_converter=bias_converter,
+            metrics=metrics
+        )
+    
+    def _finish_run(
+        self,
+        system: ThreeBodySystem,
+        analysis: StabilityAnalysis,
+        *,
+        failure_threshold: float,
+        enable_l1: bool,
+        enable_l2: bool,
+        failure_atlas: Optional[FailureAtlas],
+        bias_converter: Optional[FailureBiasConverter],
+        metrics: Optional[RunMetrics]
+    ) -> EngineRunResult:
+        """L0 결과로 L1 기록 → L2 편향 → EngineRunResult (run() / arun() 공통)"""
+        if metrics is not None:
+            started = metrics.start()
 
         atlas: Optional[FailureAtlas] = failure_atlas
         last_record: Optional[FailureRecord] = None
@@ -183,6 +409,8 @@ class ThreeBodyBoundaryEngine:
                 system=system,
                 threshold=failure_threshold
             )
+            if metrics is not None:
+                started = metrics.stop("l1_record", started)
 
         # L2: 편향 생성
         bias: Optional[SearchBias] = None
@@ -191,59 +419,541 @@ class ThreeBodyBoundaryEngine:
             if atlas is None:
                 raise ValueError("enable_l2=True requires a FailureAtlas. Provide failure_atlas or set enable_l1=True.")
 
-            converter = bias_converter or FailureBiasConverter()
+            converter = bias_converter or self._default_bias_converter()
             bias = converter.convert_failure_to_bias(failure_atlas=atlas)
+            if metrics is not None:
+                metrics.stop("l2_bias", started)
 
-        return EngineRunResult(
+        result = EngineRunResult(
             system=system,
             analysis=analysis,
             failure_atlas=atlas,
             search_bias=bias,
-            last_failure_record=last_record
+            last_failure_record=last_record,
+            metrics=metrics
+        )
+        if metrics is not None:
+            if atlas is not None:
+                metrics.set("atlas_failures", atlas.total_failures)
+                metrics.set("atlas_signatures", atlas.columns.signature_count)
+            if bias is not None:
+                metrics.set("bias_signatures", len(bias.risk_map))
+            for hook in metrics.hooks:
+                hook.on_run(metrics, result)
+        return result
+    
+    def run_sweep(
+        self,
+        systems: Iterable[ThreeBodySystem],
+        x_range: Optional[tuple] = None,
+        y_range: Optional[tuple] = None,
+        *,
+        failure_threshold: float = 0.1,
+        enable_l1: bool = True,
+        enable_l2: bool = True,
+        failure_atlas: Optional[FailureAtlas] = None,
+        bias_converter: Optional[FailureBiasConverter] = None,
+        max_workers: Optional[int] = None,
+        chunksize: int = 64,
+        max_pending_chunks: Optional[int] = None,
+        mp_context=None
+    ) -> List[EngineRunResult]:
+        """여러 시스템 통합 실행 (L0 → L1 → L2)
+        
+        시스템마다 run()을 호출한 것과 같은 실패 지도를 만들고, 편향은 마지막에 한 번만
+        계산한다. 모든 결과가 같은 failure_atlas / search_bias를 공유한다.
+        
+        max_workers를 지정하면 워커가 청크마다 부분 FailureAtlas를 만들어 샤드로 보내고,
+        부모는 청크 순서대로 merge_from()으로 병합한다 (샤드당 열 단위 일괄 복사).
+        
+        Args:
+            systems: 삼체 시스템 iterable
+            x_range: x 범위 (min, max). None이면 자동 계산.
+            y_range: y 범위 (min, max). None이면 자동 계산.
+            failure_threshold: 실패 판정 임계값
+            enable_l1: L1(FailureAtlas) 기록 수행 여부
+            enable_l2: L2(SearchBias) 생성 수행 여부
+            failure_atlas: 기존 FailureAtlas (누적 목적). None이면 필요 시 새로 생성.
+            bias_converter: 기존 FailureBiasConverter. None이면 엔진 소유 IncrementalBiasConverter 사용.
+            max_workers: 지정하면 프로세스 풀로 병렬 실행 (None이면 직렬)
+            chunksize: 병렬 실행 시 작업 하나에 묶을 시스템 수
+            max_pending_chunks: 동시에 제출해 둘 최대 청크 수 (None이면 워커 수의 2배)
+            mp_context: multiprocessing 컨텍스트
+        
+        Returns:
+            입력 순서대로 EngineRunResult 리스트
+        """
+        atlas: Optional[FailureAtlas] = failure_atlas
+        if enable_l1:
+            atlas = atlas or FailureAtlas()
+        if enable_l2 and atlas is None:
+            raise ValueError("enable_l2=True requires a FailureAtlas. Provide failure_atlas or set enable_l1=True.")
+        
+        systems = list(systems)
+        runs = self._iter_runs(
+            systems,
+            x_range,
+            y_range,
+            atlas=atlas if enable_l1 else None,
+            failure_threshold=failure_threshold,
+            max_workers=max_workers,
+            chunksize=chunksize,
+            max_pending_chunks=max_pending_chunks,
+            mp_context=mp_context
+        )
+        runs = [(system, analysis, record) for system, (analysis, record) in zip(systems, runs)]
+        
+        bias: Optional[SearchBias] = None
+        if enable_l2:
+            converter = bias_converter or self._default_bias_converter()
+            bias = converter.convert_failure_to_bias(failure_atlas=atlas)
+        
+        return [
+            EngineRunResult(
+                system=system,
+                analysis=analysis,
+                failure_atlas=atlas,
+                search_bias=bias,
+                last_failure_record=record
+            )
+            for system, analysis, record in runs
+        ]
+    
+    def run_batch(
+        self,
+        masses,
+        positions,
+        x_range: Optional[tuple] = None,
+        y_range: Optional[tuple] = None,
+        *,
+        failure_threshold: float = 0.1,
+        enable_l1: bool = True,
+        enable_l2: bool = True,
+        failure_atlas: Optional[FailureAtlas] = None,
+        bias_converter: Optional[FailureBiasConverter] = None,
+        output: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        chunksize: int = 64,
+        max_pending_chunks: Optional[int] = None,
+        mp_context=None
+    ) -> BatchRunResult:
+        """배열 입력 배치 통합 실행 (L0 → L1 → L2, 열 기반 결과)
+        
+        run_sweep()과 같은 실패 지도 / 편향을 만들지만, 시스템별 EngineRunResult /
+        StabilityAnalysis 대신 필드별 NumPy 열 (BatchRunResult)로 결과를 모은다.
+        시스템은 배열에서 지연 생성하므로 입력 크기만큼 객체를 들고 있지 않는다.
+        
+        Args:
+            masses: (n, k) 질량 배열 (k = 3이면 ThreeBodySystem, 아니면 NBodySystem)
+            positions: (n, k, 2) 위치 배열
+            x_range / y_range / failure_threshold / enable_l1 / enable_l2 /
+            failure_atlas / bias_converter / max_workers / chunksize /
+            max_pending_chunks / mp_context: run_sweep()과 동일
+            output: 결과 열 저장 경로
+                - ".npz"로 끝나면 배치가 끝난 뒤 한 파일로 저장
+                - 그 밖에는 디렉터리로 보고 열마다 .npy 메모리 맵에 바로 기록
+                  (반환되는 열도 그 메모리 맵)
+        
+        Returns:
+            BatchRunResult (행 i = 입력 i번째 시스템)
+        """
+        require_numpy("run_batch")
+        masses, positions = _validate_arrays(masses, positions)
+        atlas: Optional[FailureAtlas] = failure_atlas
+        if enable_l1:
+            atlas = atlas or FailureAtlas()
+        if enable_l2 and atlas is None:
+            raise ValueError("enable_l2=True requires a FailureAtlas. Provide failure_atlas or set enable_l1=True.")
+        
+        columns = _allocate_columns(len(masses), output)
+        views = [(columns[name], name) for name, _ in BATCH_COLUMNS]
+        runs = self._iter_runs(
+            iter_systems_from_arrays(masses, positions, self.config.gravitational_constant),
+            x_range,
+            y_range,
+            atlas=atlas if enable_l1 else None,
+            failure_threshold=failure_threshold,
+            max_workers=max_workers,
+            chunksize=chunksize,
+            max_pending_chunks=max_pending_chunks,
+            mp_context=mp_context
+        )
+        for index, (analysis, _) in enumerate(runs):
+            for column, name in views:
+                column[index] = getattr(analysis, name)
+        
+        bias: Optional[SearchBias] = None
+        if enable_l2:
+            converter = bias_converter or self._default_bias_converter()
+            bias = converter.convert_failure_to_bias(failure_atlas=atlas)
+        
+        result = BatchRunResult(**columns, failure_atlas=atlas, search_bias=bias)
+        if output is not None:
+            if output.endswith(".npz"):
+                result.save(output)
+            else:
+                for column in columns.values():
+                    column.flush()
+        return result
+    
+    def async_pool(
+        self,
+        *,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        mp_context=None
+    ) -> AsyncWorkerPool:
+        """엔진 소유 비동기 프로세스 풀 (arun / arun_batch 기본 풀)
+        
+        처음 호출할 때 인자로 풀을 만들고 이후에는 같은 풀을 반환한다
+        (인자는 무시). aclose()로 닫은 뒤 다시 호출하면 새 풀을 만든다.
+        
+        Args:
+            max_workers: 워커 프로세스 수 (None이면 CPU 수)
+            max_in_flight: 동시에 진행할 최대 요청 수 (None이면 워커 수의 2배)
+            mp_context: multiprocessing 컨텍스트
+        """
+        if self._async_pool is None or self._async_pool.closed:
+            self._async_pool = AsyncWorkerPool(
+                self.config,
+                max_workers=max_workers,
+                max_in_flight=max_in_flight,
+                mp_context=mp_context,
+                shared_manifest=self._shared_manifest()
+            )
+        return self._async_pool
+    
+    async def aclose(self) -> None:
+        """엔진 소유 비동기 풀 종료 (서비스 종료 시)"""
+        pool, self._async_pool = self._async_pool, None
+        if pool is not None:
+            await pool.aclose()
+    
+    async def arun(
+        self,
+        system: ThreeBodySystem,
+        x_range: Optional[tuple] = None,
+        y_range: Optional[tuple] = None,
+        *,
+        failure_threshold: float = 0.1,
+        enable_l1: bool = True,
+        enable_l2: bool = True,
+        failure_atlas: Optional[FailureAtlas] = None,
+        bias_converter: Optional[FailureBiasConverter] = None,
+        collect_metrics: bool = False,
+        timeout: Optional[float] = None,
+        pool: Optional[AsyncWorkerPool] = None
+    ) -> EngineRunResult:
+        """비동기 통합 실행 (L0 → L1 → L2)
+        
+        run()과 같은 결과를 반환하되, L0 분석은 프로세스 풀에서 실행해
+        이벤트 루프를 막지 않는다. L1 기록과 L2 편향은 결과가 돌아온 뒤
+        이벤트 루프 스레드에서 await 없이 한 번에 수행하므로, 같은
+        failure_atlas를 공유하는 요청이 동시에 끝나도 기록과 편향이 섞이지 않는다.
+        
+        분석 캐시는 워커에서 쓰지 않으며 (병렬 배치와 동일), 계측은
+        l1_record / l2_bias 단계만 수집한다.
+        
+        Args:
+            system / x_range / y_range / failure_threshold / enable_l1 / enable_l2 /
+            failure_atlas / bias_converter / collect_metrics: run()과 동일
+            timeout: 제한 시간 (초, 풀 슬롯 대기 포함). 넘으면 asyncio.TimeoutError
+                (지도는 바뀌지 않음)
+            pool: 사용할 AsyncWorkerPool (None이면 async_pool())
+        
+        Returns:
+            EngineRunResult
+        """
+        if enable_l2 and not enable_l1 and failure_atlas is None:
+            raise ValueError("enable_l2=True requires a FailureAtlas. Provide failure_atlas or set enable_l1=True.")
+        pool = pool or self.async_pool()
+        analysis = await pool.analyze(system, x_range, y_range, timeout=timeout)
+        
+        metrics = None
+        if collect_metrics or self.metrics_hooks:
+            metrics = RunMetrics(hooks=self.metrics_hooks)
+        return self._finish_run(
+            system,
+            analysis,
+            failure_threshold=failure_threshold,
+            enable_l1=enable_l1,
+            enable_l2=enable_l2,
+            failure_atlas=failure_atlas,
+            bias_converter=bias_converter,
+            metrics=metrics
         )
     
+    async def arun_batch(
+        self,
+        systems: Iterable[ThreeBodySystem],
+        x_range: Optional[tuple] = None,
+        y_range: Optional[tuple] = None,
+        *,
+        failure_threshold: float = 0.1,
+        enable_l1: bool = True,
+        enable_l2: bool = True,
+        failure_atlas: Optional[FailureAtlas] = None,
+        bias_converter: Optional[FailureBiasConverter] = None,
+        timeout: Optional[float] = None,
+        return_exceptions: bool = False,
+        pool: Optional[AsyncWorkerPool] = None
+    ) -> List[EngineRunResult]:
+        """비동기 배치 통합 실행 (run_sweep()의 비동기판)
+        
+        입력은 풀의 max_in_flight개씩만 읽어 제출한다 (배압). 결과가 끝나는 순서대로
+        실패를 기록하고, 편향은 마지막에 한 번 계산한다. 실패 지도의 기록 집합과 편향은
+        run_sweep()과 같다 (기록 순서만 완료 순서).
+        
+        배치를 취소하면 진행 중인 요청을 모두 취소하고 CancelledError를 전달한다
+        (그때까지 끝난 결과는 failure_atlas에 남음).
+        
+        Args:
+            systems: 삼체 시스템 iterable (지연 소비)
+            x_range / y_range / failure_threshold / enable_l1 / enable_l2 /
+            failure_atlas / bias_converter: run_sweep()과 동일
+            timeout: 요청별 제한 시간 (초)
+            return_exceptions: True면 실패한 요청 (제한 시간 초과 등) 자리에 예외를 넣고
+                계속 진행, False면 첫 예외에서 나머지를 취소하고 예외 전달
+            pool: 사용할 AsyncWorkerPool (None이면 async_pool())
+        
+        Returns:
+            입력 순서대로 EngineRunResult (return_exceptions=True면 예외 포함)
+        """
+        atlas: Optional[FailureAtlas] = failure_atlas
+        if enable_l1:
+            atlas = atlas or FailureAtlas()
+        if enable_l2 and atlas is None:
+            raise ValueError("enable_l2=True requires a FailureAtlas. Provide failure_atlas or set enable_l1=True.")
+        pool = pool or self.async_pool()
+        
+        pending: Dict[asyncio.Future, int] = {}
+        inputs: Dict[int, ThreeBodySystem] = {}
+        outcomes: Dict[int, object] = {}
+        
+        def collect(done) -> None:
+            # 이벤트 루프 스레드에서 await 없이 기록 (동시 완료에도 지도 일관)
+            for future in done:
+                index = pending.pop(future)
+                system = inputs.pop(index)
+                if future.cancelled() or future.exception() is not None:
+                    error = asyncio.CancelledError() if future.cancelled() else future.exception()
+                    if not return_exceptions:
+                        raise error
+                    outcomes[index] = error
+                    continue
+                analysis = future.result()
+                record = None
+                if enable_l1:
+                    record = atlas.record_failure(
+                        analysis=analysis,
+                        system=system,
+                        threshold=failure_threshold
+                    )
+                outcomes[index] = (system, analysis, record)
+        
+        try:
+            for index, system in enumerate(systems):
+                if len(pending) >= pool.max_in_flight:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    collect(done)
+                inputs[index] = system
+                future = asyncio.ensure_future(pool.analyze(system, x_range, y_range, timeout=timeout))
+                pending[future] = index
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                collect(done)
+        finally:
+            if pending:
+                for future in pending:
+                    future.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+        
+        bias: Optional[SearchBias] = None
+        if enable_l2:
+            converter = bias_converter or self._default_bias_converter()
+            bias = converter.convert_failure_to_bias(failure_atlas=atlas)
+        
+        results = []
+        for index in range(len(outcomes)):
+            outcome = outcomes[index]
+            if isinstance(outcome, BaseException):
+                results.append(outcome)
+                continue
+            system, analysis, record = outcome
+            results.append(EngineRunResult(
+                system=system,
+                analysis=analysis,
+                failure_atlas=atlas,
+                search_bias=bias,
+                last_failure_record=record
+            ))
+        return results
+    
+    def _iter_runs(
+        self,
+        systems: Iterable[ThreeBodySystem],
+        x_range: Optional[tuple],
+        y_range: Optional[tuple],
+        *,
+        atlas: Optional[FailureAtlas],
+        failure_threshold: float,
+        max_workers: Optional[int],
+        chunksize: int,
+        max_pending_chunks: Optional[int],
+        mp_context
+    ) -> Iterator[tuple]:
+        """시스템마다 (분석 결과, 실패 기록) — atlas가 None이면 L1 기록 생략
+        
+        병렬 실행은 청크별 부분 지도를 샤드로 받아 청크 순서대로 atlas에 병합한다.
+        """
+        if max_workers is None:
+            for system in systems:
+                analysis = self.analyze_orbit_stability(system=system, x_range=x_range, y_range=y_range)
+                record = None
+                if atlas is not None:
+                    record = atlas.record_failure(
+                        analysis=analysis,
+                        system=system,
+                        threshold=failure_threshold
+                    )
+                yield analysis, record
+        elif atlas is None:
+            analyses = iter_stability_analyses(
+                self.config,
+                systems,
+                x_range=x_range,
+                y_range=y_range,
+                max_workers=max_workers,
+                chunksize=chunksize,
+                max_pending_chunks=max_pending_chunks,
+                mp_context=mp_context,
+                shared_manifest=self._shared_manifest()
+            )
+            for analysis in analyses:
+                yield analysis, None
+        else:
+            shards = iter_run_shards(
+                self.config,
+                systems,
+                x_range=x_range,
+                y_range=y_range,
+                failure_threshold=failure_threshold,
+                max_workers=max_workers,
+                chunksize=chunksize,
+                max_pending_chunks=max_pending_chunks,
+                mp_context=mp_context,
+                shared_manifest=self._shared_manifest()
+            )
+            for analyses, rows, shard in shards:
+                partial = decode_failure_shard(shard)
+                atlas.merge_from(partial)
+                for analysis, row in zip(analyses, rows):
+                    yield analysis, partial.columns.record(row) if row >= 0 else None
+    
     def observe_boundary_formation(
         self,
         system: ThreeBodySystem,
         time_steps: List[float],
         x_range: Optional[tuple] = None,
-        y_range: Optional[tuple] = None
+        y_range: Optional[tuple] = None,
+        *,
+        evolve: bool = False,
+        integrator: Optional[OrbitIntegrator] = None
     ) -> BoundaryDynamics:
         """경계 형성 과정 관찰
         
         원인 분석: "경계가 시간에 따라 어떻게 변하는가?"
         
+        evolve=False (기본): 정적 분석. 시스템이 변하지 않으므로 한 번만 분석하고
+        모든 시간 단계에 같은 결과를 기록한다.
+        
+        evolve=True: Body.velocity로 궤도를 전파하여 요청한 관찰 시각에서만 분석한다.
+        범위를 지정하지 않으면 모든 스냅샷을 덮는 공통 범위를 사용하므로
+        스냅샷 사이에 격자가 유지되어 천체별 층 재사용
+        (config.layer_reuse_tolerance)이 적용된다.
+        
         Args:
             system: 삼체 시스템
-            time_steps: 시간 단계 리스트
+            time_steps: 시간 단계 리스트 (evolve=True이면 0 이상, 시각 0 = 입력 상태)
             x_range: x 범위
             y_range: y 범위
+            evolve: 궤도 전파 여부
+            integrator: 궤도 적분기 (None이면 기본 Yoshida 4차 적분기)
         
         Returns:
             경계 동역학 관찰 결과
         """
-        mismatches = []
-        boundary_evolutions = []
-        stability_trajectory = []
-        
-        for t in time_steps:
-            # 시간에 따른 천체 위치 업데이트 (간단한 근사)
-            # 실제로는 궤도 적분이 필요하지만, 여기서는 정적 분석
+        if not evolve:
             analysis = self.analyze_orbit_stability(
                 system=system,
                 x_range=x_range,
                 y_range=y_range
             )
-            
-            mismatches.append(analysis.mismatch)
-            boundary_evolutions.append(analysis.boundary_points)
-            stability_trajectory.append(analysis.stability_score)
-        
-        return BoundaryDynamics(
-            time_steps=time_steps,
-            mismatches=mismatches,
-            boundary_evolutions=boundary_evolutions,
-            stability_trajectory=stability_trajectory
+            return BoundaryDynamics(
+                time_steps=time_steps,
+                mismatches=[analysis.mismatch] * len(time_steps),
+                boundary_evolutions=[analysis.boundary_points] * len(time_steps),
+                stability_trajectory=[analysis.stability_score] * len(time_steps)
+            )
+        
+        return self.observe_boundary_formations(
+            [system], time_steps, x_range, y_range, integrator=integrator
+        )[0]
+    
+    def observe_boundary_formations(
+        self,
+        systems: List[ThreeBodySystem],
+        time_steps: List[float],
+        x_range: Optional[tuple] = None,
+        y_range: Optional[tuple] = None,
+        *,
+        integrator: Optional[OrbitIntegrator] = None
+    ) -> List[BoundaryDynamics]:
+        """여러 시스템의 궤도를 배열 배치로 전파하며 경계 형성 관찰
+        
+        천체 수가 같은 시스템들은 적분기 안에서 한 배열로 함께 전파된다.
+        
+        Args:
+            systems: 시스템 리스트
+            time_steps: 관찰 시각 리스트 (0 이상, 시각 0 = 입력 상태)
+            x_range: x 범위 (None이면 시스템별 스냅샷 공통 범위)
+            y_range: y 범위 (None이면 시스템별 스냅샷 공통 범위)
+            integrator: 궤도 적분기 (None이면 기본 Yoshida 4차 적분기)
+        
+        Returns:
+            시스템별 경계 동역학 관찰 결과 (입력 순서)
+        """
+        integrator = integrator or OrbitIntegrator(
+            gravitational_constant=self.config.gravitational_constant
+        )
+        # 중복 제거 후 오름차순으로 한 번만 전파
+        times = sorted(set(time_steps))
+        snapshots = integrator.propagate(list(systems), times)
+        
+        results = []
+        for frames in snapshots:
+            ranges = (x_range, y_range)
+            if x_range is None or y_range is None:
+                ranges = self._covering_ranges(frames)
+            analyses = {
+                t: self.analyze_orbit_stability(frame, x_range=ranges[0], y_range=ranges[1])
+                for t, frame in zip(times, frames)
+            }
+            results.append(BoundaryDynamics(
+                time_steps=time_steps,
+                mismatches=[analyses[t].mismatch for t in time_steps],
+                boundary_evolutions=[analyses[t].boundary_points for t in time_steps],
+                stability_trajectory=[analyses[t].stability_score for t in time_steps]
+            ))
+        return results
+    
+    def _covering_ranges(self, frames: List[ThreeBodySystem]) -> tuple:
+        """스냅샷 전체를 덮는 (x_range, y_range) (자동 범위와 같은 여유 공간)"""
+        all_x = [b.position.x for frame in frames for b in frame.get_all_bodies()]
+        all_y = [b.position.y for frame in frames for b in frame.get_all_bodies()]
+        return (
+            (min(all_x) - 1.0, max(all_x) + 1.0),
+            (min(all_y) - 1.0, max(all_y) + 1.0)
         )
     
     def observe_lagrange_points(
@@ -289,11 +999,132 @@ class ThreeBodyBoundaryEngine:
             boundary_formation=boundary_formation
         )
     
+    def observe_lagrange_points_batch(
+        self,
+        systems: List[ThreeBodySystem],
+        *,
+        half_width: float = 0.5,
+        solve_collinear: bool = True,
+        max_cover_ratio: float = 1.0
+    ) -> List[LagrangeAnalysis]:
+        """라그랑주 점 경계 관찰 (배치)
+        
+        observe_lagrange_points()와 같은 분석을 여러 시스템에 대해 수행한다.
+        - 모든 시스템의 body1-body2 라그랑주 점을 한 번에 계산
+          (solve_collinear=True면 L1-L3을 벡터화 뉴턴 풀이로 구함)
+        - 시스템마다 다섯 창 (점 ± half_width)을 덮는 퍼텐셜 필드를 하나 만들고
+          각 창을 잘라 분석 (창 원점은 덮개 격자점에 맞춤, 어긋남 ≤ 간격 / 2)
+        - 덮개 격자점 수가 다섯 창 합의 max_cover_ratio배를 넘으면
+          (창이 많이 겹치지 않는 경우) 창마다 필드를 따로 만든다
+        
+        창 해상도는 config.potential_resolution이며, 선별 / 적응형 / 분석 캐시는
+        쓰지 않는다 (균일 격자 전체 해상도).
+        
+        Args:
+            systems: 삼체 시스템 리스트
+            half_width: 창 반폭 (observe_lagrange_points와 같은 0.5가 기본)
+            solve_collinear: L1-L3 뉴턴 풀이 여부 (False면 고정 비율 근사)
+            max_cover_ratio: 덮개 필드 허용 크기 (다섯 창 격자점 합 대비,
+                기본 1.0은 덮개가 더 작을 때만 사용)
+        
+        Returns:
+            시스템별 라그랑주 점 분석 결과 (입력 순서)
+        """
+        require_numpy("observe_lagrange_points_batch")
+        if half_width <= 0:
+            raise ValueError("half_width는 양수여야 합니다")
+        systems = list(systems)
+        if not systems:
+            return []
+        
+        positions = self.lagrange_calculator.lagrange_positions(
+            positions1=[(s.body1.position.x, s.body1.position.y) for s in systems],
+            positions2=[(s.body2.position.x, s.body2.position.y) for s in systems],
+            m1=[s.body1.mass for s in systems],
+            m2=[s.body2.mass for s in systems],
+            solve_collinear=solve_collinear
+        )
+        
+        resolution = self.config.potential_resolution
+        spacing = 2.0 * half_width / resolution
+        window_cells = (resolution + 1) ** 2
+        
+        analyses = []
+        for system, points in zip(systems, positions):
+            bodies = system.get_all_bodies()
+            # 창 원점을 덮개 격자 인덱스로 (가장 가까운 격자점)
+            origin = points.min(axis=0) - half_width
+            offsets = np.rint((points - half_width - origin) / spacing).astype(np.int64)
+            nx, ny = offsets.max(axis=0) + resolution + 1
+            
+            if nx * ny <= max_cover_ratio * len(LAGRANGE_TYPES) * window_cells:
+                xs = origin[0] + np.arange(nx, dtype=np.float64) * spacing
+                ys = origin[1] + np.arange(ny, dtype=np.float64) * spacing
+                cover = self._cover_potential(bodies, xs, ys)
+                windows = [
+                    ScalarField(
+                        origin=(xs[i], ys[j]),
+                        spacing=(spacing, spacing),
+                        # 창마다 제자리 정규화하므로 복사
+                        values=cover[i:i + resolution + 1, j:j + resolution + 1].copy()
+                    )
+                    for i, j in offsets.tolist()
+                ]
+            else:
+                windows = [
+                    self.gravity_calculator.create_scalar_field(
+                        bodies=bodies,
+                        x_range=(x - half_width, x + half_width),
+                        y_range=(y - half_width, y + half_width),
+                        resolution=resolution
+                    )
+                    for x, y in points.tolist()
+                ]
+            
+            lagrange_points = [
+                LagrangePoint(
+                    position=Point(x, y),
+                    lagrange_type=lagrange_type,
+                    stability="stable" if lagrange_type in ("L4", "L5") else "unstable"
+                )
+                for lagrange_type, (x, y) in zip(LAGRANGE_TYPES, points.tolist())
+            ]
+            boundary_formation = {
+                lp.lagrange_type: self._analyze_field(window)
+                for lp, window in zip(lagrange_points, windows)
+            }
+            analyses.append(LagrangeAnalysis(
+                lagrange_points=lagrange_points,
+                stability_map={
+                    name: analysis.stability_score
+                    for name, analysis in boundary_formation.items()
+                },
+                boundary_formation=boundary_formation
+            ))
+        
+        return analyses
+    
+    def _cover_potential(self, bodies: List[Body], xs: "np.ndarray", ys: "np.ndarray") -> "np.ndarray":
+        """축 좌표 (xs, ys) 격자의 퍼텐셜 (create_potential_grid와 같은 층 합산)"""
+        calculator = self.gravity_calculator
+        if calculator.uses_tree(bodies):
+            grid_x, grid_y = np.meshgrid(xs, ys, indexing="ij")
+            return calculator.potential_at_points(bodies, grid_x, grid_y)
+        potential = np.zeros((xs.size, ys.size), dtype=np.float64)
+        contribution = np.empty_like(potential)
+        for body in bodies:
+            potential += calculator.potential_layer(body, xs, ys, out=contribution)
+        potential *= -calculator.G
+        return potential
+    
     def compare_stability_conditions(
         self,
         systems: List[ThreeBodySystem],
         x_range: Optional[tuple] = None,
-        y_range: Optional[tuple] = None
+        y_range: Optional[tuple] = None,
+        *,
+        max_workers: Optional[int] = None,
+        chunksize: int = 64
     ) -> List[StabilityAnalysis]:
         """안정/불안정 조건 비교
         
@@ -303,10 +1134,21 @@ class ThreeBodyBoundaryEngine:
             systems: 삼체 시스템 리스트 (다양한 초기 조건)
             x_range: x 범위
             y_range: y 범위
+            max_workers: 지정하면 프로세스 풀로 병렬 분석 (None이면 직렬)
+            chunksize: 병렬 분석 시 작업 하나에 묶을 시스템 수
         
         Returns:
-            안정성 분석 결과 리스트
+            안정성 분석 결과 리스트 (입력 순서)
         """
+        if max_workers is not None:
+            return list(self.iter_stability_conditions(
+                systems,
+                x_range=x_range,
+                y_range=y_range,
+                max_workers=max_workers,
+                chunksize=chunksize
+            ))
+        
         results = []
         for system in systems:
             analysis = self.analyze_orbit_stability(
@@ -317,8 +1159,59 @@ class ThreeBodyBoundaryEngine:
             results.append(analysis)
         return results
     
+    def iter_stability_conditions(
+        self,
+        systems: Iterable[ThreeBodySystem],
+        x_range: Optional[tuple] = None,
+        y_range: Optional[tuple] = None,
+        *,
+        max_workers: Optional[int] = None,
+        chunksize: int = 64,
+        max_pending_chunks: Optional[int] = None,
+        mp_context=None
+    ) -> Iterator[StabilityAnalysis]:
+        """병렬 배치 안정성 분석 (스트리밍)
+        
+        ProcessPoolExecutor에서 청크 단위로 분석하고, 입력 순서를 유지하며
+        결과가 준비되는 대로 내보낸다. 워커는 이 엔진의 설정으로
+        프로세스당 한 번만 엔진을 생성한다.
+        
+        Args:
+            systems: 삼체 시스템 iterable (지연 소비)
+            x_range: x 범위
+            y_range: y 범위
+            max_workers: 워커 프로세스 수 (None이면 CPU 수)
+            chunksize: 작업 하나에 묶을 시스템 수
+            max_pending_chunks: 동시에 제출해 둘 최대 청크 수 (None이면 워커 수의 2배)
+            mp_context: multiprocessing 컨텍스트
+        
+        Yields:
+            입력 순서대로 StabilityAnalysis
+        """
+        return iter_stability_analyses(
+            self.config,
+            systems,
+            x_range=x_range,
+            y_range=y_range,
+            max_workers=max_workers,
+            chunksize=chunksize,
+            max_pending_chunks=max_pending_chunks,
+            mp_context=mp_context,
+            shared_manifest=self._shared_manifest()
+        )
+    
+    def _shared_manifest(self) -> Optional[dict]:
+        """워커에 넘길 공유 필드 manifest (없으면 None)"""
+        if self.shared_fields is None:
+            return None
+        return self.shared_fields.manifest
+    
     def reset(self) -> None:
         """엔진 리셋"""
+        if self.field_builder is not None:
+            self.field_builder.clear()
+        self._potential_buffer = None
+        self._bias_converter = None
         self.boundary_adapter = BoundaryConvergenceAdapter(
             boundary_radius=self.config.boundary_radius,
             initial_boundary_points=self.config.initial_boundary_points,
@@ -338,8 +1231,15 @@ class ThreeBodyBoundaryEngine:
         
         # 설정 변경 후 재초기화
         self.gravity_calculator = GravityCalculator(
-            gravitational_constant=self.config.gravitational_constant
+            gravitational_constant=self.config.gravitational_constant,
+            opening_angle=self.config.opening_angle,
+            direct_sum_threshold=self.config.direct_sum_threshold,
+            shared_fields=self.shared_fields
         )
+        self.field_builder = PotentialFieldBuilder(
+            self.gravity_calculator,
+            reuse_tolerance=self.config.layer_reuse_tolerance
+        ) if HAS_NUMPY else None
         self.boundary_adapter = BoundaryConvergenceAdapter(
             boundary_radius=self.config.boundary_radius,
             initial_boundary_points=self.config.initial_boundary_points,
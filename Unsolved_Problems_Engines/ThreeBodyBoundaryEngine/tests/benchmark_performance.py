@@ -1,15 +1,39 @@
 """
-ThreeBodyBoundaryEngine - 성능 벤치마크
+ThreeBodyBoundaryEngine - 성능 벤치마크 모음 (스케일링 곡선 + 회귀 기준선 비교)
 
-L1, L2, 통합 파이프라인 성능 측정
+측정 방식:
+- time.perf_counter(), 준비 실행 (warmup) 후 반복 시행 (repeat)의 중앙값 / 최소 / 평균 / 표준편차
+- 메모리 최대치: 시간 측정과 별도로 한 번 더 실행하며 tracemalloc 최대치 (NumPy 할당 포함)
+
+모음 (--suite로 선택, 기본 전체):
+- resolution: potential_resolution별 필드 + 밀도 단계와 L0 분석 전체
+- bodies: 천체 수별 퍼텐셜 격자 (512 초과는 Barnes-Hut 경로)
+- atlas: 지도 크기별 L1 기록 / L2 편향 (전체 · 증분) / 유사도 검색 비용
+- throughput: run_sweep 직렬 · 병렬 워커 수별, run_batch 처리량 (시스템/초)
+- nbody: 직접 합 vs Barnes-Hut 정확도/속도 곡선 (benchmark_nbody_potential)
+
+사용:
+    python tests/benchmark_performance.py --quick --output bench.json
+    python tests/benchmark_performance.py --baseline bench.json --tolerance 0.25
+  --baseline이 있으면 같은 키의 중앙값 시간 / 메모리 최대치가 허용치를 넘게 늘어난 항목을
+  회귀로 표시하고 종료 코드 1을 반환한다.
 
 Author: GNJz (Qquarts)
-Version: 1.2.0
+Version: 1.2.1
 """
 
-import time
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
 import sys
+import time
+import tracemalloc
 from pathlib import Path
+from typing import Callable, Dict, List, Optional
 
 # 프로젝트 루트를 Python 경로에 추가
 project_root = Path(__file__).parent.parent
@@ -17,230 +41,454 @@ sys.path.insert(0, str(project_root / "src"))
 
 from three_body_boundary_engine import (
     ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
     FailureAtlas,
     FailureBiasConverter,
+    IncrementalBiasConverter,
+    StabilityAnalysis,
     ThreeBodySystem,
     Body,
-    Point
+    Point,
+    __version__
 )
+from three_body_boundary_engine.gravity_calculator import GravityCalculator
+from three_body_boundary_engine._compat import HAS_NUMPY, np
 
 
-def benchmark_l0_analysis(num_iterations=100):
-    """L0 안정성 분석 성능 벤치마크"""
-    engine = ThreeBodyBoundaryEngine()
-    
-    system = ThreeBodySystem(
-        body1=Body(position=Point(0.0, 0.0), mass=1.0),
-        body2=Body(position=Point(1.0, 0.0), mass=1.0),
-        body3=Body(position=Point(0.5, 0.866), mass=1.0)
-    )
-    
-    start_time = time.time()
-    
-    for _ in range(num_iterations):
-        analysis = engine.analyze_orbit_stability(system)
-    
-    end_time = time.time()
-    elapsed = end_time - start_time
-    
-    avg_time = elapsed / num_iterations
-    
-    print(f"L0 안정성 분석:")
-    print(f"  반복 횟수: {num_iterations}")
-    print(f"  총 시간: {elapsed:.3f}초")
-    print(f"  평균 시간: {avg_time*1000:.3f}ms")
-    print(f"  초당 처리량: {num_iterations/elapsed:.1f}회/초")
-    
-    return avg_time
-
-
-def benchmark_l1_recording(num_iterations=100):
-    """L1 실패 기록 성능 벤치마크"""
-    engine = ThreeBodyBoundaryEngine()
-    atlas = FailureAtlas()
-    
-    system = ThreeBodySystem(
-        body1=Body(position=Point(0.0, 0.0), mass=1.0),
-        body2=Body(position=Point(1.0, 0.0), mass=1.0),
-        body3=Body(position=Point(0.5, 0.866), mass=1.0)
-    )
-    
-    start_time = time.time()
-    
-    for _ in range(num_iterations):
-        analysis = engine.analyze_orbit_stability(system)
-        atlas.record_failure(analysis, system, threshold=0.01)
-    
-    end_time = time.time()
-    elapsed = end_time - start_time
-    
-    avg_time = elapsed / num_iterations
-    
-    print(f"\nL1 실패 기록:")
-    print(f"  반복 횟수: {num_iterations}")
-    print(f"  총 시간: {elapsed:.3f}초")
-    print(f"  평균 시간: {avg_time*1000:.3f}ms")
-    print(f"  초당 처리량: {num_iterations/elapsed:.1f}회/초")
-    print(f"  총 실패 기록 수: {atlas.total_failures}")
-    
-    return avg_time
-
-
-def benchmark_l2_conversion(num_iterations=10):
-    """L2 편향 생성 성능 벤치마크"""
-    engine = ThreeBodyBoundaryEngine()
-    atlas = FailureAtlas()
-    converter = FailureBiasConverter()
-    
-    # 실패 기록 생성
-    system = ThreeBodySystem(
-        body1=Body(position=Point(0.0, 0.0), mass=1.0),
-        body2=Body(position=Point(1.0, 0.0), mass=1.0),
-        body3=Body(position=Point(0.5, 0.866), mass=1.0)
-    )
-    
-    for _ in range(100):  # 100개 실패 기록 생성
-        analysis = engine.analyze_orbit_stability(system)
-        atlas.record_failure(analysis, system, threshold=0.01)
-    
-    start_time = time.time()
-    
-    for _ in range(num_iterations):
-        bias = converter.convert_failure_to_bias(atlas)
-    
-    end_time = time.time()
-    elapsed = end_time - start_time
-    
-    avg_time = elapsed / num_iterations
-    
-    print(f"\nL2 편향 생성:")
-    print(f"  반복 횟수: {num_iterations}")
-    print(f"  총 시간: {elapsed:.3f}초")
-    print(f"  평균 시간: {avg_time*1000:.3f}ms")
-    print(f"  초당 처리량: {num_iterations/elapsed:.1f}회/초")
-    print(f"  실패 기록 수: {atlas.total_failures}")
-    
-    return avg_time
-
-
-def benchmark_integrated_pipeline(num_iterations=50):
-    """통합 파이프라인 성능 벤치마크"""
-    engine = ThreeBodyBoundaryEngine()
-    atlas = FailureAtlas()
-    converter = FailureBiasConverter()
-    
-    system = ThreeBodySystem(
+# 모음별 기본 / 빠른 (--quick) 파라미터
+FULL = {
+    "resolutions": (50, 100, 200, 400, 800),
+    "body_counts": (3, 16, 64, 256, 1024),
+    "atlas_sizes": (100, 1000, 10000),
+    "sweep_size": 64,
+    "worker_counts": (1, 2, 4),
+    "repeat": 5,
+}
+QUICK = {
+    "resolutions": (50, 100, 200),
+    "body_counts": (3, 64, 256),
+    "atlas_sizes": (100, 1000),
+    "sweep_size": 16,
+    "worker_counts": (2,),
+    "repeat": 3,
+}
+
+
+def equilateral_system() -> ThreeBodySystem:
+    return ThreeBodySystem(
         body1=Body(position=Point(0.0, 0.0), mass=1.0),
         body2=Body(position=Point(1.0, 0.0), mass=1.0),
         body3=Body(position=Point(0.5, 0.866), mass=1.0)
     )
-    
-    start_time = time.time()
-    
-    for _ in range(num_iterations):
-        # L0: 분석
-        analysis = engine.analyze_orbit_stability(system)
-        
-        # L1: 기록
-        record = atlas.record_failure(analysis, system, threshold=0.01)
-        
-        # L2: 편향 생성 (주기적으로)
-        if atlas.total_failures % 10 == 0:
-            bias = converter.convert_failure_to_bias(atlas)
-    
-    end_time = time.time()
-    elapsed = end_time - start_time
-    
-    avg_time = elapsed / num_iterations
-    
-    print(f"\n통합 파이프라인 (L0+L1+L2):")
-    print(f"  반복 횟수: {num_iterations}")
-    print(f"  총 시간: {elapsed:.3f}초")
-    print(f"  평균 시간: {avg_time*1000:.3f}ms")
-    print(f"  초당 처리량: {num_iterations/elapsed:.1f}회/초")
-    print(f"  총 실패 기록 수: {atlas.total_failures}")
-    
-    return avg_time
-
-
-def benchmark_similarity_search(num_records=1000, num_searches=100):
-    """유사도 검색 성능 벤치마크"""
-    engine = ThreeBodyBoundaryEngine()
+
+
+def sweep_systems(count: int, seed: int = 7) -> List[ThreeBodySystem]:
+    """무작위 삼체 배치 (시드 고정)"""
+    rng = random.Random(seed)
+    return [
+        ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=rng.uniform(0.5, 2.0)),
+            body2=Body(position=Point(rng.uniform(0.5, 1.5), 0.0), mass=rng.uniform(0.5, 2.0)),
+            body3=Body(position=Point(rng.uniform(0.0, 1.0), rng.uniform(0.3, 1.2)), mass=rng.uniform(0.1, 1.0))
+        )
+        for _ in range(count)
+    ]
+
+
+# 지도 채우기용 실패 결과 (L0를 돌리지 않고 L1/L2 비용만 측정)
+FAILED_ANALYSIS = StabilityAnalysis(
+    converged=False,
+    mismatch=0.4,
+    iteration=12,
+    boundary_points=80,
+    stability_score=0.0,
+    convergence_rate=0.01
+)
+
+
+def measure(
+    function: Callable[[], object],
+    *,
+    warmup: int = 1,
+    repeat: int = 5,
+    number: int = 1,
+    setup: Optional[Callable[[], object]] = None,
+    track_memory: bool = True
+) -> Dict[str, float]:
+    """호출 하나의 시간 통계 (초) + 메모리 최대치 (바이트)
+
+    Args:
+        function: 측정할 호출
+        warmup: 측정 전 준비 실행 수
+        repeat: 시행 수 (통계는 시행별 호출당 시간으로 계산)
+        number: 시행 하나에서 연속 호출 수
+        setup: 시행마다 측정 전에 실행 (시간에 포함하지 않음)
+        track_memory: tracemalloc 최대치 측정 여부 (시간 측정과 별도 실행)
+    """
+    for _ in range(warmup):
+        if setup is not None:
+            setup()
+        function()
+
+    samples = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc.collect()
+        started = time.perf_counter()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter() - started) / number)
+
+    peak = 0
+    if track_memory:
+        if setup is not None:
+            setup()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "median": statistics.median(samples),
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+        "peak_bytes": peak,
+    }
+
+
+def entry(suite: str, name: str, params: Dict, stats: Dict, **extra) -> Dict:
+    """결과 항목 (key = 모음.이름[파라미터])"""
+    label = ",".join(f"{k}={v}" for k, v in params.items())
+    return {"key": f"{suite}.{name}[{label}]", "suite": suite, "name": name, "params": params, **stats, **extra}
+
+
+def bench_resolution(options: Dict) -> List[Dict]:
+    """potential_resolution 스케일링: 필드 + 밀도 단계, L0 분석 전체"""
+    results = []
+    system = equilateral_system()
+    bodies = system.get_all_bodies()
+    for resolution in options["resolutions"]:
+        engine = ThreeBodyBoundaryEngine(ThreeBodyConfig(potential_resolution=resolution))
+        x_range, y_range = engine._default_ranges(bodies)
+
+        if HAS_NUMPY:
+            def field_and_density():
+                field = engine.gravity_calculator.create_scalar_field(bodies, x_range, y_range, resolution)
+                engine.gravity_calculator.potential_to_density(field)
+            stats = measure(field_and_density, repeat=options["repeat"], number=3)
+            results.append(entry("resolution", "field_density", {"resolution": resolution}, stats,
+                                 grid_points=(resolution + 1) ** 2))
+
+        stats = measure(
+            lambda: engine.analyze_orbit_stability(system),
+            setup=engine.reset,
+            repeat=options["repeat"]
+        )
+        results.append(entry("resolution", "l0_analysis", {"resolution": resolution}, stats))
+    return results
+
+
+def bench_bodies(options: Dict) -> List[Dict]:
+    """천체 수 스케일링: 129² 퍼텐셜 격자 (기본 설정이면 512 초과에서 트리 경로)"""
+    if not HAS_NUMPY:
+        return []
+    results = []
+    rng = random.Random(1)
+    calculator = GravityCalculator()
+    for count in options["body_counts"]:
+        bodies = [
+            Body(position=Point(rng.gauss(0.0, 1.0), rng.gauss(0.0, 1.0)), mass=rng.uniform(0.5, 2.0))
+            for _ in range(count)
+        ]
+        stats = measure(
+            lambda: calculator.create_potential_grid(bodies, (-3.0, 3.0), (-3.0, 3.0), 128),
+            repeat=options["repeat"]
+        )
+        results.append(entry("bodies", "potential_grid", {"bodies": count}, stats,
+                             tree=calculator.uses_tree(bodies)))
+    return results
+
+
+def filled_atlas(size: int, systems: List[ThreeBodySystem]) -> FailureAtlas:
+    """실패 기록 size개 지도 (시스템 목록을 순환)"""
     atlas = FailureAtlas()
-    
-    system = ThreeBodySystem(
-        body1=Body(position=Point(0.0, 0.0), mass=1.0),
-        body2=Body(position=Point(1.0, 0.0), mass=1.0),
-        body3=Body(position=Point(0.5, 0.866), mass=1.0)
-    )
-    
-    # 실패 기록 생성
-    for _ in range(num_records):
-        analysis = engine.analyze_orbit_stability(system)
-        atlas.record_failure(analysis, system, threshold=0.01)
-    
-    # 검색 대상 선택
-    if len(atlas.failure_records) > 0:
-        target_sig = atlas.failure_records[0].condition_signature
-        
-        start_time = time.time()
-        
-        for _ in range(num_searches):
-            similar = atlas.get_similar_failures(
-                condition_signature=target_sig,
-                similarity_threshold=0.5
+    for index in range(size):
+        atlas.record_failure(FAILED_ANALYSIS, systems[index % len(systems)], threshold=0.1)
+    return atlas
+
+
+def bench_atlas(options: Dict) -> List[Dict]:
+    """지도 크기별 L1 / L2 비용"""
+    results = []
+    systems = sweep_systems(200, seed=3)
+    batch = 100
+    for size in options["atlas_sizes"]:
+        params = {"atlas": size}
+        atlas = filled_atlas(size, systems)
+
+        # L1: 크기 size 지도에 batch개 추가 (시행마다 같은 크기에서 시작)
+        state = {}
+
+        def reset_atlas():
+            state["atlas"] = filled_atlas(size, systems)
+
+        def record_batch():
+            target = state["atlas"]
+            for index in range(batch):
+                target.record_failure(FAILED_ANALYSIS, systems[index], threshold=0.1)
+
+        stats = measure(record_batch, setup=reset_atlas, repeat=options["repeat"], warmup=0)
+        stats = {**stats, **{k: stats[k] / batch for k in ("median", "min", "mean", "stdev")}}
+        results.append(entry("atlas", "l1_record", params, stats, per="record"))
+
+        # L2: 전체 변환
+        converter = FailureBiasConverter()
+        stats = measure(lambda: converter.convert_failure_to_bias(atlas), repeat=options["repeat"])
+        results.append(entry("atlas", "l2_convert", params, stats, signatures=atlas.columns.signature_count))
+
+        # L2: 증분 변환 (기록 하나 추가 후 갱신)
+        incremental = IncrementalBiasConverter()
+        incremental.convert_failure_to_bias(atlas)
+
+        def record_and_update():
+            atlas.record_failure(FAILED_ANALYSIS, systems[0], threshold=0.1)
+            incremental.convert_failure_to_bias(atlas)
+
+        stats = measure(record_and_update, repeat=options["repeat"], number=10, track_memory=False)
+        results.append(entry("atlas", "l2_incremental", params, stats))
+
+        # 유사도 검색
+        target = atlas.failure_records[0].condition_signature
+        stats = measure(
+            lambda: atlas.get_similar_failures(condition_signature=target, similarity_threshold=0.5),
+            repeat=options["repeat"]
+        )
+        results.append(entry("atlas", "similarity_search", params, stats))
+    return results
+
+
+def bench_throughput(options: Dict) -> List[Dict]:
+    """배치 / 병렬 처리량 (작은 설정: 해상도 50, 반복 50)"""
+    results = []
+    config = ThreeBodyConfig(potential_resolution=50, max_iterations=50)
+    count = options["sweep_size"]
+    systems = sweep_systems(count)
+    engine = ThreeBodyBoundaryEngine(config)
+    repeat = max(2, options["repeat"] - 2)
+
+    runs = [("run_sweep", {"workers": 0}, lambda: engine.run_sweep(systems))]
+    for workers in options["worker_counts"]:
+        runs.append((
+            "run_sweep",
+            {"workers": workers},
+            lambda workers=workers: engine.run_sweep(systems, max_workers=workers, chunksize=4)
+        ))
+    if HAS_NUMPY:
+        masses = np.array([[b.mass for b in s.get_all_bodies()] for s in systems])
+        positions = np.array([[(b.position.x, b.position.y) for b in s.get_all_bodies()] for s in systems])
+        runs.append(("run_batch", {"workers": 0}, lambda: engine.run_batch(masses, positions)))
+
+    for name, params, function in runs:
+        # 프로세스 풀의 메모리는 tracemalloc에 잡히지 않으므로 병렬 항목은 생략
+        stats = measure(function, repeat=repeat, track_memory=params["workers"] == 0)
+        results.append(entry("throughput", name, {**params, "systems": count}, stats,
+                             systems_per_second=count / stats["median"]))
+    return results
+
+
+def benchmark_nbody_potential(
+    body_counts=(64, 256, 1024, 4096),
+    opening_angles=(0.3, 0.5, 0.7, 1.0),
+    resolution=128,
+    repeat=3
+):
+    """다체 퍼텐셜 격자: 직접 합 vs Barnes-Hut (정확도/속도 곡선)
+
+    천체는 표준정규분포 위치, 질량 0.5 ~ 2.0 (난수 시드 고정).
+    오차는 직접 합 대비 최대 상대 오차, 시간은 반복 시행 중앙값.
+
+    Returns:
+        (천체 수, θ, 직접 합 시간, 트리 시간, 최대 상대 오차) 리스트
+    """
+    print(f"\n다체 퍼텐셜 격자 ({resolution + 1}² 격자점):")
+    print(f"  {'N':>6} {'θ':>5} {'직접 합(ms)':>12} {'트리(ms)':>10} {'속도비':>7} {'최대 상대 오차':>14}")
+
+    rng = random.Random(1)
+    results = []
+    for n_bodies in body_counts:
+        bodies = [
+            Body(position=Point(rng.gauss(0.0, 1.0), rng.gauss(0.0, 1.0)), mass=rng.uniform(0.5, 2.0))
+            for _ in range(n_bodies)
+        ]
+        grid = dict(bodies=bodies, x_range=(-3.0, 3.0), y_range=(-3.0, 3.0), resolution=resolution)
+
+        exact_calculator = GravityCalculator(opening_angle=0.0)
+        _, _, exact = exact_calculator.create_potential_grid(**grid)
+        direct_time = measure(
+            lambda: exact_calculator.create_potential_grid(**grid), repeat=repeat, track_memory=False
+        )["median"]
+
+        for opening_angle in opening_angles:
+            tree_calculator = GravityCalculator(opening_angle=opening_angle, direct_sum_threshold=0)
+            _, _, approx = tree_calculator.create_potential_grid(**grid)
+            tree_time = measure(
+                lambda: tree_calculator.create_potential_grid(**grid), repeat=repeat, track_memory=False
+            )["median"]
+
+            error = float(abs((approx - exact) / exact).max())
+            results.append((n_bodies, opening_angle, direct_time, tree_time, error))
+            print(
+                f"  {n_bodies:>6} {opening_angle:>5.1f} {direct_time*1000:>12.1f} "
+                f"{tree_time*1000:>10.1f} {direct_time/tree_time:>6.2f}x {error:>14.2e}"
             )
-        
-        end_time = time.time()
-        elapsed = end_time - start_time
-        
-        avg_time = elapsed / num_searches
-        
-        print(f"\n유사도 검색:")
-        print(f"  실패 기록 수: {num_records}")
-        print(f"  검색 횟수: {num_searches}")
-        print(f"  총 시간: {elapsed:.3f}초")
-        print(f"  평균 시간: {avg_time*1000:.3f}ms")
-        print(f"  초당 처리량: {num_searches/elapsed:.1f}회/초")
-        
-        return avg_time
-    
-    return 0.0
-
-
-def main():
-    """메인 벤치마크 실행"""
+
+    return results
+
+
+def bench_nbody(options: Dict) -> List[Dict]:
+    """benchmark_nbody_potential() 결과를 항목으로 변환"""
+    if not HAS_NUMPY:
+        return []
+    quick = options is QUICK
+    curve = benchmark_nbody_potential(
+        body_counts=(64, 256) if quick else (64, 256, 1024, 4096),
+        opening_angles=(0.5, 1.0) if quick else (0.3, 0.5, 0.7, 1.0),
+        repeat=options["repeat"]
+    )
+    return [
+        entry("nbody", "tree_potential", {"bodies": n, "theta": theta},
+              {"median": tree_time, "peak_bytes": 0},
+              direct_seconds=direct_time, max_relative_error=error)
+        for n, theta, direct_time, tree_time, error in curve
+    ]
+
+
+SUITES = {
+    "resolution": bench_resolution,
+    "bodies": bench_bodies,
+    "atlas": bench_atlas,
+    "throughput": bench_throughput,
+    "nbody": bench_nbody,
+}
+
+
+def run_suites(names: Optional[List[str]] = None, quick: bool = False) -> Dict:
+    """모음 실행 → JSON 직렬화 가능한 보고서"""
+    options = QUICK if quick else FULL
+    names = list(names or SUITES)
+    unknown = [name for name in names if name not in SUITES]
+    if unknown:
+        raise ValueError(f"알 수 없는 벤치마크 모음: {unknown} (가능: {sorted(SUITES)})")
+    results = []
+    for name in names:
+        started = time.perf_counter()
+        suite_results = SUITES[name](options)
+        results.extend(suite_results)
+        print(f"  {name}: 항목 {len(suite_results)}개 ({time.perf_counter() - started:.1f}초)")
+    return {
+        "meta": {
+            "engine_version": __version__,
+            "python": platform.python_version(),
+            "numpy": np.__version__ if HAS_NUMPY else None,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "quick": quick,
+            "suites": names,
+            "created": time.time(),
+        },
+        "results": results,
+    }
+
+
+def compare_results(
+    current: Dict,
+    baseline: Dict,
+    tolerance: float = 0.2,
+    memory_tolerance: float = 0.2,
+    min_seconds: float = 1e-4
+) -> List[Dict]:
+    """기준선 대비 회귀 항목
+
+    같은 key의 중앙값 시간이 (1 + tolerance)배, 메모리 최대치가 (1 + memory_tolerance)배를
+    넘으면 회귀로 본다. 두 시간이 모두 min_seconds보다 짧으면 잡음으로 보고 건너뛴다.
+
+    Returns:
+        [{"key", "metric", "baseline", "current", "ratio"}] (비율 내림차순)
+    """
+    reference = {item["key"]: item for item in baseline.get("results", [])}
+    regressions = []
+    for item in current.get("results", []):
+        base = reference.get(item["key"])
+        if base is None:
+            continue
+        if max(item["median"], base["median"]) >= min_seconds and base["median"] > 0:
+            ratio = item["median"] / base["median"]
+            if ratio > 1.0 + tolerance:
+                regressions.append({"key": item["key"], "metric": "median",
+                                    "baseline": base["median"], "current": item["median"], "ratio": ratio})
+        if base.get("peak_bytes") and item.get("peak_bytes"):
+            ratio = item["peak_bytes"] / base["peak_bytes"]
+            if ratio > 1.0 + memory_tolerance:
+                regressions.append({"key": item["key"], "metric": "peak_bytes",
+                                    "baseline": base["peak_bytes"], "current": item["peak_bytes"], "ratio": ratio})
+    return sorted(regressions, key=lambda row: row["ratio"], reverse=True)
+
+
+def print_results(report: Dict) -> None:
+    print(f"\n  {'항목':<58} {'중앙값(ms)':>11} {'±(ms)':>8} {'최대 메모리(KB)':>15}")
+    for item in report["results"]:
+        print(
+            f"  {item['key']:<58} {item['median']*1000:>11.3f} "
+            f"{item.get('stdev', 0.0)*1000:>8.3f} {item.get('peak_bytes', 0)/1024:>15.1f}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """메인 벤치마크 실행 (회귀가 있으면 1 반환)"""
+    parser = argparse.ArgumentParser(description="ThreeBodyBoundaryEngine 성능 벤치마크")
+    parser.add_argument("--suite", action="append", choices=sorted(SUITES), help="실행할 모음 (반복 지정, 기본 전체)")
+    parser.add_argument("--quick", action="store_true", help="작은 파라미터로 빠르게 실행")
+    parser.add_argument("--output", help="결과 JSON 경로")
+    parser.add_argument("--baseline", help="비교할 기준선 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="시간 회귀 허용 비율 (기본 0.2)")
+    parser.add_argument("--memory-tolerance", type=float, default=0.2, help="메모리 회귀 허용 비율 (기본 0.2)")
+    args = parser.parse_args(argv)
+
     print("=" * 60)
     print("ThreeBodyBoundaryEngine 성능 벤치마크")
     print("=" * 60)
-    
-    # L0 벤치마크
-    l0_time = benchmark_l0_analysis(100)
-    
-    # L1 벤치마크
-    l1_time = benchmark_l1_recording(100)
-    
-    # L2 벤치마크
-    l2_time = benchmark_l2_conversion(10)
-    
-    # 통합 파이프라인 벤치마크
-    integrated_time = benchmark_integrated_pipeline(50)
-    
-    # 유사도 검색 벤치마크
-    similarity_time = benchmark_similarity_search(1000, 100)
-    
-    # 요약
-    print("\n" + "=" * 60)
-    print("성능 요약")
-    print("=" * 60)
-    print(f"L0 안정성 분석: {l0_time*1000:.3f}ms")
-    print(f"L1 실패 기록: {l1_time*1000:.3f}ms")
-    print(f"L2 편향 생성: {l2_time*1000:.3f}ms")
-    print(f"통합 파이프라인: {integrated_time*1000:.3f}ms")
-    print(f"유사도 검색: {similarity_time*1000:.3f}ms")
-    print("=" * 60)
+    report = run_suites(args.suite, quick=args.quick)
+    print_results(report)
 
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, ensure_ascii=False)
+        print(f"\n결과 저장: {args.output}")
 
-if __name__ == "__main__":
-    main()
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare_results(
+            report, baseline, tolerance=args.tolerance, memory_tolerance=args.memory_tolerance
+        )
+        print("\n" + "=" * 60)
+        print(f"기준선 비교: {args.baseline}")
+        print("=" * 60)
+        if not regressions:
+            print("회귀 없음")
+            return 0
+        for row in regressions:
+            print(f"  ⚠️ {row['key']} {row['metric']}: {row['baseline']:.4g} → {row['current']:.4g} ({row['ratio']:.2f}x)")
+        return 1
+    return 0
 
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,139 @@
+"""
+ThreeBodyBoundaryEngine - AdaptiveField 테스트
+
+적응형 사분트리 퍼텐셜 필드 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    ThreeBodySystem,
+    Body,
+    Point,
+    AdaptiveField
+)
+from three_body_boundary_engine.gravity_calculator import GravityCalculator
+from three_body_boundary_engine.boundary_convergence_adapter import BoundaryConvergenceAdapter
+from three_body_boundary_engine._compat import HAS_NUMPY, np
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy 미설치")
+class TestAdaptiveField(unittest.TestCase):
+    """AdaptiveField 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = GravityCalculator()
+        self.bodies = [
+            Body(position=Point(0.0, 0.0), mass=1.0),
+            Body(position=Point(1.0, 0.0), mass=2.0),
+            Body(position=Point(0.5, 0.866), mass=1.0)
+        ]
+        self.x_range = (-1.0, 2.0)
+        self.y_range = (-1.0, 1.866)
+
+        # 천체 근처(0.05 이내)를 제외한 무작위 검증 점
+        rng = np.random.default_rng(0)
+        xs = rng.uniform(*self.x_range, 5000)
+        ys = rng.uniform(*self.y_range, 5000)
+        nearest = np.min(
+            [np.hypot(xs - b.position.x, ys - b.position.y) for b in self.bodies], axis=0
+        )
+        self.xs = xs[nearest > 0.05]
+        self.ys = ys[nearest > 0.05]
+        self.exact = self.calculator.potential_at_points(self.bodies, self.xs, self.ys)
+
+    def max_relative_error(self, field) -> float:
+        """검증 점에서의 최대 상대 오차"""
+        sampled = field.sample_many(self.xs, self.ys)
+        return float(np.max(np.abs(sampled - self.exact) / np.abs(self.exact)))
+
+    def test_matches_uniform_accuracy_with_fewer_evaluations(self):
+        """같은 최소 셀 크기의 균일 격자와 같은 최대 오차, 평가 횟수는 훨씬 적음"""
+        uniform = self.calculator.create_scalar_field(
+            self.bodies, self.x_range, self.y_range, resolution=256
+        )
+        adaptive = self.calculator.create_adaptive_field(
+            self.bodies, self.x_range, self.y_range, tolerance=1e-3, max_depth=6, base=4
+        )
+
+        self.assertLessEqual(
+            self.max_relative_error(adaptive), self.max_relative_error(uniform) * 1.01
+        )
+        self.assertLess(adaptive.evaluations * 3, len(uniform))
+        self.assertEqual(adaptive.max_level, 6)
+
+    def test_refines_near_bodies_only(self):
+        """천체를 포함한 셀은 최대 깊이까지, 먼 영역은 얕게"""
+        field = self.calculator.create_adaptive_field(
+            self.bodies, self.x_range, self.y_range, tolerance=1e-3, max_depth=5
+        )
+        for body in self.bodies:
+            depth = self._leaf_level(field, body.position.x + 1e-9, body.position.y + 1e-9)
+            self.assertEqual(depth, 5)
+        self.assertLess(self._leaf_level(field, -0.99, 1.85), 5)
+
+    def _leaf_level(self, field, x, y) -> int:
+        """(x, y)를 포함한 잎의 깊이"""
+        leaves = np.flatnonzero(field.leaf_mask)
+        inside = (
+            (field.x0[leaves] <= x) & (x < field.x0[leaves] + field.width[leaves])
+            & (field.y0[leaves] <= y) & (y < field.y0[leaves] + field.height[leaves])
+        )
+        return int(field.level[leaves[inside][0]])
+
+    def test_leaves_tile_domain(self):
+        """잎 셀이 영역 전체를 겹침 없이 덮음"""
+        field = self.calculator.create_adaptive_field(
+            self.bodies, self.x_range, self.y_range, tolerance=1e-3, max_depth=5
+        )
+        self.assertIsInstance(field, AdaptiveField)
+        area = (self.x_range[1] - self.x_range[0]) * (self.y_range[1] - self.y_range[0])
+        self.assertAlmostEqual(float(field.leaf_areas().sum()), area, places=9)
+        self.assertEqual(len(field.to_dict()), field.n_leaves)
+
+    def test_density_and_boundary_consume_field(self):
+        """밀도 정규화(제자리)와 경계 수렴 단계가 AdaptiveField를 수용"""
+        field = self.calculator.create_adaptive_field(
+            self.bodies, self.x_range, self.y_range, tolerance=1e-3, max_depth=4
+        )
+        density = self.calculator.potential_to_density(field, normalization="max")
+        self.assertIs(density, field)
+        leaf_values = field.center[field.leaf_mask]
+        self.assertGreaterEqual(leaf_values.min(), 0.0)
+        self.assertLessEqual(leaf_values.max(), 1.0)
+
+        field = self.calculator.create_adaptive_field(
+            self.bodies, self.x_range, self.y_range, tolerance=1e-3, max_depth=4
+        )
+        self.calculator.potential_to_density(field, normalization="sum")
+        areas = field.leaf_areas()
+        weighted = float(np.sum(field.center[field.leaf_mask] * areas / areas.min()))
+        self.assertAlmostEqual(weighted, 1.0, places=9)
+
+        result = BoundaryConvergenceAdapter(max_iterations=50).converge(importance_weights=density)
+        self.assertGreater(result.iteration, 0)
+
+    def test_engine_adaptive_mode(self):
+        """adaptive_tolerance 설정 시 엔진이 적응형 필드로 분석"""
+        config = ThreeBodyConfig(potential_resolution=32, max_iterations=50, adaptive_tolerance=1e-3)
+        analysis = ThreeBodyBoundaryEngine(config).analyze_orbit_stability(ThreeBodySystem(*self.bodies))
+        self.assertGreaterEqual(analysis.stability_score, 0.0)
+
+        with self.assertRaises(ValueError):
+            ThreeBodyConfig(adaptive_tolerance=0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+"""
+ThreeBodyBoundaryEngine - 편향 유도 적응형 스캔 테스트
+
+BiasGuidedSampler 경계 세분 / 편향 가지치기 / 예산 테스트
+(L0 분석만 합성 지형으로 바꾸고 run()의 L1/L2 경로는 그대로 사용)
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodySystem,
+    StabilityAnalysis,
+    Body,
+    Point,
+    FailureAtlas,
+    IncrementalBiasConverter,
+    BiasGuidedSampler
+)
+
+
+BOUNDS = ((0.0, 1.0), (0.5, 2.5))
+
+
+def make_system(mass_ratio: float, separation: float) -> ThreeBodySystem:
+    return ThreeBodySystem(
+        body1=Body(position=Point(0.0, 0.0), mass=1.0),
+        body2=Body(position=Point(separation, 0.0), mass=max(mass_ratio, 1e-3)),
+        body3=Body(position=Point(0.5 * separation, 0.866 * separation), mass=1.0)
+    )
+
+
+def landscape_mismatch(mass_ratio: float, separation: float) -> float:
+    """타원 안쪽이 안정 (mismatch < 0.1)인 합성 지형"""
+    return 0.1 * (((mass_ratio - 0.55) / 0.3) ** 2 + ((separation - 1.4) / 0.6) ** 2)
+
+
+class LandscapeEngine(ThreeBodyBoundaryEngine):
+    """L0 분석만 합성 지형으로 대체한 엔진"""
+
+    def analyze_orbit_stability(self, system, x_range=None, y_range=None):
+        mismatch = landscape_mismatch(system.body2.mass, system.body2.position.x)
+        return StabilityAnalysis(
+            converged=True,
+            mismatch=mismatch,
+            iteration=1,
+            boundary_points=8,
+            stability_score=max(0.0, 1.0 - mismatch),
+            convergence_rate=0.0
+        )
+
+
+def uniform_boundary_cells(resolution: int) -> set:
+    """균일 격자에서 꼭짓점 판정이 섞인 셀 (최소 꼭짓점 좌표)"""
+    (u_min, u_max), (v_min, v_max) = BOUNDS
+    us = [u_min + (u_max - u_min) * i / resolution for i in range(resolution + 1)]
+    vs = [v_min + (v_max - v_min) * j / resolution for j in range(resolution + 1)]
+    stable = [[landscape_mismatch(u, v) < 0.1 for v in vs] for u in us]
+    return {
+        (us[i], vs[j])
+        for i in range(resolution)
+        for j in range(resolution)
+        if len({stable[i][j], stable[i + 1][j], stable[i][j + 1], stable[i + 1][j + 1]}) > 1
+    }
+
+
+class TestBiasGuidedSampler(unittest.TestCase):
+    """BiasGuidedSampler 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.engine = LandscapeEngine()
+
+    def test_boundary_matches_uniform_grid(self):
+        """균일 격자와 같은 경계 셀을 더 적은 평가로 찾는지 테스트"""
+        sampler = BiasGuidedSampler(self.engine, make_system, BOUNDS, initial_resolution=4, max_depth=3)
+        report = sampler.run()
+
+        self.assertEqual(report.resolved_depth, 3)
+        self.assertEqual(report.uniform_evaluations, 33 * 33)
+        self.assertEqual({cell[0] for cell in report.boundary_cells}, uniform_boundary_cells(32))
+        self.assertLess(report.evaluations, report.uniform_evaluations // 2)
+        self.assertEqual(report.evaluations_saved, report.uniform_evaluations - report.evaluations)
+        self.assertEqual(len(set(report.coordinates)), report.evaluations)
+
+        # 모든 결과가 같은 지도에 되먹임
+        atlas = sampler.failure_atlas
+        self.assertIsInstance(sampler.bias_converter, IncrementalBiasConverter)
+        self.assertTrue(all(result.failure_atlas is atlas for result in report.results))
+        self.assertEqual(
+            atlas.total_failures,
+            sum(not result.analysis.is_stable(0.1) for result in report.results)
+        )
+        self.assertEqual(report.results[-1].search_bias,
+                         IncrementalBiasConverter().convert_failure_to_bias(atlas))
+
+    def test_fresh_failures_are_not_pruned(self):
+        """기본 설정: 빈 지도로 시작한 스캔은 방금 기록한 실패로 가지치기하지 않음"""
+        options = dict(initial_resolution=4, max_depth=3)
+        default_scan = BiasGuidedSampler(self.engine, make_system, BOUNDS, **options).run()
+        open_scan = BiasGuidedSampler(
+            self.engine, make_system, BOUNDS, avoid_threshold=1.1, **options
+        ).run()
+
+        self.assertEqual(default_scan.pruned_cells, 0)
+        self.assertEqual(default_scan.boundary_cells, open_scan.boundary_cells)
+        self.assertEqual(default_scan.evaluations, open_scan.evaluations)
+
+    def test_bias_prunes_known_risky_cells(self):
+        """기본 설정: 이전 스캔의 실패 (알려진 위험)로 경계 셀도 가지치기하는지 테스트"""
+        options = dict(initial_resolution=4, max_depth=3)
+        open_scan = BiasGuidedSampler(
+            self.engine, make_system, BOUNDS, avoid_threshold=1.1, **options
+        ).run()
+
+        # 같은 지도로 다시 스캔하면 처음부터 이전 편향을 사용
+        atlas = FailureAtlas()
+        sampler = BiasGuidedSampler(self.engine, make_system, BOUNDS, failure_atlas=atlas, **options)
+        first = sampler.run()
+        self.assertEqual(first.pruned_cells, 0)
+        recorded = atlas.total_failures
+        rescan = sampler.run()
+        # 첫 격자의 경계 셀은 실패 꼭짓점이 모두 알려져 있음 (안정 꼭짓점은 막지 않음)
+        self.assertGreater(rescan.pruned_cells, 0)
+        self.assertLess(rescan.evaluations, open_scan.evaluations)
+        self.assertEqual(
+            atlas.total_failures,
+            recorded + sum(not result.analysis.is_stable(0.1) for result in rescan.results)
+        )
+
+    def test_prune_only_known_region(self):
+        """일부 영역만 알려진 지도: 그 영역만 가지치기하고 나머지 경계는 균일 격자와 같은지 테스트"""
+        # (0, 0.5) × (0.5, 1.5)를 같은 격자 간격으로 먼저 스캔 (꼭짓점 좌표가 전체 스캔과 일치)
+        atlas = FailureAtlas()
+        BiasGuidedSampler(
+            self.engine, make_system, ((0.0, 0.5), (0.5, 1.5)),
+            initial_resolution=2, max_depth=3, failure_atlas=atlas
+        ).run()
+        self.assertGreater(atlas.total_failures, 0)
+
+        fresh = BiasGuidedSampler(self.engine, make_system, BOUNDS, initial_resolution=4, max_depth=3).run()
+        report = BiasGuidedSampler(
+            self.engine, make_system, BOUNDS, initial_resolution=4, max_depth=3, failure_atlas=atlas
+        ).run()
+
+        self.assertGreater(report.pruned_cells, 0)
+        self.assertLess(report.evaluations, fresh.evaluations)
+        found = {cell[0] for cell in report.boundary_cells}
+        uniform = uniform_boundary_cells(32)
+        self.assertTrue(found <= uniform)
+        # 알려진 영역에 닿지 않는 첫 격자 셀 안의 경계는 모두 유지
+        self.assertTrue({cell for cell in uniform if cell[0] >= 0.75 or cell[1] >= 2.0} <= found)
+
+    def test_budget(self):
+        """예산이 모자라면 완료한 단계까지만 보고하는지 테스트"""
+        report = BiasGuidedSampler(
+            self.engine, make_system, BOUNDS, initial_resolution=4, max_depth=3, max_evaluations=60
+        ).run()
+        self.assertLessEqual(report.evaluations, 60)
+        self.assertLess(report.resolved_depth, 3)
+        points = (4 << report.resolved_depth) + 1
+        self.assertEqual(report.uniform_evaluations, points * points)
+
+    def test_invalid_arguments(self):
+        """잘못된 설정에서 ValueError 발생 테스트"""
+        invalid = (
+            {"bounds": ((1.0, 0.0), (0.0, 1.0))},
+            {"initial_resolution": 0},
+            {"max_depth": -1},
+            {"max_evaluations": 10},
+            {"failure_threshold": 0.0},
+            {"boundary_band": -0.1},
+        )
+        for kwargs in invalid:
+            options = {"bounds": BOUNDS, **kwargs}
+            with self.assertRaises(ValueError):
+                BiasGuidedSampler(self.engine, make_system, **options)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+ThreeBodyBoundaryEngine - AnalysisCache 테스트
+
+안정성 분석 결과 캐시 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import unittest
+import sys
+import tempfile
+from unittest import mock
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    ThreeBodySystem,
+    Body,
+    Point,
+    AnalysisCache
+)
+
+
+def make_system(offset: float = 0.0) -> ThreeBodySystem:
+    """테스트용 삼체 시스템"""
+    return ThreeBodySystem(
+        body1=Body(position=Point(0.0 + offset, 0.0), mass=1.0),
+        body2=Body(position=Point(1.0 + offset, 0.0), mass=1.0),
+        body3=Body(position=Point(0.5 + offset, 0.866), mass=1.0)
+    )
+
+
+class TestAnalysisCache(unittest.TestCase):
+    """AnalysisCache 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.config = ThreeBodyConfig(potential_resolution=10, max_iterations=50)
+
+    def test_cache_hit_returns_same_result(self):
+        """같은 조건 재분석 시 캐시 적중 테스트"""
+        cache = AnalysisCache(max_entries=8)
+        engine = ThreeBodyBoundaryEngine(self.config, analysis_cache=cache)
+        uncached = ThreeBodyBoundaryEngine(self.config)
+
+        first = engine.analyze_orbit_stability(make_system())
+        second = engine.analyze_orbit_stability(make_system())
+
+        self.assertEqual(first, uncached.analyze_orbit_stability(make_system()))
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+    def test_observe_boundary_formation_reuses_analysis(self):
+        """정적 관찰은 한 번만 분석 (캐시 조회도 한 번)"""
+        cache = AnalysisCache()
+        engine = ThreeBodyBoundaryEngine(self.config, analysis_cache=cache)
+
+        dynamics = engine.observe_boundary_formation(make_system(), [0.0, 0.1, 0.2, 0.3])
+
+        self.assertEqual(len(dynamics.mismatches), 4)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 0)
+
+    def test_fingerprint_sensitivity(self):
+        """지문이 질량/위치/범위/설정에 반응하는지 테스트"""
+        cache = AnalysisCache(quantum=1e-6)
+        base = cache.fingerprint(make_system(), None, None, self.config)
+
+        # 양자화 단위보다 작은 차이는 같은 키
+        self.assertEqual(base, cache.fingerprint(make_system(1e-9), None, None, self.config))
+
+        self.assertNotEqual(base, cache.fingerprint(make_system(0.1), None, None, self.config))
+        self.assertNotEqual(base, cache.fingerprint(make_system(), (-1.0, 2.0), (-1.0, 2.0), self.config))
+        other_config = ThreeBodyConfig(potential_resolution=20, max_iterations=50)
+        self.assertNotEqual(base, cache.fingerprint(make_system(), None, None, other_config))
+
+    def test_lru_eviction(self):
+        """LRU 제거 및 카운터 테스트"""
+        cache = AnalysisCache(max_entries=2)
+        engine = ThreeBodyBoundaryEngine(self.config, analysis_cache=cache)
+
+        engine.analyze_orbit_stability(make_system(0.0))
+        engine.analyze_orbit_stability(make_system(1.0))
+        engine.analyze_orbit_stability(make_system(0.0))  # 적중 → 최근 사용
+        engine.analyze_orbit_stability(make_system(2.0))  # offset 1.0 제거
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+
+        engine.analyze_orbit_stability(make_system(0.0))
+        stats = cache.get_statistics()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 3)
+        self.assertEqual(stats["evictions"], 1)
+
+    def test_disk_tier_survives_restart(self):
+        """디스크 계층: 새 캐시(재시작)가 이전 결과 재사용 테스트"""
+        with tempfile.TemporaryDirectory() as directory:
+            first_cache = AnalysisCache(disk_path=directory)
+            first = ThreeBodyBoundaryEngine(self.config, analysis_cache=first_cache)
+            expected = first.analyze_orbit_stability(make_system())
+            self.assertEqual(first_cache.disk_writes, 1)
+
+            restarted_cache = AnalysisCache(disk_path=directory)
+            restarted = ThreeBodyBoundaryEngine(self.config, analysis_cache=restarted_cache)
+            self.assertEqual(restarted.analyze_orbit_stability(make_system()), expected)
+            self.assertEqual(restarted_cache.disk_hits, 1)
+            self.assertEqual(restarted_cache.misses, 0)
+
+    def test_disk_write_failure_does_not_fail_analysis(self):
+        """디스크 쓰기 실패: 분석 결과는 반환, 임시 파일 제거, disk_errors 집계"""
+        with tempfile.TemporaryDirectory() as directory:
+            cache = AnalysisCache(disk_path=directory)
+            engine = ThreeBodyBoundaryEngine(self.config, analysis_cache=cache)
+            with mock.patch(
+                "three_body_boundary_engine.analysis_cache.os.replace",
+                side_effect=OSError("No space left on device")
+            ):
+                analysis = engine.analyze_orbit_stability(make_system())
+            self.assertIsNotNone(analysis)
+            self.assertEqual(list(Path(directory).iterdir()), [])
+            stats = cache.get_statistics()
+            self.assertEqual(stats["disk_errors"], 1)
+            self.assertEqual(stats["disk_writes"], 0)
+            # 메모리 계층은 정상 동작
+            self.assertEqual(engine.analyze_orbit_stability(make_system()), analysis)
+            self.assertEqual(cache.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+"""
+ThreeBodyBoundaryEngine - 비동기 API 테스트
+
+AsyncWorkerPool과 ThreeBodyBoundaryEngine.arun() / arun_batch() 테스트
+(동시 완료 시 지도 일관성, 제한 시간, 취소, 배압)
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import asyncio
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    ThreeBodySystem,
+    Body,
+    Point,
+    FailureAtlas,
+    AsyncWorkerPool
+)
+
+
+X_RANGE = (-1.0, 2.0)
+Y_RANGE = (-1.0, 2.0)
+
+
+def make_systems(count: int):
+    return [
+        ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=1.0),
+            body2=Body(position=Point(1.0, 0.0), mass=0.5 + 0.25 * (k % 4)),
+            body3=Body(position=Point(0.5, 0.5 + 0.1 * (k % 3)), mass=0.1)
+        )
+        for k in range(count)
+    ]
+
+
+class TestAsyncAPI(unittest.TestCase):
+    """arun / arun_batch"""
+
+    def setUp(self):
+        self.engine = ThreeBodyBoundaryEngine(ThreeBodyConfig(potential_resolution=12, max_iterations=20))
+
+    def run_async(self, coroutine_function):
+        async def body():
+            try:
+                return await coroutine_function()
+            finally:
+                await self.engine.aclose()
+        return asyncio.run(body())
+
+    def test_arun_matches_run(self):
+        system = make_systems(1)[0]
+        expected = self.engine.run(system, X_RANGE, Y_RANGE)
+
+        async def body():
+            pool = self.engine.async_pool(max_workers=1)
+            self.assertIs(self.engine.async_pool(), pool)
+            return await self.engine.arun(system, X_RANGE, Y_RANGE)
+
+        result = self.run_async(body)
+        self.assertEqual(result.analysis, expected.analysis)
+        self.assertEqual(result.search_bias, expected.search_bias)
+        self.assertEqual(result.failure_atlas.total_failures, expected.failure_atlas.total_failures)
+
+    def test_concurrent_arun_keeps_atlas_consistent(self):
+        """공유 지도로 동시에 끝나는 요청 → run_sweep과 같은 기록 집합"""
+        systems = make_systems(12)
+        expected = self.engine.run_sweep(systems, X_RANGE, Y_RANGE)[0]
+        atlas = FailureAtlas()
+
+        async def body():
+            self.engine.async_pool(max_workers=2, max_in_flight=4)
+            return await asyncio.gather(*[
+                self.engine.arun(system, X_RANGE, Y_RANGE, failure_atlas=atlas)
+                for system in systems
+            ])
+
+        results = self.run_async(body)
+        self.assertEqual(atlas.total_failures, expected.failure_atlas.total_failures)
+        self.assertEqual(
+            sorted(record.condition_signature for record in atlas.failure_records),
+            sorted(record.condition_signature for record in expected.failure_atlas.failure_records)
+        )
+        # 마지막으로 끝난 요청의 편향은 전체 지도 기준
+        final = max(results, key=lambda result: len(result.search_bias.risk_map))
+        self.assertEqual(final.search_bias.risk_map, expected.search_bias.risk_map)
+
+    def test_arun_batch_matches_run_sweep(self):
+        systems = make_systems(10)
+        expected = self.engine.run_sweep(systems, X_RANGE, Y_RANGE)
+
+        async def body():
+            pool = AsyncWorkerPool(self.engine.config, max_workers=2, max_in_flight=3)
+            async with pool:
+                return await self.engine.arun_batch(iter(systems), X_RANGE, Y_RANGE, pool=pool)
+
+        results = asyncio.run(body())
+        self.assertEqual(len(results), len(systems))
+        for result, reference, system in zip(results, expected, systems):
+            self.assertIs(result.system, system)
+            self.assertEqual(result.analysis, reference.analysis)
+        self.assertEqual(results[0].search_bias, expected[0].search_bias)
+        self.assertIs(results[0].failure_atlas, results[-1].failure_atlas)
+
+    def test_backpressure_bounds_consumed_input(self):
+        systems = make_systems(8)
+        observed = []
+
+        async def body():
+            pool = self.engine.async_pool(max_workers=1, max_in_flight=2)
+
+            def feed():
+                for system in systems:
+                    observed.append(pool.in_flight)
+                    yield system
+
+            return await self.engine.arun_batch(feed(), X_RANGE, Y_RANGE)
+
+        results = self.run_async(body)
+        self.assertEqual(len(results), 8)
+        self.assertLessEqual(max(observed), 2)
+
+    def test_timeout(self):
+        systems = make_systems(3)
+        atlas = FailureAtlas()
+
+        async def body():
+            self.engine.async_pool(max_workers=1)
+            with self.assertRaises(asyncio.TimeoutError):
+                await self.engine.arun(systems[0], X_RANGE, Y_RANGE, failure_atlas=atlas, timeout=1e-4)
+            return await self.engine.arun_batch(
+                systems, X_RANGE, Y_RANGE, timeout=1e-4, return_exceptions=True
+            )
+
+        results = self.run_async(body)
+        self.assertEqual(atlas.total_failures, 0)
+        self.assertTrue(all(isinstance(result, asyncio.TimeoutError) for result in results))
+
+    def test_cancellation_releases_slots(self):
+        systems = make_systems(6)
+        # 기본 설정 (분석 하나가 취소 시점보다 오래 걸림)
+        self.engine = ThreeBodyBoundaryEngine()
+
+        async def body():
+            pool = self.engine.async_pool(max_workers=1, max_in_flight=2)
+            task = asyncio.ensure_future(self.engine.arun_batch(systems, X_RANGE, Y_RANGE))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            self.assertEqual(pool.in_flight, 0)
+            # 취소 후에도 풀은 계속 사용 가능
+            return await self.engine.arun(systems[0], X_RANGE, Y_RANGE)
+
+        result = self.run_async(body)
+        self.assertIsNotNone(result.analysis)
+
+    def test_broken_worker_pool_is_replaced(self):
+        """워커가 비정상 종료되면 그 요청만 실패하고 다음 요청은 새 프로세스 풀 사용"""
+        system = make_systems(1)[0]
+
+        async def body():
+            pool = self.engine.async_pool(max_workers=1)
+            await self.engine.arun(system, X_RANGE, Y_RANGE)
+            executor = pool._executor
+            shutdown = executor.shutdown
+
+            # Python 3.8의 shutdown() 시그니처 (cancel_futures 없음)
+            def shutdown_py38(wait=True):
+                shutdown(wait)
+
+            executor.shutdown = shutdown_py38
+            for process in list(executor._processes.values()):
+                process.kill()
+            with self.assertRaises(BrokenProcessPool):
+                await self.engine.arun(system, X_RANGE, Y_RANGE)
+            self.assertEqual(pool.restarts, 1)
+            self.assertFalse(pool.closed)
+            self.assertIs(self.engine.async_pool(), pool)
+            return await self.engine.arun(system, X_RANGE, Y_RANGE)
+
+        result = self.run_async(body)
+        self.assertEqual(result.analysis, self.engine.analyze_orbit_stability(system, X_RANGE, Y_RANGE))
+
+    def test_engine_pool_reused_across_event_loops(self):
+        """엔진 소유 풀을 여러 asyncio.run()에서 재사용 (슬롯은 루프마다 생성)"""
+        systems = make_systems(4)
+
+        async def body():
+            self.engine.async_pool(max_workers=1, max_in_flight=1)
+            return await asyncio.gather(*[
+                self.engine.arun(system, X_RANGE, Y_RANGE, enable_l2=False) for system in systems
+            ])
+
+        first = asyncio.run(body())
+        # 같은 풀을 다른 이벤트 루프에서 경합 상태로 사용
+        second = self.run_async(body)
+        self.assertEqual([r.analysis for r in first], [r.analysis for r in second])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            AsyncWorkerPool(self.engine.config, max_in_flight=0)
+
+        async def body():
+            with self.assertRaises(ValueError):
+                await self.engine.arun(make_systems(1)[0], enable_l1=False)
+            with self.assertRaises(ValueError):
+                await self.engine.arun(make_systems(1)[0], timeout=0.0)
+            pool = AsyncWorkerPool(self.engine.config, max_workers=1)
+            await pool.aclose()
+            with self.assertRaises(RuntimeError):
+                await pool.analyze(make_systems(1)[0])
+
+        self.run_async(body)
+
+
+if __name__ == "__main__":
+    unittest.main()
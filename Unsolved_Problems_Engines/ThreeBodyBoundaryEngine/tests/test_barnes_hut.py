@@ -0,0 +1,120 @@
+"""
+ThreeBodyBoundaryEngine - Barnes-Hut 테스트
+
+다체 퍼텐셜 근사 (트리) 및 NBodySystem 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import random
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    NBodySystem,
+    Body,
+    Point
+)
+from three_body_boundary_engine.gravity_calculator import GravityCalculator
+from three_body_boundary_engine.barnes_hut import BarnesHutTree
+from three_body_boundary_engine._compat import HAS_NUMPY, np
+
+
+def make_cluster(n_bodies, seed=0):
+    """표준정규분포 위치의 성단"""
+    rng = random.Random(seed)
+    return [
+        Body(position=Point(rng.gauss(0.0, 1.0), rng.gauss(0.0, 1.0)), mass=rng.uniform(0.5, 2.0))
+        for _ in range(n_bodies)
+    ]
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy 미설치")
+class TestBarnesHut(unittest.TestCase):
+    """BarnesHutTree / GravityCalculator 다체 경로 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.bodies = make_cluster(300)
+        self.grid = dict(x_range=(-3.0, 3.0), y_range=(-3.0, 3.0), resolution=40)
+        exact = GravityCalculator(opening_angle=0.0)
+        _, _, self.exact = exact.create_potential_grid(self.bodies, **self.grid)
+
+    def test_tree_structure(self):
+        """루트 질량/질량 중심, 잎 수"""
+        tree = BarnesHutTree(self.bodies)
+        total = sum(b.mass for b in self.bodies)
+        self.assertAlmostEqual(tree.mass[0], total, places=9)
+        self.assertAlmostEqual(
+            tree.com_x[0], sum(b.mass * b.position.x for b in self.bodies) / total, places=9
+        )
+        self.assertEqual(int(np.count_nonzero(tree.child_count == 0)), len(self.bodies))
+
+    def test_zero_opening_angle_is_exact(self):
+        """θ = 0이면 직접 합과 같음 (반올림 오차 이내)"""
+        tree = BarnesHutTree(self.bodies)
+        xs = np.linspace(-3.0, 3.0, 41)
+        approx = tree.mass_over_distance_grid(xs, xs, opening_angle=0.0)
+        self.assertTrue(np.allclose(-approx, self.exact, rtol=1e-12, atol=0.0))
+
+    def test_error_decreases_with_opening_angle(self):
+        """θ가 작을수록 오차 감소, θ = 0.5에서 0.1% 이내"""
+        errors = []
+        for opening_angle in (1.0, 0.7, 0.5, 0.3):
+            calculator = GravityCalculator(opening_angle=opening_angle, direct_sum_threshold=0)
+            _, _, approx = calculator.create_potential_grid(self.bodies, **self.grid)
+            errors.append(float(np.max(np.abs((approx - self.exact) / self.exact))))
+        self.assertEqual(errors, sorted(errors, reverse=True))
+        self.assertLess(errors[2], 1e-3)
+
+    def test_pointwise_matches_grid(self):
+        """임의 점 평가와 격자 평가가 같은 근사 수준"""
+        calculator = GravityCalculator(opening_angle=0.5, direct_sum_threshold=0)
+        xs = np.linspace(-3.0, 3.0, 41)
+        points = calculator.potential_at_points(
+            self.bodies, np.repeat(xs, xs.size), np.tile(xs, xs.size)
+        ).reshape(xs.size, xs.size)
+        self.assertLess(float(np.max(np.abs((points - self.exact) / self.exact))), 1e-3)
+
+    def test_small_n_uses_direct_sum(self):
+        """천체 수가 기준 이하면 직접 합 (비트 단위 동일)"""
+        bodies = self.bodies[:10]
+        calculator = GravityCalculator(direct_sum_threshold=64)
+        self.assertFalse(calculator.uses_tree(bodies))
+        _, _, grid = calculator.create_potential_grid(bodies, **self.grid)
+        _, _, exact = GravityCalculator(opening_angle=0.0).create_potential_grid(bodies, **self.grid)
+        self.assertTrue(np.array_equal(grid, exact))
+
+    def test_coincident_bodies(self):
+        """같은 위치의 천체는 한 잎에 모임"""
+        bodies = [Body(position=Point(0.5, 0.5), mass=1.0)] * 3 + [Body(position=Point(-1.0, 0.0), mass=2.0)]
+        tree = BarnesHutTree(bodies)
+        values = tree.mass_over_distance(np.array([0.0]), np.array([0.0]), opening_angle=0.5)
+        expected = 3.0 / np.hypot(0.5, 0.5) + 2.0
+        self.assertAlmostEqual(float(values[0]), expected, places=9)
+
+    def test_engine_analyzes_nbody_system(self):
+        """엔진이 NBodySystem을 트리 경로로 분석"""
+        config = ThreeBodyConfig(potential_resolution=20, max_iterations=50, direct_sum_threshold=100)
+        engine = ThreeBodyBoundaryEngine(config)
+        system = NBodySystem(bodies=self.bodies)
+        self.assertTrue(engine.gravity_calculator.uses_tree(system.get_all_bodies()))
+
+        analysis = engine.analyze_orbit_stability(system, x_range=(-3.0, 3.0), y_range=(-3.0, 3.0))
+        self.assertGreaterEqual(analysis.stability_score, 0.0)
+        self.assertEqual(engine.field_builder.get_statistics()["layers"], 0)
+
+        with self.assertRaises(ValueError):
+            NBodySystem(bodies=[])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+ThreeBodyBoundaryEngine - 열 기반 배치 실행 테스트
+
+run_batch() / BatchRunResult 테스트 (run_sweep 일치, .npz / 메모리 맵 출력)
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import os
+import unittest
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    NBodySystem,
+    FailureAtlas,
+    BatchRunResult,
+    iter_systems_from_arrays
+)
+from three_body_boundary_engine._compat import HAS_NUMPY, np
+
+
+def make_arrays(count: int, bodies: int = 3):
+    """시스템마다 조금씩 다른 질량/위치 배열"""
+    k = np.arange(count, dtype=np.float64)[:, None]
+    masses = 1.0 + 0.3 * ((k + np.arange(bodies)) % 4)
+    angles = 2 * np.pi * np.arange(bodies) / bodies
+    radius = 0.8 + 0.15 * (k % 5)
+    positions = np.stack([radius * np.cos(angles), radius * np.sin(angles)], axis=-1)
+    return masses, positions
+
+
+@unittest.skipUnless(HAS_NUMPY, "run_batch에는 numpy가 필요합니다")
+class TestRunBatch(unittest.TestCase):
+    """ThreeBodyBoundaryEngine.run_batch 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.engine = ThreeBodyBoundaryEngine(ThreeBodyConfig(potential_resolution=10, max_iterations=50))
+        self.masses, self.positions = make_arrays(9)
+        self.systems = list(iter_systems_from_arrays(self.masses, self.positions))
+
+    @staticmethod
+    def without_time(records):
+        return [replace(record, timestamp=0.0) for record in records]
+
+    def assert_matches(self, batch: BatchRunResult, analyses):
+        self.assertEqual(len(batch), len(analyses))
+        self.assertEqual([batch.analysis(i) for i in range(len(batch))], analyses)
+        self.assertEqual(
+            batch.stable_mask(0.01).tolist(), [analysis.is_stable(0.01) for analysis in analyses]
+        )
+
+    def test_matches_run_sweep(self):
+        """직렬/병렬 배치가 run_sweep과 같은 열/지도/편향을 만드는지 테스트"""
+        sweep = self.engine.run_sweep(self.systems, failure_threshold=0.01)
+        analyses = [result.analysis for result in sweep]
+        for options in ({}, {"max_workers": 2, "chunksize": 4}):
+            batch = self.engine.run_batch(self.masses, self.positions, failure_threshold=0.01, **options)
+            self.assert_matches(batch, analyses)
+            self.assertEqual(batch.mismatch.dtype, np.float64)
+            self.assertEqual(batch.converged.dtype, np.bool_)
+            self.assertEqual(
+                self.without_time(batch.failure_atlas.failure_records),
+                self.without_time(sweep[0].failure_atlas.failure_records)
+            )
+            self.assertEqual(batch.search_bias, sweep[0].search_bias)
+
+        # 기존 지도에 누적 / L1·L2 끄기
+        atlas = FailureAtlas()
+        self.engine.run_batch(self.masses, self.positions, failure_threshold=0.01, failure_atlas=atlas)
+        self.assertEqual(atlas.total_failures, sweep[0].failure_atlas.total_failures)
+        plain = self.engine.run_batch(self.masses, self.positions, enable_l1=False, enable_l2=False)
+        self.assertIsNone(plain.failure_atlas)
+        self.assertIsNone(plain.search_bias)
+        self.assert_matches(plain, analyses)
+
+    def test_output_files(self):
+        """.npz와 메모리 맵 디렉터리 출력 왕복 테스트"""
+        with tempfile.TemporaryDirectory() as directory:
+            npz_path = os.path.join(directory, "batch.npz")
+            batch = self.engine.run_batch(self.masses, self.positions, output=npz_path)
+            loaded = BatchRunResult.load(npz_path)
+            for name, column in batch.columns.items():
+                np.testing.assert_array_equal(loaded.columns[name], column)
+
+            mmap_path = os.path.join(directory, "columns")
+            mapped = self.engine.run_batch(self.masses, self.positions, output=mmap_path)
+            self.assertIsInstance(mapped.mismatch, np.memmap)
+            self.assertEqual(sorted(os.listdir(mmap_path)), sorted(f"{name}.npy" for name in batch.columns))
+            reopened = BatchRunResult.load(mmap_path)
+            self.assertIsInstance(reopened.mismatch, np.memmap)
+            for name, column in batch.columns.items():
+                np.testing.assert_array_equal(reopened.columns[name], column)
+            del mapped, reopened
+
+    def test_body_counts_and_validation(self):
+        """천체 수에 따른 시스템 종류와 잘못된 배열 테스트"""
+        masses, positions = make_arrays(3, bodies=4)
+        systems = list(iter_systems_from_arrays(masses, positions))
+        self.assertTrue(all(isinstance(system, NBodySystem) for system in systems))
+        batch = self.engine.run_batch(masses, positions, enable_l2=False)
+        self.assert_matches(batch, self.engine.compare_stability_conditions(systems))
+
+        self.assertEqual(len(self.engine.run_batch(np.zeros((0, 3)), np.zeros((0, 3, 2)))), 0)
+        invalid = (
+            (self.masses[0], self.positions[0]),
+            (self.masses, self.positions[:, :2]),
+            (-self.masses, self.positions),
+        )
+        for masses, positions in invalid:
+            with self.assertRaises(ValueError):
+                self.engine.run_batch(masses, positions)
+        with self.assertRaises(ValueError):
+            self.engine.run_batch(self.masses, self.positions, enable_l1=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
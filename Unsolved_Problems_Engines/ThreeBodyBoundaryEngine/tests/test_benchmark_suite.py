@@ -0,0 +1,80 @@
+"""
+ThreeBodyBoundaryEngine - 벤치마크 도구 테스트
+
+tests/benchmark_performance.py의 measure() 통계와 compare_results() 회귀 판정 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import json
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(project_root / "tests"))
+
+from benchmark_performance import measure, compare_results, entry, run_suites
+
+
+def report(**medians):
+    return {"results": [
+        entry("suite", name, {"n": 1}, {"median": value[0], "peak_bytes": value[1]})
+        for name, value in medians.items()
+    ]}
+
+
+class TestMeasure(unittest.TestCase):
+    """measure() 통계"""
+
+    def test_statistics_and_setup(self):
+        calls = []
+        stats = measure(lambda: calls.append("run"), setup=lambda: calls.append("setup"),
+                        warmup=2, repeat=4, number=3)
+        # 준비 2 + 시행 4 × 3 + 메모리 측정 1, setup은 준비 / 시행 / 메모리 측정마다
+        self.assertEqual(calls.count("run"), 2 + 12 + 1)
+        self.assertEqual(calls.count("setup"), 2 + 4 + 1)
+        self.assertEqual(stats["repeat"], 4)
+        self.assertLessEqual(stats["min"], stats["median"])
+        self.assertGreaterEqual(stats["stdev"], 0.0)
+
+    def test_peak_memory(self):
+        stats = measure(lambda: bytearray(1 << 20), repeat=1)
+        self.assertGreaterEqual(stats["peak_bytes"], 1 << 20)
+        self.assertEqual(measure(lambda: None, repeat=1, track_memory=False)["peak_bytes"], 0)
+
+
+class TestCompareResults(unittest.TestCase):
+    """기준선 비교"""
+
+    def test_flags_time_and_memory_regressions(self):
+        baseline = report(fast=(0.010, 1000), slow=(0.010, 1000), grown=(0.010, 1000))
+        current = report(fast=(0.011, 1000), slow=(0.020, 1000), grown=(0.010, 5000), new=(1.0, 1))
+        regressions = compare_results(current, baseline, tolerance=0.2)
+        flagged = {(row["key"], row["metric"]) for row in regressions}
+        self.assertEqual(flagged, {
+            ("suite.slow[n=1]", "median"),
+            ("suite.grown[n=1]", "peak_bytes"),
+        })
+        self.assertEqual(regressions[0]["metric"], "peak_bytes")
+
+    def test_ignores_noise_below_min_seconds(self):
+        baseline = report(tiny=(1e-6, 0))
+        current = report(tiny=(5e-6, 0))
+        self.assertEqual(compare_results(current, baseline), [])
+        self.assertEqual(len(compare_results(current, baseline, min_seconds=0.0)), 1)
+
+    def test_report_is_json_round_trip(self):
+        result = run_suites(["atlas"], quick=True)
+        restored = json.loads(json.dumps(result))
+        self.assertEqual(compare_results(restored, restored), [])
+        self.assertTrue(all(item["suite"] == "atlas" for item in restored["results"]))
+        with self.assertRaises(ValueError):
+            run_suites(["unknown"])
+
+
+if __name__ == "__main__":
+    unittest.main()
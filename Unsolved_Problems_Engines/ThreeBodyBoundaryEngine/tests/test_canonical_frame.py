@@ -0,0 +1,151 @@
+"""
+ThreeBodyBoundaryEngine - Canonical Frame 테스트
+
+평행이동/회전/스케일 정규화 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import math
+import random
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    ThreeBodySystem,
+    Body,
+    Point,
+    AnalysisCache,
+    canonicalize_system
+)
+
+
+def move_system(system, angle, scale, shift, order=(0, 1, 2), mirror=False):
+    """강체 운동 + 균일 스케일 (+ 선택적 거울상, 천체 순서 변경)"""
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    bodies = []
+    for body in system.get_all_bodies():
+        x, y = body.position.x, -body.position.y if mirror else body.position.y
+        bodies.append(Body(
+            position=Point(
+                (cos_a * x - sin_a * y) * scale + shift[0],
+                (sin_a * x + cos_a * y) * scale + shift[1]
+            ),
+            mass=body.mass
+        ))
+    return ThreeBodySystem(*[bodies[k] for k in order])
+
+
+class TestCanonicalFrame(unittest.TestCase):
+    """정규화 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.system = ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=1.0),
+            body2=Body(position=Point(2.0, 0.3), mass=2.0),
+            body3=Body(position=Point(0.7, 1.1), mass=0.5)
+        )
+        self.cache = AnalysisCache(quantum=1e-7)
+        self.config = ThreeBodyConfig()
+
+    def key(self, system):
+        """정규형 지문"""
+        canonical = canonicalize_system(system).system
+        return self.cache.fingerprint(canonical, None, None, self.config)
+
+    def test_canonical_form_properties(self):
+        """정규형: 질량 중심 원점, 최대 거리 1"""
+        canonical = canonicalize_system(self.system).system
+        bodies = canonical.get_all_bodies()
+        total_mass = sum(b.mass for b in bodies)
+
+        self.assertAlmostEqual(sum(b.mass * b.position.x for b in bodies) / total_mass, 0.0, places=12)
+        self.assertAlmostEqual(sum(b.mass * b.position.y for b in bodies) / total_mass, 0.0, places=12)
+
+        separations = [
+            bodies[i].position.distance_to(bodies[j].position)
+            for i in range(3) for j in range(i + 1, 3)
+        ]
+        self.assertAlmostEqual(max(separations), 1.0, places=12)
+
+        # 주축 정렬: 질량 가중 교차 모멘트 = 0
+        sxy = sum(b.mass * b.position.x * b.position.y for b in bodies)
+        self.assertAlmostEqual(sxy, 0.0, places=12)
+
+    def test_equivalent_systems_share_canonical_form(self):
+        """강체 운동/스케일/순서/거울상이 달라도 같은 정규형"""
+        rng = random.Random(3)
+        expected = self.key(self.system)
+        for _ in range(25):
+            moved = move_system(
+                self.system,
+                angle=rng.uniform(0.0, 2.0 * math.pi),
+                scale=rng.uniform(0.1, 10.0),
+                shift=(rng.uniform(-5.0, 5.0), rng.uniform(-5.0, 5.0)),
+                order=tuple(rng.sample(range(3), 3)),
+                mirror=rng.random() < 0.5
+            )
+            self.assertEqual(self.key(moved), expected)
+
+        different = ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=1.0),
+            body2=Body(position=Point(2.0, 0.0), mass=2.0),
+            body3=Body(position=Point(0.7, 1.1), mass=0.5)
+        )
+        self.assertNotEqual(self.key(different), expected)
+
+    def test_symmetric_configurations(self):
+        """등방성(정삼각형)·대칭(일직선) 배치도 정규형 공유"""
+        equilateral = ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=1.0),
+            body2=Body(position=Point(1.0, 0.0), mass=1.0),
+            body3=Body(position=Point(0.5, math.sqrt(3) / 2), mass=1.0)
+        )
+        collinear = ThreeBodySystem(
+            body1=Body(position=Point(-1.0, 0.0), mass=1.0),
+            body2=Body(position=Point(0.0, 0.0), mass=1.0),
+            body3=Body(position=Point(1.0, 0.0), mass=1.0)
+        )
+        for system in (equilateral, collinear):
+            expected = self.key(system)
+            for angle in (0.3, 1.7, 4.0):
+                moved = move_system(system, angle=angle, scale=3.0, shift=(1.0, -2.0))
+                self.assertEqual(self.key(moved), expected)
+
+    def test_transform_round_trip(self):
+        """정규 좌표 ↔ 원래 좌표 왕복"""
+        canonical = canonicalize_system(self.system)
+        for k, original_index in enumerate(canonical.permutation):
+            original = self.system.get_all_bodies()[original_index].position
+            mapped = canonical.system.get_all_bodies()[k].position
+            self.assertAlmostEqual(canonical.transform.to_canonical(original).x, mapped.x, places=12)
+            back = canonical.transform.to_original(mapped)
+            self.assertAlmostEqual(back.x, original.x, places=9)
+            self.assertAlmostEqual(back.y, original.y, places=9)
+
+    def test_engine_reuses_work_for_equivalent_systems(self):
+        """canonicalize=True + 캐시: 동치 시스템은 한 번만 계산"""
+        config = ThreeBodyConfig(canonicalize=True, potential_resolution=10, max_iterations=50)
+        cache = AnalysisCache(quantum=1e-7)
+        engine = ThreeBodyBoundaryEngine(config, analysis_cache=cache)
+
+        first = engine.analyze_orbit_stability(self.system)
+        moved = move_system(self.system, angle=2.0, scale=4.0, shift=(3.0, 1.0), order=(2, 0, 1))
+        second = engine.analyze_orbit_stability(moved)
+
+        self.assertEqual(first, second)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -28,6 +28,27 @@ from three_body_boundary_engine import (
 )
 
 
+def make_record(
+    signature: str,
+    features=None,
+    mode: CollapseMode = CollapseMode.MISMATCH,
+    severity: float = 0.0
+) -> FailureRecord:
+    """서명만 다른 합성 실패 기록"""
+    return FailureRecord(
+        condition_signature=signature,
+        timestamp=0.0,
+        delta_threshold_crossed=0.1,
+        mismatch=0.2,
+        convergence_rate=0.0,
+        converged=False,
+        stability_score=0.5,
+        collapse_mode=mode,
+        collapse_severity=severity,
+        signature_features=features
+    )
+
+
 class TestFailureAtlas(unittest.TestCase):
     """Failure Atlas 테스트"""
     
@@ -178,6 +199,188 @@ class TestFailureAtlas(unittest.TestCase):
         print("✅ Atlas 초기화 성공")
 
 
+
+class TestFailureAtlasSimilarity(unittest.TestCase):
+    """수치 서명 / 유사도 색인 테스트"""
+    
+    def setUp(self):
+        """합성 기록 (값 토큰이 부분적으로 겹치도록)"""
+        self.atlas = FailureAtlas()
+        masses = ["(1.0, 1.0, 1.0)", "(2.0, 1.0, 1.0)", "(3.0, 2.0, 1.0)"]
+        distances = ["(1.0, 1.0, 1.0)", "(0.5, 1.2, 1.5)"]
+        for i in range(60):
+            signature = (
+                f"mass_{masses[i % 3]}_dist_{distances[i % 2]}_mismatch_{0.1 * (i % 5):.3f}"
+            )
+            self.atlas.failure_records.append(make_record(signature))
+        self.atlas.failure_records.append(make_record("custom_signature"))
+    
+    def test_signature_features(self):
+        """record_failure가 반올림 없는 수치 서명을 저장"""
+        engine = ThreeBodyBoundaryEngine()
+        system = ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=1.0),
+            body2=Body(position=Point(1.0, 0.0), mass=2.0),
+            body3=Body(position=Point(0.0, 0.333), mass=3.0)
+        )
+        analysis = engine.analyze_orbit_stability(system)
+        atlas = FailureAtlas()
+        record = atlas.record_failure(analysis, system, threshold=0.0)
+        
+        features = record.signature_features
+        self.assertEqual(features[:3], (3.0, 2.0, 1.0))
+        self.assertEqual(features[3:6], tuple(sorted([1.0, 0.333, (1.0 + 0.333 ** 2) ** 0.5])))
+        self.assertEqual(features[6], analysis.mismatch)
+        self.assertEqual(atlas.find_nearest_failures(features)[0], (0.0, record))
+    
+    def test_features_parsed_from_signature(self):
+        """수치 서명이 없는 기록은 서명 문자열에서 복원"""
+        record = self.atlas.failure_records[1]
+        self.assertEqual(record.signature_features, (2.0, 1.0, 1.0, 0.5, 1.2, 1.5, 0.1))
+        self.assertIsNone(self.atlas.failure_records[-1].signature_features)
+    
+    def test_similar_failures_match_linear_scan(self):
+        """get_similar_failures 결과가 전수 비교와 같음 (비표준 서명 포함)"""
+        queries = [
+            record.condition_signature for record in self.atlas.failure_records[:6]
+        ] + ["custom_signature", "mass_(9.0,)_dist_(1.0, 1.0, 1.0)_mismatch_0.100", "mass"]
+        for signature in queries:
+            for threshold in (0.0, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1):
+                expected = [
+                    record for record in self.atlas.failure_records
+                    if self.atlas._calculate_signature_similarity(
+                        signature, record.condition_signature
+                    ) >= threshold
+                ]
+                self.assertEqual(
+                    self.atlas.get_similar_failures(signature, threshold), expected,
+                    (signature, threshold)
+                )
+    
+    def test_nearest_and_radius_queries(self):
+        """수치 서명 최근접 / 반경 질의"""
+        query = (2.0, 1.0, 1.0, 0.5, 1.2, 1.5, 0.1)
+        nearest = self.atlas.find_nearest_failures(query, k=2)
+        self.assertEqual([distance for distance, _ in nearest], [0.0, 0.0])
+        self.assertTrue(all(record.signature_features == query for _, record in nearest))
+        
+        within = self.atlas.find_failures_within(query, 0.15)
+        self.assertEqual(len(within), 6)  # mismatch 0.0 / 0.1 / 0.2 각 2개
+        self.assertEqual(self.atlas.find_failures_within((1.0, 2.0), 10.0), [])
+        
+        with self.assertRaises(ValueError):
+            self.atlas.find_nearest_failures(query, k=0)
+        with self.assertRaises(ValueError):
+            self.atlas.find_failures_within(query, -1.0)
+    
+    def test_index_follows_record_list(self):
+        """추가/초기화 후 색인 갱신"""
+        query = (1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 0.0)
+        self.assertEqual(len(self.atlas.find_failures_within(query, 0.0)), 2)
+        
+        self.atlas.failure_records.append(make_record("extra", features=query))
+        self.assertEqual(len(self.atlas.find_failures_within(query, 0.0)), 3)
+        
+        del self.atlas.failure_records[:]
+        self.assertEqual(self.atlas.find_failures_within(query, 0.0), [])
+        self.atlas.clear()
+        self.assertEqual(self.atlas.get_similar_failures("custom_signature", 0.0), [])
+
+
+
+class TestFailureAtlasColumns(unittest.TestCase):
+    """열 기반 저장소 테스트"""
+    
+    def setUp(self):
+        """모드/서명이 섞인 합성 기록"""
+        self.atlas = FailureAtlas()
+        modes = [CollapseMode.MISMATCH, CollapseMode.DIVERGENCE, CollapseMode.CONVERGENCE_FAILURE]
+        self.records = [
+            make_record(
+                f"mass_(1.0, 1.0, 1.0)_dist_(1.0, 1.0, 1.0)_mismatch_{0.1 * (i % 4):.3f}",
+                mode=modes[(i // 3) % 3],
+                severity=0.05 * (i % 7)
+            )
+            for i in range(40)
+        ]
+        self.records[5].spatial_pattern = {"x": 1.0}
+        self.atlas.failure_records.extend(self.records)
+    
+    def test_records_round_trip(self):
+        """열에서 만든 기록이 원래 기록과 같음, 서명은 인턴"""
+        self.assertEqual(len(self.atlas.failure_records), 40)
+        self.assertEqual(self.atlas.failure_records, self.records)
+        self.assertEqual(self.atlas.failure_records[-1], self.records[-1])
+        self.assertEqual(self.atlas.failure_records[2:4], self.records[2:4])
+        self.assertEqual(self.atlas.failure_records[5].spatial_pattern, {"x": 1.0})
+        self.assertEqual(len(self.atlas.columns.signatures), 4)
+        with self.assertRaises(IndexError):
+            self.atlas.failure_records[40]
+    
+    def test_statistics_match_record_scan(self):
+        """분류표/실패율/유형별 뷰가 기록 순회 결과와 같음 (처음 나타난 순서)"""
+        expected: dict = {}
+        for record in self.records:
+            expected[record.collapse_mode.value] = expected.get(record.collapse_mode.value, 0) + 1
+        
+        stats = self.atlas.get_failure_statistics()
+        self.assertEqual(stats["total_failures"], 40)
+        self.assertEqual(list(stats["failure_by_mode"].items()), list(expected.items()))
+        self.assertEqual(stats["failure_by_type"], expected)
+        self.assertEqual(
+            self.atlas.failure_rate_by_mode,
+            {mode: count / 40 for mode, count in expected.items()}
+        )
+        
+        manifold = self.atlas.failure_manifold
+        self.assertEqual(list(manifold), list(expected))
+        for mode, records in manifold.items():
+            self.assertEqual(
+                records, [r for r in self.records if r.collapse_mode.value == mode]
+            )
+    
+    def test_signature_statistics(self):
+        """서명별 개수/심각도 합 (행 순서 누적)"""
+        signatures, counts, sums = self.atlas.signature_statistics()
+        self.assertEqual(signatures, [r.condition_signature for r in self.records[:4]])
+        for signature, count, severity_sum in zip(signatures, counts, sums):
+            members = [r for r in self.records if r.condition_signature == signature]
+            self.assertEqual(count, len(members))
+            self.assertEqual(severity_sum, sum(r.collapse_severity for r in members))
+    
+    def test_delete_and_clear(self):
+        """뷰에서 삭제하면 열과 색인이 함께 갱신"""
+        query = self.records[1].condition_signature
+        before = len(self.atlas.get_similar_failures(query, 1.0))
+        
+        del self.atlas.failure_records[1]
+        self.assertEqual(self.atlas.failure_records, self.records[:1] + self.records[2:])
+        self.assertEqual(self.atlas.failure_records[4].spatial_pattern, {"x": 1.0})
+        self.assertEqual(len(self.atlas.get_similar_failures(query, 1.0)), before - 1)
+        
+        self.atlas.failure_records.clear()
+        self.assertEqual(self.atlas.total_failures, 0)
+        self.assertEqual(self.atlas.get_failure_statistics()["failure_by_mode"], {})
+    
+    def test_value_equality_and_from_records(self):
+        """지도 비교는 기록 값 기준 (인턴 순서 무관), from_records() 생성 경로"""
+        self.assertEqual(FailureAtlas(), FailureAtlas())
+        
+        rebuilt = FailureAtlas.from_records(self.records)
+        self.assertEqual(rebuilt, self.atlas)
+        self.assertEqual(rebuilt.failure_records, self.records)
+        
+        # 미사용 서명이 남은 테이블도 같은 기록이면 같음
+        shifted = FailureAtlas.from_records([make_record("unused")] + self.records)
+        del shifted.failure_records[0]
+        self.assertEqual(shifted, self.atlas)
+        
+        changed = FailureAtlas.from_records(self.records[:-1])
+        self.assertNotEqual(changed, self.atlas)
+        changed.failure_records.append(make_record("other"))
+        self.assertNotEqual(changed, self.atlas)
+
+
 if __name__ == "__main__":
     unittest.main()
 
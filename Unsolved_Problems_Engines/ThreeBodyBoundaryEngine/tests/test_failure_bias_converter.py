@@ -7,7 +7,10 @@ Author: GNJz (Qquarts)
 Version: 1.2.0
 """
 
+import pickle
+import time
 import unittest
+from unittest import mock
 import sys
 from pathlib import Path
 
@@ -21,11 +24,30 @@ from three_body_boundary_engine import (
     Body,
     Point,
     FailureAtlas,
+    FailureRecord,
     FailureBiasConverter,
-    SearchBias
+    SearchBias,
+    CollapseMode,
+    IncrementalBiasConverter
 )
 
 
+def make_record(index: int, signature_count: int = 12) -> FailureRecord:
+    """서명이 반복되는 합성 실패 기록"""
+    key = (index * 7) % signature_count
+    return FailureRecord(
+        condition_signature=f"mass_(1.0,)_dist_()_mismatch_{key / 10:.3f}",
+        timestamp=float(index),
+        delta_threshold_crossed=0.0,
+        mismatch=0.05 + (index % 9) * 0.1,
+        convergence_rate=-0.01 * (index % 3),
+        converged=False,
+        stability_score=0.5,
+        collapse_mode=list(CollapseMode)[index % 3],
+        collapse_severity=0.0
+    )
+
+
 class TestFailureBiasConverter(unittest.TestCase):
     """Failure Bias Converter 테스트"""
     
@@ -64,6 +86,34 @@ class TestFailureBiasConverter(unittest.TestCase):
         self.assertIsInstance(bias.collapse_mode_risk, dict)
         print(f"✅ 편향 생성: 총 위험도 {bias.total_risk_score:.3f}")
     
+    def test_risk_map_matches_record_scan(self):
+        """열 축약 위험 지도가 기록 순회 계산과 같음 (값과 키 순서)"""
+        for i in range(50):
+            self.atlas.failure_records.append(FailureRecord(
+                condition_signature=f"mass_(1.0,)_dist_()_mismatch_{(i * 7) % 11 / 10:.3f}",
+                timestamp=float(i),
+                delta_threshold_crossed=0.0,
+                mismatch=0.3,
+                convergence_rate=-0.01 * (i % 3),
+                converged=False,
+                stability_score=0.5,
+                collapse_mode=CollapseMode.MISMATCH,
+                collapse_severity=0.0
+            ))
+        
+        counts, severities = {}, {}
+        for record in self.atlas.failure_records:
+            counts[record.condition_signature] = counts.get(record.condition_signature, 0) + 1
+            severities.setdefault(record.condition_signature, []).append(record.collapse_severity)
+        expected = {}
+        for sig, count in counts.items():
+            risk = count / max(counts.values()) * 0.6 + sum(severities[sig]) / len(severities[sig]) * 0.4
+            if risk >= self.converter.min_risk_threshold:
+                expected[sig] = risk
+        
+        bias = self.converter.convert_failure_to_bias(self.atlas)
+        self.assertEqual(list(bias.risk_map.items()), list(expected.items()))
+    
     def test_risk_map(self):
         """위험 지도 테스트"""
         # 여러 실패 기록 생성
@@ -162,6 +212,142 @@ class TestFailureBiasConverter(unittest.TestCase):
             print(f"✅ 편향 업데이트: {initial_risk:.3f} → {updated_bias.total_risk_score:.3f}")
 
 
+class TestIncrementalBiasConverter(unittest.TestCase):
+    """IncrementalBiasConverter 테스트"""
+    
+    def test_matches_batch_conversion(self):
+        """지도를 키워 가며 변환한 결과가 일괄 변환과 같은지 테스트"""
+        atlas = FailureAtlas()
+        batch = FailureBiasConverter()
+        incremental = IncrementalBiasConverter()
+        for index in range(120):
+            atlas.failure_records.append(make_record(index))
+            if index % 13 == 0:
+                bias = incremental.convert_failure_to_bias(atlas)
+                expected = batch.convert_failure_to_bias(atlas)
+                self.assertEqual(bias, expected)
+                self.assertEqual(list(bias.risk_map), list(expected.risk_map))
+        
+        self.assertEqual(incremental.sync(atlas), 120 - 118)
+        expected = batch.convert_failure_to_bias(atlas)
+        self.assertEqual(incremental.search_bias(), expected)
+        for signature in expected.risk_map:
+            self.assertEqual(incremental.get_risk(signature), expected.get_risk(signature))
+        self.assertEqual(incremental.get_risk("unknown"), 0.0)
+        
+        # 행 삭제 / 다른 지도는 처음부터 다시 누적
+        del atlas.failure_records[0:10]
+        self.assertEqual(incremental.convert_failure_to_bias(atlas), batch.convert_failure_to_bias(atlas))
+        other = FailureAtlas()
+        other.failure_records.extend(make_record(index) for index in range(5))
+        self.assertEqual(incremental.convert_failure_to_bias(other), batch.convert_failure_to_bias(other))
+        self.assertEqual(incremental.convert_failure_to_bias(FailureAtlas()), SearchBias())
+    
+    def test_observe_matches_batch(self):
+        """기록을 직접 반영한 상태가 일괄 변환과 같은지 테스트"""
+        records = [make_record(index) for index in range(60)]
+        atlas = FailureAtlas()
+        atlas.failure_records.extend(records)
+        incremental = IncrementalBiasConverter()
+        incremental.observe_all(records)
+        self.assertEqual(incremental.total_failures, 60)
+        self.assertEqual(incremental.search_bias(), FailureBiasConverter().convert_failure_to_bias(atlas))
+    
+    def test_decayed_bias_matches_chained_updates(self):
+        """지연 감쇠가 update_bias_with_new_failure 연쇄와 같은지 테스트"""
+        for decay, threshold in ((0.9, 0.1), (0.5, 0.3), (1.0, 0.4)):
+            batch = FailureBiasConverter(risk_decay_factor=decay, min_risk_threshold=threshold)
+            incremental = IncrementalBiasConverter(risk_decay_factor=decay, min_risk_threshold=threshold)
+            chained = SearchBias()
+            for index in range(300):
+                record = make_record(index * index, signature_count=25)
+                chained = batch.update_bias_with_new_failure(chained, record)
+                incremental.observe(record)
+                if index % 20 == 0:
+                    decayed = incremental.decayed_bias()
+                    self.assertEqual(list(decayed.risk_map), list(chained.risk_map))
+                    for signature, risk in chained.risk_map.items():
+                        self.assertAlmostEqual(decayed.risk_map[signature], risk, places=12)
+                        self.assertAlmostEqual(incremental.decayed_risk(signature), risk, places=12)
+                    self.assertAlmostEqual(decayed.total_risk_score, chained.total_risk_score, places=12)
+    
+    def test_bias_is_lazy_snapshot(self):
+        """변환은 위험 지도를 만들지 않고, 반환한 편향은 이후 기록과 무관 (일괄 변환과 같은 값)"""
+        records = [make_record(index) for index in range(60)]
+        atlas = FailureAtlas.from_records(records[:30])
+        converter = IncrementalBiasConverter()
+        with mock.patch.object(
+            FailureBiasConverter, "_build_risk_map", side_effect=AssertionError("eager rebuild")
+        ):
+            early = converter.convert_failure_to_bias(atlas)
+            atlas.failure_records.extend(records[30:])
+            late = converter.convert_failure_to_bias(atlas)
+        self.assertEqual(early, FailureBiasConverter().convert_failure_to_bias(FailureAtlas.from_records(records[:30])))
+        self.assertEqual(late, FailureBiasConverter().convert_failure_to_bias(atlas))
+        self.assertNotEqual(early.total_risk_score, late.total_risk_score)
+        # 처음부터 다시 누적해도 (reset) 이미 반환한 편향은 유지
+        converter.convert_failure_to_bias(FailureAtlas.from_records(records[:5]))
+        self.assertEqual(late, FailureBiasConverter().convert_failure_to_bias(atlas))
+        self.assertEqual(pickle.loads(pickle.dumps(late)), late)
+    
+    def test_per_run_cost_independent_of_atlas_size(self):
+        """기록 하나 추가 후 변환 비용이 지도 크기 (고유 서명 수)와 무관"""
+        def per_call(size):
+            atlas = FailureAtlas.from_records([make_record(i, signature_count=size) for i in range(size)])
+            converter = IncrementalBiasConverter()
+            converter.convert_failure_to_bias(atlas)
+            samples = []
+            for index in range(30):
+                atlas.failure_records.append(make_record(size + index, signature_count=size + 30))
+                started = time.perf_counter()
+                converter.convert_failure_to_bias(atlas)
+                samples.append(time.perf_counter() - started)
+            return min(samples)
+        
+        small, large = per_call(100), per_call(20000)
+        # 일괄 재구성이면 약 200배 (서명 수 비례)
+        self.assertLess(large, small * 10 + 1e-4)
+    
+    def test_engine_run_uses_incremental_state(self):
+        """엔진 run()에 넘긴 온라인 변환기 결과가 일괄 변환과 같은지 테스트"""
+        engine = ThreeBodyBoundaryEngine()
+        system = ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=1.0),
+            body2=Body(position=Point(1.0, 0.0), mass=1.0),
+            body3=Body(position=Point(0.5, 0.866), mass=1.0)
+        )
+        atlas = FailureAtlas()
+        converter = IncrementalBiasConverter()
+        for _ in range(3):
+            result = engine.run(system, failure_threshold=0.01, failure_atlas=atlas, bias_converter=converter)
+        self.assertEqual(result.search_bias, FailureBiasConverter().convert_failure_to_bias(atlas))
+    
+    def test_engine_default_converter_is_incremental(self):
+        """bias_converter 없이 같은 지도로 반복 실행 → 엔진 소유 변환기가 새 행만 반영"""
+        engine = ThreeBodyBoundaryEngine()
+        system = ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=1.0),
+            body2=Body(position=Point(1.0, 0.0), mass=1.0),
+            body3=Body(position=Point(0.5, 0.866), mass=1.0)
+        )
+        atlas = FailureAtlas()
+        synced = []
+        for _ in range(3):
+            result = engine.run(system, failure_threshold=0.01, failure_atlas=atlas)
+            converter = engine._bias_converter
+            synced.append(converter._source_rows)
+            self.assertIs(converter._source, atlas.columns)
+            self.assertEqual(result.search_bias, FailureBiasConverter().convert_failure_to_bias(atlas))
+        self.assertEqual(synced, [1, 2, 3])
+        
+        # 다른 지도 → 처음부터 다시 누적 (결과 동일)
+        other = FailureAtlas.from_records([make_record(index) for index in range(5)])
+        result = engine.run(system, failure_threshold=0.01, failure_atlas=other)
+        self.assertEqual(result.search_bias, FailureBiasConverter().convert_failure_to_bias(other))
+        engine.reset()
+        self.assertIsNone(engine._bias_converter)
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,165 @@
+"""
+ThreeBodyBoundaryEngine - BoundedFailureAtlas 테스트
+
+메모리 상한이 있는 실패 지도 테스트 (버킷 요약, 제거 정책, 편향 일관성)
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import unittest
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from three_body_boundary_engine import (
+    FailureAtlas,
+    BoundedFailureAtlas,
+    FailureBiasConverter,
+    IncrementalBiasConverter
+)
+from test_failure_store import make_record
+
+
+def bucketed_reference(atlas: BoundedFailureAtlas, records) -> FailureAtlas:
+    """서명을 버킷 대표 서명으로 바꿔 모두 기록한 일반 지도"""
+    reference = FailureAtlas()
+    reference.failure_records.extend(
+        replace(record, condition_signature=atlas.bucket_signature(record.condition_signature))
+        for record in records
+    )
+    return reference
+
+
+class TestBoundedFailureAtlas(unittest.TestCase):
+    """BoundedFailureAtlas 테스트"""
+
+    def test_aggregates_match_unbounded_atlas(self):
+        """원본을 제거해도 분류표/편향이 버킷 기준 전체 지도와 같은지 테스트"""
+        records = [make_record(index * 31) for index in range(400)]
+        converter = FailureBiasConverter()
+        for eviction in ("oldest", "lru", "lowest_severity"):
+            atlas = BoundedFailureAtlas(max_records=40, eviction=eviction)
+            atlas.failure_records.extend(records)
+            reference = bucketed_reference(atlas, records)
+
+            self.assertLessEqual(len(atlas.failure_records), 40)
+            self.assertEqual(atlas.total_failures, 400)
+            self.assertEqual(atlas.collapse_taxonomy, reference.collapse_taxonomy)
+            self.assertEqual(atlas.get_failure_statistics()["failure_rate_by_mode"],
+                             reference.get_failure_statistics()["failure_rate_by_mode"])
+            self.assertEqual(converter.convert_failure_to_bias(atlas),
+                             converter.convert_failure_to_bias(reference))
+            self.assertEqual(IncrementalBiasConverter().convert_failure_to_bias(atlas),
+                             converter.convert_failure_to_bias(reference))
+
+            statistics = atlas.get_failure_statistics()
+            self.assertEqual(statistics["raw_records"] + statistics["evicted_records"], 400)
+            # 참조 없는 서명은 테이블에서 제거
+            self.assertLessEqual(atlas.columns.signature_count, len(atlas.failure_records))
+
+    def test_near_duplicates_share_bucket(self):
+        """mismatch만 조금 다른 서명이 한 버킷으로 모이는지 테스트"""
+        atlas = BoundedFailureAtlas(bucket_resolution=0.05)
+        first = make_record(1)
+        second = replace(first, condition_signature=first.condition_signature[:-1] + "9")
+        self.assertNotEqual(first.condition_signature, second.condition_signature)
+        atlas.failure_records.extend([first, second])
+        self.assertEqual(len(atlas.buckets), 1)
+
+        bucket = atlas.buckets[atlas.bucket_signature(first.condition_signature)]
+        self.assertEqual(bucket.count, 2)
+        self.assertAlmostEqual(bucket.mean_severity, (first.collapse_severity + second.collapse_severity) / 2)
+        self.assertAlmostEqual(bucket.severity_variance, 0.0)
+        self.assertEqual((bucket.first_seen, bucket.last_seen), (first.timestamp, second.timestamp))
+        self.assertEqual(bucket.mode_counts, {first.collapse_mode.value: 2})
+
+        # 비표준 서명은 그대로 버킷
+        self.assertEqual(atlas.bucket_signature("custom_1"), "custom_1")
+        self.assertEqual(
+            BoundedFailureAtlas(bucket_resolution=None).bucket_signature(first.condition_signature),
+            first.condition_signature
+        )
+
+    def test_eviction_policies(self):
+        """정책별로 남는 원본 기록 테스트"""
+        records = [make_record(index) for index in range(64)]
+
+        oldest = BoundedFailureAtlas(max_records=16, eviction="oldest")
+        oldest.failure_records.extend(records)
+        kept = list(oldest.failure_records)
+        self.assertEqual(kept, records[-len(kept):])
+
+        severe = BoundedFailureAtlas(max_records=16, eviction="lowest_severity")
+        severe.failure_records.extend(records)
+        kept = list(severe.failure_records)
+        self.assertEqual(kept[-1], records[-1])
+        severities = sorted(record.collapse_severity for record in records)
+        self.assertEqual(
+            sorted(record.collapse_severity for record in kept[:-1])[-4:], severities[-4:]
+        )
+
+        # LRU: 자주 반복되는 버킷의 기록이 남음
+        hot = make_record(3)
+        lru = BoundedFailureAtlas(max_records=16, eviction="lru")
+        for record in records:
+            lru.failure_records.append(record)
+            lru.failure_records.append(replace(hot, timestamp=record.timestamp))
+        hot_bucket = lru.bucket_signature(hot.condition_signature)
+        self.assertTrue(any(
+            lru.bucket_signature(record.condition_signature) == hot_bucket
+            for record in lru.failure_records[:4]
+        ))
+
+    def test_bucket_limit_keeps_totals_consistent(self):
+        """버킷 제거 후에도 전체 수 = 버킷 합 = 분류표 합인지 테스트"""
+        atlas = BoundedFailureAtlas(max_buckets=8, max_records=50, eviction="lru")
+        atlas.failure_records.extend(make_record(index * 17) for index in range(300))
+        self.assertLessEqual(len(atlas.buckets), 8)
+        self.assertGreater(atlas.columns.evicted_buckets, 0)
+        self.assertEqual(atlas.total_failures, sum(bucket.count for bucket in atlas.buckets.values()))
+        self.assertEqual(atlas.total_failures, sum(atlas.collapse_taxonomy.values()))
+        for record in atlas.failure_records:
+            self.assertIn(atlas.bucket_signature(record.condition_signature), atlas.buckets)
+
+    def test_byte_budget_stays_flat(self):
+        """추정 메모리가 예산 안에 머무는지 테스트"""
+        atlas = BoundedFailureAtlas(max_bytes=40_000, bucket_resolution=0.001)
+        for index in range(3000):
+            atlas.failure_records.append(make_record(index * 7919))
+            self.assertLessEqual(atlas.columns.memory_bytes, 40_000)
+        self.assertGreater(atlas.columns.evicted_records, 0)
+
+    def test_delete_and_clear(self):
+        """직접 삭제한 기록은 버킷에서도 빠지고 clear는 모두 초기화하는지 테스트"""
+        records = [make_record(index) for index in range(30)]
+        atlas = BoundedFailureAtlas()
+        atlas.failure_records.extend(records)
+        del atlas.failure_records[0:10]
+        reference = bucketed_reference(atlas, records[10:])
+        self.assertEqual(atlas.total_failures, 20)
+        self.assertEqual(atlas.collapse_taxonomy, reference.collapse_taxonomy)
+        self.assertEqual(
+            {name: count for name, count in zip(*atlas.signature_statistics()[:2])},
+            {name: count for name, count in zip(*reference.signature_statistics()[:2])}
+        )
+
+        atlas.clear()
+        self.assertEqual(atlas.total_failures, 0)
+        self.assertEqual(atlas.buckets, {})
+        self.assertEqual(atlas.collapse_taxonomy, {})
+
+    def test_invalid_arguments(self):
+        """잘못된 설정에서 ValueError 발생 테스트"""
+        for kwargs in ({"eviction": "random"}, {"max_records": 0}, {"max_bytes": -1}, {"bucket_resolution": 0.0}):
+            with self.assertRaises(ValueError):
+                BoundedFailureAtlas(**kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
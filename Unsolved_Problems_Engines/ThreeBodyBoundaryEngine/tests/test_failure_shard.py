@@ -0,0 +1,205 @@
+"""
+ThreeBodyBoundaryEngine - 실패 샤드 병합 테스트
+
+FailureAtlas / FailureSummary 병합과 샤드 형식, 병렬 run_sweep 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import os
+import unittest
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    ThreeBodySystem,
+    Body,
+    Point,
+    FailureAtlas,
+    FailureSummary,
+    FailureBiasConverter,
+    PersistentFailureAtlas,
+    write_failure_shard,
+    read_failure_shard,
+    read_failure_shard_summary
+)
+from three_body_boundary_engine.failure_shard import encode_failure_shard, decode_failure_shard
+from three_body_boundary_engine._compat import HAS_NUMPY
+from test_failure_store import make_record
+
+
+def make_atlas(start: int, stop: int) -> FailureAtlas:
+    atlas = FailureAtlas()
+    for index in range(start, stop):
+        atlas.failure_records.append(make_record(index))
+    return atlas
+
+
+def summary_key(summary: FailureSummary) -> tuple:
+    """순서 무관 비교용 (심각도 합은 반올림 오차 허용)"""
+    return (
+        summary.total_failures,
+        sorted(summary.collapse_taxonomy.items()),
+        sorted(summary.signature_counts.items()),
+        sorted((name, round(value, 9)) for name, value in summary.signature_severity.items())
+    )
+
+
+class TestFailureShard(unittest.TestCase):
+    """FailureAtlas 병합 / 샤드 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.parts = [make_atlas(0, 20), make_atlas(20, 45), make_atlas(45, 60)]
+        self.reference = make_atlas(0, 60)
+
+    def test_merge_matches_sequential_recording(self):
+        """병합한 지도가 차례로 기록한 지도와 같은지 테스트"""
+        first, second, third = self.parts
+        merged = first.merge(second, third)
+        self.assertEqual(list(merged.failure_records), list(self.reference.failure_records))
+        self.assertEqual(merged.get_failure_statistics(), self.reference.get_failure_statistics())
+        self.assertEqual(merged.signature_statistics()[0], self.reference.signature_statistics()[0])
+        self.assertEqual(len(first.failure_records), 20)
+
+        query = make_record(8).signature_features
+        self.assertEqual(
+            merged.find_nearest_failures(query, 5),
+            self.reference.find_nearest_failures(query, 5)
+        )
+        self.assertEqual(
+            merged.get_similar_failures(make_record(8).condition_signature, 0.6),
+            self.reference.get_similar_failures(make_record(8).condition_signature, 0.6)
+        )
+
+        # 결합 법칙: (a + b) + c == a + (b + c)
+        grouped = first.merge(second).merge(third)
+        self.assertEqual(list(grouped.failure_records), list(merged.failure_records))
+        nested = first.merge(second.merge(third))
+        self.assertEqual(list(nested.failure_records), list(merged.failure_records))
+
+    def test_summary_merge_is_associative_and_commutative(self):
+        """요약 병합의 결합·교환 법칙과 지도 통계 일치 테스트"""
+        a, b, c = (part.summary() for part in self.parts)
+        expected = self.reference.summary()
+        self.assertEqual(summary_key(a.merge(b, c)), summary_key(expected))
+        self.assertEqual(summary_key((a + b) + c), summary_key(a + (b + c)))
+        self.assertEqual(summary_key(c + a + b), summary_key(a + b + c))
+        self.assertEqual((a + b + c).get_failure_statistics(), self.reference.get_failure_statistics())
+        self.assertEqual(summary_key(FailureSummary().merge(a)), summary_key(a))
+
+        converter = FailureBiasConverter()
+        bias = converter.convert_failure_to_bias(a + b + c)
+        expected_bias = converter.convert_failure_to_bias(self.reference)
+        self.assertEqual(list(bias.risk_map), list(expected_bias.risk_map))
+        for signature, risk in expected_bias.risk_map.items():
+            self.assertAlmostEqual(bias.risk_map[signature], risk)
+        self.assertEqual(bias.collapse_mode_risk, expected_bias.collapse_mode_risk)
+
+    def test_shard_round_trip(self):
+        """샤드 바이트/파일 왕복과 헤더만 읽는 요약 테스트"""
+        decoded = decode_failure_shard(encode_failure_shard(self.reference))
+        self.assertEqual(list(decoded.failure_records), list(self.reference.failure_records))
+        self.assertEqual(decode_failure_shard(encode_failure_shard(FailureAtlas())).total_failures, 0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for index, part in enumerate(self.parts):
+                paths.append(os.path.join(directory, f"shard-{index}.bin"))
+                self.assertGreater(write_failure_shard(part, paths[-1]), 0)
+
+            merged = FailureAtlas().merge_from(*(read_failure_shard(path) for path in paths))
+            self.assertEqual(list(merged.failure_records), list(self.reference.failure_records))
+
+            summary = FailureSummary().merge(*(read_failure_shard_summary(path) for path in paths))
+            self.assertEqual(summary_key(summary), summary_key(self.reference.summary()))
+
+    def test_corrupt_shard_raises(self):
+        """손상된 샤드에서 ValueError 발생 테스트"""
+        data = encode_failure_shard(self.parts[0])
+        for corrupt in (b"not a shard", data[:20], data[:-8]):
+            with self.assertRaises(ValueError):
+                decode_failure_shard(corrupt)
+
+    @unittest.skipUnless(HAS_NUMPY, "FailureStore에는 numpy가 필요합니다")
+    def test_merge_into_persistent_atlas(self):
+        """영구 지도로 병합 후 다시 열어도 같은지 테스트"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "atlas")
+            with PersistentFailureAtlas(path, segment_records=16) as atlas:
+                atlas.merge_from(*self.parts)
+            with PersistentFailureAtlas(path) as reopened:
+                self.assertEqual(list(reopened.failure_records), list(self.reference.failure_records))
+                shard = decode_failure_shard(encode_failure_shard(reopened))
+                self.assertEqual(list(shard.failure_records), list(self.reference.failure_records))
+
+
+class TestRunSweep(unittest.TestCase):
+    """ThreeBodyBoundaryEngine.run_sweep 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.engine = ThreeBodyBoundaryEngine(ThreeBodyConfig(potential_resolution=10, max_iterations=50))
+        self.systems = [
+            ThreeBodySystem(
+                body1=Body(position=Point(0.0, 0.0), mass=1.0 + 0.4 * k),
+                body2=Body(position=Point(1.0 + 0.3 * k, 0.0), mass=1.0),
+                body3=Body(position=Point(0.5, 0.866 - 0.2 * k), mass=1.0 + 0.2 * k)
+            )
+            for k in range(7)
+        ]
+
+    @staticmethod
+    def without_time(records):
+        return [replace(record, timestamp=0.0) for record in records]
+
+    def test_sweep_matches_run(self):
+        """직렬/병렬 스윕이 시스템마다 run()한 결과와 같은지 테스트"""
+        atlas = FailureAtlas()
+        expected = [
+            self.engine.run(system, failure_threshold=0.01, failure_atlas=atlas)
+            for system in self.systems
+        ]
+        self.assertGreater(atlas.total_failures, 0)
+
+        for options in ({}, {"max_workers": 2, "chunksize": 3}):
+            results = self.engine.run_sweep(self.systems, failure_threshold=0.01, **options)
+            self.assertEqual(len(results), len(self.systems))
+            merged = results[0].failure_atlas
+            self.assertTrue(all(result.failure_atlas is merged for result in results))
+            self.assertEqual(
+                self.without_time(merged.failure_records), self.without_time(atlas.failure_records)
+            )
+            self.assertEqual(results[-1].search_bias, expected[-1].search_bias)
+            for result, run in zip(results, expected):
+                self.assertEqual(result.system, run.system)
+                self.assertEqual(result.analysis, run.analysis)
+                self.assertEqual(
+                    self.without_time([result.last_failure_record] if result.last_failure_record else []),
+                    self.without_time([run.last_failure_record] if run.last_failure_record else [])
+                )
+
+    def test_sweep_switches(self):
+        """스윕 스위치 동작 테스트"""
+        results = self.engine.run_sweep(
+            self.systems[:3], enable_l1=False, enable_l2=False, max_workers=2, chunksize=2
+        )
+        self.assertEqual([result.analysis for result in results],
+                         self.engine.compare_stability_conditions(self.systems[:3]))
+        self.assertTrue(all(result.failure_atlas is None for result in results))
+        with self.assertRaises(ValueError):
+            self.engine.run_sweep(self.systems[:1], enable_l1=False, enable_l2=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
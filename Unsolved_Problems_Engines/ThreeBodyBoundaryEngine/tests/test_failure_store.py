@@ -0,0 +1,239 @@
+"""
+ThreeBodyBoundaryEngine - FailureStore 테스트
+
+추가 전용 영구 실패 기록 저장소 테스트 (재열기, 꼬리 복구, 압축)
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import os
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    FailureAtlas,
+    FailureRecord,
+    CollapseMode,
+    PersistentFailureAtlas,
+    compact_failure_store
+)
+from three_body_boundary_engine._compat import HAS_NUMPY
+
+
+def make_record(index: int) -> FailureRecord:
+    """행마다 다른 합성 실패 기록 (서명은 일부 반복, 일부 비표준)"""
+    mismatch = 0.1 + (index % 13) * 0.05
+    distances = (0.5 + (index % 5) * 0.25, 1.0, 1.5)
+    signature = (
+        f"mass_(3.0, 2.0, 1.0)_dist_{distances}_mismatch_{mismatch:.3f}"
+        if index % 7 else f"custom_{index % 3}"
+    )
+    return FailureRecord(
+        condition_signature=signature,
+        timestamp=float(index),
+        delta_threshold_crossed=mismatch - 0.1,
+        mismatch=mismatch,
+        convergence_rate=-0.01 * (index % 3),
+        converged=bool(index % 2),
+        stability_score=0.5,
+        collapse_mode=list(CollapseMode)[index % 4],
+        collapse_severity=0.0,
+        spatial_pattern={"density": float(index)} if index % 10 == 0 else None,
+        iteration=index,
+        boundary_points=3 * index
+    )
+
+
+def segment_files(path: str):
+    return sorted(name for name in os.listdir(path) if "-segment-" in name)
+
+
+@unittest.skipUnless(HAS_NUMPY, "FailureStore에는 numpy가 필요합니다")
+class TestFailureStore(unittest.TestCase):
+    """FailureStore / PersistentFailureAtlas 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        temp = tempfile.TemporaryDirectory()
+        self.addCleanup(temp.cleanup)
+        self.path = os.path.join(temp.name, "atlas")
+        self.reference = FailureAtlas()
+
+    def open_atlas(self, **kwargs) -> PersistentFailureAtlas:
+        """저장소 열기 (중단 상황을 흉내 내도록 정리 시 스냅샷 없이 핸들만 닫음)"""
+        atlas = PersistentFailureAtlas(self.path, **kwargs)
+        self.addCleanup(atlas.columns._close_handles)
+        return atlas
+
+    def fill(self, atlas, start: int, stop: int) -> None:
+        for index in range(start, stop):
+            atlas.failure_records.append(make_record(index))
+            self.reference.failure_records.append(make_record(index))
+
+    def assert_matches_reference(self, atlas) -> None:
+        self.assertEqual(list(atlas.failure_records), list(self.reference.failure_records))
+        self.assertEqual(atlas.get_failure_statistics(), self.reference.get_failure_statistics())
+        names, counts, sums = atlas.signature_statistics()
+        expected_names, expected_counts, expected_sums = self.reference.signature_statistics()
+        self.assertEqual(names, expected_names)
+        self.assertEqual(counts.tolist(), expected_counts.tolist())
+        self.assertEqual(sums.tolist(), expected_sums.tolist())
+
+    def test_reopen_round_trip(self):
+        """닫고 다시 연 저장소가 메모리 FailureAtlas와 같은지 테스트"""
+        with self.open_atlas(segment_records=16, snapshot_interval=20) as atlas:
+            self.fill(atlas, 0, 70)
+            self.assert_matches_reference(atlas)
+
+        atlas = self.open_atlas()
+        self.assertEqual(atlas.columns.recovered_records, 0)
+        self.assert_matches_reference(atlas)
+        query = make_record(12)
+        self.assertEqual(
+            atlas.find_nearest_failures(query.signature_features, 4),
+            self.reference.find_nearest_failures(query.signature_features, 4)
+        )
+        self.assertEqual(
+            atlas.get_similar_failures(query.condition_signature, 0.6),
+            self.reference.get_similar_failures(query.condition_signature, 0.6)
+        )
+
+        # 기존 서명은 다시 쓰지 않음 (스냅샷 해시 색인으로 인턴)
+        self.fill(atlas, 0, 10)
+        self.assertEqual(
+            atlas.columns.signature_count, self.reference.columns.signature_count
+        )
+        atlas.close()
+        self.assert_matches_reference(self.open_atlas())
+
+    def test_reopen_without_snapshot_recovers_tail(self):
+        """스냅샷 없이 중단된 꼬리를 검사 후 복원하는지 테스트"""
+        atlas = self.open_atlas(segment_records=8, snapshot_interval=1000)
+        self.fill(atlas, 0, 30)
+        atlas.flush()
+
+        reopened = self.open_atlas()
+        self.assertEqual(reopened.columns.recovered_records, 30)
+        self.assertEqual(reopened.columns.truncated_records, 0)
+        self.assert_matches_reference(reopened)
+
+    def test_torn_writes_are_truncated(self):
+        """반쯤 쓰인 기록/서명/float/줄을 잘라내는지 테스트"""
+        atlas = self.open_atlas(segment_records=8, snapshot_interval=1000)
+        self.fill(atlas, 0, 21)
+        atlas.flush()
+        last_segment = os.path.join(self.path, segment_files(self.path)[-1])
+        with open(last_segment, "ab") as f:
+            f.write(b"\x01" * 50)
+        for name, garbage in (
+            ("g0-signatures.bin", b"\x40\x00\x00\x00mass"),
+            ("g0-features.bin", b"\x00\x00\x00"),
+            ("g0-patterns.jsonl", b'{"row": 3'),
+        ):
+            with open(os.path.join(self.path, name), "ab") as f:
+                f.write(garbage)
+
+        reopened = self.open_atlas()
+        self.assert_matches_reference(reopened)
+        self.fill(reopened, 21, 30)
+        reopened.close()
+        self.assert_matches_reference(self.open_atlas())
+
+    def test_corrupt_tail_record_is_dropped(self):
+        """CRC가 맞지 않는 꼬리 기록부터 잘라내는지 테스트"""
+        atlas = self.open_atlas(segment_records=8, snapshot_interval=1000)
+        self.fill(atlas, 0, 20)
+        atlas.flush()
+        last_segment = os.path.join(self.path, segment_files(self.path)[-1])
+        with open(last_segment, "r+b") as f:
+            f.seek(-2 * 96 + 10, os.SEEK_END)
+            value = f.read(1)[0]
+            f.seek(-1, os.SEEK_CUR)
+            f.write(bytes([value ^ 0x01]))
+
+        reopened = self.open_atlas()
+        self.assertEqual(reopened.total_failures, 18)
+        self.assertEqual(reopened.columns.truncated_records, 2)
+        self.assertEqual(
+            list(reopened.failure_records), list(self.reference.failure_records)[:18]
+        )
+
+    def test_full_segment_before_rotation(self):
+        """세그먼트를 채운 직후 중단돼도 다음 세그먼트로 이어 쓰는지 테스트"""
+        atlas = self.open_atlas(segment_records=5, snapshot_interval=1000)
+        self.fill(atlas, 0, 10)
+        atlas.flush()
+        # 회전으로 만든 빈 세그먼트가 생기기 전 상태
+        os.remove(os.path.join(self.path, segment_files(self.path)[-1]))
+
+        reopened = self.open_atlas()
+        self.fill(reopened, 10, 13)
+        reopened.close()
+        self.assertEqual(len(segment_files(self.path)), 3)
+        self.assert_matches_reference(self.open_atlas())
+
+    def test_compact_drops_orphans_and_keeps_rows(self):
+        """압축이 행을 유지하고 참조 없는 서명을 제거하는지 테스트"""
+        atlas = self.open_atlas(segment_records=8, snapshot_interval=16)
+        self.fill(atlas, 0, 40)
+        # 기록 전에 중단된 서명 (고아)
+        atlas.columns.intern("orphan_signature")
+        atlas.close()
+
+        before = self.open_atlas()
+        signatures = before.columns.signature_count
+        before.close()
+        stats = compact_failure_store(self.path)
+        self.assertEqual(stats["records"], 40)
+        self.assertEqual(stats["signatures"], signatures - 1)
+        self.assertLess(stats["bytes_after"], stats["bytes_before"])
+
+        compacted = self.open_atlas()
+        self.assertTrue(all(name.startswith("g1-") for name in segment_files(self.path)))
+        self.assert_matches_reference(compacted)
+
+    def test_delete_and_clear_rewrite_store(self):
+        """기록 삭제/초기화가 압축으로 반영되는지 테스트"""
+        atlas = self.open_atlas(segment_records=8, snapshot_interval=16)
+        self.fill(atlas, 0, 25)
+        query = make_record(3).signature_features
+        atlas.find_nearest_failures(query)
+
+        del atlas.failure_records[0:5]
+        del self.reference.failure_records[0:5]
+        self.assert_matches_reference(atlas)
+        self.assertEqual(
+            atlas.find_nearest_failures(query, 3),
+            self.reference.find_nearest_failures(query, 3)
+        )
+        atlas.close()
+        self.assert_matches_reference(self.open_atlas())
+
+        atlas = self.open_atlas()
+        atlas.clear()
+        self.assertEqual(atlas.total_failures, 0)
+        atlas.close()
+        self.assertEqual(self.open_atlas().total_failures, 0)
+
+    def test_interrupted_compaction_keeps_previous_generation(self):
+        """manifest 교체 전에 중단된 압축의 파일을 무시하는지 테스트"""
+        with self.open_atlas(segment_records=8) as atlas:
+            self.fill(atlas, 0, 12)
+        stray = os.path.join(self.path, "g1-segment-000000.bin")
+        with open(stray, "wb") as f:
+            f.write(b"partial")
+
+        reopened = self.open_atlas()
+        self.assertFalse(os.path.exists(stray))
+        self.assert_matches_reference(reopened)
+
+
+if __name__ == "__main__":
+    unittest.main()
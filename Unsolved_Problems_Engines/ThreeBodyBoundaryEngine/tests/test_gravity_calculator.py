@@ -15,6 +15,7 @@ sys.path.insert(0, str(project_root / "src"))
 
 from three_body_boundary_engine.gravity_calculator import GravityCalculator
 from three_body_boundary_engine import Body, Point
+from three_body_boundary_engine._compat import HAS_NUMPY
 
 
 def test_gravity_calculator():
@@ -76,6 +77,78 @@ def test_gravity_calculator():
     print("=" * 60)
 
 
+def test_potential_grid_matches_dict_field():
+    """벡터화 격자와 딕셔너리 필드 일치 테스트"""
+    if not HAS_NUMPY:
+        print("ℹ️ numpy 미설치: 배열 경로 테스트 건너뜀")
+        return
+    
+    calculator = GravityCalculator(gravitational_constant=1.0)
+    bodies = [
+        Body(position=Point(0.0, 0.0), mass=1.0),
+        Body(position=Point(1.0, 0.0), mass=2.0),
+        Body(position=Point(0.5, 0.866), mass=1.0)
+    ]
+    
+    xs, ys, grid = calculator.create_potential_grid(
+        bodies=bodies,
+        x_range=(-1.0, 2.0),
+        y_range=(-1.0, 1.0),
+        resolution=10
+    )
+    assert xs.shape == (11,)
+    assert ys.shape == (11,)
+    assert grid.shape == (11, 11)
+    
+    # 격자점 값은 점 단위 계산과 같아야 함 (천체 위치 r = 0 포함)
+    for i, x in enumerate(xs):
+        for j, y in enumerate(ys):
+            expected = calculator.calculate_potential(Point(float(x), float(y)), bodies)
+            assert abs(grid[i, j] - expected) < 1e-12
+    
+    # 호환 뷰는 기존 딕셔너리 필드와 같은 점 집합
+    field = calculator.potential_grid_to_field(xs, ys, grid)
+    assert len(field) == grid.size
+    assert abs(field[Point(0.2, 0.0)] - calculator.calculate_potential(Point(0.2, 0.0), bodies)) < 1e-12
+    print(f"✅ 벡터화 퍼텐셜 격자: {grid.shape}")
+
+
+def test_potential_to_density_inplace():
+    """배열 밀도 변환의 제자리 정규화 테스트"""
+    if not HAS_NUMPY:
+        print("ℹ️ numpy 미설치: 배열 경로 테스트 건너뜀")
+        return
+    
+    calculator = GravityCalculator(gravitational_constant=1.0)
+    bodies = [
+        Body(position=Point(0.0, 0.0), mass=1.0),
+        Body(position=Point(1.0, 0.0), mass=1.0)
+    ]
+    
+    for normalization in ("max", "sum"):
+        xs, ys, grid = calculator.create_potential_grid(
+            bodies=bodies,
+            x_range=(-1.0, 2.0),
+            y_range=(-1.0, 1.0),
+            resolution=10
+        )
+        expected = calculator.potential_to_density(
+            calculator.potential_grid_to_field(xs, ys, grid),
+            normalization=normalization
+        )
+        
+        density = calculator.potential_to_density(grid, normalization=normalization)
+        assert density is grid
+        assert 0.0 <= density.min() and density.max() <= 1.0
+        for i, x in enumerate(xs):
+            for j, y in enumerate(ys):
+                assert abs(density[i, j] - expected[Point(float(x), float(y))]) < 1e-12
+    
+    print("✅ 배열 밀도 변환: 제자리 정규화")
+
+
 if __name__ == "__main__":
     test_gravity_calculator()
+    test_potential_grid_matches_dict_field()
+    test_potential_to_density_inplace()
 
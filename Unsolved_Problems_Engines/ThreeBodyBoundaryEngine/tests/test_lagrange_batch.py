@@ -0,0 +1,176 @@
+"""
+ThreeBodyBoundaryEngine - 라그랑주 점 배치 풀이 테스트
+
+LagrangeCalculator.solve_collinear_points() / lagrange_positions()와
+ThreeBodyBoundaryEngine.observe_lagrange_points_batch() 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    ThreeBodySystem,
+    Body,
+    Point,
+    LagrangeCalculator
+)
+from three_body_boundary_engine._compat import HAS_NUMPY, np
+
+
+# 지구-달 질량비 (무게중심 기준 L1/L2/L3: 0.836915, 1.155682, -1.005063)
+EARTH_MOON_MU = 0.012150585
+
+
+def make_system(separation: float = 1.0, mass2: float = 0.5) -> ThreeBodySystem:
+    return ThreeBodySystem(
+        body1=Body(position=Point(0.0, 0.0), mass=1.0),
+        body2=Body(position=Point(separation, 0.0), mass=mass2),
+        body3=Body(position=Point(0.5, 1.0), mass=0.1)
+    )
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy 필요")
+class TestCollinearSolver(unittest.TestCase):
+    """벡터화 뉴턴 풀이"""
+
+    def setUp(self):
+        self.calculator = LagrangeCalculator()
+
+    def test_earth_moon_reference(self):
+        offsets = self.calculator.solve_collinear_points(1.0 - EARTH_MOON_MU, EARTH_MOON_MU, 1.0)
+        barycentric = offsets[0] - EARTH_MOON_MU
+        np.testing.assert_allclose(barycentric, [0.836915, 1.155682, -1.005063], atol=1e-6)
+
+    def test_equilibrium_residual(self):
+        """풀이 결과에서 유효 퍼텐셜 기울기가 0"""
+        m1 = np.array([1.0, 1.0, 3.0, 1.0])
+        m2 = np.array([1.0, 1e-6, 1.0, 50.0])
+        offsets = self.calculator.solve_collinear_points(m1, m2, 1.0)
+        mu = (m2 / (m1 + m2))[:, np.newaxis]
+        x = offsets - mu
+        d1 = x + mu
+        d2 = x - 1.0 + mu
+        gradient = x - (1.0 - mu) * d1 / np.abs(d1) ** 3 - mu * d2 / np.abs(d2) ** 3
+        np.testing.assert_allclose(gradient, 0.0, atol=1e-9)
+        # L1은 두 천체 사이, L2는 body2 너머, L3은 body1 반대편
+        self.assertTrue(np.all((offsets[:, 0] > 0) & (offsets[:, 0] < 1)))
+        self.assertTrue(np.all(offsets[:, 1] > 1))
+        self.assertTrue(np.all(offsets[:, 2] < 0))
+
+    def test_scales_with_separation(self):
+        unit = self.calculator.solve_collinear_points([1.0, 2.0], [0.3, 0.7], 1.0)
+        scaled = self.calculator.solve_collinear_points([1.0, 2.0], [0.3, 0.7], [2.5, 4.0])
+        np.testing.assert_allclose(scaled, unit * np.array([[2.5], [4.0]]), rtol=1e-12)
+
+    def test_equal_masses_symmetric(self):
+        offsets = self.calculator.solve_collinear_points(1.0, 1.0, 2.0)[0]
+        self.assertAlmostEqual(offsets[0], 1.0, places=12)
+        self.assertAlmostEqual(offsets[1] - 2.0, -offsets[2], places=12)
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            self.calculator.solve_collinear_points([1.0, -1.0], 1.0, 1.0)
+        with self.assertRaises(ValueError):
+            self.calculator.solve_collinear_points(1.0, 1.0, 0.0)
+        with self.assertRaises(ValueError):
+            self.calculator.lagrange_positions([(0.0, 0.0)], [(1.0, 0.0)], solve_collinear=True)
+        with self.assertRaises(ValueError):
+            self.calculator.lagrange_positions([(1.0, 1.0)], [(1.0, 1.0)], solve_collinear=False)
+
+    def test_positions_match_scalar_approximation(self):
+        """solve_collinear=False는 calculate_lagrange_points와 같은 좌표"""
+        system = make_system()
+        system.body2.position = Point(0.6, 0.8)
+        expected = self.calculator.calculate_lagrange_points(system.body1, system.body2, system.body3)
+        points = self.calculator.lagrange_positions(
+            [(0.0, 0.0)], [(0.6, 0.8)], solve_collinear=False
+        )[0]
+        for lp, (x, y) in zip(expected, points.tolist()):
+            self.assertAlmostEqual(lp.position.x, x, places=12)
+            self.assertAlmostEqual(lp.position.y, y, places=12)
+
+    def test_positions_on_rotated_axis(self):
+        """L1-L3은 두 천체를 잇는 축 위"""
+        points = self.calculator.lagrange_positions(
+            [(1.0, 1.0)], [(1.0, 3.0)], m1=[1.0], m2=[0.2]
+        )[0]
+        offsets = self.calculator.solve_collinear_points(1.0, 0.2, 2.0)[0]
+        np.testing.assert_allclose(points[:3, 0], 1.0)
+        np.testing.assert_allclose(points[:3, 1], 1.0 + offsets)
+
+
+@unittest.skipUnless(HAS_NUMPY, "NumPy 필요")
+class TestObserveLagrangeBatch(unittest.TestCase):
+    """덮개 필드 한 장으로 다섯 창 분석"""
+
+    def setUp(self):
+        self.engine = ThreeBodyBoundaryEngine(ThreeBodyConfig(potential_resolution=20))
+
+    def test_matches_per_point_observation(self):
+        systems = [make_system(0.3), make_system(1.0, 0.8)]
+        batch = self.engine.observe_lagrange_points_batch(systems, solve_collinear=False)
+        self.assertEqual(len(batch), 2)
+        for system, analysis in zip(systems, batch):
+            single = self.engine.observe_lagrange_points(system)
+            self.assertEqual(
+                [lp.lagrange_type for lp in analysis.lagrange_points],
+                ["L1", "L2", "L3", "L4", "L5"]
+            )
+            self.assertEqual(analysis.stability_map, single.stability_map)
+            self.assertEqual(analysis.boundary_formation, single.boundary_formation)
+
+    def test_cover_and_per_window_paths_agree(self):
+        systems = [make_system(0.3)]
+        covered = self.engine.observe_lagrange_points_batch(systems)
+        separate = self.engine.observe_lagrange_points_batch(systems, max_cover_ratio=0.0)
+        self.assertEqual(covered[0].stability_map, separate[0].stability_map)
+        self.assertEqual(
+            [lp.position for lp in covered[0].lagrange_points],
+            [lp.position for lp in separate[0].lagrange_points]
+        )
+
+    def test_cover_windows_match_direct_fields(self):
+        """잘라낸 창의 퍼텐셜은 창 좌표에서 직접 계산한 값과 같음"""
+        system = make_system(0.3)
+        captured = []
+        analyze_field = self.engine._analyze_field
+
+        def capture(field):
+            captured.append(field.copy())
+            return analyze_field(field)
+
+        self.engine._analyze_field = capture
+        analysis = self.engine.observe_lagrange_points_batch([system])
+        self.assertEqual(len(captured), 5)
+
+        resolution = self.engine.config.potential_resolution
+        spacing = 1.0 / resolution
+        for field, lp in zip(captured, analysis[0].lagrange_points):
+            self.assertEqual(field.shape, (resolution + 1, resolution + 1))
+            # 창 원점은 덮개 격자점에 맞춤 (어긋남 ≤ 간격 / 2)
+            self.assertLessEqual(abs(field.origin[0] - (lp.position.x - 0.5)), spacing / 2 + 1e-12)
+            self.assertLessEqual(abs(field.origin[1] - (lp.position.y - 0.5)), spacing / 2 + 1e-12)
+            grid_x, grid_y = np.meshgrid(field.x_coords(), field.y_coords(), indexing="ij")
+            expected = self.engine.gravity_calculator.potential_at_points(
+                system.get_all_bodies(), grid_x, grid_y
+            )
+            np.testing.assert_allclose(field.values, expected, rtol=1e-12)
+
+    def test_empty_and_invalid(self):
+        self.assertEqual(self.engine.observe_lagrange_points_batch([]), [])
+        with self.assertRaises(ValueError):
+            self.engine.observe_lagrange_points_batch([make_system()], half_width=0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+ThreeBodyBoundaryEngine - OrbitIntegrator 테스트
+
+궤도 전파 (leapfrog / Yoshida 4차) 및 evolve 관찰 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import math
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    ThreeBodySystem,
+    Body,
+    Point,
+    OrbitIntegrator
+)
+from three_body_boundary_engine._compat import HAS_NUMPY, np
+
+
+def circular_binary():
+    """질량 1 + 1, 간격 1의 원궤도 쌍성 (G = 1), 주기 반환"""
+    omega = math.sqrt(2.0)
+    positions = np.array([[[-0.5, 0.0], [0.5, 0.0]]])
+    velocities = np.array([[[0.0, -0.5 * omega], [0.0, 0.5 * omega]]])
+    masses = np.array([[1.0, 1.0]])
+    return positions, velocities, masses, 2.0 * math.pi / omega
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy 미설치")
+class TestOrbitIntegrator(unittest.TestCase):
+    """OrbitIntegrator 테스트"""
+
+    def test_circular_orbit_returns_after_period(self):
+        """한 주기 후 원위치, Yoshida가 leapfrog보다 정확"""
+        positions, velocities, masses, period = circular_binary()
+        errors = {}
+        for method in ("leapfrog", "yoshida4"):
+            integrator = OrbitIntegrator(method=method)
+            positions_at, velocities_at = integrator.integrate(positions, velocities, masses, [period])
+            errors[method] = float(np.abs(positions_at[-1] - positions).max())
+
+            energy_0 = integrator.total_energy(positions, velocities, masses)
+            energy_1 = integrator.total_energy(positions_at[-1], velocities_at[-1], masses)
+            self.assertLess(abs((energy_1 - energy_0) / energy_0)[0], 1e-8)
+
+        self.assertLess(errors["yoshida4"], 1e-5)
+        self.assertLess(errors["yoshida4"], errors["leapfrog"])
+
+    def test_batch_matches_individual(self):
+        """배치 전파 = 시스템별 전파 (시스템별 dt 독립)"""
+        rng = np.random.default_rng(0)
+        positions = rng.normal(0.0, 1.0, (6, 3, 2))
+        velocities = rng.normal(0.0, 0.3, (6, 3, 2))
+        masses = rng.uniform(0.5, 2.0, (6, 3))
+        times = [0.25, 0.5]
+
+        batch, _ = OrbitIntegrator().integrate(positions, velocities, masses, times)
+        for b in range(6):
+            single, _ = OrbitIntegrator().integrate(
+                positions[b:b + 1], velocities[b:b + 1], masses[b:b + 1], times
+            )
+            self.assertTrue(np.allclose(batch[:, b], single[:, 0], rtol=1e-12, atol=1e-12))
+
+    def test_invalid_times(self):
+        """관찰 시각 검증"""
+        positions, velocities, masses, _ = circular_binary()
+        with self.assertRaises(ValueError):
+            OrbitIntegrator().integrate(positions, velocities, masses, [1.0, 0.5])
+        with self.assertRaises(ValueError):
+            OrbitIntegrator(method="euler")
+
+    def test_propagate_systems(self):
+        """시스템 스냅샷 (velocity None은 정지 출발)"""
+        system = ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=1.0),
+            body2=Body(position=Point(1.0, 0.0), mass=1.0, velocity=Point(0.0, 1.0)),
+            body3=Body(position=Point(0.5, 0.866), mass=1.0)
+        )
+        snapshots = OrbitIntegrator().propagate([system], [0.0, 0.1])[0]
+        self.assertEqual(len(snapshots), 2)
+        self.assertIsInstance(snapshots[1], ThreeBodySystem)
+        self.assertEqual(snapshots[0].body1.position, system.body1.position)
+        self.assertGreater(snapshots[1].body2.position.y, 0.0)
+
+    def test_engine_evolve_reuses_layers(self):
+        """evolve=True: 공통 범위 + 허용 거리 이내 층 재사용"""
+        config = ThreeBodyConfig(potential_resolution=20, max_iterations=50, layer_reuse_tolerance=1e-3)
+        engine = ThreeBodyBoundaryEngine(config)
+        # 무거운 중심 천체는 거의 움직이지 않음
+        system = ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=1000.0, velocity=Point(0.0, 0.0)),
+            body2=Body(position=Point(10.0, 0.0), mass=0.001, velocity=Point(0.0, 10.0)),
+            body3=Body(position=Point(-12.0, 0.0), mass=0.001, velocity=Point(0.0, -9.0))
+        )
+        time_steps = [0.0, 0.01, 0.02, 0.01]
+        dynamics = engine.observe_boundary_formation(system, time_steps, evolve=True)
+
+        self.assertEqual(dynamics.time_steps, time_steps)
+        self.assertEqual(len(dynamics.mismatches), len(time_steps))
+        # 고유 시각 3개 × 천체 3개 = 층 9개 중 중심 천체 층 2회 재사용
+        stats = engine.field_builder.get_statistics()
+        self.assertEqual(stats["layer_reuses"], 2)
+        self.assertEqual(stats["layer_computations"], 7)
+
+    def test_engine_static_observation(self):
+        """evolve=False: 한 번만 분석하고 모든 단계에 기록"""
+        engine = ThreeBodyBoundaryEngine(ThreeBodyConfig(potential_resolution=10, max_iterations=50))
+        system = ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=1.0),
+            body2=Body(position=Point(1.0, 0.0), mass=1.0),
+            body3=Body(position=Point(0.5, 0.866), mass=1.0)
+        )
+        dynamics = engine.observe_boundary_formation(system, [0.0, 0.5, 1.0])
+        self.assertEqual(len(set(dynamics.mismatches)), 1)
+        self.assertEqual(engine.field_builder.layer_computations, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+ThreeBodyBoundaryEngine - PotentialFieldBuilder 테스트
+
+천체별 층 재사용 퍼텐셜 필드 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    ThreeBodySystem,
+    Body,
+    Point,
+    PotentialFieldBuilder
+)
+from three_body_boundary_engine.gravity_calculator import GravityCalculator
+from three_body_boundary_engine._compat import HAS_NUMPY, np
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy 미설치")
+class TestPotentialFieldBuilder(unittest.TestCase):
+    """PotentialFieldBuilder 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = GravityCalculator(gravitational_constant=1.5)
+        self.builder = PotentialFieldBuilder(self.calculator)
+        self.bodies = [
+            Body(position=Point(0.0, 0.0), mass=1.0),
+            Body(position=Point(1.0, 0.0), mass=2.0),
+            Body(position=Point(0.5, 0.866), mass=1.0)
+        ]
+        self.grid = dict(x_range=(-1.0, 2.0), y_range=(-1.0, 1.866), resolution=30)
+
+    def assert_matches_direct(self, bodies, field):
+        """직접 계산한 격자와 비트 단위 일치 확인"""
+        _, _, expected = self.calculator.create_potential_grid(bodies=bodies, **self.grid)
+        self.assertTrue(np.array_equal(field.values, expected))
+
+    def test_single_body_update_recomputes_one_layer(self):
+        """한 천체만 움직이면 층 하나만 재계산"""
+        field = self.builder.build(self.bodies, **self.grid)
+        self.assert_matches_direct(self.bodies, field)
+        self.assertEqual(self.builder.layer_computations, 3)
+
+        for step in range(1, 6):
+            moved = list(self.bodies)
+            moved[2] = Body(position=Point(0.5 + 0.05 * step, 0.866), mass=1.0)
+            field = self.builder.build(moved, **self.grid)
+            self.assert_matches_direct(moved, field)
+
+        self.assertEqual(self.builder.layer_computations, 3 + 5)
+        self.assertEqual(self.builder.layer_reuses, 2 * 5)
+
+    def test_mass_change_and_grid_change(self):
+        """질량 변경은 해당 층만, 격자 변경은 전체 재계산"""
+        self.builder.build(self.bodies, **self.grid)
+
+        heavier = list(self.bodies)
+        heavier[0] = Body(position=Point(0.0, 0.0), mass=3.0)
+        field = self.builder.build(heavier, **self.grid)
+        self.assert_matches_direct(heavier, field)
+        self.assertEqual(self.builder.layer_computations, 4)
+
+        self.grid["resolution"] = 20
+        field = self.builder.build(heavier, **self.grid)
+        self.assert_matches_direct(heavier, field)
+        self.assertEqual(self.builder.layer_computations, 7)
+
+    def test_built_fields_do_not_share_buffers(self):
+        """반환된 필드를 제자리 정규화해도 층은 영향 없음"""
+        first = self.builder.build(self.bodies, **self.grid)
+        self.calculator.potential_to_density(first)
+        second = self.builder.build(self.bodies, **self.grid)
+        self.assert_matches_direct(self.bodies, second)
+
+    def test_engine_uses_builder(self):
+        """엔진 분석이 빌더를 통해 층을 재사용"""
+        engine = ThreeBodyBoundaryEngine(ThreeBodyConfig(potential_resolution=10, max_iterations=50))
+        system = ThreeBodySystem(*self.bodies)
+
+        engine.analyze_orbit_stability(system, x_range=(-1.0, 2.0), y_range=(-1.0, 2.0))
+        engine.analyze_orbit_stability(
+            ThreeBodySystem(self.bodies[0], self.bodies[1], Body(position=Point(0.6, 0.9), mass=1.0)),
+            x_range=(-1.0, 2.0),
+            y_range=(-1.0, 2.0)
+        )
+
+        stats = engine.field_builder.get_statistics()
+        self.assertEqual(stats["layer_computations"], 4)
+        self.assertEqual(stats["layer_reuses"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+"""
+ThreeBodyBoundaryEngine - 필드 정밀도 (float32) 테스트
+
+ThreeBodyConfig.field_precision, 버퍼 재사용, compare_precision() 보고서 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    ThreeBodySystem,
+    Body,
+    Point,
+    PotentialFieldBuilder,
+    AnalysisCache,
+    compare_precision,
+    reference_systems
+)
+from three_body_boundary_engine.gravity_calculator import GravityCalculator
+from three_body_boundary_engine._compat import HAS_NUMPY, np
+
+
+X_RANGE = (-1.0, 2.0)
+Y_RANGE = (-1.0, 2.0)
+
+
+def make_system(k: int = 0) -> ThreeBodySystem:
+    return ThreeBodySystem(
+        body1=Body(position=Point(0.0, 0.0), mass=1.0),
+        body2=Body(position=Point(1.0, 0.0), mass=0.5),
+        body3=Body(position=Point(0.5, 0.3 + 0.05 * k), mass=0.1)
+    )
+
+
+class TestPrecisionConfig(unittest.TestCase):
+    """설정 검증"""
+
+    def test_invalid_precision(self):
+        with self.assertRaises(ValueError):
+            ThreeBodyConfig(field_precision="float16")
+
+    def test_fingerprint_depends_on_precision(self):
+        cache = AnalysisCache()
+        system = make_system()
+        keys = {
+            cache.fingerprint(system, X_RANGE, Y_RANGE, ThreeBodyConfig(field_precision=precision))
+            for precision in ("float64", "float32")
+        }
+        self.assertEqual(len(keys), 2)
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy 미설치")
+class TestFloat32Fields(unittest.TestCase):
+    """float32 층 / 필드 / 버퍼 재사용"""
+
+    def test_layer_float32_close_to_float64(self):
+        calculator = GravityCalculator()
+        body = Body(position=Point(0.25, 0.5), mass=2.0)
+        xs = np.linspace(-1.0, 2.0, 41)
+        ys = np.linspace(-1.0, 2.0, 41)
+        reference = calculator.potential_layer(body, xs, ys)
+        reduced = calculator.potential_layer(body, xs, ys, out=np.empty((41, 41), dtype=np.float32))
+        self.assertEqual(reduced.dtype, np.float32)
+        np.testing.assert_allclose(reduced, reference, rtol=1e-5)
+
+    def test_layer_float64_matches_direct_formula(self):
+        calculator = GravityCalculator()
+        body = Body(position=Point(0.5, 0.5), mass=1.5)
+        xs = np.linspace(0.0, 1.0, 11)
+        ys = np.linspace(0.0, 1.0, 11)
+        distance = np.sqrt((xs[:, None] - 0.5) ** 2 + (ys[None, :] - 0.5) ** 2)
+        expected = np.zeros_like(distance)
+        np.divide(1.5, distance, out=expected, where=distance > 0)
+        # 천체 위치와 겹치는 격자점은 0
+        np.testing.assert_array_equal(calculator.potential_layer(body, xs, ys), expected)
+
+    def test_builder_float32_layers_and_out_buffer(self):
+        builder = PotentialFieldBuilder()
+        bodies = make_system().get_all_bodies()
+        out = np.empty((21, 21), dtype=np.float32)
+        field = builder.build(bodies, X_RANGE, Y_RANGE, resolution=20, dtype="float32", out=out)
+        self.assertIs(field.values, out)
+        self.assertEqual(builder.get_statistics()["layer_bytes"], 3 * out.nbytes)
+
+        reference = builder.build(bodies, X_RANGE, Y_RANGE, resolution=20)
+        self.assertEqual(reference.dtype, "float64")
+        np.testing.assert_allclose(field.values, reference.values, rtol=1e-5)
+
+        with self.assertRaises(ValueError):
+            builder.build(bodies, X_RANGE, Y_RANGE, resolution=20, out=out)
+
+    def test_engine_reuses_field_buffer(self):
+        engine = ThreeBodyBoundaryEngine(ThreeBodyConfig(potential_resolution=24, field_precision="float32"))
+        engine.analyze_orbit_stability(make_system(0), X_RANGE, Y_RANGE)
+        buffer = engine._potential_buffer
+        self.assertEqual(buffer.dtype, np.float32)
+        engine.analyze_orbit_stability(make_system(1), X_RANGE, Y_RANGE)
+        self.assertIs(engine._potential_buffer, buffer)
+
+        engine.update_config(field_precision="float64")
+        engine.analyze_orbit_stability(make_system(2), X_RANGE, Y_RANGE)
+        self.assertEqual(engine._potential_buffer.dtype, np.float64)
+
+    def test_float32_analysis_matches_float64(self):
+        reduced = ThreeBodyBoundaryEngine(ThreeBodyConfig(potential_resolution=24, field_precision="float32"))
+        reference = ThreeBodyBoundaryEngine(ThreeBodyConfig(potential_resolution=24))
+        for k in range(3):
+            self.assertEqual(
+                reduced.analyze_orbit_stability(make_system(k), X_RANGE, Y_RANGE),
+                reference.analyze_orbit_stability(make_system(k), X_RANGE, Y_RANGE)
+            )
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy 미설치")
+class TestPrecisionReport(unittest.TestCase):
+    """compare_precision 보고서"""
+
+    def test_reference_suite_report(self):
+        report = compare_precision(config=ThreeBodyConfig(potential_resolution=40))
+        self.assertEqual(report.systems, len(reference_systems()))
+        self.assertEqual(len(report.per_system), report.systems)
+        self.assertEqual(report.verdict_changes, 0)
+        self.assertAlmostEqual(report.memory_ratio, 0.5)
+        self.assertLess(report.max_density_error, 1e-4)
+        self.assertGreater(report.max_potential_error, 0.0)
+        self.assertTrue(report.is_safe())
+        summary = report.as_dict()
+        self.assertEqual(summary["field_bytes"]["float64"], 41 * 41 * 8)
+        self.assertNotIn("per_system", summary)
+
+    def test_empty_suite(self):
+        with self.assertRaises(ValueError):
+            compare_precision(systems=[])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+ThreeBodyBoundaryEngine - 단계별 계측 테스트
+
+run(collect_metrics=True) / MetricsHook / RunMetrics 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    ThreeBodySystem,
+    Body,
+    Point,
+    AnalysisCache,
+    RunMetrics,
+    MetricsHook
+)
+
+
+class RecordingHook(MetricsHook):
+    """받은 계측을 그대로 모으는 훅"""
+
+    def __init__(self):
+        self.stages = []
+        self.runs = []
+
+    def on_stage(self, stage, wall, cpu):
+        self.stages.append(stage)
+
+    def on_run(self, metrics, result):
+        self.runs.append((metrics, result))
+
+
+class TestRunMetrics(unittest.TestCase):
+    """run() 계측 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.config = ThreeBodyConfig(potential_resolution=10, max_iterations=30)
+        self.system = ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=1.0),
+            body2=Body(position=Point(1.0, 0.0), mass=2.0),
+            body3=Body(position=Point(0.5, 0.866), mass=1.0)
+        )
+
+    def test_disabled_by_default(self):
+        """기본값에서는 계측하지 않고 결과도 같은지 테스트"""
+        engine = ThreeBodyBoundaryEngine(self.config)
+        plain = engine.run(self.system, failure_threshold=0.01)
+        measured = engine.run(self.system, failure_threshold=0.01, collect_metrics=True)
+        self.assertIsNone(plain.metrics)
+        self.assertIsInstance(measured.metrics, RunMetrics)
+        self.assertEqual(plain.analysis, measured.analysis)
+        self.assertEqual(plain.search_bias, measured.search_bias)
+        self.assertIsNone(engine._metrics)
+
+    def test_stages_and_counters(self):
+        """단계별 시간과 카운터 테스트"""
+        result = ThreeBodyBoundaryEngine(self.config).run(
+            self.system, failure_threshold=0.01, collect_metrics=True
+        )
+        metrics = result.metrics
+        self.assertEqual(list(metrics.stages), ["field", "density", "converge", "l1_record", "l2_bias"])
+        for timing in metrics.stages.values():
+            self.assertEqual(timing.calls, 1)
+            self.assertGreaterEqual(timing.wall, 0.0)
+            self.assertGreaterEqual(timing.cpu, 0.0)
+        self.assertAlmostEqual(metrics.total_wall, sum(t.wall for t in metrics.stages.values()))
+
+        self.assertEqual(metrics.counters["grid_cells"], 11 * 11)
+        self.assertEqual(metrics.counters["convergence_iterations"], result.analysis.iteration)
+        self.assertEqual(metrics.counters["boundary_points"], result.analysis.boundary_points)
+        self.assertEqual(metrics.counters["screening_levels"], 1)
+        self.assertEqual(metrics.counters["atlas_failures"], result.failure_atlas.total_failures)
+        self.assertEqual(metrics.counters["bias_signatures"], len(result.search_bias.risk_map))
+
+        flat = metrics.as_dict()
+        self.assertEqual(flat["converge.calls"], 1)
+        self.assertEqual(flat["grid_cells"], 121)
+
+        # L1/L2를 끄면 해당 단계 없음
+        bare = ThreeBodyBoundaryEngine(self.config).run(
+            self.system, enable_l1=False, enable_l2=False, collect_metrics=True
+        )
+        self.assertEqual(list(bare.metrics.stages), ["field", "density", "converge"])
+
+    def test_screening_and_cache(self):
+        """선별 단계 합산과 캐시 적중 테스트"""
+        config = ThreeBodyConfig(
+            potential_resolution=10, max_iterations=30, screening_resolutions=(5,), screening_band=10.0
+        )
+        metrics = ThreeBodyBoundaryEngine(config).run(self.system, collect_metrics=True).metrics
+        self.assertEqual(metrics.counters["screening_levels"], 2)
+        self.assertEqual(metrics.stages["field"].calls, 2)
+        self.assertEqual(metrics.counters["grid_cells"], 6 * 6 + 11 * 11)
+
+        engine = ThreeBodyBoundaryEngine(self.config, analysis_cache=AnalysisCache())
+        engine.run(self.system)
+        cached = engine.run(self.system, collect_metrics=True).metrics
+        self.assertEqual(cached.counters["cache_hits"], 1)
+        self.assertNotIn("field", cached.stages)
+
+    def test_hooks(self):
+        """훅이 단계/실행 계측을 받는지 테스트"""
+        hook = RecordingHook()
+        engine = ThreeBodyBoundaryEngine(self.config, metrics_hooks=[hook])
+        result = engine.run(self.system, failure_threshold=0.01)
+        self.assertIsNotNone(result.metrics)
+        self.assertEqual(hook.stages, ["field", "density", "converge", "l1_record", "l2_bias"])
+        self.assertEqual(len(hook.runs), 1)
+        self.assertIs(hook.runs[0][0], result.metrics)
+        self.assertIs(hook.runs[0][1], result)
+
+        # 기본 훅은 아무것도 하지 않음
+        ThreeBodyBoundaryEngine(self.config, metrics_hooks=[MetricsHook()]).run(self.system)
+
+
+if __name__ == "__main__":
+    unittest.main()
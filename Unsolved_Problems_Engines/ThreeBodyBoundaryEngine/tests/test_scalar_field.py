@@ -0,0 +1,137 @@
+"""
+ThreeBodyBoundaryEngine - ScalarField 테스트
+
+조밀 격자 필드 표현 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodySystem,
+    Body,
+    Point,
+    ScalarField
+)
+from three_body_boundary_engine.gravity_calculator import GravityCalculator
+from three_body_boundary_engine.boundary_convergence_adapter import BoundaryConvergenceAdapter
+from three_body_boundary_engine._compat import HAS_NUMPY, np
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy 미설치")
+class TestScalarField(unittest.TestCase):
+    """ScalarField 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.calculator = GravityCalculator(gravitational_constant=1.0)
+        self.bodies = [
+            Body(position=Point(0.0, 0.0), mass=1.0),
+            Body(position=Point(1.0, 0.0), mass=2.0),
+            Body(position=Point(0.5, 0.866), mass=1.0)
+        ]
+
+    def test_field_matches_dict_field(self):
+        """ScalarField와 기존 딕셔너리 필드 일치 테스트"""
+        field = self.calculator.create_scalar_field(
+            bodies=self.bodies,
+            x_range=(-1.0, 2.0),
+            y_range=(-1.0, 1.866),
+            resolution=20
+        )
+        legacy = self.calculator.create_potential_field(
+            bodies=self.bodies,
+            x_range=(-1.0, 2.0),
+            y_range=(-1.0, 1.866),
+            resolution=20
+        )
+
+        self.assertEqual(field.shape, (21, 21))
+        self.assertEqual(len(field), len(legacy))
+        self.assertTrue(field.values.flags["C_CONTIGUOUS"])
+        self.assertEqual(field.to_dict(), legacy)
+
+    def test_dict_round_trip(self):
+        """딕셔너리 어댑터 왕복 테스트"""
+        legacy = self.calculator.create_potential_field(
+            bodies=self.bodies,
+            x_range=(-1.0, 2.0),
+            y_range=(-1.0, 1.0),
+            resolution=10
+        )
+        field = ScalarField.from_dict(legacy)
+
+        self.assertEqual(field.shape, (11, 11))
+        for point, value in field.to_dict().items():
+            self.assertAlmostEqual(value, legacy[point], places=12)
+
+        # 규칙 격자가 아니면 변환 불가
+        broken = dict(legacy)
+        broken.pop(next(iter(broken)))
+        with self.assertRaises(ValueError):
+            ScalarField.from_dict(broken)
+
+    def test_bilinear_sampling(self):
+        """쌍선형 샘플링 테스트"""
+        # f(x, y) = 2x + 3y + 1 은 쌍선형 보간으로 정확히 재현됨
+        xs = np.linspace(0.0, 1.0, 5)
+        ys = np.linspace(-1.0, 1.0, 9)
+        values = 2.0 * xs[:, np.newaxis] + 3.0 * ys[np.newaxis, :] + 1.0
+        field = ScalarField.from_grid(xs, ys, values)
+
+        self.assertAlmostEqual(field.sample(0.3, 0.2), 2.0 * 0.3 + 3.0 * 0.2 + 1.0, places=12)
+        self.assertAlmostEqual(field.sample(1.0, 1.0), 6.0, places=12)
+
+        # 격자 밖은 경계로 고정
+        self.assertAlmostEqual(field.sample(5.0, -5.0), field.sample(1.0, -1.0), places=12)
+
+        sampled = field.sample_many(np.array([0.3, 0.77, 2.0]), np.array([0.2, -0.41, 0.0]))
+        for value, (x, y) in zip(sampled, [(0.3, 0.2), (0.77, -0.41), (2.0, 0.0)]):
+            self.assertAlmostEqual(value, field.sample(x, y), places=12)
+
+    def test_density_inplace_and_float32(self):
+        """밀도 변환 제자리 정규화 + float32 버퍼 테스트"""
+        field = self.calculator.create_scalar_field(
+            bodies=self.bodies,
+            x_range=(-1.0, 2.0),
+            y_range=(-1.0, 1.866),
+            resolution=20,
+            dtype="float32"
+        )
+        self.assertEqual(field.dtype, "float32")
+
+        density = self.calculator.potential_to_density(field, normalization="max")
+        self.assertIs(density, field)
+        self.assertGreaterEqual(float(density.values.min()), 0.0)
+        self.assertLessEqual(float(density.values.max()), 1.0)
+
+    def test_pipeline_accepts_scalar_field(self):
+        """경계 수렴 어댑터와 엔진의 ScalarField 경로 테스트"""
+        field = self.calculator.create_scalar_field(
+            bodies=self.bodies,
+            x_range=(-1.0, 2.0),
+            y_range=(-1.0, 1.866),
+            resolution=10
+        )
+        adapter = BoundaryConvergenceAdapter(max_iterations=50)
+        from_field = adapter.converge(importance_weights=field)
+        from_dict = adapter.converge(importance_weights=field.to_dict())
+        self.assertEqual(from_field, from_dict)
+
+        engine = ThreeBodyBoundaryEngine()
+        analysis = engine.analyze_orbit_stability(ThreeBodySystem(*self.bodies))
+        self.assertGreaterEqual(analysis.stability_score, 0.0)
+        self.assertLessEqual(analysis.stability_score, 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
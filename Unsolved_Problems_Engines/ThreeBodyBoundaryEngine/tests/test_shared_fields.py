@@ -0,0 +1,184 @@
+"""
+ThreeBodyBoundaryEngine - 공유 메모리 필드 테스트
+
+SharedFieldRegistry / SharedFieldView와 계산기·층 빌더·밀도 단계·병렬 워커 연동 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import multiprocessing
+import os
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine import (
+    ThreeBodyBoundaryEngine,
+    ThreeBodyConfig,
+    ThreeBodySystem,
+    Body,
+    Point,
+    PotentialFieldBuilder,
+    SharedFieldRegistry,
+    SharedFieldView
+)
+from three_body_boundary_engine import parallel_batch
+from three_body_boundary_engine.gravity_calculator import GravityCalculator
+from three_body_boundary_engine._compat import HAS_NUMPY, np
+
+
+X_RANGE = (-2.0, 3.0)
+Y_RANGE = (-2.0, 3.0)
+RESOLUTION = 24
+
+FIXED = [Body(position=Point(0.0, 0.0), mass=2.0), Body(position=Point(1.0, 0.0), mass=1.0)]
+
+
+def moving_body(k: int) -> Body:
+    return Body(position=Point(0.5 + 0.1 * k, 0.9 - 0.05 * k), mass=0.5 + 0.1 * k)
+
+
+def report_worker_fields(systems, x_range, y_range):
+    """워커 작업 (테스트용): 분석 후 워커 엔진이 붙은 공유 필드 상태 보고"""
+    engine = parallel_batch._WORKER_ENGINE
+    for system in systems:
+        engine.analyze_orbit_stability(system=system, x_range=x_range, y_range=y_range)
+    shared = engine.shared_fields
+    layer = shared.layer(FIXED[0], x_range, y_range, RESOLUTION) if shared is not None else None
+    return {
+        "pid": os.getpid(),
+        "view": isinstance(shared, SharedFieldView),
+        "layer_shares": engine.field_builder.get_statistics()["layer_shares"],
+        "checksum": float(layer.sum()) if layer is not None else None,
+        "zero_copy": layer is not None and not layer.flags.owndata and not layer.flags.writeable,
+    }
+
+
+@unittest.skipUnless(HAS_NUMPY, "공유 필드에는 numpy가 필요합니다")
+class TestSharedFields(unittest.TestCase):
+    """SharedFieldRegistry 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.registry = SharedFieldRegistry()
+        for body in FIXED:
+            self.registry.publish_layer(body, X_RANGE, Y_RANGE, RESOLUTION)
+
+    def tearDown(self):
+        self.registry.close()
+
+    def test_publish_and_attach(self):
+        """manifest로 붙은 뷰가 같은 값을 읽기 전용으로 보는지 테스트"""
+        self.assertEqual(len(self.registry), 3)
+        plain = GravityCalculator()
+        xs, ys, _ = plain.create_potential_grid(FIXED, X_RANGE, Y_RANGE, RESOLUTION)
+
+        with SharedFieldView(self.registry.manifest) as view:
+            shared_xs, shared_ys = view.coordinates(X_RANGE, Y_RANGE, RESOLUTION)
+            np.testing.assert_array_equal(shared_xs, xs)
+            np.testing.assert_array_equal(shared_ys, ys)
+            layer = view.layer(FIXED[0], X_RANGE, Y_RANGE, RESOLUTION)
+            np.testing.assert_array_equal(layer, plain.potential_layer(FIXED[0], xs, ys))
+            self.assertFalse(layer.flags.writeable)
+            self.assertFalse(layer.flags.owndata)
+            with self.assertRaises(ValueError):
+                layer[0, 0] = 1.0
+            self.assertIsNone(view.layer(moving_body(0), X_RANGE, Y_RANGE, RESOLUTION))
+            self.assertIsNone(view.coordinates(X_RANGE, Y_RANGE, RESOLUTION + 1))
+            self.assertEqual(view.nbytes, self.registry.nbytes)
+
+        # 같은 층을 다시 올리면 블록을 새로 만들지 않음
+        self.registry.publish_layer(FIXED[0], X_RANGE, Y_RANGE, RESOLUTION)
+        self.assertEqual(len(self.registry), 3)
+
+    def test_calculator_and_builder_match(self):
+        """공유 층을 쓴 필드가 직접 계산한 필드와 비트 단위로 같은지 테스트"""
+        plain = GravityCalculator()
+        shared = GravityCalculator(shared_fields=self.registry)
+        builder = PotentialFieldBuilder(shared)
+        for k in range(3):
+            bodies = FIXED + [moving_body(k)]
+            expected = plain.create_potential_grid(bodies, X_RANGE, Y_RANGE, RESOLUTION)[2]
+            np.testing.assert_array_equal(
+                shared.create_potential_grid(bodies, X_RANGE, Y_RANGE, RESOLUTION)[2], expected
+            )
+            np.testing.assert_array_equal(
+                builder.build(bodies, X_RANGE, Y_RANGE, RESOLUTION).values, expected
+            )
+
+        statistics = builder.get_statistics()
+        self.assertEqual(statistics["layer_shares"], 2)
+        self.assertEqual(statistics["layer_reuses"], 4)
+        self.assertEqual(statistics["layer_computations"], 3)
+
+        # 공유 층 슬롯의 천체가 움직이면 새 버퍼로 계산 (공유 블록은 그대로)
+        before = self.registry.layer(FIXED[0], X_RANGE, Y_RANGE, RESOLUTION).copy()
+        bodies = [moving_body(5), FIXED[1], moving_body(2)]
+        np.testing.assert_array_equal(
+            builder.build(bodies, X_RANGE, Y_RANGE, RESOLUTION).values,
+            plain.create_potential_grid(bodies, X_RANGE, Y_RANGE, RESOLUTION)[2]
+        )
+        np.testing.assert_array_equal(self.registry.layer(FIXED[0], X_RANGE, Y_RANGE, RESOLUTION), before)
+
+    def test_density_accepts_read_only_views(self):
+        """읽기 전용 버퍼는 복사본을 정규화하는지 테스트"""
+        calculator = GravityCalculator()
+        layer = self.registry.layer(FIXED[0], X_RANGE, Y_RANGE, RESOLUTION)
+        original = layer.copy()
+        for normalization in ("max", "sum"):
+            density = calculator.potential_to_density(layer, normalization=normalization)
+            self.assertIsNot(density, layer)
+            np.testing.assert_array_equal(
+                density, calculator.potential_to_density(original.copy(), normalization=normalization)
+            )
+            np.testing.assert_array_equal(layer, original)
+
+    def test_parallel_results_match(self):
+        """공유 필드를 넘긴 병렬 분석 결과가 직렬과 같은지 테스트 (부착 여부는 아래에서 확인)"""
+        config = ThreeBodyConfig(potential_resolution=RESOLUTION, max_iterations=30)
+        systems = [ThreeBodySystem(FIXED[0], FIXED[1], moving_body(k)) for k in range(6)]
+        expected = ThreeBodyBoundaryEngine(config).compare_stability_conditions(
+            systems, x_range=X_RANGE, y_range=Y_RANGE
+        )
+        engine = ThreeBodyBoundaryEngine(config, shared_fields=self.registry)
+        self.assertEqual(
+            engine.compare_stability_conditions(systems, x_range=X_RANGE, y_range=Y_RANGE), expected
+        )
+        self.assertEqual(
+            engine.compare_stability_conditions(
+                systems, x_range=X_RANGE, y_range=Y_RANGE, max_workers=2, chunksize=2
+            ),
+            expected
+        )
+        self.assertGreater(engine.field_builder.get_statistics()["layer_shares"], 0)
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "fork 시작 방식 필요")
+    def test_parallel_workers_use_shared_layers(self):
+        """병렬 워커가 manifest로 공유 층에 붙어 복사 없이 읽는지 워커 쪽에서 확인"""
+        config = ThreeBodyConfig(potential_resolution=RESOLUTION, max_iterations=30)
+        systems = [ThreeBodySystem(FIXED[0], FIXED[1], moving_body(k)) for k in range(6)]
+        engine = ThreeBodyBoundaryEngine(config, shared_fields=self.registry)
+        # 엔진이 워커에 넘기는 것과 같은 manifest로 초기화 (테스트 작업은 fork로 전달)
+        reports = list(parallel_batch._iter_chunk_results(
+            config, systems, report_worker_fields, (X_RANGE, Y_RANGE),
+            2, 2, None, multiprocessing.get_context("fork"), engine._shared_manifest()
+        ))
+
+        self.assertEqual(len(reports), 3)
+        expected = float(self.registry.layer(FIXED[0], X_RANGE, Y_RANGE, RESOLUTION).sum())
+        for report in reports:
+            self.assertNotEqual(report["pid"], os.getpid())
+            self.assertTrue(report["view"])
+            self.assertTrue(report["zero_copy"])
+            self.assertEqual(report["checksum"], expected)
+            # 고정 천체 두 개의 층은 계산하지 않고 공유 블록에서 읽음
+            self.assertGreaterEqual(report["layer_shares"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
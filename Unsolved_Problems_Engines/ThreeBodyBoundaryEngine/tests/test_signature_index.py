@@ -0,0 +1,111 @@
+"""
+ThreeBodyBoundaryEngine - SignatureIndex 테스트
+
+조건 서명 특징 벡터 색인 (KD-트리 분할) 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from three_body_boundary_engine.signature_index import SignatureIndex
+from three_body_boundary_engine._compat import HAS_NUMPY, np
+
+
+@unittest.skipUnless(HAS_NUMPY, "numpy 미설치")
+class TestSignatureIndex(unittest.TestCase):
+    """SignatureIndex 테스트"""
+
+    def setUp(self):
+        """테스트 설정 (이산 질량 + 연속 거리/mismatch, 중복 포함)"""
+        rng = np.random.default_rng(7)
+        n = 5000
+        masses = -np.sort(-rng.choice([1.0, 2.0, 3.0], (n, 3)), axis=1)
+        distances = np.sort(np.round(rng.uniform(0.5, 2.0, (n, 3)), 2), axis=1)
+        mismatch = rng.uniform(0.0, 1.0, (n, 1))
+        self.features = np.hstack([masses, distances, mismatch])
+        self.index = SignatureIndex(7, leaf_size=16, group_size=4)
+        for i, row in enumerate(self.features):
+            self.index.add(row, i)
+        self.queries = np.vstack([
+            self.features[rng.integers(0, n, 20)],
+            self.features[rng.integers(0, n, 20)] + rng.normal(0.0, 0.05, (20, 7))
+        ])
+
+    def brute_force(self, query):
+        """전수 비교 거리"""
+        return np.sqrt(np.sum((self.features - query) ** 2, axis=1))
+
+    def test_nearest_matches_brute_force(self):
+        """k-최근접 결과가 전수 비교와 같음"""
+        for query in self.queries:
+            distances = self.brute_force(query)
+            for k in (1, 10):
+                result = self.index.nearest(query, k)
+                self.assertEqual(len(result), k)
+                self.assertTrue(np.allclose([d for d, _ in result], np.sort(distances)[:k]))
+                for distance, record_id in result:
+                    self.assertAlmostEqual(distance, distances[record_id])
+        self.assertEqual(self.index.rebuilds, 1)
+
+    def test_within_matches_brute_force(self):
+        """반경 질의 결과 집합이 전수 비교와 같음 (거리 오름차순)"""
+        for query in self.queries:
+            distances = self.brute_force(query)
+            result = self.index.within(query, 0.15)
+            self.assertEqual(sorted(i for _, i in result), np.flatnonzero(distances <= 0.15).tolist())
+            self.assertEqual([d for d, _ in result], sorted(d for d, _ in result))
+
+    def test_pending_points_are_visible(self):
+        """재구성 전에 추가된 점도 질의에 포함, 많이 쌓이면 재구성"""
+        self.index.nearest(self.queries[0])
+        self.assertEqual(self.index.rebuilds, 1)
+
+        self.index.add([9.0] * 7, 99999)
+        self.assertEqual(self.index.nearest([9.0] * 7)[0], (0.0, 99999))
+        self.assertEqual(self.index.rebuilds, 1)
+
+        extra = int(max(self.index.min_pending, self.index.rebuild_ratio * len(self.index))) + 1
+        for i in range(extra):
+            self.index.add([5.0] * 7, 100000 + i)
+        self.assertEqual(len(self.index.within([5.0] * 7, 0.0)), extra)
+        self.assertEqual(self.index.rebuilds, 2)
+
+    def test_add_many_matches_add(self):
+        """묶음 추가가 한 점씩 추가한 색인과 같은 결과"""
+        index = SignatureIndex(7, leaf_size=16, group_size=4)
+        index.add_many(self.features[:100], np.arange(100))
+        index.add_many(self.features[100:], np.arange(100, len(self.features)))
+        self.assertEqual(len(index), len(self.index))
+        for query in self.queries[:10]:
+            self.assertEqual(index.nearest(query, 5), self.index.nearest(query, 5))
+        with self.assertRaises(ValueError):
+            index.add_many(self.features[:, :3], np.arange(len(self.features)))
+
+    def test_small_index_and_validation(self):
+        """점이 k보다 적은 색인, 잘못된 입력"""
+        index = SignatureIndex(2)
+        self.assertEqual(index.nearest([0.0, 0.0], 3), [])
+        index.add([1.0, 0.0], 0)
+        index.add([0.0, 2.0], 1)
+        self.assertEqual(index.nearest([0.0, 0.0], 3), [(1.0, 0), (2.0, 1)])
+
+        with self.assertRaises(ValueError):
+            index.add([1.0], 2)
+        with self.assertRaises(ValueError):
+            index.nearest([0.0, 0.0, 0.0])
+        with self.assertRaises(ValueError):
+            index.nearest([0.0, 0.0], k=0)
+        with self.assertRaises(ValueError):
+            index.within([0.0, 0.0], -1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
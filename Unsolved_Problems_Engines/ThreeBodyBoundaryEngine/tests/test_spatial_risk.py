@@ -0,0 +1,175 @@
+"""
+ThreeBodyBoundaryEngine - 공간 위험도 격자 테스트
+
+SpatialRiskGrid 셀 조회 / 보간 / 일괄 필터와 SearchBias 연동 테스트
+
+Author: GNJz (Qquarts)
+Version: 1.2.1
+"""
+
+import unittest
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from three_body_boundary_engine import (
+    ThreeBodySystem,
+    Body,
+    Point,
+    FailureAtlas,
+    FailureBiasConverter,
+    IncrementalBiasConverter,
+    SpatialRiskGrid,
+    configuration_coordinates,
+    system_coordinates
+)
+from three_body_boundary_engine.spatial_risk import signature_coordinates
+from three_body_boundary_engine._compat import HAS_NUMPY, np
+from test_failure_store import make_record
+
+
+def make_atlas(count: int = 200) -> FailureAtlas:
+    atlas = FailureAtlas()
+    atlas.failure_records.extend(make_record(index) for index in range(count))
+    return atlas
+
+
+class TestSpatialRiskGrid(unittest.TestCase):
+    """SpatialRiskGrid 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.grid = SpatialRiskGrid(cell_size=(0.1, 0.5))
+        self.grid.add(0.32, 1.1, count=4, severity_sum=2.0)
+        self.grid.add(0.38, 1.4, count=2, severity_sum=0.0)
+        self.grid.add(0.45, 1.2, count=1, severity_sum=1.0)
+
+    def test_cell_lookup(self):
+        """셀 위험도 규칙과 O(1) 조회 테스트"""
+        self.assertEqual(len(self.grid), 2)
+        # (3, 2): 6회, 심각도 합 2.0 / (4, 2): 1회, 심각도 합 1.0
+        self.assertAlmostEqual(self.grid.risk(0.31, 1.01), 0.6 + 2.0 / 6 * 0.4)
+        self.assertAlmostEqual(self.grid.risk(0.41, 1.49), 1 / 6 * 0.6 + 0.4)
+        self.assertEqual(self.grid.risk(0.9, 5.0), 0.0)
+
+        pattern = self.grid.pattern()
+        self.assertEqual(len(pattern), 2)
+        self.assertAlmostEqual(pattern[self.grid.cell_center((3, 2))], self.grid.risk(0.35, 1.25))
+        self.assertEqual(len(self.grid.pattern(min_risk=0.7)), 1)
+
+    def test_interpolation(self):
+        """셀 중심에서는 셀 값, 사이에서는 선형 보간인지 테스트"""
+        left = self.grid.risk(0.35, 1.25)
+        right = self.grid.risk(0.45, 1.25)
+        self.assertAlmostEqual(self.grid.risk(0.35, 1.25, interpolate=True), left)
+        self.assertAlmostEqual(self.grid.risk(0.40, 1.25, interpolate=True), (left + right) / 2)
+        # 빈 셀 쪽으로는 0을 향해 감소
+        self.assertAlmostEqual(self.grid.risk(0.35, 1.5, interpolate=True), left / 2)
+
+    @unittest.skipUnless(HAS_NUMPY, "risk_many에는 numpy가 필요합니다")
+    def test_risk_many_matches_scalar(self):
+        """일괄 조회가 점별 조회와 같은지 테스트"""
+        rng = np.random.default_rng(7)
+        points = np.column_stack([rng.uniform(-0.2, 1.0, 500), rng.uniform(0.0, 3.0, 500)])
+        for interpolate in (False, True):
+            expected = [self.grid.risk(x, y, interpolate) for x, y in points.tolist()]
+            np.testing.assert_allclose(self.grid.risk_many(points, interpolate), expected)
+
+        self.assertEqual(SpatialRiskGrid().risk_many(points).tolist(), [0.0] * 500)
+        with self.assertRaises(ValueError):
+            self.grid.risk_many(np.zeros(3))
+
+    def test_invalid_arguments(self):
+        """잘못된 설정에서 ValueError 발생 테스트"""
+        for kwargs in ({"cell_size": (0.0, 0.1)}, {"cell_size": (0.1,)}, {"max_cells": 0}):
+            with self.assertRaises(ValueError):
+                SpatialRiskGrid(**kwargs)
+        with self.assertRaises(ValueError):
+            FailureBiasConverter(spatial_cell_size=(-1.0, 0.1))
+        if HAS_NUMPY:
+            sparse = SpatialRiskGrid(cell_size=(0.01, 0.01), max_cells=100)
+            sparse.add(0.0, 0.0)
+            sparse.add(1.0, 1.0)
+            with self.assertRaises(ValueError):
+                sparse.risk_many(np.zeros((1, 2)))
+
+    def test_coordinates(self):
+        """서명/시스템 좌표가 같은 규칙인지 테스트"""
+        system = ThreeBodySystem(
+            body1=Body(position=Point(0.0, 0.0), mass=2.0),
+            body2=Body(position=Point(3.0, 0.0), mass=1.0),
+            body3=Body(position=Point(0.0, 4.0), mass=4.0)
+        )
+        self.assertEqual(system_coordinates(system), (0.25, 4.0))
+        self.assertEqual(configuration_coordinates([4.0, 2.0, 1.0], [3.0, 4.0, 5.0]), (0.25, 4.0))
+        self.assertEqual(
+            signature_coordinates("mass_(4.0, 2.0, 1.0)_dist_(3.0, 4.0, 5.0)_mismatch_0.100"),
+            (0.25, 4.0)
+        )
+        self.assertIsNone(signature_coordinates("custom_1"))
+
+
+class TestSpatialSearchBias(unittest.TestCase):
+    """SearchBias 공간 위험도 연동 테스트"""
+
+    def setUp(self):
+        """테스트 설정"""
+        self.atlas = make_atlas()
+        self.converter = FailureBiasConverter(spatial_cell_size=(0.1, 0.2))
+
+    def test_bias_carries_grid(self):
+        """편향에 격자/패턴이 채워지고 기존 필드는 그대로인지 테스트"""
+        bias = self.converter.convert_failure_to_bias(self.atlas)
+        plain = FailureBiasConverter().convert_failure_to_bias(self.atlas)
+        self.assertIsNone(plain.spatial_grid)
+        self.assertIsNone(plain.spatial_risk_pattern)
+        self.assertEqual(bias.risk_map, plain.risk_map)
+        self.assertGreater(len(bias.spatial_risk_pattern), 0)
+
+        for (x, y), risk in bias.spatial_risk_pattern.items():
+            self.assertAlmostEqual(bias.get_spatial_risk(x, y), risk)
+        self.assertEqual(plain.get_spatial_risk(0.3, 1.0), 0.0)
+
+        incremental = IncrementalBiasConverter(spatial_cell_size=(0.1, 0.2))
+        self.assertEqual(
+            incremental.convert_failure_to_bias(self.atlas).spatial_risk_pattern,
+            bias.spatial_risk_pattern
+        )
+        updated = self.converter.update_bias_with_new_failure(bias, make_record(1))
+        self.assertIs(updated.spatial_grid, bias.spatial_grid)
+
+    @unittest.skipUnless(HAS_NUMPY, "좌표 배열 필터에는 numpy가 필요합니다")
+    def test_safe_conditions_vectorized(self):
+        """10^6 후보를 한 번에 거르고 점별 판정과 같은지 테스트"""
+        bias = self.converter.convert_failure_to_bias(self.atlas)
+        rng = np.random.default_rng(0)
+        candidates = np.column_stack([rng.uniform(0.0, 1.0, 10 ** 6), rng.uniform(0.0, 3.0, 10 ** 6)])
+
+        safe = self.converter.get_safe_conditions(bias, candidates, threshold=0.3)
+        self.assertLess(len(safe), len(candidates))
+        self.assertTrue((bias.spatial_grid.risk_many(safe) < 0.3).all())
+
+        sample = candidates[:2000]
+        expected = [row for row in sample.tolist() if bias.get_spatial_risk(*row) < 0.3]
+        self.assertEqual(
+            self.converter.get_safe_conditions(bias, sample, threshold=0.3).tolist(), expected
+        )
+
+        # 서명 리스트는 기존대로
+        signatures = [make_record(index).condition_signature for index in range(20)]
+        self.assertEqual(
+            self.converter.get_safe_conditions(bias, signatures, threshold=0.3),
+            [signature for signature in signatures if bias.get_risk(signature) < 0.3]
+        )
+        with self.assertRaises(ValueError):
+            FailureBiasConverter().get_safe_conditions(
+                FailureBiasConverter().convert_failure_to_bias(self.atlas), candidates
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
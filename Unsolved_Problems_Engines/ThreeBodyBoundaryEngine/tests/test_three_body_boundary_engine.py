@@ -7,6 +7,7 @@ Version: 1.2.0
 
 import sys
 import unittest
+from unittest import mock
 from pathlib import Path
 
 # 프로젝트 루트를 Python 경로에 추가
@@ -18,7 +19,8 @@ from three_body_boundary_engine import (
     ThreeBodyConfig,
     ThreeBodySystem,
     Body,
-    Point
+    Point,
+    StabilityAnalysis
 )
 
 
@@ -173,6 +175,116 @@ class TestThreeBodyBoundaryEngine(unittest.TestCase):
             assert hasattr(result, 'stability_score')
             assert 0.0 <= result.stability_score <= 1.0
     
+    def test_parallel_stability_conditions(self):
+        """프로세스 풀 배치 분석 테스트 (입력 순서 유지)"""
+        config = ThreeBodyConfig(potential_resolution=10, max_iterations=50)
+        engine = ThreeBodyBoundaryEngine(config)
+        
+        systems = [
+            ThreeBodySystem(
+                body1=Body(position=Point(0.0, 0.0), mass=1.0 + 0.1 * k),
+                body2=Body(position=Point(1.0 + 0.1 * k, 0.0), mass=1.0),
+                body3=Body(position=Point(0.5, 0.866), mass=1.0)
+            )
+            for k in range(7)
+        ]
+        
+        serial = engine.compare_stability_conditions(systems)
+        parallel = engine.compare_stability_conditions(systems, max_workers=2, chunksize=3)
+        assert parallel == serial
+        
+        # 제너레이터 입력도 지연 소비되며 같은 순서로 스트리밍
+        streamed = engine.iter_stability_conditions(
+            (system for system in systems),
+            max_workers=2,
+            chunksize=2,
+            max_pending_chunks=1
+        )
+        assert list(streamed) == serial
+    
+    def test_screening_mode(self):
+        """선별 모드 (coarse-to-fine) 테스트
+        
+        참고: 현재 BoundaryConvergenceAdapter.converge()는 필드 가중치를 읽지 않으므로
+        실제 엔진의 mismatch는 해상도와 무관하다. 단계 올림 규칙은 해상도에 따라
+        mismatch가 달라지는 분석으로 바꿔 직접 확인하고, 실제 엔진에서는 단계 기록만 확인한다.
+        """
+        systems = [
+            ThreeBodySystem(
+                body1=Body(position=Point(0.0, 0.0), mass=1.0),
+                body2=Body(position=Point(1.0 + 0.2 * k, 0.0), mass=1.0 + 0.5 * k),
+                body3=Body(position=Point(0.5, 0.866 - 0.1 * k), mass=1.0)
+            )
+            for k in range(4)
+        ]
+        # stability_threshold 0.1, screening_band 0.25 → 불확실 대역 mismatch 0.075 ~ 0.125
+        screened = ThreeBodyBoundaryEngine(ThreeBodyConfig(
+            potential_resolution=20,
+            max_iterations=60,
+            screening_resolutions=(5, 10),
+            screening_band=0.25
+        ))
+        
+        def analyze_with(mismatches):
+            calls = []
+            
+            def fake_analysis(bodies, x_range, y_range, resolution):
+                calls.append(resolution)
+                return StabilityAnalysis(
+                    converged=True,
+                    mismatch=mismatches[resolution],
+                    iteration=1,
+                    boundary_points=10,
+                    stability_score=max(0.0, 1.0 - mismatches[resolution] / 0.1),
+                    convergence_rate=0.0
+                )
+            
+            with mock.patch.object(screened, "_analyze_at_resolution", side_effect=fake_analysis):
+                return screened.analyze_orbit_stability(systems[0]), calls
+        
+        # 거친 해상도가 대역 밖 → 그 단계에서 확정
+        analysis, calls = analyze_with({5: 0.3, 10: 0.01, 20: 0.01})
+        assert calls == [5]
+        assert (analysis.screening_level, analysis.screening_resolution) == (0, 5)
+        assert not analysis.is_stable()
+        
+        # 대역 안 → 다음 해상도, 대역 밖이면 중간 단계에서 확정
+        analysis, calls = analyze_with({5: 0.11, 10: 0.01, 20: 0.5})
+        assert calls == [5, 10]
+        assert (analysis.screening_level, analysis.screening_resolution) == (1, 10)
+        assert analysis.mismatch == 0.01
+        
+        # 모든 거친 단계가 대역 안 → 전체 해상도 결과를 사용
+        analysis, calls = analyze_with({5: 0.1, 10: 0.09, 20: 0.02})
+        assert calls == [5, 10, 20]
+        assert (analysis.screening_level, analysis.screening_resolution) == (2, 20)
+        assert analysis.mismatch == 0.02
+        
+        # 실제 엔진: 단계 기록 일관성 (선별 미설정이면 기록 없음)
+        full = ThreeBodyBoundaryEngine(ThreeBodyConfig(potential_resolution=20, max_iterations=60))
+        for system in systems:
+            analysis = screened.analyze_orbit_stability(system)
+            assert analysis.screening_level in (0, 1, 2)
+            assert analysis.screening_resolution == (5, 10, 20)[analysis.screening_level]
+            assert full.analyze_orbit_stability(system).screening_level is None
+        
+        # 불확실 대역이 모든 결과를 덮으면 전체 해상도까지 올라감
+        escalating = ThreeBodyBoundaryEngine(ThreeBodyConfig(
+            potential_resolution=20,
+            max_iterations=60,
+            screening_resolutions=(5, 10),
+            screening_band=1e9
+        ))
+        analysis = escalating.analyze_orbit_stability(systems[0])
+        assert analysis.screening_level == 2
+        assert analysis.screening_resolution == 20
+        
+        # run()과 배치 API도 설정을 통해 선별 모드를 사용
+        result = screened.run(systems[0], enable_l1=False, enable_l2=False)
+        assert result.analysis.screening_level is not None
+        batch = screened.compare_stability_conditions(systems, max_workers=2, chunksize=2)
+        assert all(a.screening_level is not None for a in batch)
+    
     def test_boundary_formation_observation(self):
         """경계 형성 과정 관찰 테스트"""
         config = ThreeBodyConfig()